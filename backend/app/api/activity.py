@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import asyncio
 import json
-from collections import deque
+import time
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
@@ -16,8 +17,9 @@ from sse_starlette.sse import EventSourceResponse
 
 from app.api.deps import ActorContext, require_admin_or_agent, require_org_member
 from app.core.time import utcnow
-from app.db.pagination import paginate
-from app.db.session import async_session_maker, get_session
+from app.db.pagination import KeysetOrder, paginate
+from app.db.query_stats import query_stats_scope
+from app.db.session import get_session, stream_session_maker
 from app.models.activity_events import ActivityEvent
 from app.models.agents import Agent
 from app.models.boards import Board
@@ -29,16 +31,21 @@ from app.services.organizations import (
     get_active_membership,
     list_accessible_board_ids,
 )
+from app.services.sse_replay import (
+    LAST_EVENT_ID_HEADER,
+    ReplayCursor,
+    ReplayEntry,
+    get_replay_buffer,
+)
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Sequence
+    from collections.abc import AsyncIterator, Collection, Sequence
 
     from fastapi_pagination.limit_offset import LimitOffsetPage
     from sqlmodel.ext.asyncio.session import AsyncSession
 
 router = APIRouter(prefix="/activity", tags=["activity"])
 
-SSE_SEEN_MAX = 2000
 STREAM_POLL_SECONDS = 2
 TASK_COMMENT_ROW_LEN = 4
 SESSION_DEP = Depends(get_session)
@@ -46,6 +53,7 @@ ACTOR_DEP = Depends(require_admin_or_agent)
 ORG_MEMBER_DEP = Depends(require_org_member)
 BOARD_ID_QUERY = Query(default=None)
 SINCE_QUERY = Query(default=None)
+ACTIVITY_KEYSET = KeysetOrder(col(ActivityEvent.created_at), col(ActivityEvent.id))
 _RUNTIME_TYPE_REFERENCES = (UUID,)
 
 
@@ -145,8 +153,12 @@ async def _fetch_task_comment_events(
     session: AsyncSession,
     since: datetime,
     *,
-    board_id: UUID | None = None,
+    board_ids: Collection[UUID],
 ) -> Sequence[tuple[ActivityEvent, Task, Board, Agent | None]]:
+    if not board_ids:
+        return []
+    # Scope by board in SQL so each poll is bounded by the caller's boards; the
+    # (event_type, created_at) index drives the scan and tasks join by primary key.
     statement = (
         select(ActivityEvent, Task, Board, Agent)
         .join(Task, col(ActivityEvent.task_id) == col(Task.id))
@@ -155,13 +167,72 @@ async def _fetch_task_comment_events(
         .where(col(ActivityEvent.event_type) == "task.comment")
         .where(col(ActivityEvent.created_at) >= since)
         .where(func.length(func.trim(col(ActivityEvent.message))) > 0)
+        .where(col(Task.board_id).in_(sorted(board_ids)))
         .order_by(asc(col(ActivityEvent.created_at)))
     )
-    if board_id is not None:
-        statement = statement.where(col(Task.board_id) == board_id)
     return _coerce_task_comment_rows(list(await session.exec(statement)))
 
 
+@dataclass(slots=True)
+class _SharedFeedPoll:
+    fetched_at: float
+    rows: Sequence[tuple[ActivityEvent, Task, Board, Agent | None]]
+
+
+class _TaskCommentFeedPoller:
+    """Share one feed query per poll interval across streams with identical access sets.
+
+    Org members with the same accessible boards (e.g. everyone with all-board
+    read access) poll the same (board set, cursor) pair; the first stream to
+    poll runs the query and the others reuse its rows for the poll interval.
+    """
+
+    def __init__(self, *, ttl_seconds: float) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._polls: dict[tuple[frozenset[UUID], datetime], _SharedFeedPoll] = {}
+        self._locks: dict[tuple[frozenset[UUID], datetime], asyncio.Lock] = {}
+
+    def _prune(self, now: float) -> None:
+        expired = [
+            key for key, poll in self._polls.items() if now - poll.fetched_at >= self._ttl_seconds
+        ]
+        for key in expired:
+            del self._polls[key]
+        idle = [
+            key for key, lock in self._locks.items() if key not in self._polls and not lock.locked()
+        ]
+        for key in idle:
+            del self._locks[key]
+
+    async def fetch(
+        self,
+        board_ids: frozenset[UUID],
+        since: datetime,
+    ) -> Sequence[tuple[ActivityEvent, Task, Board, Agent | None]]:
+        key = (board_ids, since)
+        self._prune(time.monotonic())
+        cached = self._polls.get(key)
+        if cached is not None:
+            return cached.rows
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            cached = self._polls.get(key)
+            if cached is not None:
+                return cached.rows
+            async with stream_session_maker() as stream_session:
+                with query_stats_scope():
+                    rows = await _fetch_task_comment_events(
+                        stream_session,
+                        since,
+                        board_ids=board_ids,
+                    )
+            self._polls[key] = _SharedFeedPoll(fetched_at=time.monotonic(), rows=rows)
+            return rows
+
+
+_TASK_COMMENT_FEED_POLLER = _TaskCommentFeedPoller(ttl_seconds=STREAM_POLL_SECONDS)
+
+
 @router.get("", response_model=DefaultLimitOffsetPage[ActivityEventRead])
 async def list_activity(
     session: AsyncSession = SESSION_DEP,
@@ -184,7 +255,7 @@ async def list_activity(
                 col(ActivityEvent.task_id) == col(Task.id),
             ).where(col(Task.board_id).in_(board_ids))
     statement = statement.order_by(desc(col(ActivityEvent.created_at)))
-    return await paginate(session, statement)
+    return await paginate(session, statement, keyset=ACTIVITY_KEYSET)
 
 
 @router.get(
@@ -220,7 +291,7 @@ async def list_task_comment_feed(
         rows = _coerce_task_comment_rows(items)
         return [_feed_item(event, task, board, agent) for event, task, board, agent in rows]
 
-    return await paginate(session, statement, transformer=_transform)
+    return await paginate(session, statement, transformer=_transform, keyset=ACTIVITY_KEYSET)
 
 
 @router.get("/task-comments/stream")
@@ -231,55 +302,57 @@ async def stream_task_comment_feed(
     db_session: AsyncSession = SESSION_DEP,
     ctx: OrganizationContext = ORG_MEMBER_DEP,
 ) -> EventSourceResponse:
-    """Stream task-comment events for accessible boards."""
+    """Stream task-comment events for accessible boards.
+
+    Reconnecting clients resume from the `Last-Event-ID` header when present.
+    """
     since_dt = _parse_since(since) or utcnow()
     board_ids = await list_accessible_board_ids(
         db_session,
         member=ctx.member,
         write=False,
     )
-    allowed_ids = set(board_ids)
+    allowed_ids = frozenset(board_ids)
     if board_id is not None and board_id not in allowed_ids:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
-    seen_ids: set[UUID] = set()
-    seen_queue: deque[UUID] = deque()
+    buffer = get_replay_buffer()
+    stream_board_ids = frozenset({board_id}) if board_id is not None else allowed_ids
+    cursor = ReplayCursor(
+        buffer,
+        last_event_id=request.headers.get(LAST_EVENT_ID_HEADER),
+        since=since_dt,
+    )
 
     async def event_generator() -> AsyncIterator[dict[str, str]]:
-        last_seen = since_dt
+        for message in cursor.resume([("task_comments", value) for value in stream_board_ids]):
+            yield message
         while True:
             if await request.is_disconnected():
                 break
-            async with async_session_maker() as stream_session:
-                if board_id is not None:
-                    rows = await _fetch_task_comment_events(
-                        stream_session,
-                        last_seen,
-                        board_id=board_id,
-                    )
-                elif allowed_ids:
-                    rows = await _fetch_task_comment_events(stream_session, last_seen)
-                    rows = [row for row in rows if row[1].board_id in allowed_ids]
-                else:
-                    rows = []
+            rows = await _TASK_COMMENT_FEED_POLLER.fetch(stream_board_ids, cursor.last_seen)
+            entries: list[ReplayEntry] = []
             for event, task, board, agent in rows:
-                event_id = event.id
-                if event_id in seen_ids:
-                    continue
-                seen_ids.add(event_id)
-                seen_queue.append(event_id)
-                if len(seen_queue) > SSE_SEEN_MAX:
-                    oldest = seen_queue.popleft()
-                    seen_ids.discard(oldest)
-                last_seen = max(event.created_at, last_seen)
-                payload = {
-                    "comment": _feed_item(
-                        event,
-                        task,
-                        board,
-                        agent,
-                    ).model_dump(mode="json"),
-                }
-                yield {"event": "comment", "data": json.dumps(payload)}
+                channel = ("task_comments", board.id)
+                entry = buffer.lookup(channel, event.id)
+                if entry is None:
+                    payload = {
+                        "comment": _feed_item(
+                            event,
+                            task,
+                            board,
+                            agent,
+                        ).model_dump(mode="json"),
+                    }
+                    entry = buffer.record(
+                        channel,
+                        key=event.id,
+                        event="comment",
+                        data=json.dumps(payload),
+                        cursor=event.created_at,
+                    )
+                entries.append(entry)
+            for message in cursor.deliver(entries):
+                yield message
             await asyncio.sleep(STREAM_POLL_SECONDS)
 
     return EventSourceResponse(event_generator(), ping=15)
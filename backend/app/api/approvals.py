@@ -23,7 +23,8 @@ from app.api.deps import (
 from app.core.logging import get_logger
 from app.core.time import utcnow
 from app.db.pagination import paginate
-from app.db.session import async_session_maker, get_session
+from app.db.query_stats import query_stats_scope
+from app.db.session import get_session, stream_session_maker
 from app.models.agents import Agent
 from app.models.approvals import Approval
 from app.models.tasks import Task
@@ -39,6 +40,13 @@ from app.services.approval_task_links import (
     task_counts_for_board,
 )
 from app.services.openclaw.gateway_dispatch import GatewayDispatchService
+from app.services.sse_replay import (
+    LAST_EVENT_ID_HEADER,
+    ReplayChannel,
+    ReplayCursor,
+    ReplayEntry,
+    get_replay_buffer,
+)
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator, Sequence
@@ -296,6 +304,88 @@ async def _fetch_approval_events(
     return await statement.all(session)
 
 
+def approval_stream_channel(board_id: UUID) -> ReplayChannel:
+    return ("approvals", board_id)
+
+
+async def poll_approval_stream(
+    session: AsyncSession,
+    *,
+    board_id: UUID,
+    cursor: ReplayCursor,
+) -> list[dict[str, str]]:
+    """Fetch approval updates for one stream subscription and return undelivered messages."""
+    buffer = get_replay_buffer()
+    channel = approval_stream_channel(board_id)
+    approvals = await _fetch_approval_events(session, board_id, cursor.last_seen)
+    # Approval versions already buffered by another connection reuse the stored
+    # payload, so only new versions need reads, counts and serialization.
+    unbuffered = [
+        approval
+        for approval in approvals
+        if buffer.lookup(channel, (approval.id, _approval_updated_at(approval))) is None
+    ]
+    approval_reads = await _approval_reads(session, unbuffered)
+    pending_approvals_count = 0
+    counts_by_task_id: dict[UUID, tuple[int, int]] = {}
+    if unbuffered:
+        pending_approvals_count = int(
+            (
+                await session.exec(
+                    select(func.count(col(Approval.id)))
+                    .where(col(Approval.board_id) == board_id)
+                    .where(col(Approval.status) == "pending"),
+                )
+            ).one(),
+        )
+        task_ids = {
+            task_id for approval_read in approval_reads for task_id in approval_read.task_ids
+        }
+        counts_by_task_id = await task_counts_for_board(
+            session,
+            board_id=board_id,
+            task_ids=task_ids,
+        )
+    reads_by_id = {
+        approval.id: approval_read
+        for approval, approval_read in zip(unbuffered, approval_reads, strict=True)
+    }
+    entries: list[ReplayEntry] = []
+    for approval in approvals:
+        updated_at = _approval_updated_at(approval)
+        key = (approval.id, updated_at)
+        entry = buffer.lookup(channel, key)
+        if entry is None:
+            approval_read = reads_by_id[approval.id]
+            payload: dict[str, object] = {
+                "approval": _serialize_approval(approval_read),
+                "pending_approvals_count": pending_approvals_count,
+            }
+            task_counts = [
+                {
+                    "task_id": str(task_id),
+                    "approvals_count": total,
+                    "approvals_pending_count": pending,
+                }
+                for task_id in approval_read.task_ids
+                if (counts := counts_by_task_id.get(task_id)) is not None
+                for total, pending in [counts]
+            ]
+            if len(task_counts) == 1:
+                payload["task_counts"] = task_counts[0]
+            elif task_counts:
+                payload["task_counts"] = task_counts
+            entry = buffer.record(
+                channel,
+                key=key,
+                event="approval",
+                data=json.dumps(payload),
+                cursor=updated_at,
+            )
+        entries.append(entry)
+    return cursor.deliver(entries)
+
+
 @router.get("", response_model=DefaultLimitOffsetPage[ApprovalRead])
 async def list_approvals(
     status_filter: ApprovalStatus | None = STATUS_FILTER_QUERY,
@@ -330,57 +420,27 @@ async def stream_approvals(
 ) -> EventSourceResponse:
     """Stream approval updates for a board using server-sent events."""
     since_dt = _parse_since(since) or utcnow()
-    last_seen = since_dt
+    cursor = ReplayCursor(
+        get_replay_buffer(),
+        last_event_id=request.headers.get(LAST_EVENT_ID_HEADER),
+        since=since_dt,
+    )
 
     async def event_generator() -> AsyncIterator[dict[str, str]]:
-        nonlocal last_seen
+        for message in cursor.resume([approval_stream_channel(board.id)]):
+            yield message
         while True:
             if await request.is_disconnected():
                 break
-            async with async_session_maker() as session:
-                approvals = await _fetch_approval_events(session, board.id, last_seen)
-                approval_reads = await _approval_reads(session, approvals)
-                pending_approvals_count = int(
-                    (
-                        await session.exec(
-                            select(func.count(col(Approval.id)))
-                            .where(col(Approval.board_id) == board.id)
-                            .where(col(Approval.status) == "pending"),
-                        )
-                    ).one(),
-                )
-                task_ids = {
-                    task_id
-                    for approval_read in approval_reads
-                    for task_id in approval_read.task_ids
-                }
-                counts_by_task_id = await task_counts_for_board(
-                    session,
-                    board_id=board.id,
-                    task_ids=task_ids,
-                )
-            for approval, approval_read in zip(approvals, approval_reads, strict=True):
-                updated_at = _approval_updated_at(approval)
-                last_seen = max(updated_at, last_seen)
-                payload: dict[str, object] = {
-                    "approval": _serialize_approval(approval_read),
-                    "pending_approvals_count": pending_approvals_count,
-                }
-                task_counts = [
-                    {
-                        "task_id": str(task_id),
-                        "approvals_count": total,
-                        "approvals_pending_count": pending,
-                    }
-                    for task_id in approval_read.task_ids
-                    if (counts := counts_by_task_id.get(task_id)) is not None
-                    for total, pending in [counts]
-                ]
-                if len(task_counts) == 1:
-                    payload["task_counts"] = task_counts[0]
-                elif task_counts:
-                    payload["task_counts"] = task_counts
-                yield {"event": "approval", "data": json.dumps(payload)}
+            async with stream_session_maker() as session:
+                with query_stats_scope():
+                    messages = await poll_approval_stream(
+                        session,
+                        board_id=board.id,
+                        cursor=cursor,
+                    )
+            for message in messages:
+                yield message
             await asyncio.sleep(STREAM_POLL_SECONDS)
 
     return EventSourceResponse(event_generator(), ping=15)
@@ -8,6 +8,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 
 from app.api.deps import require_org_admin
 from app.core.time import utcnow
+from app.db.replicas import use_primary
 from app.db.session import get_session
 from app.models.backups import BackupPolicy
 from app.schemas.backups import (
@@ -48,6 +49,8 @@ async def _get_or_create_policy(
     session: AsyncSession,
     ctx: OrganizationContext,
 ) -> BackupPolicy:
+    # Every caller updates the policy next, so read it from the primary even on GET.
+    use_primary(session)
     policy = await BackupPolicy.objects.filter_by(organization_id=ctx.organization.id).first(session)
     if policy is not None:
         return policy
@@ -25,8 +25,9 @@ from app.api.deps import (
 )
 from app.core.config import settings
 from app.core.time import utcnow
-from app.db.pagination import paginate
-from app.db.session import async_session_maker, get_session
+from app.db.pagination import KeysetOrder, paginate
+from app.db.query_stats import query_stats_scope
+from app.db.session import get_session, stream_session_maker
 from app.models.agents import Agent
 from app.models.board_group_memory import BoardGroupMemory
 from app.models.board_groups import BoardGroup
@@ -42,6 +43,13 @@ from app.services.organizations import (
     member_all_boards_read,
     member_all_boards_write,
 )
+from app.services.sse_replay import (
+    LAST_EVENT_ID_HEADER,
+    ReplayChannel,
+    ReplayCursor,
+    ReplayEntry,
+    get_replay_buffer,
+)
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
@@ -69,6 +77,7 @@ BOARD_WRITE_DEP = Depends(get_board_for_actor_write)
 ACTOR_DEP = Depends(require_admin_or_agent)
 IS_CHAT_QUERY = Query(default=None)
 SINCE_QUERY = Query(default=None)
+MEMORY_KEYSET = KeysetOrder(col(BoardGroupMemory.created_at), col(BoardGroupMemory.id))
 _RUNTIME_TYPE_REFERENCES = (UUID,)
 AGENT_BOARD_ROLE_TAGS = cast("list[str | Enum]", ["agent-lead", "agent-worker"])
 _SENSITIVE_KV_RE = re.compile(
@@ -143,6 +152,42 @@ def _serialize_memory(memory: BoardGroupMemory) -> dict[str, object]:
     ).model_dump(mode="json")
 
 
+def memory_stream_channel(group_id: UUID, is_chat: bool | None) -> ReplayChannel:
+    return ("group_memory", group_id, is_chat)
+
+
+async def poll_memory_stream(
+    session: AsyncSession,
+    *,
+    group_id: UUID,
+    is_chat: bool | None,
+    cursor: ReplayCursor,
+) -> list[dict[str, str]]:
+    """Fetch new group memory for one stream subscription and return undelivered messages."""
+    buffer = get_replay_buffer()
+    channel = memory_stream_channel(group_id, is_chat)
+    memories = await _fetch_memory_events(
+        session,
+        group_id,
+        cursor.last_seen,
+        is_chat=is_chat,
+    )
+    entries: list[ReplayEntry] = []
+    for memory in memories:
+        entry = buffer.lookup(channel, memory.id)
+        if entry is None:
+            payload = {"memory": _serialize_memory(memory)}
+            entry = buffer.record(
+                channel,
+                key=memory.id,
+                event="memory",
+                data=json.dumps(payload),
+                cursor=memory.created_at,
+            )
+        entries.append(entry)
+    return cursor.deliver(entries)
+
+
 async def _fetch_memory_events(
     session: AsyncSession,
     board_group_id: UUID,
@@ -417,7 +462,7 @@ async def list_board_group_memory(
     if is_chat is not None:
         statement = statement.filter(col(BoardGroupMemory.is_chat) == is_chat)
     statement = statement.order_by(col(BoardGroupMemory.created_at).desc())
-    return await paginate(session, statement.statement)
+    return await paginate(session, statement.statement, keyset=MEMORY_KEYSET)
 
 
 @group_router.get("/stream")
@@ -430,24 +475,28 @@ async def stream_board_group_memory(
 ) -> EventSourceResponse:
     """Stream memory entries for a board group via server-sent events."""
     since_dt = _parse_since(since) or utcnow()
-    last_seen = since_dt
+    cursor = ReplayCursor(
+        get_replay_buffer(),
+        last_event_id=request.headers.get(LAST_EVENT_ID_HEADER),
+        since=since_dt,
+    )
 
     async def event_generator() -> AsyncIterator[dict[str, str]]:
-        nonlocal last_seen
+        for message in cursor.resume([memory_stream_channel(group.id, is_chat)]):
+            yield message
         while True:
             if await request.is_disconnected():
                 break
-            async with async_session_maker() as s:
-                memories = await _fetch_memory_events(
-                    s,
-                    group.id,
-                    last_seen,
-                    is_chat=is_chat,
-                )
-            for memory in memories:
-                last_seen = max(memory.created_at, last_seen)
-                payload = {"memory": _serialize_memory(memory)}
-                yield {"event": "memory", "data": json.dumps(payload)}
+            async with stream_session_maker() as s:
+                with query_stats_scope():
+                    messages = await poll_memory_stream(
+                        s,
+                        group_id=group.id,
+                        is_chat=is_chat,
+                        cursor=cursor,
+                    )
+            for message in messages:
+                yield message
             await asyncio.sleep(STREAM_POLL_SECONDS)
 
     return EventSourceResponse(event_generator(), ping=15)
@@ -533,7 +582,11 @@ async def list_board_group_memory_for_board(
     """
     group_id = board.board_group_id
     if group_id is None:
-        return await paginate(session, BoardGroupMemory.objects.by_ids([]).statement)
+        return await paginate(
+            session,
+            BoardGroupMemory.objects.by_ids([]).statement,
+            keyset=MEMORY_KEYSET,
+        )
 
     queryset = (
         BoardGroupMemory.objects.filter_by(board_group_id=group_id)
@@ -544,7 +597,7 @@ async def list_board_group_memory_for_board(
     if is_chat is not None:
         queryset = queryset.filter(col(BoardGroupMemory.is_chat) == is_chat)
     queryset = queryset.order_by(col(BoardGroupMemory.created_at).desc())
-    return await paginate(session, queryset.statement)
+    return await paginate(session, queryset.statement, keyset=MEMORY_KEYSET)
 
 
 @board_router.get(
@@ -582,27 +635,32 @@ async def stream_board_group_memory_for_board(
     """Stream linked-group memory via SSE for near-real-time coordination."""
     group_id = board.board_group_id
     since_dt = _parse_since(since) or utcnow()
-    last_seen = since_dt
+    cursor = ReplayCursor(
+        get_replay_buffer(),
+        last_event_id=request.headers.get(LAST_EVENT_ID_HEADER),
+        since=since_dt,
+    )
 
     async def event_generator() -> AsyncIterator[dict[str, str]]:
-        nonlocal last_seen
+        if group_id is not None:
+            for message in cursor.resume([memory_stream_channel(group_id, is_chat)]):
+                yield message
         while True:
             if await request.is_disconnected():
                 break
             if group_id is None:
                 await asyncio.sleep(2)
                 continue
-            async with async_session_maker() as session:
-                memories = await _fetch_memory_events(
-                    session,
-                    group_id,
-                    last_seen,
-                    is_chat=is_chat,
-                )
-            for memory in memories:
-                last_seen = max(memory.created_at, last_seen)
-                payload = {"memory": _serialize_memory(memory)}
-                yield {"event": "memory", "data": json.dumps(payload)}
+            async with stream_session_maker() as session:
+                with query_stats_scope():
+                    messages = await poll_memory_stream(
+                        session,
+                        group_id=group_id,
+                        is_chat=is_chat,
+                        cursor=cursor,
+                    )
+            for message in messages:
+                yield message
             await asyncio.sleep(STREAM_POLL_SECONDS)
 
     return EventSourceResponse(event_generator(), ping=15)
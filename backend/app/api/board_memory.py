@@ -22,8 +22,9 @@ from app.api.deps import (
 )
 from app.core.config import settings
 from app.core.time import utcnow
-from app.db.pagination import paginate
-from app.db.session import async_session_maker, get_session
+from app.db.pagination import KeysetOrder, paginate
+from app.db.query_stats import query_stats_scope
+from app.db.session import get_session, stream_session_maker
 from app.models.agents import Agent
 from app.models.board_memory import BoardMemory
 from app.schemas.board_memory import BoardMemoryCreate, BoardMemoryRead
@@ -31,6 +32,13 @@ from app.schemas.pagination import DefaultLimitOffsetPage
 from app.services.mentions import extract_mentions, matches_agent_mention
 from app.services.openclaw.gateway_dispatch import GatewayDispatchService
 from app.services.openclaw.gateway_rpc import GatewayConfig as GatewayClientConfig
+from app.services.sse_replay import (
+    LAST_EVENT_ID_HEADER,
+    ReplayChannel,
+    ReplayCursor,
+    ReplayEntry,
+    get_replay_buffer,
+)
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
@@ -45,6 +53,7 @@ MAX_SNIPPET_LENGTH = 800
 STREAM_POLL_SECONDS = 2
 IS_CHAT_QUERY = Query(default=None)
 SINCE_QUERY = Query(default=None)
+MEMORY_KEYSET = KeysetOrder(col(BoardMemory.created_at), col(BoardMemory.id))
 BOARD_READ_DEP = Depends(get_board_for_actor_read)
 BOARD_WRITE_DEP = Depends(get_board_for_actor_write)
 SESSION_DEP = Depends(get_session)
@@ -101,6 +110,42 @@ async def _fetch_memory_events(
     return await statement.all(session)
 
 
+def memory_stream_channel(board_id: UUID, is_chat: bool | None) -> ReplayChannel:
+    return ("board_memory", board_id, is_chat)
+
+
+async def poll_memory_stream(
+    session: AsyncSession,
+    *,
+    board_id: UUID,
+    is_chat: bool | None,
+    cursor: ReplayCursor,
+) -> list[dict[str, str]]:
+    """Fetch new memory entries for one stream subscription and return undelivered messages."""
+    buffer = get_replay_buffer()
+    channel = memory_stream_channel(board_id, is_chat)
+    memories = await _fetch_memory_events(
+        session,
+        board_id,
+        cursor.last_seen,
+        is_chat=is_chat,
+    )
+    entries: list[ReplayEntry] = []
+    for memory in memories:
+        entry = buffer.lookup(channel, memory.id)
+        if entry is None:
+            payload = {"memory": _serialize_memory(memory)}
+            entry = buffer.record(
+                channel,
+                key=memory.id,
+                event="memory",
+                data=json.dumps(payload),
+                cursor=memory.created_at,
+            )
+        entries.append(entry)
+    return cursor.deliver(entries)
+
+
 async def _send_control_command(
     *,
     session: AsyncSession,
@@ -247,7 +292,7 @@ async def list_board_memory(
     if is_chat is not None:
         statement = statement.filter(col(BoardMemory.is_chat) == is_chat)
     statement = statement.order_by(col(BoardMemory.created_at).desc())
-    return await paginate(session, statement.statement)
+    return await paginate(session, statement.statement, keyset=MEMORY_KEYSET)
 
 
 @router.get("/stream")
@@ -261,24 +306,28 @@ async def stream_board_memory(
 ) -> EventSourceResponse:
     """Stream board memory events over server-sent events."""
     since_dt = _parse_since(since) or utcnow()
-    last_seen = since_dt
+    cursor = ReplayCursor(
+        get_replay_buffer(),
+        last_event_id=request.headers.get(LAST_EVENT_ID_HEADER),
+        since=since_dt,
+    )
 
     async def event_generator() -> AsyncIterator[dict[str, str]]:
-        nonlocal last_seen
+        for message in cursor.resume([memory_stream_channel(board.id, is_chat)]):
+            yield message
         while True:
             if await request.is_disconnected():
                 break
-            async with async_session_maker() as session:
-                memories = await _fetch_memory_events(
-                    session,
-                    board.id,
-                    last_seen,
-                    is_chat=is_chat,
-                )
-            for memory in memories:
-                last_seen = max(memory.created_at, last_seen)
-                payload = {"memory": _serialize_memory(memory)}
-                yield {"event": "memory", "data": json.dumps(payload)}
+            async with stream_session_maker() as session:
+                with query_stats_scope():
+                    messages = await poll_memory_stream(
+                        session,
+                        board_id=board.id,
+                        is_chat=is_chat,
+                        cursor=cursor,
+                    )
+            for message in messages:
+                yield message
             await asyncio.sleep(STREAM_POLL_SECONDS)
 
     return EventSourceResponse(event_generator(), ping=15)
@@ -14,7 +14,7 @@ from app.core.config import settings
 from app.core.logging import get_logger
 from app.core.time import utcnow
 from app.db import crud
-from app.db.pagination import paginate
+from app.db.pagination import KeysetOrder, paginate
 from app.db.session import get_session
 from app.models.agents import Agent
 from app.models.board_memory import BoardMemory
@@ -37,6 +37,7 @@ from app.services.channel_ingress import (
 )
 from app.services.openclaw.gateway_dispatch import GatewayDispatchService
 from app.services.webhooks.queue import QueuedInboundDelivery, enqueue_webhook_delivery
+from app.services.webhooks.retention import stored_payload
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -50,6 +51,10 @@ router = APIRouter(prefix="/boards/{board_id}/webhooks", tags=["board-webhooks"]
 SESSION_DEP = Depends(get_session)
 BOARD_USER_READ_DEP = Depends(get_board_for_user_read)
 BOARD_USER_WRITE_DEP = Depends(get_board_for_user_write)
+PAYLOAD_KEYSET = KeysetOrder(
+    col(BoardWebhookPayload.received_at),
+    col(BoardWebhookPayload.id),
+)
 BOARD_OR_404_DEP = Depends(get_board_or_404)
 logger = get_logger(__name__)
 
@@ -73,6 +78,8 @@ def _to_webhook_read(webhook: BoardWebhook) -> BoardWebhookRead:
         agent_id=webhook.agent_id,
         description=webhook.description,
         enabled=webhook.enabled,
+        retention_max_age_days=webhook.retention_max_age_days,
+        retention_max_payloads=webhook.retention_max_payloads,
         endpoint_path=endpoint_path,
         endpoint_url=_webhook_endpoint_url(endpoint_path),
         created_at=webhook.created_at,
@@ -81,7 +88,16 @@ def _to_webhook_read(webhook: BoardWebhook) -> BoardWebhookRead:
 
 
 def _to_payload_read(payload: BoardWebhookPayload) -> BoardWebhookPayloadRead:
-    return BoardWebhookPayloadRead.model_validate(payload, from_attributes=True)
+    return BoardWebhookPayloadRead(
+        id=payload.id,
+        board_id=payload.board_id,
+        webhook_id=payload.webhook_id,
+        payload=stored_payload(payload),
+        headers=payload.headers,
+        source_ip=payload.source_ip,
+        content_type=payload.content_type,
+        received_at=payload.received_at,
+    )
 
 
 def _coerce_webhook_items(items: Sequence[object]) -> list[BoardWebhook]:
@@ -194,7 +210,7 @@ def _webhook_memory_content(
     payload: BoardWebhookPayload,
     policy: IngressPolicyDecision,
 ) -> str:
-    preview = _payload_preview(payload.payload)
+    preview = _payload_preview(stored_payload(payload))
     inspect_path = f"/api/v1/boards/{webhook.board_id}/webhooks/{webhook.id}/payloads/{payload.id}"
     return (
         "WEBHOOK PAYLOAD RECEIVED\n"
@@ -235,7 +251,7 @@ async def _notify_lead_on_webhook_payload(
     if config is None:
         return
 
-    payload_preview = _payload_preview(payload.payload)
+    payload_preview = _payload_preview(stored_payload(payload))
     message = (
         "WEBHOOK EVENT RECEIVED\n"
         f"Board: {board.name}\n"
@@ -314,6 +330,8 @@ async def create_board_webhook(
         agent_id=payload.agent_id,
         description=payload.description,
         enabled=payload.enabled,
+        retention_max_age_days=payload.retention_max_age_days,
+        retention_max_payloads=payload.retention_max_payloads,
     )
     await crud.save(session, webhook)
     return _to_webhook_read(webhook)
@@ -341,7 +359,7 @@ async def update_board_webhook(
     board: Board = BOARD_USER_WRITE_DEP,
     session: AsyncSession = SESSION_DEP,
 ) -> BoardWebhookRead:
-    """Update board webhook description or enabled state."""
+    """Update board webhook description, enabled state, or retention policy."""
     webhook = await _require_board_webhook(
         session,
         board_id=board.id,
@@ -408,7 +426,12 @@ async def list_board_webhook_payloads(
         payloads = _coerce_payload_items(items)
         return [_to_payload_read(value) for value in payloads]
 
-    return await paginate(session, statement, transformer=_transform)
+    return await paginate(
+        session,
+        statement,
+        transformer=_transform,
+        keyset=PAYLOAD_KEYSET,
+    )
 
 
 @router.get("/{webhook_id}/payloads/{payload_id}", response_model=BoardWebhookPayloadRead)
@@ -445,6 +468,11 @@ async def ingest_board_webhook(
     session: AsyncSession = SESSION_DEP,
 ) -> BoardWebhookIngestResponse:
     """Open inbound webhook endpoint that stores payloads and nudges the board lead."""
+    if board.deleting_at is not None:
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail="Board is being deleted.",
+        )
     webhook = await _require_board_webhook(
         session,
         board_id=board.id,
@@ -492,6 +520,8 @@ async def ingest_board_webhook(
         headers=headers,
         source_ip=request.client.host if request.client else None,
         content_type=content_type,
+        # Set before enqueueing so a fast dispatch cannot clear it first.
+        dispatch_pending=policy.allow_processing,
     )
     session.add(payload)
     memory = BoardMemory(
@@ -505,6 +535,7 @@ async def ingest_board_webhook(
         ],
         source="webhook",
         is_chat=False,
+        webhook_payload_id=payload.id,
     )
     session.add(memory)
     await session.commit()
@@ -549,6 +580,9 @@ async def ingest_board_webhook(
             payload=payload,
             policy=policy,
         )
+        payload.dispatch_pending = False
+        session.add(payload)
+        await session.commit()
 
     return BoardWebhookIngestResponse(
         board_id=board.id,
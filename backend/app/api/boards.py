@@ -6,12 +6,13 @@ from enum import Enum
 from typing import TYPE_CHECKING, Literal, cast
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
 from sqlalchemy import func
 from sqlmodel import col, select
 
 from app.api.deps import (
     get_board_for_actor_read,
+    get_board_for_user_delete,
     get_board_for_user_read,
     get_board_for_user_write,
     require_org_admin,
@@ -26,14 +27,13 @@ from app.models.agents import Agent
 from app.models.board_groups import BoardGroup
 from app.models.boards import Board
 from app.models.gateways import Gateway
-from app.schemas.boards import BoardCreate, BoardRead, BoardUpdate
-from app.schemas.common import OkResponse
+from app.schemas.boards import BoardCreate, BoardDeletionRead, BoardRead, BoardUpdate
 from app.schemas.pagination import DefaultLimitOffsetPage
 from app.schemas.view_models import BoardGroupSnapshot, BoardSnapshot
 from app.services.activity_log import record_activity
 from app.services.board_group_snapshot import build_board_group_snapshot
-from app.services.board_lifecycle import delete_board as delete_board_service
-from app.services.board_snapshot import build_board_snapshot
+from app.services.board_lifecycle import deletion_status, request_board_deletion
+from app.services.board_snapshot import load_board_snapshot
 from app.services.openclaw.gateway_dispatch import GatewayDispatchService
 from app.services.openclaw.gateway_rpc import GatewayConfig as GatewayClientConfig
 from app.services.openclaw.gateway_rpc import OpenClawGatewayError
@@ -51,12 +51,14 @@ ORG_ADMIN_DEP = Depends(require_org_admin)
 ORG_MEMBER_DEP = Depends(require_org_member)
 BOARD_USER_READ_DEP = Depends(get_board_for_user_read)
 BOARD_USER_WRITE_DEP = Depends(get_board_for_user_write)
+BOARD_USER_DELETE_DEP = Depends(get_board_for_user_delete)
 BOARD_ACTOR_READ_DEP = Depends(get_board_for_actor_read)
 GATEWAY_ID_QUERY = Query(default=None)
 BOARD_GROUP_ID_QUERY = Query(default=None)
 INCLUDE_SELF_QUERY = Query(default=False)
 INCLUDE_DONE_QUERY = Query(default=False)
 PER_BOARD_TASK_LIMIT_QUERY = Query(default=5, ge=0, le=100)
+IF_NONE_MATCH_HEADER = Header(default=None, alias="If-None-Match")
 AGENT_BOARD_ROLE_TAGS = cast("list[str | Enum]", ["agent-lead", "agent-worker"])
 _ERR_GATEWAY_MAIN_AGENT_REQUIRED = (
     "gateway must have a gateway main agent before boards can be created or updated"
@@ -374,7 +376,11 @@ async def list_boards(
     ctx: OrganizationContext = ORG_MEMBER_DEP,
 ) -> LimitOffsetPage[BoardRead]:
     """List boards visible to the current organization member."""
-    statement = select(Board).where(board_access_filter(ctx.member, write=False))
+    statement = (
+        select(Board)
+        .where(board_access_filter(ctx.member, write=False))
+        .where(col(Board.deleting_at).is_(None))
+    )
     if gateway_id is not None:
         statement = statement.where(col(Board.gateway_id) == gateway_id)
     if board_group_id is not None:
@@ -412,9 +418,18 @@ def get_board(
 async def get_board_snapshot(
     board: Board = BOARD_ACTOR_READ_DEP,
     session: AsyncSession = SESSION_DEP,
-) -> BoardSnapshot:
-    """Get a board snapshot view model."""
-    return await build_board_snapshot(session, board)
+    if_none_match: str | None = IF_NONE_MATCH_HEADER,
+) -> Response:
+    """Get a board snapshot view model.
+
+    Responses carry an `ETag`; sending it back in `If-None-Match` returns
+    `304 Not Modified` while the board is unchanged.
+    """
+    snapshot = await load_board_snapshot(session, board)
+    headers = {"ETag": snapshot.etag, "Cache-Control": "no-cache"}
+    if snapshot.matches(if_none_match):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=snapshot.body, media_type="application/json", headers=headers)
 
 
 @router.get(
@@ -486,10 +501,20 @@ async def update_board(
     return updated
 
 
-@router.delete("/{board_id}", response_model=OkResponse)
+@router.delete("/{board_id}", response_model=BoardDeletionRead)
 async def delete_board(
     session: AsyncSession = SESSION_DEP,
-    board: Board = BOARD_USER_WRITE_DEP,
-) -> OkResponse:
-    """Delete a board and all dependent records."""
-    return await delete_board_service(session, board=board)
+    board: Board = BOARD_USER_DELETE_DEP,
+) -> BoardDeletionRead:
+    """Start deleting a board and its dependent records in the background."""
+    return await request_board_deletion(session, board=board)
+
+
+@router.get("/{board_id}/deletion", response_model=BoardDeletionRead)
+def get_board_deletion(
+    board: Board = BOARD_USER_READ_DEP,
+) -> BoardDeletionRead:
+    """Return background deletion progress; 404 once the board is gone."""
+    if board.deleting_at is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    return deletion_status(board)
@@ -125,6 +125,12 @@ async def get_board_or_404(
     return board
 
 
+def _require_board_not_deleting(board: Board) -> None:
+    """Reject writes to a board whose background deletion has started."""
+    if board.deleting_at is not None:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Board is being deleted.")
+
+
 async def get_board_for_actor_read(
     board_id: str,
     session: AsyncSession = SESSION_DEP,
@@ -156,10 +162,11 @@ async def get_board_for_actor_write(
     if actor.actor_type == "agent":
         if actor.agent and actor.agent.board_id and actor.agent.board_id != board.id:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
-        return board
-    if actor.user is None:
+    elif actor.user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
-    await require_board_access(session, user=actor.user, board=board, write=True)
+    else:
+        await require_board_access(session, user=actor.user, board=board, write=True)
+    _require_board_not_deleting(board)
     return board
 
 
@@ -178,12 +185,16 @@ async def get_board_for_user_read(
     return board
 
 
-async def get_board_for_user_write(
+async def get_board_for_user_delete(
     board_id: str,
     session: AsyncSession = SESSION_DEP,
     auth: AuthContext = AUTH_DEP,
 ) -> Board:
-    """Load a board and enforce authenticated-user write access."""
+    """Load a board and enforce authenticated-user write access.
+
+    Unlike `get_board_for_user_write`, boards that are already being deleted are
+    returned, so repeated delete requests stay idempotent.
+    """
     board = await Board.objects.by_id(board_id).first(session)
     if board is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
@@ -193,6 +204,17 @@ async def get_board_for_user_write(
     return board
 
 
+async def get_board_for_user_write(
+    board_id: str,
+    session: AsyncSession = SESSION_DEP,
+    auth: AuthContext = AUTH_DEP,
+) -> Board:
+    """Load a board and enforce authenticated-user write access."""
+    board = await get_board_for_user_delete(board_id, session=session, auth=auth)
+    _require_board_not_deleting(board)
+    return board
+
+
 BOARD_READ_DEP = Depends(get_board_for_actor_read)
 
 
@@ -2,21 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from typing import TypeVar
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import DateTime, case
-from sqlalchemy import cast as sql_cast
 from sqlalchemy import func
 from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.api.deps import require_org_member
 from app.core.time import utcnow
-from app.db.session import get_session
-from app.models.activity_events import ActivityEvent
+from app.db.session import get_session, read_session_maker
 from app.models.agents import Agent
 from app.models.boards import Board
 from app.models.tasks import Task
@@ -32,11 +32,23 @@ from app.schemas.metrics import (
     DashboardWipRangeSeries,
     DashboardWipSeriesSet,
 )
+from app.services.dashboard_metrics_cache import (
+    dashboard_cache_key,
+    get_dashboard_metrics_cache,
+)
+from app.services.dashboard_rollups import (
+    HourlyMetrics,
+    digest_quantile,
+    hour_start,
+    hourly_metrics,
+    merge_metrics,
+)
 from app.services.organizations import OrganizationContext, list_accessible_board_ids
 
 router = APIRouter(prefix="/metrics", tags=["metrics"])
 
-ERROR_EVENT_PATTERN = "%failed"
+T = TypeVar("T")
+
 _RUNTIME_TYPE_REFERENCES = (UUID, AsyncSession)
 RANGE_QUERY = Query(default="24h")
 BOARD_ID_QUERY = Query(default=None)
@@ -161,198 +173,70 @@ def _wip_series_from_mapping(
     )
 
 
-async def _query_throughput(
-    session: AsyncSession,
+def _hourly_buckets(
+    hourly: dict[datetime, HourlyMetrics],
     range_spec: RangeSpec,
-    board_ids: list[UUID],
+) -> dict[datetime, HourlyMetrics]:
+    """Merge the hours inside `range_spec` into its display buckets."""
+    first_hour = hour_start(range_spec.start)
+    buckets: dict[datetime, HourlyMetrics] = {}
+    for hour, values in hourly.items():
+        if first_hour <= hour <= range_spec.end:
+            bucket = _bucket_start(hour, range_spec.bucket)
+            buckets.setdefault(bucket, HourlyMetrics()).merge(values)
+    return buckets
+
+
+def _error_rate(values: HourlyMetrics) -> float:
+    if values.event_count <= 0:
+        return 0.0
+    return (values.error_count / values.event_count) * 100
+
+
+def _throughput_series(
+    range_spec: RangeSpec,
+    buckets: dict[datetime, HourlyMetrics],
 ) -> DashboardRangeSeries:
-    bucket_col = func.date_trunc(range_spec.bucket, Task.updated_at).label("bucket")
-    statement = (
-        select(bucket_col, func.count())
-        .where(col(Task.status) == "review")
-        .where(col(Task.updated_at) >= range_spec.start)
-        .where(col(Task.updated_at) <= range_spec.end)
-    )
-    if not board_ids:
-        return _series_from_mapping(range_spec, {})
-    statement = (
-        statement.where(col(Task.board_id).in_(board_ids)).group_by(bucket_col).order_by(bucket_col)
-    )
-    results = (await session.exec(statement)).all()
-    mapping = {row[0]: float(row[1]) for row in results}
+    mapping = {bucket: float(values.throughput_count) for bucket, values in buckets.items()}
     return _series_from_mapping(range_spec, mapping)
 
 
-async def _query_cycle_time(
-    session: AsyncSession,
+def _cycle_time_series(
     range_spec: RangeSpec,
-    board_ids: list[UUID],
+    buckets: dict[datetime, HourlyMetrics],
 ) -> DashboardRangeSeries:
-    bucket_col = func.date_trunc(range_spec.bucket, Task.updated_at).label("bucket")
-    in_progress = sql_cast(Task.in_progress_at, DateTime)
-    duration_hours = func.extract("epoch", Task.updated_at - in_progress) / 3600.0
-    statement = (
-        select(bucket_col, func.avg(duration_hours))
-        .where(col(Task.status) == "review")
-        .where(col(Task.in_progress_at).is_not(None))
-        .where(col(Task.updated_at) >= range_spec.start)
-        .where(col(Task.updated_at) <= range_spec.end)
-    )
-    if not board_ids:
-        return _series_from_mapping(range_spec, {})
-    statement = (
-        statement.where(col(Task.board_id).in_(board_ids)).group_by(bucket_col).order_by(bucket_col)
-    )
-    results = (await session.exec(statement)).all()
-    mapping = {row[0]: float(row[1] or 0) for row in results}
+    mapping = {
+        bucket: values.cycle_time_sum_hours / values.cycle_time_count
+        for bucket, values in buckets.items()
+        if values.cycle_time_count > 0
+    }
     return _series_from_mapping(range_spec, mapping)
 
 
-async def _query_error_rate(
-    session: AsyncSession,
+def _error_rate_series(
     range_spec: RangeSpec,
-    board_ids: list[UUID],
+    buckets: dict[datetime, HourlyMetrics],
 ) -> DashboardRangeSeries:
-    bucket_col = func.date_trunc(
-        range_spec.bucket,
-        ActivityEvent.created_at,
-    ).label("bucket")
-    error_case = case(
-        (
-            col(ActivityEvent.event_type).like(ERROR_EVENT_PATTERN),
-            1,
-        ),
-        else_=0,
-    )
-    statement = (
-        select(bucket_col, func.sum(error_case), func.count())
-        .join(Task, col(ActivityEvent.task_id) == col(Task.id))
-        .where(col(ActivityEvent.created_at) >= range_spec.start)
-        .where(col(ActivityEvent.created_at) <= range_spec.end)
-    )
-    if not board_ids:
-        return _series_from_mapping(range_spec, {})
-    statement = (
-        statement.where(col(Task.board_id).in_(board_ids)).group_by(bucket_col).order_by(bucket_col)
-    )
-    results = (await session.exec(statement)).all()
-    mapping: dict[datetime, float] = {}
-    for bucket, errors, total in results:
-        total_count = float(total or 0)
-        error_count = float(errors or 0)
-        rate = (error_count / total_count) * 100 if total_count > 0 else 0.0
-        mapping[bucket] = rate
+    mapping = {bucket: _error_rate(values) for bucket, values in buckets.items()}
     return _series_from_mapping(range_spec, mapping)
 
 
-async def _query_wip(
-    session: AsyncSession,
+def _wip_series(
     range_spec: RangeSpec,
-    board_ids: list[UUID],
+    buckets: dict[datetime, HourlyMetrics],
 ) -> DashboardWipRangeSeries:
-    if not board_ids:
-        return _wip_series_from_mapping(range_spec, {})
-
-    inbox_bucket_col = func.date_trunc(range_spec.bucket, Task.created_at).label("inbox_bucket")
-    inbox_statement = (
-        select(inbox_bucket_col, func.count())
-        .where(col(Task.status) == "inbox")
-        .where(col(Task.created_at) >= range_spec.start)
-        .where(col(Task.created_at) <= range_spec.end)
-        .where(col(Task.board_id).in_(board_ids))
-        .group_by(inbox_bucket_col)
-        .order_by(inbox_bucket_col)
-    )
-    inbox_results = (await session.exec(inbox_statement)).all()
-
-    status_bucket_col = func.date_trunc(range_spec.bucket, Task.updated_at).label("status_bucket")
-    progress_case = case((col(Task.status) == "in_progress", 1), else_=0)
-    review_case = case((col(Task.status) == "review", 1), else_=0)
-    done_case = case((col(Task.status) == "done", 1), else_=0)
-    status_statement = (
-        select(
-            status_bucket_col,
-            func.sum(progress_case),
-            func.sum(review_case),
-            func.sum(done_case),
-        )
-        .where(col(Task.updated_at) >= range_spec.start)
-        .where(col(Task.updated_at) <= range_spec.end)
-        .where(col(Task.board_id).in_(board_ids))
-        .group_by(status_bucket_col)
-        .order_by(status_bucket_col)
-    )
-    status_results = (await session.exec(status_statement)).all()
-
-    mapping: dict[datetime, dict[str, int]] = {}
-    for bucket, inbox in inbox_results:
-        values = mapping.setdefault(bucket, {})
-        values["inbox"] = int(inbox or 0)
-    for bucket, in_progress, review, done in status_results:
-        values = mapping.setdefault(bucket, {})
-        values["in_progress"] = int(in_progress or 0)
-        values["review"] = int(review or 0)
-        values["done"] = int(done or 0)
+    mapping = {
+        bucket: {
+            "inbox": values.wip_inbox,
+            "in_progress": values.wip_in_progress,
+            "review": values.wip_review,
+            "done": values.wip_done,
+        }
+        for bucket, values in buckets.items()
+    }
     return _wip_series_from_mapping(range_spec, mapping)
 
 
-async def _median_cycle_time_for_range(
-    session: AsyncSession,
-    range_spec: RangeSpec,
-    board_ids: list[UUID],
-) -> float | None:
-    in_progress = sql_cast(Task.in_progress_at, DateTime)
-    duration_hours = func.extract("epoch", Task.updated_at - in_progress) / 3600.0
-    statement = (
-        select(func.percentile_cont(0.5).within_group(duration_hours))
-        .where(col(Task.status) == "review")
-        .where(col(Task.in_progress_at).is_not(None))
-        .where(col(Task.updated_at) >= range_spec.start)
-        .where(col(Task.updated_at) <= range_spec.end)
-    )
-    if not board_ids:
-        return None
-    statement = statement.where(col(Task.board_id).in_(board_ids))
-    value = (await session.exec(statement)).one_or_none()
-    if value is None:
-        return None
-    if isinstance(value, tuple):
-        value = value[0]
-    if value is None:
-        return None
-    return float(value)
-
-
-async def _error_rate_kpi(
-    session: AsyncSession,
-    range_spec: RangeSpec,
-    board_ids: list[UUID],
-) -> float:
-    error_case = case(
-        (
-            col(ActivityEvent.event_type).like(ERROR_EVENT_PATTERN),
-            1,
-        ),
-        else_=0,
-    )
-    statement = (
-        select(func.sum(error_case), func.count())
-        .join(Task, col(ActivityEvent.task_id) == col(Task.id))
-        .where(col(ActivityEvent.created_at) >= range_spec.start)
-        .where(col(ActivityEvent.created_at) <= range_spec.end)
-    )
-    if not board_ids:
-        return 0.0
-    statement = statement.where(col(Task.board_id).in_(board_ids))
-    result = (await session.exec(statement)).one_or_none()
-    if result is None:
-        return 0.0
-    errors, total = result
-    total_count = float(total or 0)
-    error_count = float(errors or 0)
-    return (error_count / total_count) * 100 if total_count > 0 else 0.0
-
-
 async def _active_agents(
     session: AsyncSession,
     range_spec: RangeSpec,
@@ -419,58 +303,58 @@ async def _resolve_dashboard_board_ids(
     return group_board_ids
 
 
-@router.get("/dashboard", response_model=DashboardMetrics)
-async def dashboard_metrics(
-    range_key: DashboardRangeKey = RANGE_QUERY,
-    board_id: UUID | None = BOARD_ID_QUERY,
-    group_id: UUID | None = GROUP_ID_QUERY,
-    session: AsyncSession = SESSION_DEP,
-    ctx: OrganizationContext = ORG_MEMBER_DEP,
+async def _in_own_session(query: Callable[[AsyncSession], Awaitable[T]]) -> T:
+    """Run `query` on a dedicated pooled session so independent queries overlap."""
+    async with read_session_maker() as session:
+        return await query(session)
+
+
+async def _compute_dashboard_metrics(
+    range_key: DashboardRangeKey,
+    board_ids: list[UUID],
 ) -> DashboardMetrics:
-    """Return dashboard KPIs and time-series data for accessible boards."""
     primary = _resolve_range(range_key)
     comparison = _comparison_range(primary)
-    board_ids = await _resolve_dashboard_board_ids(
-        session,
-        ctx=ctx,
-        board_id=board_id,
-        group_id=group_id,
+
+    # One pass over both windows: rolled-up hours plus a live tail for the open hour.
+    hourly, active_agents, tasks_in_progress = await asyncio.gather(
+        _in_own_session(
+            lambda session: hourly_metrics(
+                session,
+                board_ids,
+                start=comparison.start,
+                end=primary.end,
+            ),
+        ),
+        _in_own_session(lambda session: _active_agents(session, primary, board_ids)),
+        _in_own_session(lambda session: _tasks_in_progress(session, primary, board_ids)),
     )
+    primary_buckets = _hourly_buckets(hourly, primary)
+    comparison_buckets = _hourly_buckets(hourly, comparison)
 
-    throughput_primary = await _query_throughput(session, primary, board_ids)
-    throughput_comparison = await _query_throughput(session, comparison, board_ids)
     throughput = DashboardSeriesSet(
-        primary=throughput_primary,
-        comparison=throughput_comparison,
+        primary=_throughput_series(primary, primary_buckets),
+        comparison=_throughput_series(comparison, comparison_buckets),
     )
-    cycle_time_primary = await _query_cycle_time(session, primary, board_ids)
-    cycle_time_comparison = await _query_cycle_time(session, comparison, board_ids)
     cycle_time = DashboardSeriesSet(
-        primary=cycle_time_primary,
-        comparison=cycle_time_comparison,
+        primary=_cycle_time_series(primary, primary_buckets),
+        comparison=_cycle_time_series(comparison, comparison_buckets),
     )
-    error_rate_primary = await _query_error_rate(session, primary, board_ids)
-    error_rate_comparison = await _query_error_rate(session, comparison, board_ids)
     error_rate = DashboardSeriesSet(
-        primary=error_rate_primary,
-        comparison=error_rate_comparison,
+        primary=_error_rate_series(primary, primary_buckets),
+        comparison=_error_rate_series(comparison, comparison_buckets),
     )
-    wip_primary = await _query_wip(session, primary, board_ids)
-    wip_comparison = await _query_wip(session, comparison, board_ids)
     wip = DashboardWipSeriesSet(
-        primary=wip_primary,
-        comparison=wip_comparison,
+        primary=_wip_series(primary, primary_buckets),
+        comparison=_wip_series(comparison, comparison_buckets),
     )
 
+    primary_totals = merge_metrics(primary_buckets.values())
     kpis = DashboardKpis(
-        active_agents=await _active_agents(session, primary, board_ids),
-        tasks_in_progress=await _tasks_in_progress(session, primary, board_ids),
-        error_rate_pct=await _error_rate_kpi(session, primary, board_ids),
-        median_cycle_time_hours_7d=await _median_cycle_time_for_range(
-            session,
-            primary,
-            board_ids,
-        ),
+        active_agents=active_agents,
+        tasks_in_progress=tasks_in_progress,
+        error_rate_pct=_error_rate(primary_totals),
+        median_cycle_time_hours_7d=digest_quantile(primary_totals.cycle_time_digest, 0.5),
     )
 
     return DashboardMetrics(
@@ -482,3 +366,28 @@ async def dashboard_metrics(
         error_rate=error_rate,
         wip=wip,
     )
+
+
+@router.get("/dashboard", response_model=DashboardMetrics)
+async def dashboard_metrics(
+    range_key: DashboardRangeKey = RANGE_QUERY,
+    board_id: UUID | None = BOARD_ID_QUERY,
+    group_id: UUID | None = GROUP_ID_QUERY,
+    session: AsyncSession = SESSION_DEP,
+    ctx: OrganizationContext = ORG_MEMBER_DEP,
+) -> DashboardMetrics:
+    """Return dashboard KPIs and time-series data for accessible boards.
+
+    Payloads are shared for a few seconds between requests resolving to the
+    same range and board set.
+    """
+    board_ids = await _resolve_dashboard_board_ids(
+        session,
+        ctx=ctx,
+        board_id=board_id,
+        group_id=group_id,
+    )
+    return await get_dashboard_metrics_cache().get_or_compute(
+        dashboard_cache_key(range_key, board_ids),
+        lambda: _compute_dashboard_metrics(range_key, board_ids),
+    )
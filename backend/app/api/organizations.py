@@ -27,6 +27,7 @@ from app.models.board_onboarding import BoardOnboardingSession
 from app.models.board_webhook_payloads import BoardWebhookPayload
 from app.models.board_webhooks import BoardWebhook
 from app.models.boards import Board
+from app.models.dashboard_rollups import BoardMetricsRollup
 from app.models.gateways import Gateway
 from app.models.organization_board_access import OrganizationBoardAccess
 from app.models.organization_invite_board_access import OrganizationInviteBoardAccess
@@ -304,6 +305,12 @@ async def delete_my_org(
         col(BoardWebhook.board_id).in_(board_ids),
         commit=False,
     )
+    await crud.delete_where(
+        session,
+        BoardMetricsRollup,
+        col(BoardMetricsRollup.board_id).in_(board_ids),
+        commit=False,
+    )
     await crud.delete_where(
         session,
         BoardOnboardingSession,
@@ -19,6 +19,7 @@ from app.schemas.control_plane import (
 )
 from app.services.control_plane import (
     eval_summary_for_pack,
+    invalidate_pack_binding_cache,
     latest_non_current_pack_for_binding,
     normalize_scope_ref,
     record_promotion_event,
@@ -140,6 +141,8 @@ async def create_pack(
         )
 
     await session.commit()
+    if payload.set_champion:
+        invalidate_pack_binding_cache(tier=payload.tier, pack_key=payload.pack_key)
     await session.refresh(pack)
     return _pack_read_model(pack)
 
@@ -182,6 +185,8 @@ async def promote_pack(
         session,
         organization_id=ctx.organization.id,
         pack_id=pack.id,
+        window_days=payload.eval_window_days,
+        last_n=payload.eval_last_n,
     )
     champion_summary = None
     if previous_pack_id is not None:
@@ -189,6 +194,8 @@ async def promote_pack(
             session,
             organization_id=ctx.organization.id,
             pack_id=previous_pack_id,
+            window_days=payload.eval_window_days,
+            last_n=payload.eval_last_n,
         )
 
     if not payload.force:
@@ -250,6 +257,7 @@ async def promote_pack(
     )
 
     await session.commit()
+    invalidate_pack_binding_cache(tier=payload.tier, pack_key=payload.pack_key)
     return PackMutationResponse(
         binding_id=binding.id,
         previous_pack_id=previous_pack_id,
@@ -334,6 +342,7 @@ async def rollback_pack(
         metrics={"rolled_back_from": str(pack_id)},
     )
     await session.commit()
+    invalidate_pack_binding_cache(tier=payload.tier, pack_key=payload.pack_key)
 
     return PackMutationResponse(
         binding_id=updated_binding.id,
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from contextlib import contextmanager
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 from uuid import UUID
@@ -14,12 +15,25 @@ from app.core.time import utcnow
 from app.db.session import get_session
 from app.models.boards import Board
 from app.models.run_telemetry import RunTelemetry
-from app.schemas.control_plane import PackResolutionResponse, RuntimeRunIngestRequest, RuntimeRunIngestResponse
+from app.schemas.control_plane import (
+    PackResolutionResponse,
+    RuntimeRunBatchIngestRequest,
+    RuntimeRunBatchIngestResponse,
+    RuntimeRunIngestRequest,
+    RuntimeRunIngestResponse,
+)
 from app.services.control_plane import resolve_pack_binding
-from app.services.deterministic_eval_queue import QueuedDeterministicEval, enqueue_deterministic_eval
+from app.services.deterministic_eval_queue import (
+    QueuedDeterministicEval,
+    QueuedDeterministicEvalBatch,
+    enqueue_deterministic_eval,
+    enqueue_deterministic_eval_batch,
+)
 from app.services.organizations import OrganizationContext, ensure_member_for_user, require_board_access
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from sqlmodel.ext.asyncio.session import AsyncSession
 
     from app.api.deps import ActorContext
@@ -80,6 +94,52 @@ async def _runtime_scope(
     return member.organization_id, None, actor.user.id
 
 
+def _run_from_payload(
+    payload: RuntimeRunIngestRequest,
+    *,
+    actor: ActorContext,
+    organization_id: UUID,
+    board_id: UUID | None,
+    user_id: UUID | None,
+    pack_id: UUID | None,
+) -> RunTelemetry:
+    return RunTelemetry(
+        organization_id=organization_id,
+        board_id=board_id,
+        user_id=user_id,
+        agent_id=(actor.agent.id if actor.actor_type == "agent" and actor.agent else None),
+        task_id=payload.task_id,
+        pack_id=pack_id,
+        pack_key=payload.pack_key,
+        tier=payload.tier,
+        domain=(payload.domain or "").strip(),
+        run_ref=(payload.run_ref or "").strip(),
+        success_bool=payload.success_bool,
+        retries=payload.retries,
+        latency_ms=payload.latency_ms,
+        format_contract_passed=payload.format_contract_passed,
+        approval_gate_passed=payload.approval_gate_passed,
+        checks=dict(payload.checks),
+        run_metadata=dict(payload.metadata),
+        created_at=utcnow(),
+    )
+
+
+@contextmanager
+def _batch_item_errors(index: int) -> Iterator[None]:
+    """Tag HTTP errors raised while handling one batch item with its request index."""
+    try:
+        yield
+    except HTTPException as exc:
+        detail = exc.detail
+        tagged = (
+            {**detail, "index": index}
+            if isinstance(detail, dict)
+            else {"message": detail, "index": index}
+        )
+        raise HTTPException(status_code=exc.status_code, detail=tagged) from exc
+
+
 @router.post("/runs", response_model=RuntimeRunIngestResponse)
 async def ingest_runtime_run(
     payload: RuntimeRunIngestRequest,
@@ -106,25 +166,13 @@ async def ingest_runtime_run(
         if resolved is not None:
             resolved_pack_id = resolved.pack.id
 
-    run = RunTelemetry(
+    run = _run_from_payload(
+        payload,
+        actor=actor,
         organization_id=organization_id,
         board_id=effective_board_id,
         user_id=user_id,
-        agent_id=(actor.agent.id if actor.actor_type == "agent" and actor.agent else None),
-        task_id=payload.task_id,
         pack_id=resolved_pack_id,
-        pack_key=payload.pack_key,
-        tier=payload.tier,
-        domain=(payload.domain or "").strip(),
-        run_ref=(payload.run_ref or "").strip(),
-        success_bool=payload.success_bool,
-        retries=payload.retries,
-        latency_ms=payload.latency_ms,
-        format_contract_passed=payload.format_contract_passed,
-        approval_gate_passed=payload.approval_gate_passed,
-        checks=dict(payload.checks),
-        run_metadata=dict(payload.metadata),
-        created_at=utcnow(),
     )
     session.add(run)
     await session.commit()
@@ -139,6 +187,70 @@ async def ingest_runtime_run(
     return RuntimeRunIngestResponse(run_id=run.id, queued_for_eval=queued)
 
 
+@router.post("/runs/batch", response_model=RuntimeRunBatchIngestResponse)
+async def ingest_runtime_runs(
+    payload: RuntimeRunBatchIngestRequest,
+    session: AsyncSession = SESSION_DEP,
+    actor: ActorContext = ACTOR_DEP,
+) -> RuntimeRunBatchIngestResponse:
+    """Ingest many runtime telemetry runs and enqueue one evaluation job for them.
+
+    Scope and pack bindings are resolved once per distinct board and pack key.
+    Errors for a specific item carry its `index` in the detail and nothing is
+    written.
+    """
+    scopes: dict[UUID | None, tuple[UUID, UUID | None, UUID | None]] = {}
+    pack_ids: dict[tuple[UUID, UUID | None, str, str, str], UUID | None] = {}
+    runs: list[RunTelemetry] = []
+    for index, item in enumerate(payload.items):
+        with _batch_item_errors(index):
+            if item.board_id not in scopes:
+                scopes[item.board_id] = await _runtime_scope(
+                    session=session,
+                    actor=actor,
+                    board_id=item.board_id,
+                )
+        organization_id, effective_board_id, user_id = scopes[item.board_id]
+
+        resolved_pack_id = item.pack_id
+        if resolved_pack_id is None:
+            domain = (item.domain or "").strip()
+            binding_key = (organization_id, user_id, domain, item.tier, item.pack_key)
+            if binding_key not in pack_ids:
+                resolved = await resolve_pack_binding(
+                    session,
+                    organization_id=organization_id,
+                    user_id=user_id,
+                    domain=domain,
+                    tier=item.tier,
+                    pack_key=item.pack_key,
+                )
+                pack_ids[binding_key] = resolved.pack.id if resolved is not None else None
+            resolved_pack_id = pack_ids[binding_key]
+
+        runs.append(
+            _run_from_payload(
+                item,
+                actor=actor,
+                organization_id=organization_id,
+                board_id=effective_board_id,
+                user_id=user_id,
+                pack_id=resolved_pack_id,
+            ),
+        )
+    session.add_all(runs)
+    await session.commit()
+
+    run_ids = [run.id for run in runs]
+    queued = enqueue_deterministic_eval_batch(
+        QueuedDeterministicEvalBatch(
+            run_telemetry_ids=tuple(run_ids),
+            queued_at=datetime.now(UTC),
+        ),
+    )
+    return RuntimeRunBatchIngestResponse(run_ids=run_ids, queued_for_eval=queued)
+
+
 @router.get("/packs/resolve", response_model=PackResolutionResponse)
 async def resolve_runtime_pack(
     board_id: UUID | None = None,
@@ -13,6 +13,7 @@ from sqlmodel import Field, SQLModel, col, select
 from app.api.deps import require_admin_or_agent, require_org_admin
 from app.core.config import settings
 from app.core.time import utcnow
+from app.db.pools import pool_telemetry
 from app.db.session import get_session
 from app.models.boards import Board
 from app.models.gsd_runs import GSDRun
@@ -129,6 +130,30 @@ class RuntimeControlPlaneStatusRead(SQLModel):
     )
 
 
+class RuntimeDbPoolRead(SQLModel):
+    """Occupancy and checkout statistics for one workload connection pool."""
+
+    workload: str
+    pool_size: int
+    max_overflow: int
+    checked_out: int
+    checked_in: int
+    overflow: int
+    checkouts: int
+    overflow_checkouts: int
+    timeouts: int
+    wait_avg_ms: float | None = None
+    wait_p95_ms: float | None = None
+    wait_max_ms: float
+
+
+class RuntimeDbPoolsRead(SQLModel):
+    """Connection pool telemetry for the serving API process."""
+
+    checked_at: datetime
+    pools: list[RuntimeDbPoolRead]
+
+
 def _collect_route_paths(request: Request) -> set[str]:
     return {
         str(route.path)
@@ -234,6 +259,17 @@ async def runtime_disk_guard(
     )
 
 
+@router.get("/db-pools", response_model=RuntimeDbPoolsRead)
+async def runtime_db_pools(
+    _actor: object = ACTOR_DEP,
+) -> RuntimeDbPoolsRead:
+    """Return per-workload connection pool occupancy, waits, and timeouts."""
+    return RuntimeDbPoolsRead(
+        checked_at=utcnow(),
+        pools=[RuntimeDbPoolRead(**vars(row)) for row in pool_telemetry()],
+    )
+
+
 @router.get("/control-plane-status", response_model=RuntimeControlPlaneStatusRead)
 async def runtime_control_plane_status(
     request: Request,
@@ -0,0 +1,453 @@
+"""Multiplexed WebSocket endpoint for board stream subscriptions.
+
+A single connection can subscribe to several (stream, board) channels that are
+otherwise served by one SSE route each: tasks, board memory, group memory,
+approvals and agents. Subscriptions reuse the SSE poll helpers and the shared
+replay buffer, so event ids are interchangeable with the SSE routes and
+`last_event_id` resumes work the same way.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect, status
+from pydantic import ValidationError
+from starlette.requests import Request
+
+from app.api import approvals as approvals_api
+from app.api import board_group_memory as board_group_memory_api
+from app.api import board_memory as board_memory_api
+from app.api import tasks as tasks_api
+from app.api.deps import (
+    ActorContext,
+    get_board_for_actor_read,
+    require_admin_or_agent,
+    require_org_admin,
+    require_org_member,
+)
+from app.core.agent_auth import get_agent_auth_context_optional
+from app.core.auth import AuthContext, get_auth_context_optional
+from app.core.logging import get_logger
+from app.core.time import utcnow
+from app.db.session import async_session_maker, stream_session_maker
+from app.schemas.streams import StreamControlMessage, StreamName
+from app.services.openclaw.policies import OpenClawAuthorizationPolicy
+from app.services.openclaw.provisioning_db import AgentLifecycleService
+from app.services.organizations import list_accessible_board_ids
+from app.services.sse_replay import ReplayCursor, get_replay_buffer
+
+if TYPE_CHECKING:
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+    from app.services.sse_replay import ReplayChannel
+
+router = APIRouter(prefix="/streams", tags=["streams"])
+logger = get_logger(__name__)
+
+STREAM_POLL_SECONDS = 2
+AUTH_TIMEOUT_SECONDS = 10
+MAX_SUBSCRIPTIONS = 50
+_RUNTIME_TYPE_REFERENCES = (UUID,)
+
+SubscriptionKey = tuple[str, UUID | None, bool | None]
+
+
+def _parse_since(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    normalized = value.strip()
+    if not normalized:
+        return None
+    normalized = normalized.replace("Z", "+00:00")
+    try:
+        parsed = datetime.fromisoformat(normalized)
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        return parsed.astimezone(UTC).replace(tzinfo=None)
+    return parsed
+
+
+@dataclass
+class StreamSubscription:
+    """One (stream, board) channel subscribed on a WebSocket connection."""
+
+    stream: StreamName
+    board_id: UUID | None
+    is_chat: bool | None
+    cursor: ReplayCursor
+    group_id: UUID | None = None
+    allowed_board_ids: set[UUID] = field(default_factory=set)
+
+    @property
+    def key(self) -> SubscriptionKey:
+        """Return the identity used to deduplicate and unsubscribe channels."""
+        return (self.stream, self.board_id, self.is_chat)
+
+    def channels(self) -> list[ReplayChannel]:
+        """Return the replay buffer channels backing this subscription."""
+        if self.stream == "tasks" and self.board_id is not None:
+            return [tasks_api.task_stream_channel(self.board_id)]
+        if self.stream == "board_memory" and self.board_id is not None:
+            return [board_memory_api.memory_stream_channel(self.board_id, self.is_chat)]
+        if self.stream == "approvals" and self.board_id is not None:
+            return [approvals_api.approval_stream_channel(self.board_id)]
+        if self.stream == "group_memory" and self.group_id is not None:
+            return [board_group_memory_api.memory_stream_channel(self.group_id, self.is_chat)]
+        if self.stream == "agents":
+            board_ids = (
+                [self.board_id] if self.board_id is not None else sorted(self.allowed_board_ids)
+            )
+            return [AgentLifecycleService.agent_stream_channel(value) for value in board_ids]
+        return []
+
+    async def poll(self, session: AsyncSession) -> list[dict[str, str]]:
+        """Fetch undelivered messages for this subscription."""
+        if self.stream == "tasks" and self.board_id is not None:
+            return await tasks_api.poll_task_stream(
+                session,
+                board_id=self.board_id,
+                cursor=self.cursor,
+            )
+        if self.stream == "board_memory" and self.board_id is not None:
+            return await board_memory_api.poll_memory_stream(
+                session,
+                board_id=self.board_id,
+                is_chat=self.is_chat,
+                cursor=self.cursor,
+            )
+        if self.stream == "approvals" and self.board_id is not None:
+            return await approvals_api.poll_approval_stream(
+                session,
+                board_id=self.board_id,
+                cursor=self.cursor,
+            )
+        if self.stream == "group_memory" and self.group_id is not None:
+            return await board_group_memory_api.poll_memory_stream(
+                session,
+                group_id=self.group_id,
+                is_chat=self.is_chat,
+                cursor=self.cursor,
+            )
+        if self.stream == "agents":
+            return await AgentLifecycleService(session).poll_agent_stream(
+                board_id=self.board_id,
+                allowed_ids=self.allowed_board_ids,
+                cursor=self.cursor,
+            )
+        return []
+
+
+@dataclass
+class StreamActor:
+    """Authenticated caller of the stream WebSocket."""
+
+    actor: ActorContext
+    auth: AuthContext | None = None
+
+
+def _handshake_request(
+    websocket: WebSocket,
+    *,
+    token: str | None = None,
+    agent_token: str | None = None,
+) -> Request:
+    headers = list(websocket.scope.get("headers", []))
+    if token or agent_token:
+        headers = [
+            (name, value)
+            for name, value in headers
+            if name.lower() not in {b"authorization", b"x-agent-token"}
+        ]
+    if token:
+        headers.append((b"authorization", f"Bearer {token}".encode()))
+    if agent_token:
+        headers.append((b"x-agent-token", agent_token.encode()))
+    return Request({**websocket.scope, "type": "http", "method": "GET", "headers": headers})
+
+
+async def resolve_stream_actor(session: AsyncSession, request: Request) -> StreamActor:
+    """Resolve the WebSocket caller the same way `require_admin_or_agent` does."""
+    auth = await get_auth_context_optional(request=request, credentials=None, session=session)
+    agent_auth = None
+    if auth is None:
+        agent_auth = await get_agent_auth_context_optional(
+            request=request,
+            agent_token=request.headers.get("X-Agent-Token"),
+            authorization=request.headers.get("Authorization"),
+            session=session,
+        )
+    actor = require_admin_or_agent(auth=auth, agent_auth=agent_auth)
+    return StreamActor(actor=actor, auth=auth)
+
+
+async def authorize_subscription(
+    session: AsyncSession,
+    *,
+    caller: StreamActor,
+    message: StreamControlMessage,
+) -> StreamSubscription:
+    """Apply the access checks of the matching SSE route and build a subscription."""
+    if message.stream is None:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail="stream is required",
+        )
+    since = _parse_since(message.since) or utcnow()
+    if message.stream == "tasks":
+        cursor = tasks_api.task_stream_cursor(
+            last_event_id=message.last_event_id,
+            since=since,
+            delta=message.delta,
+        )
+    else:
+        cursor = ReplayCursor(
+            get_replay_buffer(),
+            last_event_id=message.last_event_id,
+            since=since,
+        )
+    subscription = StreamSubscription(
+        stream=message.stream,
+        board_id=message.board_id,
+        is_chat=message.is_chat,
+        cursor=cursor,
+    )
+    if message.stream == "agents":
+        if caller.auth is None:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
+        ctx = await require_org_admin(await require_org_member(caller.auth, session))
+        board_ids = await list_accessible_board_ids(session, member=ctx.member, write=False)
+        subscription.allowed_board_ids = set(board_ids)
+        if message.board_id is not None:
+            OpenClawAuthorizationPolicy.require_board_write_access(
+                allowed=message.board_id in subscription.allowed_board_ids,
+            )
+        return subscription
+    if message.board_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail="board_id is required",
+        )
+    board = await get_board_for_actor_read(str(message.board_id), session, caller.actor)
+    subscription.group_id = board.board_group_id
+    return subscription
+
+
+def event_frame(subscription: StreamSubscription, message: dict[str, str]) -> str:
+    """Wrap an SSE-style message in a WebSocket event frame.
+
+    `data` is already serialized JSON shared across connections, so it is
+    spliced into the frame instead of being decoded and re-encoded.
+    """
+    header = json.dumps(
+        {
+            "type": "event",
+            "stream": subscription.stream,
+            "board_id": str(subscription.board_id) if subscription.board_id else None,
+            "is_chat": subscription.is_chat,
+            "id": message.get("id"),
+            "event": message.get("event"),
+        },
+    )
+    return f'{header[:-1]}, "data": {message["data"]}}}'
+
+
+class StreamConnection:
+    """Subscription state and control-message handling for one WebSocket."""
+
+    def __init__(self, websocket: WebSocket, caller: StreamActor) -> None:
+        self.websocket = websocket
+        self.caller = caller
+        self.subscriptions: dict[SubscriptionKey, StreamSubscription] = {}
+        self._send_lock = asyncio.Lock()
+
+    async def send(self, frame: dict[str, object] | str) -> None:
+        """Send one frame; concurrent senders are serialized."""
+        text = frame if isinstance(frame, str) else json.dumps(frame, default=str)
+        async with self._send_lock:
+            await self.websocket.send_text(text)
+
+    async def send_error(self, status_code: int, detail: object, **extra: object) -> None:
+        """Send an error frame without closing the connection."""
+        await self.send({"type": "error", "status": status_code, "detail": detail, **extra})
+
+    async def send_messages(
+        self,
+        subscription: StreamSubscription,
+        messages: list[dict[str, str]],
+    ) -> None:
+        """Forward SSE-style messages for one subscription."""
+        for message in messages:
+            await self.send(event_frame(subscription, message))
+
+    async def handle(self, raw: str) -> None:
+        """Apply one client control message."""
+        try:
+            message = StreamControlMessage.model_validate_json(raw)
+        except ValidationError as exc:
+            await self.send_error(
+                status.HTTP_422_UNPROCESSABLE_CONTENT,
+                exc.errors(include_url=False, include_context=False),
+            )
+            return
+        if message.action == "subscribe":
+            await self.subscribe(message)
+        elif message.action == "unsubscribe":
+            await self.unsubscribe(message)
+        else:
+            await self.send_error(status.HTTP_400_BAD_REQUEST, "already authenticated")
+
+    async def subscribe(self, message: StreamControlMessage) -> None:
+        """Authorize and register a subscription, replaying buffered messages."""
+        key: SubscriptionKey = (message.stream or "", message.board_id, message.is_chat)
+        if key not in self.subscriptions and len(self.subscriptions) >= MAX_SUBSCRIPTIONS:
+            await self.send_error(
+                status.HTTP_429_TOO_MANY_REQUESTS,
+                f"at most {MAX_SUBSCRIPTIONS} subscriptions per connection",
+                stream=message.stream,
+                board_id=message.board_id,
+            )
+            return
+        try:
+            async with async_session_maker() as session:
+                subscription = await authorize_subscription(
+                    session,
+                    caller=self.caller,
+                    message=message,
+                )
+        except HTTPException as exc:
+            await self.send_error(
+                exc.status_code,
+                exc.detail,
+                stream=message.stream,
+                board_id=message.board_id,
+            )
+            return
+        self.subscriptions[subscription.key] = subscription
+        await self.send(
+            {
+                "type": "subscribed",
+                "stream": subscription.stream,
+                "board_id": subscription.board_id,
+                "is_chat": subscription.is_chat,
+            },
+        )
+        await self.send_messages(
+            subscription,
+            subscription.cursor.resume(subscription.channels()),
+        )
+
+    async def unsubscribe(self, message: StreamControlMessage) -> None:
+        """Drop a subscription; unknown channels are acknowledged as well."""
+        key: SubscriptionKey = (message.stream or "", message.board_id, message.is_chat)
+        self.subscriptions.pop(key, None)
+        await self.send(
+            {
+                "type": "unsubscribed",
+                "stream": message.stream,
+                "board_id": message.board_id,
+                "is_chat": message.is_chat,
+            },
+        )
+
+    async def poll_once(self) -> None:
+        """Poll every subscription on one pooled session and forward new messages."""
+        subscriptions = list(self.subscriptions.values())
+        if not subscriptions:
+            return
+        async with stream_session_maker() as session:
+            for subscription in subscriptions:
+                messages = await subscription.poll(session)
+                if self.subscriptions.get(subscription.key) is subscription:
+                    await self.send_messages(subscription, messages)
+
+    async def read_loop(self) -> None:
+        """Apply control messages until the client disconnects."""
+        while True:
+            await self.handle(await self.websocket.receive_text())
+
+    async def poll_loop(self) -> None:
+        """Poll subscribed channels at the SSE poll interval."""
+        while True:
+            await self.poll_once()
+            await asyncio.sleep(STREAM_POLL_SECONDS)
+
+    async def run(self) -> None:
+        """Serve the connection until the client disconnects."""
+        reader = asyncio.create_task(self.read_loop())
+        poller = asyncio.create_task(self.poll_loop())
+        try:
+            done, _pending = await asyncio.wait(
+                {reader, poller},
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            for task in done:
+                task.result()
+        finally:
+            for task in (reader, poller):
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError, WebSocketDisconnect):
+                    await task
+
+
+async def _authenticate(websocket: WebSocket) -> StreamActor | None:
+    """Authenticate from handshake headers, falling back to an `auth` message."""
+    try:
+        async with async_session_maker() as session:
+            return await resolve_stream_actor(session, _handshake_request(websocket))
+    except HTTPException:
+        pass
+    try:
+        raw = await asyncio.wait_for(websocket.receive_text(), timeout=AUTH_TIMEOUT_SECONDS)
+        message = StreamControlMessage.model_validate_json(raw)
+    except (TimeoutError, ValidationError, WebSocketDisconnect):
+        return None
+    if message.action != "auth":
+        return None
+    try:
+        async with async_session_maker() as session:
+            return await resolve_stream_actor(
+                session,
+                _handshake_request(
+                    websocket,
+                    token=message.token,
+                    agent_token=message.agent_token,
+                ),
+            )
+    except HTTPException:
+        return None
+
+
+@router.websocket("/ws")
+async def stream_websocket(websocket: WebSocket) -> None:
+    """Serve multiplexed stream subscriptions over one WebSocket connection.
+
+    Clients authenticate with the same headers as the SSE routes, or with an
+    initial `{"action": "auth", ...}` message, then send `subscribe` and
+    `unsubscribe` control messages. Server frames are typed `subscribed`,
+    `unsubscribed`, `event` and `error`.
+    """
+    await websocket.accept()
+    caller = await _authenticate(websocket)
+    if caller is None:
+        with contextlib.suppress(WebSocketDisconnect, RuntimeError):
+            await websocket.send_text(
+                json.dumps({"type": "error", "status": status.HTTP_401_UNAUTHORIZED}),
+            )
+            await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    await websocket.send_text(json.dumps({"type": "ready"}))
+    connection = StreamConnection(websocket, caller)
+    with contextlib.suppress(WebSocketDisconnect):
+        await connection.run()
+    logger.debug(
+        "streams.ws.closed subscriptions=%s",
+        len(connection.subscriptions),
+    )
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
-from collections import deque
+from collections import OrderedDict, defaultdict
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, cast
@@ -27,7 +29,8 @@ from app.core.config import settings
 from app.core.time import utcnow
 from app.db import crud
 from app.db.pagination import paginate
-from app.db.session import async_session_maker, get_session
+from app.db.query_stats import query_stats_scope
+from app.db.session import get_session, stream_session_maker
 from app.models.activity_events import ActivityEvent
 from app.models.agents import Agent
 from app.models.approval_task_links import ApprovalTaskLink
@@ -54,6 +57,9 @@ from app.schemas.task_custom_fields import (
 )
 from app.schemas.tasks import (
     ArenaConfig,
+    TaskBulkCreate,
+    TaskBulkRead,
+    TaskBulkUpdate,
     TaskCommentCreate,
     TaskCommentRead,
     TaskCreate,
@@ -62,6 +68,7 @@ from app.schemas.tasks import (
     TaskNotebookQueryRead,
     TaskRead,
     TaskUpdate,
+    TaskVersionedRead,
 )
 from app.services.activity_log import record_activity
 from app.services.approval_task_links import (
@@ -75,6 +82,13 @@ from app.services.openclaw.gateway_dispatch import GatewayDispatchService
 from app.services.openclaw.gateway_rpc import GatewayConfig as GatewayClientConfig
 from app.services.openclaw.gateway_rpc import OpenClawGatewayError
 from app.services.organizations import require_board_access
+from app.services.sse_replay import (
+    LAST_EVENT_ID_HEADER,
+    ReplayChannel,
+    ReplayCursor,
+    ReplayEntry,
+    get_replay_buffer,
+)
 from app.services.task_gsd_policy import validate_transition
 from app.services.task_mode_queue import QueuedTaskModeExecution, enqueue_task_mode_execution
 from app.services.tags import (
@@ -90,10 +104,11 @@ from app.services.task_dependencies import (
     dependent_task_ids,
     replace_task_dependencies,
     validate_dependency_update,
+    validate_new_task_dependencies,
 )
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Sequence
+    from collections.abc import AsyncIterator, Callable, Iterator, Mapping, Sequence
 
     from fastapi_pagination.limit_offset import LimitOffsetPage
     from sqlmodel.ext.asyncio.session import AsyncSession
@@ -111,14 +126,17 @@ TASK_EVENT_TYPES = {
     "task.status_changed",
     "task.comment",
 }
-SSE_SEEN_MAX = 2000
 TASK_SNIPPET_MAX_LEN = 500
 TASK_SNIPPET_TRUNCATED_LEN = 497
 TASK_EVENT_ROW_LEN = 2
+TASK_VERSION_LEDGER_MAX = 10_000
+TASK_RESYNC_MAX_IDS = 200
 BOARD_READ_DEP = Depends(get_board_for_actor_read)
 ACTOR_DEP = Depends(require_admin_or_agent)
 SINCE_QUERY = Query(default=None)
 STATUS_QUERY = Query(default=None, alias="status")
+DELTA_QUERY = Query(default=False)
+RESYNC_TASK_IDS_QUERY = Query(alias="task_id")
 BOARD_WRITE_DEP = Depends(get_board_for_user_write)
 SESSION_DEP = Depends(get_session)
 ADMIN_AUTH_DEP = Depends(require_admin_auth)
@@ -201,6 +219,21 @@ def _blocked_task_error(blocked_by_task_ids: Sequence[UUID]) -> HTTPException:
     )
 
 
+@contextmanager
+def _bulk_item_errors(index: int) -> Iterator[None]:
+    """Tag HTTP errors raised while handling one bulk item with its request index."""
+    try:
+        yield
+    except HTTPException as exc:
+        detail = exc.detail
+        tagged = (
+            {**detail, "index": index}
+            if isinstance(detail, dict)
+            else {"message": detail, "index": index}
+        )
+        raise HTTPException(status_code=exc.status_code, detail=tagged) from exc
+
+
 def _approval_required_for_done_error() -> HTTPException:
     return HTTPException(
         status_code=status.HTTP_409_CONFLICT,
@@ -873,6 +906,156 @@ async def _notify_lead_on_task_unassigned(
         await session.commit()
 
 
+def _task_digest_lines(tasks: Sequence[Task]) -> list[str]:
+    return [f"- {task.title} (Task ID: {task.id}, Status: {task.status})" for task in tasks]
+
+
+async def _notify_lead_on_bulk_task_changes(
+    *,
+    session: AsyncSession,
+    dispatch: GatewayDispatchService,
+    config: GatewayClientConfig,
+    board: Board,
+    created: Sequence[Task],
+    unassigned: Sequence[Task],
+) -> None:
+    lead = (
+        await Agent.objects.filter_by(board_id=board.id)
+        .filter(col(Agent.is_board_lead).is_(True))
+        .first(session)
+    )
+    if lead is None or not lead.openclaw_session_id:
+        return
+    sections = [f"Board: {board.name}"]
+    if created:
+        sections.append(
+            f"NEW TASKS ADDED ({len(created)})\n" + "\n".join(_task_digest_lines(created)),
+        )
+    if unassigned:
+        sections.append(
+            f"TASKS BACK IN INBOX ({len(unassigned)})\n"
+            + "\n".join(_task_digest_lines(unassigned)),
+        )
+    message = (
+        "\n\n".join(sections)
+        + "\n\nTake action: triage, assign new owners, or plan next steps."
+    )
+    error = await _send_lead_task_message(
+        dispatch=dispatch,
+        session_key=lead.openclaw_session_id,
+        config=config,
+        message=message,
+    )
+    for task in created:
+        record_activity(
+            session,
+            event_type="task.lead_notified" if error is None else "task.lead_notify_failed",
+            message=(
+                f"Lead agent notified for task: {task.title}."
+                if error is None
+                else f"Lead notify failed: {error}"
+            ),
+            agent_id=lead.id,
+            task_id=task.id,
+        )
+    for task in unassigned:
+        record_activity(
+            session,
+            event_type=(
+                "task.lead_unassigned_notified"
+                if error is None
+                else "task.lead_unassigned_notify_failed"
+            ),
+            message=(
+                f"Lead notified task returned to inbox: {task.title}."
+                if error is None
+                else f"Lead notify failed: {error}"
+            ),
+            agent_id=lead.id,
+            task_id=task.id,
+        )
+
+
+async def _notify_agents_on_bulk_assign(
+    *,
+    session: AsyncSession,
+    dispatch: GatewayDispatchService,
+    config: GatewayClientConfig,
+    board: Board,
+    assigned_by_agent_id: Mapping[UUID, Sequence[Task]],
+) -> None:
+    agents = await Agent.objects.filter(col(Agent.id).in_(list(assigned_by_agent_id))).all(
+        session,
+    )
+    for agent in agents:
+        tasks = assigned_by_agent_id[agent.id]
+        if not agent.openclaw_session_id or not tasks:
+            continue
+        message = (
+            f"TASKS ASSIGNED ({len(tasks)})\n"
+            + f"Board: {board.name}\n"
+            + "\n".join(_task_digest_lines(tasks))
+            + "\n\nTake action: open the tasks and begin work. Post updates as task comments."
+        )
+        error = await _send_agent_task_message(
+            dispatch=dispatch,
+            session_key=agent.openclaw_session_id,
+            config=config,
+            agent_name=agent.name,
+            message=message,
+        )
+        for task in tasks:
+            record_activity(
+                session,
+                event_type=(
+                    "task.assignee_notified" if error is None else "task.assignee_notify_failed"
+                ),
+                message=(
+                    f"Agent notified for assignment: {agent.name}."
+                    if error is None
+                    else f"Assignee notify failed: {error}"
+                ),
+                agent_id=agent.id,
+                task_id=task.id,
+            )
+
+
+async def _notify_bulk_task_changes(
+    *,
+    session: AsyncSession,
+    board: Board,
+    created: Sequence[Task] = (),
+    unassigned: Sequence[Task] = (),
+    assigned_by_agent_id: Mapping[UUID, Sequence[Task]] | None = None,
+) -> None:
+    """Send one consolidated gateway message per notified agent for a bulk write."""
+    assigned_by_agent_id = assigned_by_agent_id or {}
+    if not created and not unassigned and not assigned_by_agent_id:
+        return
+    dispatch = GatewayDispatchService(session)
+    config = await dispatch.optional_gateway_config_for_board(board)
+    if config is None:
+        return
+    if created or unassigned:
+        await _notify_lead_on_bulk_task_changes(
+            session=session,
+            dispatch=dispatch,
+            config=config,
+            board=board,
+            created=created,
+            unassigned=unassigned,
+        )
+    if assigned_by_agent_id:
+        await _notify_agents_on_bulk_assign(
+            session=session,
+            dispatch=dispatch,
+            config=config,
+            board=board,
+            assigned_by_agent_id=assigned_by_agent_id,
+        )
+    await session.commit()
+
+
 def _status_values(status_filter: str | None) -> list[str]:
     if not status_filter:
         return []
@@ -1006,17 +1189,11 @@ async def _task_custom_field_rows_by_definition_id(
     return {row.task_custom_field_definition_id: row for row in rows}
 
 
-async def _set_task_custom_field_values_for_create(
-    session: AsyncSession,
+def _effective_create_custom_field_values(
     *,
-    board_id: UUID,
-    task_id: UUID,
     custom_field_values: TaskCustomFieldValues,
-) -> None:
-    definitions_by_key = await _organization_custom_field_definitions_for_board(
-        session,
-        board_id=board_id,
-    )
+    definitions_by_key: dict[str, _BoardCustomFieldDefinition],
+) -> TaskCustomFieldValues:
     _reject_unknown_custom_field_keys(
         custom_field_values=custom_field_values,
         definitions_by_key=definitions_by_key,
@@ -1037,7 +1214,16 @@ async def _set_task_custom_field_values_for_create(
         effective_values=effective_values,
         definitions_by_key=definitions_by_key,
     )
+    return effective_values
+
 
+def _add_task_custom_field_values(
+    session: AsyncSession,
+    *,
+    task_id: UUID,
+    effective_values: TaskCustomFieldValues,
+    definitions_by_key: dict[str, _BoardCustomFieldDefinition],
+) -> None:
     for field_key, definition in definitions_by_key.items():
         value = effective_values.get(field_key)
         if value is None:
@@ -1051,6 +1237,28 @@ async def _set_task_custom_field_values_for_create(
         )
 
 
+async def _set_task_custom_field_values_for_create(
+    session: AsyncSession,
+    *,
+    board_id: UUID,
+    task_id: UUID,
+    custom_field_values: TaskCustomFieldValues,
+) -> None:
+    definitions_by_key = await _organization_custom_field_definitions_for_board(
+        session,
+        board_id=board_id,
+    )
+    _add_task_custom_field_values(
+        session,
+        task_id=task_id,
+        effective_values=_effective_create_custom_field_values(
+            custom_field_values=custom_field_values,
+            definitions_by_key=definitions_by_key,
+        ),
+        definitions_by_key=definitions_by_key,
+    )
+
+
 async def _set_task_custom_field_values_for_update(
     session: AsyncSession,
     *,
@@ -1281,6 +1489,62 @@ async def _stream_task_state(
     return deps_map, dep_status, tag_state_by_task_id, custom_field_values_by_task_id
 
 
+# TaskRead fields that come from related rows rather than the task row itself.
+_TASK_READ_RELATED_FIELDS = frozenset(
+    {
+        "depends_on_task_ids",
+        "tag_ids",
+        "tags",
+        "blocked_by_task_ids",
+        "is_blocked",
+        "custom_field_values",
+    },
+)
+_TASK_READ_COLUMN_FIELDS = tuple(
+    name for name in TaskRead.model_fields if name not in _TASK_READ_RELATED_FIELDS
+)
+
+
+def _task_row_key(task: Task) -> tuple[object, ...]:
+    return tuple(
+        json.dumps(value, sort_keys=True) if isinstance(value, dict | list) else value
+        for value in (getattr(task, name) for name in _TASK_READ_COLUMN_FIELDS)
+    )
+
+
+class _TaskReadColumnsCache:
+    """Serialized TaskRead columns of each task, reused while its row is unchanged.
+
+    Several events (and stream connections) usually carry the same task state,
+    so only a changed row pays for TaskRead validation and serialization.
+    """
+
+    def __init__(self, *, max_entries: int) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[UUID, tuple[tuple[object, ...], dict[str, object]]] = (
+            OrderedDict()
+        )
+
+    def columns(self, task: Task) -> dict[str, object]:
+        row_key = _task_row_key(task)
+        cached = self._entries.pop(task.id, None)
+        if cached is None or cached[0] != row_key:
+            cached = (
+                row_key,
+                TaskRead.model_validate(task, from_attributes=True).model_dump(
+                    mode="json",
+                    exclude=set(_TASK_READ_RELATED_FIELDS),
+                ),
+            )
+        self._entries[task.id] = cached
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        return cached[1]
+
+
+_TASK_READ_COLUMNS_CACHE = _TaskReadColumnsCache(max_entries=TASK_VERSION_LEDGER_MAX)
+
+
 def _task_event_payload(
     event: ActivityEvent,
     task: Task | None,
@@ -1310,60 +1574,149 @@ def _task_event_payload(
     )
     if task.status == "done":
         blocked_by = []
-    payload["task"] = (
-        TaskRead.model_validate(task, from_attributes=True)
-        .model_copy(
-            update={
-                "depends_on_task_ids": dep_list,
-                "tag_ids": tag_state.tag_ids,
-                "tags": tag_state.tags,
-                "blocked_by_task_ids": blocked_by,
-                "is_blocked": bool(blocked_by),
-                "custom_field_values": resolved_custom_field_values_by_task_id.get(
-                    task.id,
-                    {},
-                ),
-            },
-        )
-        .model_dump(mode="json")
-    )
+    payload["task"] = {
+        **_TASK_READ_COLUMNS_CACHE.columns(task),
+        "depends_on_task_ids": [str(value) for value in dep_list],
+        "tag_ids": [str(value) for value in tag_state.tag_ids],
+        "tags": [tag.model_dump(mode="json") for tag in tag_state.tags],
+        "blocked_by_task_ids": [str(value) for value in blocked_by],
+        "is_blocked": bool(blocked_by),
+        "custom_field_values": resolved_custom_field_values_by_task_id.get(task.id, {}),
+    }
     return payload
 
 
-async def _task_event_generator(
-    *,
-    request: Request,
-    board_id: UUID,
-    since_dt: datetime,
-) -> AsyncIterator[dict[str, str]]:
-    last_seen = since_dt
-    seen_ids: set[UUID] = set()
-    seen_queue: deque[UUID] = deque()
+def _task_version(task_payload: dict[str, object]) -> str:
+    encoded = json.dumps(task_payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
 
-    while True:
-        if await request.is_disconnected():
-            break
 
-        async with async_session_maker() as session:
-            rows = await _fetch_task_events(session, board_id, last_seen)
-            deps_map, dep_status, tag_state_by_task_id, custom_field_values_by_task_id = (
-                await _stream_task_state(
-                    session,
-                    board_id=board_id,
-                    rows=rows,
-                )
-            )
+@dataclass(frozen=True, slots=True)
+class _TaskEventDelta:
+    task_id: UUID
+    version: str
+    base_version: str | None
+    data: str | None
 
-        for event, task in rows:
-            if event.id in seen_ids:
-                continue
-            seen_ids.add(event.id)
-            seen_queue.append(event.id)
-            if len(seen_queue) > SSE_SEEN_MAX:
-                oldest = seen_queue.popleft()
-                seen_ids.discard(oldest)
-            last_seen = max(event.created_at, last_seen)
 
+class _TaskVersionLedger:
+    """Last streamed state of each task, used to diff consecutive task events."""
+
+    def __init__(self, *, max_entries: int) -> None:
+        self._max_entries = max_entries
+        self._states: OrderedDict[UUID, tuple[str, dict[str, object]]] = OrderedDict()
+
+    def advance(
+        self,
+        task_id: UUID,
+        *,
+        version: str,
+        task_payload: dict[str, object],
+    ) -> tuple[str, dict[str, object]] | None:
+        previous = self._states.pop(task_id, None)
+        self._states[task_id] = (version, task_payload)
+        while len(self._states) > self._max_entries:
+            self._states.popitem(last=False)
+        return previous
+
+
+_TASK_VERSION_LEDGER = _TaskVersionLedger(max_entries=TASK_VERSION_LEDGER_MAX)
+
+
+def _task_event_delta(payload: dict[str, object]) -> _TaskEventDelta | None:
+    """Version the task in `payload` and build its field-level diff from the last version."""
+    task_payload = payload.get("task")
+    if not isinstance(task_payload, dict):
+        return None
+    version = _task_version(task_payload)
+    payload["task_version"] = version
+    task_id = UUID(str(task_payload["id"]))
+    previous = _TASK_VERSION_LEDGER.advance(
+        task_id,
+        version=version,
+        task_payload=task_payload,
+    )
+    if previous is None:
+        return _TaskEventDelta(task_id=task_id, version=version, base_version=None, data=None)
+    base_version, base_payload = previous
+    changes = {key: value for key, value in task_payload.items() if base_payload.get(key) != value}
+    delta_payload = {
+        "type": payload["type"],
+        "activity": payload["activity"],
+        "task_id": str(task_id),
+        "task_version": version,
+        "base_version": base_version,
+        "changes": changes,
+    }
+    return _TaskEventDelta(
+        task_id=task_id,
+        version=version,
+        base_version=base_version,
+        data=json.dumps(delta_payload),
+    )
+
+
+def _delta_renderer() -> Callable[[ReplayEntry], dict[str, str]]:
+    """Render entries as field-level diffs once the client holds the base version."""
+    client_versions: dict[UUID, str] = {}
+
+    def _render(entry: ReplayEntry) -> dict[str, str]:
+        delta = entry.meta
+        if not isinstance(delta, _TaskEventDelta):
+            return entry.message()
+        known_version = client_versions.get(delta.task_id)
+        client_versions[delta.task_id] = delta.version
+        if delta.data is None or known_version is None or known_version != delta.base_version:
+            return entry.message()
+        return {"id": entry.event_id, "event": entry.event, "data": delta.data}
+
+    return _render
+
+
+def task_stream_channel(board_id: UUID) -> ReplayChannel:
+    return ("tasks", board_id)
+
+
+def task_stream_cursor(
+    *,
+    last_event_id: str | None,
+    since: datetime,
+    delta: bool = False,
+) -> ReplayCursor:
+    return ReplayCursor(
+        get_replay_buffer(),
+        last_event_id=last_event_id,
+        since=since,
+        render=_delta_renderer() if delta else None,
+    )
+
+
+async def poll_task_stream(
+    session: AsyncSession,
+    *,
+    board_id: UUID,
+    cursor: ReplayCursor,
+) -> list[dict[str, str]]:
+    """Fetch new task events for one stream subscription and return undelivered messages."""
+    buffer = get_replay_buffer()
+    channel = task_stream_channel(board_id)
+    rows = await _fetch_task_events(session, board_id, cursor.last_seen)
+    # Events already buffered by another connection reuse the stored payload.
+    unbuffered_rows = [
+        (event, task) for event, task in rows if buffer.lookup(channel, event.id) is None
+    ]
+    deps_map, dep_status, tag_state_by_task_id, custom_field_values_by_task_id = (
+        await _stream_task_state(
+            session,
+            board_id=board_id,
+            rows=unbuffered_rows,
+        )
+    )
+
+    entries: list[ReplayEntry] = []
+    for event, task in rows:
+        entry = buffer.lookup(channel, event.id)
+        if entry is None:
             payload = _task_event_payload(
                 event,
                 task,
@@ -1372,7 +1725,43 @@ async def _task_event_generator(
                 tag_state_by_task_id=tag_state_by_task_id,
                 custom_field_values_by_task_id=custom_field_values_by_task_id,
             )
-            yield {"event": "task", "data": json.dumps(payload)}
+            event_delta = _task_event_delta(payload)
+            entry = buffer.record(
+                channel,
+                key=event.id,
+                event="task",
+                data=json.dumps(payload),
+                cursor=event.created_at,
+                meta=event_delta,
+            )
+        entries.append(entry)
+    return cursor.deliver(entries)
+
+
+async def _task_event_generator(
+    *,
+    request: Request,
+    board_id: UUID,
+    since_dt: datetime,
+    delta: bool = False,
+) -> AsyncIterator[dict[str, str]]:
+    cursor = task_stream_cursor(
+        last_event_id=request.headers.get(LAST_EVENT_ID_HEADER),
+        since=since_dt,
+        delta=delta,
+    )
+    for message in cursor.resume([task_stream_channel(board_id)]):
+        yield message
+
+    while True:
+        if await request.is_disconnected():
+            break
+
+        async with stream_session_maker() as session:
+            with query_stats_scope():
+                messages = await poll_task_stream(session, board_id=board_id, cursor=cursor)
+        for message in messages:
+            yield message
         await asyncio.sleep(2)
 
 
@@ -1382,19 +1771,54 @@ async def stream_tasks(
     board: Board = BOARD_READ_DEP,
     _actor: ActorContext = ACTOR_DEP,
     since: str | None = SINCE_QUERY,
+    delta: bool = DELTA_QUERY,
 ) -> EventSourceResponse:
-    """Stream task and task-comment events as SSE payloads."""
+    """Stream task and task-comment events as SSE payloads.
+
+    Reconnecting clients resume from the `Last-Event-ID` header when present.
+    Task payloads carry a `task_version`. With `delta=true`, a task is sent in
+    full the first time the connection sees it and as `changes` against
+    `base_version` afterwards; clients whose copy does not match
+    `base_version` should refetch via `GET /resync`.
+    """
     since_dt = _parse_since(since) or utcnow()
     return EventSourceResponse(
         _task_event_generator(
             request=request,
             board_id=board.id,
             since_dt=since_dt,
+            delta=delta,
         ),
         ping=15,
     )
 
 
+@router.get("/resync", response_model=list[TaskVersionedRead])
+async def resync_tasks(
+    task_ids: list[UUID] = RESYNC_TASK_IDS_QUERY,
+    board: Board = BOARD_READ_DEP,
+    session: AsyncSession = SESSION_DEP,
+    _actor: ActorContext = ACTOR_DEP,
+) -> list[TaskVersionedRead]:
+    """Return full, versioned tasks for delta-stream clients that lost sync."""
+    unique_ids = list(dict.fromkeys(task_ids))
+    if len(unique_ids) > TASK_RESYNC_MAX_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail=f"At most {TASK_RESYNC_MAX_IDS} task ids can be resynced at once.",
+        )
+    tasks = list(
+        await session.exec(
+            select(Task).where(col(Task.board_id) == board.id).where(col(Task.id).in_(unique_ids)),
+        ),
+    )
+    reads = await _task_read_page(session=session, board_id=board.id, tasks=tasks)
+    return [
+        TaskVersionedRead(task=read, task_version=_task_version(read.model_dump(mode="json")))
+        for read in reads
+    ]
+
+
 @router.get("", response_model=DefaultLimitOffsetPage[TaskRead])
 async def list_tasks(
     status_filter: str | None = STATUS_QUERY,
@@ -1423,6 +1847,19 @@ async def list_tasks(
     return await paginate(session, statement, transformer=_transform)
 
 
+def _task_from_create_payload(payload: TaskCreate, *, board: Board, auth: AuthContext) -> Task:
+    data = payload.model_dump(exclude={"depends_on_task_ids", "tag_ids", "custom_field_values"})
+    data["arena_config"] = _normalize_arena_config_for_storage(
+        config=payload.arena_config,
+        task_mode=payload.task_mode,
+    )
+    task = Task.model_validate(data)
+    task.board_id = board.id
+    if task.created_by_user_id is None and auth.user is not None:
+        task.created_by_user_id = auth.user.id
+    return task
+
+
 @router.post("", response_model=TaskRead, responses={409: {"model": BlockedTaskError}})
 async def create_task(
     payload: TaskCreate,
@@ -1431,20 +1868,10 @@ async def create_task(
     auth: AuthContext = ADMIN_AUTH_DEP,
 ) -> TaskRead:
     """Create a task and initialize dependency rows."""
-    data = payload.model_dump(exclude={"depends_on_task_ids", "tag_ids", "custom_field_values"})
-    normalized_arena_config = _normalize_arena_config_for_storage(
-        config=payload.arena_config,
-        task_mode=payload.task_mode,
-    )
-    data["arena_config"] = normalized_arena_config
     depends_on_task_ids = list(payload.depends_on_task_ids)
     tag_ids = list(payload.tag_ids)
     custom_field_values = dict(payload.custom_field_values)
-
-    task = Task.model_validate(data)
-    task.board_id = board.id
-    if task.created_by_user_id is None and auth.user is not None:
-        task.created_by_user_id = auth.user.id
+    task = _task_from_create_payload(payload, board=board, auth=auth)
 
     normalized_deps = await validate_dependency_update(
         session,
@@ -1528,6 +1955,216 @@ async def create_task(
     )
 
 
+@router.post(
+    "/bulk",
+    response_model=TaskBulkRead,
+    responses={409: {"model": BlockedTaskError}},
+)
+async def bulk_create_tasks(
+    payload: TaskBulkCreate,
+    board: Board = BOARD_WRITE_DEP,
+    session: AsyncSession = SESSION_DEP,
+    auth: AuthContext = ADMIN_AUTH_DEP,
+) -> TaskBulkRead:
+    """Create many tasks in one transaction, validating every item up front.
+
+    Errors for a specific item carry its `index` in the detail and nothing is
+    written. Leads and assignees get one consolidated notification each.
+    """
+    definitions_by_key = await _organization_custom_field_definitions_for_board(
+        session,
+        board_id=board.id,
+    )
+    normalized_deps, dep_status = await validate_new_task_dependencies(
+        session,
+        board_id=board.id,
+        depends_on_task_ids=[item.depends_on_task_ids for item in payload.items],
+    )
+    try:
+        await validate_tag_ids(
+            session,
+            organization_id=board.organization_id,
+            tag_ids=[tag_id for item in payload.items for tag_id in item.tag_ids],
+        )
+    except HTTPException:
+        # One query covers a valid batch; only a failing one is re-checked per item.
+        for index, item in enumerate(payload.items):
+            with _bulk_item_errors(index):
+                await validate_tag_ids(
+                    session,
+                    organization_id=board.organization_id,
+                    tag_ids=item.tag_ids,
+                )
+        raise
+    staged: list[tuple[Task, TaskCustomFieldValues]] = []
+    for index, item in enumerate(payload.items):
+        with _bulk_item_errors(index):
+            task = _task_from_create_payload(item, board=board, auth=auth)
+            effective_values = _effective_create_custom_field_values(
+                custom_field_values=dict(item.custom_field_values),
+                definitions_by_key=definitions_by_key,
+            )
+            blocked_by = blocked_by_dependency_ids(
+                dependency_ids=normalized_deps[index],
+                status_by_id=dep_status,
+            )
+            if blocked_by and (task.assigned_agent_id is not None or task.status != "inbox"):
+                raise _blocked_task_error(blocked_by)
+        staged.append((task, effective_values))
+
+    tasks = [task for task, _ in staged]
+    session.add_all(tasks)
+    # Insert tasks first so dependency, tag and custom-field rows can reference them.
+    await session.flush()
+    for index, (task, effective_values) in enumerate(staged):
+        _add_task_custom_field_values(
+            session,
+            task_id=task.id,
+            effective_values=effective_values,
+            definitions_by_key=definitions_by_key,
+        )
+        session.add_all(
+            TaskDependency(board_id=board.id, task_id=task.id, depends_on_task_id=dep_id)
+            for dep_id in normalized_deps[index]
+        )
+        session.add_all(
+            TagAssignment(task_id=task.id, tag_id=tag_id)
+            for tag_id in dict.fromkeys(payload.items[index].tag_ids)
+        )
+        record_activity(
+            session,
+            event_type="task.created",
+            task_id=task.id,
+            message=f"Task created: {task.title}.",
+        )
+    await session.commit()
+
+    queued_at = datetime.now(UTC)
+    assigned_by_agent_id: dict[UUID, list[Task]] = defaultdict(list)
+    for task in tasks:
+        if task.task_mode in MODE_EXECUTION_TASK_MODES:
+            enqueue_task_mode_execution(
+                QueuedTaskModeExecution(board_id=board.id, task_id=task.id, queued_at=queued_at),
+            )
+        if task.assigned_agent_id is not None:
+            assigned_by_agent_id[task.assigned_agent_id].append(task)
+    await _notify_bulk_task_changes(
+        session=session,
+        board=board,
+        created=tasks,
+        assigned_by_agent_id=assigned_by_agent_id,
+    )
+    return TaskBulkRead(
+        items=await _task_read_page(session=session, board_id=board.id, tasks=tasks),
+    )
+
+
+@router.patch(
+    "/bulk",
+    response_model=TaskBulkRead,
+    responses={409: {"model": BlockedTaskError}},
+)
+async def bulk_update_tasks(
+    payload: TaskBulkUpdate,
+    board: Board = BOARD_READ_DEP,
+    session: AsyncSession = SESSION_DEP,
+    actor: ActorContext = ACTOR_DEP,
+) -> TaskBulkRead:
+    """Apply many task updates in one transaction under the single-update rules.
+
+    Items are applied in order, so later items observe earlier ones. Any
+    failure rejects the whole batch with the failing item's `index`.
+    """
+    task_ids = [item.id for item in payload.items]
+    duplicates = sorted({str(task_id) for task_id in task_ids if task_ids.count(task_id) > 1})
+    if duplicates:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail={
+                "message": "Each task may appear only once per bulk update.",
+                "duplicate_task_ids": duplicates,
+            },
+        )
+    if actor.actor_type == "user" and actor.user is not None:
+        await _require_task_user_write_access(
+            session,
+            board_id=board.id,
+            user=actor.user,
+        )
+    tasks_by_id = {
+        task.id: task
+        for task in await session.exec(
+            select(Task)
+            .where(col(Task.board_id) == board.id)
+            .where(col(Task.id).in_(task_ids)),
+        )
+    }
+    missing = [str(task_id) for task_id in task_ids if task_id not in tasks_by_id]
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "message": "One or more tasks were not found on this board.",
+                "missing_task_ids": missing,
+            },
+        )
+
+    is_lead = actor.actor_type == "agent" and actor.agent is not None and actor.agent.is_board_lead
+    updates: list[_TaskUpdateInput] = []
+    for index, item in enumerate(payload.items):
+        with _bulk_item_errors(index):
+            update = _task_update_input(
+                task=tasks_by_id[item.id],
+                board_id=board.id,
+                payload=TaskUpdate.model_validate(
+                    item.model_dump(exclude={"id"}, exclude_unset=True),
+                ),
+                actor=actor,
+            )
+            if is_lead:
+                await _stage_lead_task_update(session, update=update)
+            else:
+                if actor.actor_type == "agent":
+                    await _apply_non_lead_agent_task_rules(session, update=update)
+                else:
+                    await _apply_admin_task_rules(session, update=update)
+                await _stage_updated_task(session, update=update)
+        updates.append(update)
+    await session.commit()
+
+    actor_agent_id = actor.agent.id if actor.actor_type == "agent" and actor.agent else None
+    unassigned: list[Task] = []
+    assigned_by_agent_id: dict[UUID, list[Task]] = defaultdict(list)
+    for update in updates:
+        task = update.task
+        if (
+            not is_lead
+            and task.status == "inbox"
+            and task.assigned_agent_id is None
+            and (update.previous_status != "inbox" or update.previous_assigned is not None)
+        ):
+            unassigned.append(task)
+        if (
+            task.assigned_agent_id is not None
+            and task.assigned_agent_id != update.previous_assigned
+            and task.assigned_agent_id != actor_agent_id
+        ):
+            assigned_by_agent_id[task.assigned_agent_id].append(task)
+    await _notify_bulk_task_changes(
+        session=session,
+        board=board,
+        unassigned=unassigned,
+        assigned_by_agent_id=assigned_by_agent_id,
+    )
+    return TaskBulkRead(
+        items=await _task_read_page(
+            session=session,
+            board_id=board.id,
+            tasks=[update.task for update in updates],
+        ),
+    )
+
+
 @router.get("/{task_id}/iterations", response_model=list[TaskIterationRead])
 async def list_task_iterations(
     task: Task = TASK_DEP,
@@ -1659,39 +2296,7 @@ async def update_task(
             board_id=board_id,
             user=actor.user,
         )
-    previous_status = task.status
-    previous_assigned = task.assigned_agent_id
-    updates = payload.model_dump(exclude_unset=True)
-    comment = payload.comment if "comment" in payload.model_fields_set else None
-    depends_on_task_ids = (
-        payload.depends_on_task_ids if "depends_on_task_ids" in payload.model_fields_set else None
-    )
-    tag_ids = payload.tag_ids if "tag_ids" in payload.model_fields_set else None
-    custom_field_values = (
-        payload.custom_field_values if "custom_field_values" in payload.model_fields_set else None
-    )
-    custom_field_values_set = "custom_field_values" in payload.model_fields_set
-    updates.pop("comment", None)
-    updates.pop("depends_on_task_ids", None)
-    updates.pop("tag_ids", None)
-    updates.pop("custom_field_values", None)
-    _validate_gsd_transition_or_raise(task=task, updates=updates)
-    requested_status = payload.status if "status" in payload.model_fields_set else None
-    update = _TaskUpdateInput(
-        task=task,
-        actor=actor,
-        board_id=board_id,
-        previous_status=previous_status,
-        previous_assigned=previous_assigned,
-        previous_in_progress_at=task.in_progress_at,
-        status_requested=(requested_status is not None and requested_status != previous_status),
-        updates=updates,
-        comment=comment,
-        depends_on_task_ids=depends_on_task_ids,
-        tag_ids=tag_ids,
-        custom_field_values=custom_field_values or {},
-        custom_field_values_set=custom_field_values_set,
-    )
+    update = _task_update_input(task=task, board_id=board_id, payload=payload, actor=actor)
     if actor.actor_type == "agent" and actor.agent and actor.agent.is_board_lead:
         return await _apply_lead_task_update(session, update=update)
 
@@ -1952,6 +2557,48 @@ class _TaskUpdateInput:
     normalized_tag_ids: list[UUID] | None = None
 
 
+def _task_update_input(
+    *,
+    task: Task,
+    board_id: UUID,
+    payload: TaskUpdate,
+    actor: ActorContext,
+) -> _TaskUpdateInput:
+    previous_status = task.status
+    previous_assigned = task.assigned_agent_id
+    updates = payload.model_dump(exclude_unset=True)
+    comment = payload.comment if "comment" in payload.model_fields_set else None
+    depends_on_task_ids = (
+        payload.depends_on_task_ids if "depends_on_task_ids" in payload.model_fields_set else None
+    )
+    tag_ids = payload.tag_ids if "tag_ids" in payload.model_fields_set else None
+    custom_field_values = (
+        payload.custom_field_values if "custom_field_values" in payload.model_fields_set else None
+    )
+    custom_field_values_set = "custom_field_values" in payload.model_fields_set
+    updates.pop("comment", None)
+    updates.pop("depends_on_task_ids", None)
+    updates.pop("tag_ids", None)
+    updates.pop("custom_field_values", None)
+    _validate_gsd_transition_or_raise(task=task, updates=updates)
+    requested_status = payload.status if "status" in payload.model_fields_set else None
+    return _TaskUpdateInput(
+        task=task,
+        actor=actor,
+        board_id=board_id,
+        previous_status=previous_status,
+        previous_assigned=previous_assigned,
+        previous_in_progress_at=task.in_progress_at,
+        status_requested=(requested_status is not None and requested_status != previous_status),
+        updates=updates,
+        comment=comment,
+        depends_on_task_ids=depends_on_task_ids,
+        tag_ids=tag_ids,
+        custom_field_values=custom_field_values or {},
+        custom_field_values_set=custom_field_values_set,
+    )
+
+
 def _required_status_value(value: object) -> str:
     if isinstance(value, str):
         return value
@@ -2245,11 +2892,12 @@ async def _lead_notify_new_assignee(
         )
 
 
-async def _apply_lead_task_update(
+async def _stage_lead_task_update(
     session: AsyncSession,
     *,
     update: _TaskUpdateInput,
-) -> TaskRead:
+) -> None:
+    """Validate and apply a board-lead task update without committing it."""
     if update.actor.actor_type != "agent" or update.actor.agent is None:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
     _validate_lead_update_request(update)
@@ -2339,6 +2987,14 @@ async def _apply_lead_task_update(
         previous_status=update.previous_status,
         actor_agent_id=update.actor.agent.id,
     )
+
+
+async def _apply_lead_task_update(
+    session: AsyncSession,
+    *,
+    update: _TaskUpdateInput,
+) -> TaskRead:
+    await _stage_lead_task_update(session, update=update)
     await session.commit()
     await session.refresh(update.task)
     await _lead_notify_new_assignee(session, update=update)
@@ -2505,7 +3161,7 @@ async def _apply_admin_task_rules(
             raise HTTPException(status_code=status.HTTP_409_CONFLICT)
 
 
-async def _record_task_comment_from_update(
+def _record_task_comment_from_update(
     session: AsyncSession,
     *,
     update: _TaskUpdateInput,
@@ -2523,7 +3179,6 @@ async def _record_task_comment_from_update(
         ),
     )
     session.add(event)
-    await session.commit()
 
 
 async def _record_task_update_activity(
@@ -2551,7 +3206,6 @@ async def _record_task_update_activity(
         previous_status=update.previous_status,
         actor_agent_id=actor_agent_id,
     )
-    await session.commit()
 
 
 async def _notify_task_update_assignment_changes(
@@ -2606,11 +3260,12 @@ async def _notify_task_update_assignment_changes(
         )
 
 
-async def _finalize_updated_task(
+async def _stage_updated_task(
     session: AsyncSession,
     *,
     update: _TaskUpdateInput,
-) -> TaskRead:
+) -> None:
+    """Validate and apply a non-lead task update without committing it."""
     for key, value in update.updates.items():
         setattr(update.task, key, value)
     await _require_no_pending_approval_for_status_change_when_enabled(
@@ -2685,10 +3340,18 @@ async def _finalize_updated_task(
         )
 
     session.add(update.task)
+    _record_task_comment_from_update(session, update=update)
+    await _record_task_update_activity(session, update=update)
+
+
+async def _finalize_updated_task(
+    session: AsyncSession,
+    *,
+    update: _TaskUpdateInput,
+) -> TaskRead:
+    await _stage_updated_task(session, update=update)
     await session.commit()
     await session.refresh(update.task)
-    await _record_task_comment_from_update(session, update=update)
-    await _record_task_update_activity(session, update=update)
     await _notify_task_update_assignment_changes(session, update=update)
 
     return await _task_read_response(
@@ -25,6 +25,7 @@ from sqlmodel import col, select
 from app.core.agent_tokens import verify_agent_token
 from app.core.logging import get_logger
 from app.core.time import utcnow
+from app.db.replicas import primary_reads
 from app.db.session import get_session
 from app.models.agents import Agent
 
@@ -47,11 +48,13 @@ class AgentAuthContext:
 
 
 async def _find_agent_for_token(session: AsyncSession, token: str) -> Agent | None:
-    agents = list(
-        await session.exec(
-            select(Agent).where(col(Agent.agent_token_hash).is_not(None)),
-        ),
-    )
+    # A lagging replica would reject tokens minted moments ago.
+    with primary_reads(session):
+        agents = list(
+            await session.exec(
+                select(Agent).where(col(Agent.agent_token_hash).is_not(None)),
+            ),
+        )
     for agent in agents:
         if agent.agent_token_hash and verify_agent_token(token, agent.agent_token_hash):
             return agent
@@ -35,6 +35,7 @@ from app.core.auth_mode import AuthMode
 from app.core.config import settings
 from app.core.logging import get_logger
 from app.db import crud
+from app.db.replicas import primary_reads
 from app.db.session import get_session
 from app.models.users import User
 
@@ -329,12 +330,14 @@ async def _get_or_sync_user(
         "email": claim_email,
         "name": claim_name,
     }
-    user, created = await crud.get_or_create(
-        session,
-        User,
-        clerk_user_id=clerk_user_id,
-        defaults=defaults,
-    )
+    # Get-or-create on a lagging replica would try to insert an existing user.
+    with primary_reads(session):
+        user, created = await crud.get_or_create(
+            session,
+            User,
+            clerk_user_id=clerk_user_id,
+            defaults=defaults,
+        )
 
     profile_email: str | None = None
     profile_name: str | None = None
@@ -383,12 +386,13 @@ async def _get_or_create_local_user(session: AsyncSession) -> User:
         "email": LOCAL_AUTH_EMAIL,
         "name": LOCAL_AUTH_NAME,
     }
-    user, _created = await crud.get_or_create(
-        session,
-        User,
-        clerk_user_id=LOCAL_AUTH_USER_ID,
-        defaults=defaults,
-    )
+    with primary_reads(session):
+        user, _created = await crud.get_or_create(
+            session,
+            User,
+            clerk_user_id=LOCAL_AUTH_USER_ID,
+            defaults=defaults,
+        )
     changed = False
     if not user.email:
         user.email = LOCAL_AUTH_EMAIL
@@ -52,6 +52,24 @@ class Settings(BaseSettings):
 
     # Database lifecycle
     db_auto_migrate: bool = False
+    # Optional streaming replica serving plain reads of GET handlers, streams and metrics.
+    database_replica_url: str = ""
+    # Reads fall back to the primary while measured replica lag exceeds this.
+    database_replica_max_lag_seconds: float = Field(default=5.0, ge=0)
+    database_replica_lag_check_seconds: float = Field(default=2.0, gt=0)
+    # Separate connection pools so long-lived stream polls cannot starve request handlers.
+    db_api_pool_size: int = Field(default=10, ge=1)
+    db_api_max_overflow: int = Field(default=10, ge=0)
+    db_stream_pool_size: int = Field(default=5, ge=1)
+    db_stream_max_overflow: int = Field(default=5, ge=0)
+    db_worker_pool_size: int = Field(default=5, ge=1)
+    db_worker_max_overflow: int = Field(default=5, ge=0)
+    db_pool_timeout_seconds: float = Field(default=30.0, gt=0)
+
+    # SSE streaming: recent messages kept per stream channel for Last-Event-ID replay.
+    sse_replay_buffer_size: int = Field(default=500, ge=1)
+    # Channels buffered at once; the least recently written one is dropped first.
+    sse_replay_max_channels: int = Field(default=1000, ge=1)
 
     # RQ queueing / dispatch
     rq_redis_url: str = "redis://localhost:6379/0"
@@ -63,6 +81,47 @@ class Settings(BaseSettings):
     recovery_loop_enabled: bool = True
     recovery_loop_interval_seconds: int = 180
 
+    # Dashboard metrics: closed hours are rolled up per board by the worker.
+    dashboard_rollup_enabled: bool = True
+    dashboard_rollup_interval_seconds: int = 300
+    dashboard_rollup_backfill_hours: int = Field(default=24 * 730, ge=1)
+    dashboard_rollup_max_hours_per_run: int = Field(default=24 * 31, ge=1)
+    # Identical dashboard requests within this window share one computation (0 disables).
+    dashboard_cache_ttl_seconds: float = Field(default=5.0, ge=0)
+    # Resolved champion pack bindings are cached per scope for this long (0 disables).
+    pack_binding_cache_ttl_seconds: float = Field(default=30.0, ge=0)
+
+    # Activity events: monthly partitions (Postgres) and archival of old months.
+    activity_archive_enabled: bool = True
+    activity_archive_interval_seconds: int = 3600
+    # Months kept in the database; older months are exported then removed (0 keeps all).
+    activity_retention_months: int = Field(default=0, ge=0)
+    # There is no default partition, so next month's must exist before it starts.
+    activity_partition_months_ahead: int = Field(default=3, ge=1)
+    activity_archive_dir: str = str(BACKEND_ROOT / "artifacts" / "activity_archive")
+    activity_archive_batch_size: int = Field(default=5000, ge=1)
+
+    # Webhook payloads: per-webhook retention and compression applied by the worker.
+    webhook_compaction_enabled: bool = True
+    webhook_compaction_interval_seconds: int = 600
+    webhook_compaction_batch_size: int = Field(default=500, ge=1)
+    # Stored bodies with at least this many JSON characters are gzip-compressed (0 disables).
+    webhook_payload_compress_min_chars: int = Field(default=65536, ge=0)
+    # Payloads still queued for dispatch are kept past retention limits for this long.
+    webhook_dispatch_pending_max_age_seconds: int = Field(default=86400, ge=0)
+
+    # Board deletion: child rows are removed by the worker in chunks of this many rows.
+    board_deletion_batch_size: int = Field(default=1000, ge=1)
+    # Deletions without progress for this long are re-queued by the periodic sweep.
+    board_deletion_stale_seconds: int = Field(default=300, ge=1)
+    board_deletion_sweep_interval_seconds: int = 60
+
+    # Skill pack sync: one bare git mirror per pack source, refreshed by incremental fetch.
+    skill_pack_mirror_dir: str = str(BACKEND_ROOT / "artifacts" / "skill_pack_mirrors")
+    skill_pack_git_timeout_seconds: float = Field(default=120.0, gt=0)
+    # A queued/running sync older than this no longer blocks a new sync request.
+    skill_pack_sync_stale_seconds: int = Field(default=900, ge=1)
+
     # Task mode orchestration
     arena_allowed_agents: str = "friday,arsenal,edith,jocasta"
     arena_reviewer_agent: str = "arsenal"
@@ -113,6 +172,10 @@ class Settings(BaseSettings):
     log_use_utc: bool = False
     request_log_slow_ms: int = Field(default=1000, ge=0)
     request_log_include_health: bool = False
+    # Per-request SQL instrumentation (see app.db.query_stats)
+    sql_slow_statement_ms: int = Field(default=250, ge=0)
+    sql_n_plus_one_threshold: int = Field(default=10, ge=0)
+    sql_debug_headers: bool = False
 
     @model_validator(mode="after")
     def _defaults(self) -> Self:
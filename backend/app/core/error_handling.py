@@ -4,6 +4,10 @@ This module standardizes two operational behaviors:
 
 1) **Request IDs**
    - Every response includes an `X-Request-Id` header.
+   - With `SQL_DEBUG_HEADERS=true`, responses also carry `X-DB-Query-Count` and
+     `X-DB-Time-Ms` for the statements run before the response started. Event
+     streams omit them; the `http.request.complete` log, emitted once the
+     response body ends, carries the totals for every response.
    - Clients may supply their own request id; otherwise we generate one.
    - The request id is propagated into logs via context vars.
 
@@ -41,6 +45,7 @@ from app.core.logging import (
     set_request_id,
     set_request_route_context,
 )
+from app.db.query_stats import reset_request_query_stats, start_request_query_stats
 
 if TYPE_CHECKING:  # pragma: no cover
     from starlette.types import ASGIApp, Message, Receive, Scope, Send
@@ -48,6 +53,8 @@ if TYPE_CHECKING:  # pragma: no cover
 logger = get_logger(__name__)
 
 REQUEST_ID_HEADER: Final[str] = "X-Request-Id"
+DB_QUERY_COUNT_HEADER: Final[bytes] = b"x-db-query-count"
+DB_TIME_HEADER: Final[bytes] = b"x-db-time-ms"
 _HEALTH_CHECK_PATHS: Final[frozenset[str]] = frozenset({"/health", "/healthz", "/readyz"})
 
 ExceptionHandler = Callable[[Request, Exception], Response | Awaitable[Response]]
@@ -63,6 +70,7 @@ class RequestIdMiddleware:
         self._header_name_bytes = header_name.lower().encode("latin-1")
         self._slow_request_ms = settings.request_log_slow_ms
         self._include_health_logs = settings.request_log_include_health
+        self._sql_debug_headers = settings.sql_debug_headers
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Inject request-id into request state and response headers."""
@@ -83,6 +91,7 @@ class RequestIdMiddleware:
         request_id = self._get_or_create_request_id(scope)
         context_token = set_request_id(request_id)
         route_context_tokens = set_request_route_context(method, path)
+        query_stats, query_stats_token = start_request_query_stats()
         if should_log:
             logger.log(
                 TRACE_LEVEL,
@@ -94,6 +103,38 @@ class RequestIdMiddleware:
                 },
             )
 
+        completion_logged = False
+
+        def log_completion() -> None:
+            nonlocal completion_logged
+            completion_logged = True
+            if not should_log or status_code is None:
+                return
+            duration_ms = int((perf_counter() - started_at) * 1000)
+            extra = {
+                "method": method,
+                "path": path,
+                "status_code": status_code,
+                "duration_ms": duration_ms,
+                "client_ip": client_ip,
+                "db_query_count": query_stats.statement_count,
+                "db_time_ms": round(query_stats.db_time_ms, 1),
+            }
+            if status_code >= 500:
+                logger.error("http.request.complete", extra=extra)
+            elif status_code >= 400:
+                logger.warning("http.request.complete", extra=extra)
+            else:
+                logger.debug("http.request.complete", extra=extra)
+            if self._slow_request_ms and duration_ms >= self._slow_request_ms:
+                logger.warning(
+                    "http.request.slow",
+                    extra={
+                        **extra,
+                        "slow_threshold_ms": self._slow_request_ms,
+                    },
+                )
+
         async def send_with_request_id(message: Message) -> None:
             nonlocal status_code
             if message["type"] == "http.response.start":
@@ -102,32 +143,18 @@ class RequestIdMiddleware:
                 if not any(key.lower() == self._header_name_bytes for key, _ in headers):
                     request_id_bytes = request_id.encode("latin-1")
                     headers.append((self._header_name_bytes, request_id_bytes))
+                # Event streams keep querying after the headers are sent, so
+                # their counts only appear in the completion log.
+                if self._sql_debug_headers and not _is_event_stream(headers):
+                    headers.append(
+                        (DB_QUERY_COUNT_HEADER, str(query_stats.statement_count).encode()),
+                    )
+                    headers.append((DB_TIME_HEADER, f"{query_stats.db_time_ms:.1f}".encode()))
                 status = message.get("status")
                 status_code = status if isinstance(status, int) else 500
-                if should_log:
-                    duration_ms = int((perf_counter() - started_at) * 1000)
-                    extra = {
-                        "method": method,
-                        "path": path,
-                        "status_code": status_code,
-                        "duration_ms": duration_ms,
-                        "client_ip": client_ip,
-                    }
-                    if status_code >= 500:
-                        logger.error("http.request.complete", extra=extra)
-                    elif status_code >= 400:
-                        logger.warning("http.request.complete", extra=extra)
-                    else:
-                        logger.debug("http.request.complete", extra=extra)
-                    if self._slow_request_ms and duration_ms >= self._slow_request_ms:
-                        logger.warning(
-                            "http.request.slow",
-                            extra={
-                                **extra,
-                                "slow_threshold_ms": self._slow_request_ms,
-                            },
-                        )
             await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                log_completion()
 
         try:
             await self._app(scope, receive, send_with_request_id)
@@ -142,6 +169,10 @@ class RequestIdMiddleware:
                         "client_ip": client_ip,
                     },
                 )
+            elif not completion_logged:
+                # The client went away before the last body chunk was sent.
+                log_completion()
+            reset_request_query_stats(query_stats_token)
             reset_request_route_context(route_context_tokens)
             reset_request_id(context_token)
 
@@ -164,6 +195,13 @@ class RequestIdMiddleware:
         return request_id
 
 
+def _is_event_stream(headers: list[tuple[bytes, bytes]]) -> bool:
+    return any(
+        key.lower() == b"content-type" and value.startswith(b"text/event-stream")
+        for key, value in headers
+    )
+
+
 def install_error_handling(app: FastAPI) -> None:
     """Install middleware and exception handlers on the FastAPI app."""
     # Important: add request-id middleware last so it's the outermost middleware.
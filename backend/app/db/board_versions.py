@@ -0,0 +1,254 @@
+"""Per-board version counters maintained from session write events.
+
+Every flush or bulk UPDATE/DELETE that touches a table feeding the board
+snapshot bumps `boards.snapshot_version` for the affected boards in the same
+transaction. Readers can then key caches on `(board_id, snapshot_version)`
+and treat an unchanged version as "nothing on this board changed". Writes to
+`task_dependencies` additionally bump `boards.dependency_version`, which keys
+the cached dependency graph without invalidating it on ordinary task edits.
+
+Rows that only reference a board indirectly (tag assignments, approval task
+links, tags) are mapped to boards through `tasks`/`approvals` before the
+write runs, so deletes still resolve their board.
+
+Updates that change only columns the snapshot does not render leave the
+version alone. So do agent presence touches (`last_seen_at`/`updated_at`) of
+an agent whose status has not lapsed yet: a cached snapshot already expires
+when the first rendered agent status would lapse, so skipping the bump only
+delays the refreshed timestamps, never a status change.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import event, select, true, update
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import instance_state
+from sqlmodel import SQLModel
+
+from app.core.time import utcnow
+from app.services.openclaw.constants import stale_after_for_heartbeat_config
+
+if TYPE_CHECKING:
+    from datetime import datetime
+    from uuid import UUID
+
+    from sqlalchemy import ColumnElement, Table
+    from sqlalchemy.orm import ORMExecuteState, SessionTransaction, UOWTransaction
+    from sqlalchemy.sql import Select
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+# Tables whose rows are rendered into `build_board_snapshot`.
+SNAPSHOT_TABLES: frozenset[str] = frozenset(
+    {
+        "agents",
+        "approval_task_links",
+        "approvals",
+        "board_memory",
+        "boards",
+        "tag_assignments",
+        "tags",
+        "task_dependencies",
+        "tasks",
+    },
+)
+# Columns of snapshot tables that `build_board_snapshot` does not render.
+_UNRENDERED_COLUMNS: dict[str, frozenset[str]] = {
+    "agents": frozenset(
+        {
+            "agent_token_hash",
+            "delete_confirm_token_hash",
+            "delete_requested_at",
+            "provision_action",
+            "provision_confirm_token_hash",
+            "provision_requested_at",
+        },
+    ),
+    "board_memory": frozenset({"webhook_payload_id"}),
+    "boards": frozenset({"deletion_progress"}),
+    "tags": frozenset({"created_at", "description", "organization_id", "updated_at"}),
+    "tasks": frozenset({"auto_created", "auto_reason", "previous_in_progress_at"}),
+}
+_AGENT_PRESENCE_COLUMNS = frozenset({"last_seen_at", "updated_at"})
+# Narrower counters bumped alongside `snapshot_version` for specific tables.
+_EXTRA_VERSION_COLUMNS: dict[str, tuple[str, ...]] = {
+    "task_dependencies": ("dependency_version",),
+}
+
+# `Session.info` key holding the version columns bumped in the open transaction.
+_UNCOMMITTED_BUMPS_KEY = "board_versions.uncommitted_bumps"
+
+
+def has_uncommitted_bumps(session: Session | AsyncSession, column: str) -> bool:
+    """Return whether the open transaction bumped `column` without committing yet.
+
+    Caches must not store state read at such a version: if the transaction
+    rolls back, another writer can later reach the same version number with
+    different contents.
+    """
+    return column in session.info.get(_UNCOMMITTED_BUMPS_KEY, ())
+
+
+def _version_columns(table_name: str) -> tuple[str, ...]:
+    return ("snapshot_version", *_EXTRA_VERSION_COLUMNS.get(table_name, ()))
+
+
+def _table(name: str) -> Table:
+    return SQLModel.metadata.tables[name]
+
+
+def board_ids_for_rows(table: Table, whereclause: ColumnElement[bool] | None) -> Select[Any]:
+    """Return a query selecting the boards owning rows of `table` matching `whereclause`."""
+    criteria = whereclause if whereclause is not None else true()
+    if table.name == "boards":
+        return select(table.c.id).where(criteria)
+    if "board_id" in table.c:
+        return select(table.c.board_id).where(criteria)
+    tasks = _table("tasks")
+    if "task_id" in table.c:
+        return select(tasks.c.board_id).where(
+            tasks.c.id.in_(select(table.c.task_id).where(criteria)),
+        )
+    if table.name == "tags":
+        assignments = _table("tag_assignments")
+        return (
+            select(tasks.c.board_id)
+            .join(assignments, assignments.c.task_id == tasks.c.id)
+            .where(assignments.c.tag_id.in_(select(table.c.id).where(criteria)))
+        )
+    msg = f"cannot map {table.name} rows to boards"
+    raise ValueError(msg)
+
+
+def _bump_statement(
+    board_ids: Select[Any] | list[UUID],
+    columns: tuple[str, ...] = ("snapshot_version",),
+) -> Any:
+    boards = _table("boards")
+    return (
+        update(boards)
+        .where(boards.c.id.in_(board_ids))
+        .values({name: boards.c[name] + 1 for name in columns})
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _attribute_values(obj: object, name: str) -> list[Any]:
+    """Return the current and (when changed in this flush) previous value of `name`."""
+    state = instance_state(obj)
+    if name not in state.attrs:
+        return []
+    values = [getattr(obj, name), *state.attrs[name].history.deleted]
+    return [value for value in values if value is not None]
+
+
+def _changed_columns(obj: object) -> set[str]:
+    """Return the names of attributes whose value changes in this flush."""
+    changed: set[str] = set()
+    for attr in instance_state(obj).attrs:
+        history = attr.history
+        if history.added and list(history.added) != list(history.deleted):
+            changed.add(attr.key)
+    return changed
+
+
+def _is_presence_touch(obj: Any, changed: set[str]) -> bool:
+    """Return whether an agent update only refreshes the presence of a live agent."""
+    if not changed <= _AGENT_PRESENCE_COLUMNS:
+        return False
+    deleted = instance_state(obj).attrs["last_seen_at"].history.deleted
+    previous: datetime | None = deleted[0] if deleted else obj.last_seen_at
+    if previous is None:
+        return False
+    return utcnow() - previous <= stale_after_for_heartbeat_config(obj.heartbeat_config)
+
+
+def _renders_change(obj: object, table_name: str) -> bool:
+    """Return whether updating `obj` can change the rendered board snapshot."""
+    changed = _changed_columns(obj)
+    if not changed:
+        return False
+    if table_name == "agents" and _is_presence_touch(obj, changed):
+        return False
+    return not changed <= _UNRENDERED_COLUMNS.get(table_name, frozenset())
+
+
+def _pending_bumps(session: Session) -> list[tuple[tuple[str, ...], Select[Any] | list[UUID]]]:
+    """Return `(version columns, board ids)` pairs for the objects about to flush."""
+    board_ids: dict[tuple[str, ...], set[UUID]] = {}
+    row_ids_by_table: dict[str, set[Any]] = {}
+    updated = {id(obj) for obj in session.dirty}
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        table_name = getattr(obj, "__tablename__", None)
+        if table_name not in SNAPSHOT_TABLES:
+            continue
+        if id(obj) in updated and not _renders_change(obj, table_name):
+            continue
+        if table_name == "boards":
+            board_ids.setdefault(_version_columns(table_name), set()).update(
+                _attribute_values(obj, "id"),
+            )
+            continue
+        direct = _attribute_values(obj, "board_id")
+        if direct:
+            board_ids.setdefault(_version_columns(table_name), set()).update(direct)
+            continue
+        key = "task_id" if table_name != "tags" else "id"
+        for value in _attribute_values(obj, key):
+            row_ids_by_table.setdefault(table_name, set()).add(value)
+
+    bumps: list[tuple[tuple[str, ...], Select[Any] | list[UUID]]] = [
+        (columns, sorted(ids, key=str)) for columns, ids in board_ids.items() if ids
+    ]
+    for table_name, row_ids in row_ids_by_table.items():
+        table = _table(table_name)
+        if table_name == "tags":
+            statement = board_ids_for_rows(table, table.c.id.in_(row_ids))
+        else:
+            tasks = _table("tasks")
+            statement = select(tasks.c.board_id).where(tasks.c.id.in_(row_ids))
+        bumps.append((_version_columns(table_name), statement))
+    return bumps
+
+
+@event.listens_for(Session, "before_flush")
+def _bump_versions_for_flush(
+    session: Session,
+    _flush_context: UOWTransaction,
+    _instances: object,
+) -> None:
+    bumps = _pending_bumps(session)
+    if not bumps:
+        return
+    connection = session.connection()
+    bumped = session.info.setdefault(_UNCOMMITTED_BUMPS_KEY, set())
+    for columns, board_ids in bumps:
+        connection.execute(_bump_statement(board_ids, columns))
+        bumped.update(columns)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _bump_versions_for_bulk_write(orm_execute_state: ORMExecuteState) -> None:
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    statement: Any = orm_execute_state.statement
+    table = getattr(statement, "table", None)
+    table_name = getattr(table, "name", None)
+    if table is None or table_name not in SNAPSHOT_TABLES:
+        return
+    # Resolve owners before the statement runs so deleted rows still map to a board.
+    affected = board_ids_for_rows(table, statement.whereclause)
+    columns = _version_columns(table_name)
+    session = orm_execute_state.session
+    session.connection().execute(_bump_statement(affected, columns))
+    session.info.setdefault(_UNCOMMITTED_BUMPS_KEY, set()).update(columns)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _forget_bumps_at_transaction_end(
+    session: Session,
+    transaction: SessionTransaction,
+) -> None:
+    if transaction.parent is None:
+        session.info.pop(_UNCOMMITTED_BUMPS_KEY, None)
@@ -0,0 +1,116 @@
+"""Mark closed dashboard rollup hours stale when the tasks behind them change.
+
+Rollups count each task under its current status in the hour of its last
+update (and inbox tasks in the hour they were created). Editing, moving, or
+deleting a task therefore changes hours that may already be rolled up. Every
+flush or bulk UPDATE/DELETE on `tasks` records the affected closed
+`(board_id, hour)` pairs in `board_metrics_dirty_hours`, in the same
+transaction; the rollup job re-rolls them and dashboard reads aggregate them
+live until it does.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+from uuid import UUID, uuid4
+
+from sqlalchemy import event, insert, select
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import instance_state
+from sqlmodel import SQLModel
+
+from app.core.time import utcnow
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from sqlalchemy.orm import ORMExecuteState, UOWTransaction
+
+# Task columns that decide which hour and status bucket a task is counted in.
+_BUCKET_COLUMNS = ("board_id", "status", "created_at", "updated_at", "in_progress_at")
+
+
+def _hour(value: datetime) -> datetime:
+    return value.replace(minute=0, second=0, microsecond=0)
+
+
+def _closed_hours(
+    board_ids: Iterable[UUID | None],
+    times: Iterable[datetime | None],
+    *,
+    current_hour: datetime,
+) -> set[tuple[UUID, datetime]]:
+    hours = {_hour(value) for value in times if value is not None}
+    return {
+        (board_id, hour)
+        for board_id in board_ids
+        if board_id is not None
+        for hour in hours
+        if hour < current_hour
+    }
+
+
+def _values(obj: object, name: str) -> list[Any]:
+    """Return the current and (when changed in this flush) previous value of `name`."""
+    attribute = instance_state(obj).attrs[name]
+    return [getattr(obj, name), *attribute.history.deleted]
+
+
+def _mark(session: Session, hours: set[tuple[UUID, datetime]]) -> None:
+    if not hours:
+        return
+    now = utcnow()
+    session.connection().execute(
+        insert(SQLModel.metadata.tables["board_metrics_dirty_hours"]),
+        [
+            {"id": uuid4(), "board_id": board_id, "bucket_start": hour, "marked_at": now}
+            for board_id, hour in sorted(hours, key=lambda item: (str(item[0]), item[1]))
+        ],
+    )
+
+
+@event.listens_for(Session, "before_flush")
+def _mark_hours_for_flush(
+    session: Session,
+    _flush_context: UOWTransaction,
+    _instances: object,
+) -> None:
+    current_hour = _hour(utcnow())
+    hours: set[tuple[UUID, datetime]] = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if getattr(obj, "__tablename__", None) != "tasks":
+            continue
+        state = instance_state(obj)
+        if obj in session.dirty and not any(
+            state.attrs[name].history.has_changes() for name in _BUCKET_COLUMNS
+        ):
+            continue
+        hours |= _closed_hours(
+            _values(obj, "board_id"),
+            [*_values(obj, "created_at"), *_values(obj, "updated_at")],
+            current_hour=current_hour,
+        )
+    _mark(session, hours)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_hours_for_bulk_write(orm_execute_state: ORMExecuteState) -> None:
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    statement: Any = orm_execute_state.statement
+    table: Any = getattr(statement, "table", None)
+    if getattr(table, "name", None) != "tasks":
+        return
+    session = orm_execute_state.session
+    # Read the rows' current buckets before the statement changes or removes them.
+    rows = session.connection().execute(
+        select(table.c.board_id, table.c.created_at, table.c.updated_at).where(
+            *([statement.whereclause] if statement.whereclause is not None else []),
+        ),
+    )
+    current_hour = _hour(utcnow())
+    hours: set[tuple[UUID, datetime]] = set()
+    for board_id, created_at, updated_at in rows:
+        hours |= _closed_hours([board_id], [created_at, updated_at], current_hour=current_hour)
+    _mark(session, hours)
@@ -1,25 +1,102 @@
-"""Typed wrapper around fastapi-pagination for backend query helpers."""
+"""Typed wrapper around fastapi-pagination for backend query helpers.
+
+Listings ordered by a timestamp can opt into keyset pagination by passing a
+`KeysetOrder`. Pages then carry an opaque `next_cursor` encoding the
+`(timestamp, id)` of their last row; requests that send it back seek past that
+row instead of scanning `offset` rows, so late pages cost the same as the first.
+"""
 
 from __future__ import annotations
 
+import base64
+import binascii
+import inspect
+import json
 from collections.abc import Awaitable, Callable, Sequence
-from typing import TYPE_CHECKING, Any, TypeVar
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+from uuid import UUID
 
+from fastapi import HTTPException, status
+from fastapi_pagination.api import resolve_params
+from fastapi_pagination.ext.sqlalchemy import create_count_query
 from fastapi_pagination.ext.sqlalchemy import paginate as _paginate
+from sqlalchemy import literal, tuple_
 
 from app.schemas.pagination import DefaultLimitOffsetPage
 
 if TYPE_CHECKING:
-    from fastapi_pagination.limit_offset import LimitOffsetPage
+    from sqlalchemy.sql.elements import ColumnElement
     from sqlmodel.ext.asyncio.session import AsyncSession
     from sqlmodel.sql.expression import Select, SelectOfScalar
 
+    from app.schemas.pagination import KeysetLimitOffsetPage, KeysetLimitOffsetParams
+
 T = TypeVar("T")
 
 Transformer = Callable[
     [Sequence[Any]],
     Sequence[Any] | Awaitable[Sequence[Any]],
 ]
+KeysetPosition = tuple[datetime, UUID]
+
+
+def encode_cursor(timestamp: datetime, row_id: UUID) -> str:
+    """Encode a `(timestamp, id)` keyset position as an opaque cursor."""
+    raw = json.dumps([timestamp.isoformat(), str(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> KeysetPosition:
+    """Decode a cursor produced by `encode_cursor`, raising HTTP 422 when malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw_timestamp, raw_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(raw_timestamp), UUID(raw_id)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail="Invalid pagination cursor.",
+        ) from exc
+
+
+@dataclass(frozen=True, slots=True)
+class KeysetOrder:
+    """`(timestamp, id)` ordering used for keyset pagination.
+
+    Both columns must belong to the first entity selected by the statement.
+    """
+
+    timestamp: Any
+    id: Any
+    descending: bool = True
+
+    def order_by(self) -> tuple[Any, Any]:
+        """Return ORDER BY clauses with `id` as a stable tiebreaker."""
+        if self.descending:
+            return self.timestamp.desc(), self.id.desc()
+        return self.timestamp.asc(), self.id.asc()
+
+    def after(self, position: KeysetPosition) -> ColumnElement[bool]:
+        """Return the predicate selecting rows past `position`."""
+        timestamp, row_id = position
+        current = tuple_(self.timestamp, self.id)
+        boundary = tuple_(
+            literal(timestamp, self.timestamp.type),
+            literal(row_id, self.id.type),
+        )
+        return current < boundary if self.descending else current > boundary
+
+    def cursor_for(self, item: object) -> str | None:
+        """Return the cursor addressing `item`, a model or a row led by one."""
+        if isinstance(item, Sequence) and not isinstance(item, str):
+            item = item[0] if item else None
+        timestamp = getattr(item, self.timestamp.key, None)
+        row_id = getattr(item, self.id.key, None)
+        if not isinstance(timestamp, datetime) or not isinstance(row_id, UUID):
+            return None
+        return encode_cursor(timestamp, row_id)
 
 
 async def paginate(
@@ -27,7 +104,47 @@ async def paginate(
     statement: Select[Any] | SelectOfScalar[Any],
     *,
     transformer: Transformer | None = None,
-) -> LimitOffsetPage[T]:
+    keyset: KeysetOrder | None = None,
+) -> KeysetLimitOffsetPage[T]:
     """Execute a paginated query and cast to the project page type alias."""
-    page = await _paginate(session, statement, transformer=transformer)
-    return DefaultLimitOffsetPage[T].model_validate(page)
+    params = cast("KeysetLimitOffsetParams", resolve_params())
+    cursor = params.cursor
+    if keyset is None:
+        if cursor:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cursor pagination is not supported for this listing.",
+            )
+        page = await _paginate(session, statement, transformer=transformer)
+        return DefaultLimitOffsetPage[T].model_validate(page)
+
+    last_items: list[object] = []
+
+    async def _capture(items: Sequence[Any]) -> Sequence[Any]:
+        last_items[:] = list(items[-1:])
+        if transformer is None:
+            return items
+        result = transformer(items)
+        if inspect.isawaitable(result):
+            return await result
+        return result
+
+    ordered = statement.order_by(None).order_by(*keyset.order_by())
+    count_query = None
+    if cursor:
+        # Seek past the cursor row instead of skipping `offset` rows; the total
+        # still counts the whole filtered listing.
+        ordered = ordered.where(keyset.after(decode_cursor(cursor)))
+        count_query = create_count_query(statement)
+        params = params.model_copy(update={"offset": 0})
+    page = await _paginate(
+        session,
+        ordered,
+        params,
+        count_query=count_query,
+        transformer=_capture,
+    )
+    result: KeysetLimitOffsetPage[T] = DefaultLimitOffsetPage[T].model_validate(page)
+    if last_items and len(result.items) >= result.limit:
+        result.next_cursor = keyset.cursor_for(last_items[0])
+    return result
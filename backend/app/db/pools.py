@@ -0,0 +1,163 @@
+"""Per-workload database connection pools with checkout telemetry.
+
+Request handlers, stream pollers (SSE generators and WebSocket polls) and the
+queue worker each get their own engine and pool, sized by `DB_<WORKLOAD>_*`
+settings, so a burst of long-lived streams can exhaust only the stream pool.
+
+Every pool records how long `connect()` waited for a connection, how many
+checkouts needed an overflow connection, and how many timed out.
+`pool_telemetry()` reports those figures together with the current occupancy.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import exc as sa_exc
+from sqlalchemy import make_url
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.db.query_stats import instrument_engine
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
+    from sqlalchemy.pool import PoolProxiedConnection
+
+# Checkout waits kept per pool for percentile estimates.
+WAIT_SAMPLE_SIZE = 1024
+
+
+@dataclass
+class PoolStats:
+    """Running checkout counters for one pool."""
+
+    checkouts: int = 0
+    overflow_checkouts: int = 0
+    timeouts: int = 0
+    wait_total_seconds: float = 0.0
+    wait_max_seconds: float = 0.0
+    recent_waits: deque[float] = field(default_factory=lambda: deque(maxlen=WAIT_SAMPLE_SIZE))
+
+    def record(self, wait_seconds: float, *, overflow: bool) -> None:
+        """Record one successful checkout."""
+        self.checkouts += 1
+        if overflow:
+            self.overflow_checkouts += 1
+        self.wait_total_seconds += wait_seconds
+        self.wait_max_seconds = max(self.wait_max_seconds, wait_seconds)
+        self.recent_waits.append(wait_seconds)
+
+    def wait_quantile(self, quantile: float) -> float | None:
+        """Return the `quantile` of recent checkout waits, or None before any checkout."""
+        if not self.recent_waits:
+            return None
+        ordered = sorted(self.recent_waits)
+        return ordered[min(len(ordered) - 1, int(quantile * len(ordered)))]
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that feeds `PoolStats` (bound per workload by subclassing)."""
+
+    stats: PoolStats = PoolStats()
+
+    def connect(self) -> PoolProxiedConnection:
+        """Check out a connection, timing how long the caller waited for it."""
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except sa_exc.TimeoutError:
+            self.stats.timeouts += 1
+            raise
+        self.stats.record(
+            time.perf_counter() - started,
+            overflow=self.checkedout() > self.size(),
+        )
+        return connection
+
+
+@dataclass(frozen=True)
+class PoolTelemetry:
+    """Point-in-time view of one workload pool."""
+
+    workload: str
+    pool_size: int
+    max_overflow: int
+    checked_out: int
+    checked_in: int
+    overflow: int
+    checkouts: int
+    overflow_checkouts: int
+    timeouts: int
+    wait_avg_ms: float | None
+    wait_p95_ms: float | None
+    wait_max_ms: float
+
+
+_ENGINES: dict[str, AsyncEngine] = {}
+
+
+def create_workload_engine(
+    url: str,
+    *,
+    workload: str,
+    pool_size: int,
+    max_overflow: int,
+    pool_timeout: float,
+) -> AsyncEngine:
+    """Create an engine with its own instrumented pool and register it for telemetry.
+
+    Statements on the engine feed the per-request counters of `app.db.query_stats`.
+    """
+    options: dict[str, Any] = {"pool_pre_ping": True}
+    if make_url(url).get_backend_name() != "sqlite":
+        stats = PoolStats()
+        # A subclass per workload keeps the stats attached when the pool is recreated.
+        pool_class = type(
+            f"{workload.title().replace('-', '')}QueuePool",
+            (InstrumentedQueuePool,),
+            {"stats": stats},
+        )
+        options.update(
+            poolclass=pool_class,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+        )
+    engine = create_async_engine(url, **options)
+    instrument_engine(engine)
+    _ENGINES[workload] = engine
+    return engine
+
+
+def pool_telemetry() -> list[PoolTelemetry]:
+    """Return telemetry for every instrumented workload pool in this process."""
+    rows: list[PoolTelemetry] = []
+    for workload, engine in _ENGINES.items():
+        pool = engine.sync_engine.pool
+        if not isinstance(pool, InstrumentedQueuePool):
+            continue
+        stats = pool.stats
+        p95 = stats.wait_quantile(0.95)
+        rows.append(
+            PoolTelemetry(
+                workload=workload,
+                pool_size=pool.size(),
+                max_overflow=pool._max_overflow,  # noqa: SLF001
+                checked_out=pool.checkedout(),
+                checked_in=pool.checkedin(),
+                overflow=max(pool.overflow(), 0),
+                checkouts=stats.checkouts,
+                overflow_checkouts=stats.overflow_checkouts,
+                timeouts=stats.timeouts,
+                wait_avg_ms=(
+                    stats.wait_total_seconds / stats.checkouts * 1000 if stats.checkouts else None
+                ),
+                wait_p95_ms=p95 * 1000 if p95 is not None else None,
+                wait_max_ms=stats.wait_max_seconds * 1000,
+            ),
+        )
+    return rows
@@ -0,0 +1,165 @@
+"""Per-request SQL statement counters, slow-statement logs, and N+1 detection.
+
+`instrument_engine` hooks cursor execution on an engine. While a request is
+being served (`RequestIdMiddleware` binds a `RequestQueryStats` through
+`start_request_query_stats`), every statement adds to that request's count and
+DB time. Statements slower than `SQL_SLOW_STATEMENT_MS` are logged with the
+request id and route. A statement shape (the compiled SQL with placeholders)
+executed `SQL_N_PLUS_ONE_THRESHOLD` times within one request is logged once as
+a likely N+1 query.
+
+Long-lived streams re-run the same poll query for as long as a client stays
+connected, so each poll runs in its own `query_stats_scope`: repeats are
+detected per poll while counts and DB time still roll up into the request.
+
+Statements run outside a request (queue worker, startup) are still checked
+for slowness but are not counted.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import event
+
+from app.core.config import settings
+from app.core.logging import get_logger, get_request_id, get_request_method, get_request_path
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from sqlalchemy import Connection
+    from sqlalchemy.engine import ExceptionContext
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = get_logger(__name__)
+
+# Longest statement text included in log records.
+STATEMENT_LOG_CHARS = 500
+_STARTED_AT_KEY = "query_stats.started_at"
+_QUERY_STATS: ContextVar[RequestQueryStats | None] = ContextVar("query_stats", default=None)
+
+
+@dataclass
+class RequestQueryStats:
+    """Statements executed on behalf of one request (or one scope within it)."""
+
+    statement_count: int = 0
+    db_time_seconds: float = 0.0
+    shapes: Counter[str] = field(default_factory=Counter)
+    repeated_shapes: set[str] = field(default_factory=set)
+    parent: RequestQueryStats | None = None
+
+    @property
+    def db_time_ms(self) -> float:
+        """Return accumulated statement time in milliseconds."""
+        return self.db_time_seconds * 1000
+
+
+def start_request_query_stats() -> tuple[RequestQueryStats, Token[RequestQueryStats | None]]:
+    """Bind fresh statement counters to the current request context."""
+    stats = RequestQueryStats()
+    return stats, _QUERY_STATS.set(stats)
+
+
+def reset_request_query_stats(token: Token[RequestQueryStats | None]) -> None:
+    """Unbind the counters bound by `start_request_query_stats`."""
+    _QUERY_STATS.reset(token)
+
+
+@contextmanager
+def query_stats_scope() -> Iterator[RequestQueryStats]:
+    """Detect repeated statements separately for the enclosed block.
+
+    Counts and DB time are also added to the enclosing request's counters.
+    """
+    stats = RequestQueryStats(parent=_QUERY_STATS.get())
+    token = _QUERY_STATS.set(stats)
+    try:
+        yield stats
+    finally:
+        _QUERY_STATS.reset(token)
+
+
+def current_query_stats() -> RequestQueryStats | None:
+    """Return the counters of the request being served, if any."""
+    return _QUERY_STATS.get()
+
+
+def _route_extra() -> dict[str, object]:
+    return {
+        "request_id": get_request_id(),
+        "method": get_request_method(),
+        "path": get_request_path(),
+    }
+
+
+def _before_cursor_execute(conn: Connection, *_args: Any) -> None:
+    conn.info.setdefault(_STARTED_AT_KEY, []).append(perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Connection,
+    _cursor: Any,
+    statement: str,
+    *_args: Any,
+) -> None:
+    started = conn.info.get(_STARTED_AT_KEY)
+    if not started:
+        return
+    elapsed = perf_counter() - started.pop()
+    slow_ms = settings.sql_slow_statement_ms
+    if slow_ms and elapsed * 1000 >= slow_ms:
+        logger.warning(
+            "sql.statement.slow",
+            extra={
+                **_route_extra(),
+                "duration_ms": round(elapsed * 1000, 1),
+                "slow_threshold_ms": slow_ms,
+                "statement": statement[:STATEMENT_LOG_CHARS],
+            },
+        )
+    stats = _QUERY_STATS.get()
+    if stats is None:
+        return
+    scope: RequestQueryStats | None = stats
+    while scope is not None:
+        scope.statement_count += 1
+        scope.db_time_seconds += elapsed
+        scope = scope.parent
+    stats.shapes[statement] += 1
+    threshold = settings.sql_n_plus_one_threshold
+    if (
+        threshold
+        and stats.shapes[statement] >= threshold
+        and statement not in stats.repeated_shapes
+    ):
+        stats.repeated_shapes.add(statement)
+        logger.warning(
+            "sql.n_plus_one",
+            extra={
+                **_route_extra(),
+                "repeat_threshold": threshold,
+                "statement": statement[:STATEMENT_LOG_CHARS],
+            },
+        )
+
+
+def _handle_error(context: ExceptionContext) -> None:
+    # `after_cursor_execute` does not run for failed statements.
+    connection = context.connection
+    if connection is not None and connection.info.get(_STARTED_AT_KEY):
+        connection.info[_STARTED_AT_KEY].pop()
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Attach statement timing and counting hooks to `engine`."""
+    sync_engine = engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
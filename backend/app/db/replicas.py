@@ -0,0 +1,196 @@
+"""Read-replica routing for sessions that mostly read.
+
+`ReadRoutingSession` sends plain `SELECT` statements to its replica engine
+while `ReplicaLagMonitor` reports the replica as fresh enough, and everything
+else (flushes, bulk DML, `SELECT ... FOR UPDATE`, raw SQL, explicit
+`session.connection()` calls) to the primary. Once a session has written it
+stays on the primary for the rest of its life so it reads its own writes;
+handlers can also pin a session up front with `use_primary`, or send only a
+block of lookups to the primary with `primary_reads` (e.g. auth token
+lookups that must see a token or user created moments ago).
+
+Lag is measured in the background at most every `check_interval_seconds`, so
+routing decisions never wait on the replica. Until the first measurement
+succeeds, and whenever the replica is unreachable or lagging, reads go to the
+primary. A standby whose WAL receiver is not running is not considered
+caught up just because it replayed everything it received; its lag is the age
+of the last replayed transaction.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import Delete, Insert, Select, Update, text
+from sqlmodel.orm.session import Session
+
+from app.core.logging import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from sqlalchemy import ClauseElement, Connection, Engine
+    from sqlalchemy.ext.asyncio import AsyncEngine
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+logger = get_logger(__name__)
+
+# `Session.info` key pinning a session to the primary.
+_PRIMARY_ONLY_KEY = "replicas.primary_only"
+# `Session.info` key counting open `primary_reads` blocks.
+_PRIMARY_READS_KEY = "replicas.primary_reads"
+REPLICA_CHECK_TIMEOUT_SECONDS = 2.0
+# Zero when the replica is not a standby, or is streaming from the primary and has
+# replayed everything it received; otherwise the age of the last replayed transaction
+# (NULL, i.e. unusable, when nothing was replayed yet). Without `pg_read_all_stats`
+# only the receiver's pid is visible, so a NULL status counts as streaming.
+_POSTGRES_LAG_SQL = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn()
+            AND EXISTS (
+                SELECT 1 FROM pg_stat_wal_receiver
+                WHERE COALESCE(status, 'streaming') = 'streaming'
+            )
+            THEN 0
+        ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+    END
+    """,
+)
+
+
+def use_primary(session: AsyncSession | Session) -> None:
+    """Route every later statement of `session` to the primary (read-your-writes)."""
+    session.info[_PRIMARY_ONLY_KEY] = True
+
+
+def uses_primary_only(session: AsyncSession | Session) -> bool:
+    """Return whether `session` is pinned to the primary."""
+    return bool(session.info.get(_PRIMARY_ONLY_KEY))
+
+
+@contextmanager
+def primary_reads(session: AsyncSession | Session) -> Iterator[None]:
+    """Route reads inside the block to the primary without pinning the session."""
+    session.info[_PRIMARY_READS_KEY] = session.info.get(_PRIMARY_READS_KEY, 0) + 1
+    try:
+        yield
+    finally:
+        session.info[_PRIMARY_READS_KEY] -= 1
+
+
+class ReplicaLagMonitor:
+    """Cached view of replica freshness, refreshed in the background."""
+
+    def __init__(
+        self,
+        engine: AsyncEngine | None,
+        *,
+        max_lag_seconds: float,
+        check_interval_seconds: float,
+    ) -> None:
+        self.engine = engine
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self.lag_seconds: float | None = None
+        self._checked_at: float | None = None
+        self._refresh_task: asyncio.Task[None] | None = None
+
+    @property
+    def usable(self) -> bool:
+        """Return whether reads may go to the replica, scheduling a refresh when stale."""
+        if self.engine is None:
+            return False
+        if self._is_stale():
+            self._schedule_refresh()
+        return self.lag_seconds is not None and self.lag_seconds <= self.max_lag_seconds
+
+    def _is_stale(self) -> bool:
+        return (
+            self._checked_at is None
+            or time.monotonic() - self._checked_at >= self.check_interval_seconds
+        )
+
+    def _schedule_refresh(self) -> None:
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._refresh_task = loop.create_task(self.refresh())
+
+    async def refresh(self) -> None:
+        """Measure replica lag now and record the result."""
+        if self.engine is None:
+            return
+        was_usable = self.lag_seconds is not None and self.lag_seconds <= self.max_lag_seconds
+        try:
+            lag = await asyncio.wait_for(self._measure(), timeout=REPLICA_CHECK_TIMEOUT_SECONDS)
+        except Exception:  # noqa: BLE001 - any failure just means "do not use the replica"
+            lag = None
+            if was_usable or self._checked_at is None:
+                logger.warning("db.replica.unavailable", exc_info=True)
+        else:
+            if lag is None and was_usable:
+                logger.warning("db.replica.unavailable")
+        self.lag_seconds = lag
+        self._checked_at = time.monotonic()
+        now_usable = lag is not None and lag <= self.max_lag_seconds
+        if was_usable and not now_usable and lag is not None:
+            logger.warning(
+                "db.replica.lagging",
+                extra={"lag_seconds": lag, "max_lag_seconds": self.max_lag_seconds},
+            )
+        elif now_usable and not was_usable:
+            logger.info("db.replica.available", extra={"lag_seconds": lag})
+
+    async def _measure(self) -> float | None:
+        assert self.engine is not None  # noqa: S101 - checked by caller
+        async with self.engine.connect() as conn:
+            if conn.dialect.name != "postgresql":
+                return 0.0
+            lag = (await conn.execute(_POSTGRES_LAG_SQL)).scalar_one()
+            return None if lag is None else float(lag)
+
+
+class ReadRoutingSession(Session):
+    """Sync session class that serves plain reads from a fresh-enough replica."""
+
+    def __init__(
+        self,
+        *args: Any,
+        replica: AsyncEngine | None = None,
+        replica_monitor: ReplicaLagMonitor | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.replica = replica
+        self.replica_monitor = replica_monitor
+
+    def get_bind(
+        self,
+        mapper: Any = None,
+        *,
+        clause: ClauseElement | None = None,
+        **kwargs: Any,
+    ) -> Engine | Connection:
+        """Return the replica engine for plain reads, the primary otherwise."""
+        monitor = self.replica_monitor
+        if self._flushing or isinstance(clause, (Insert, Update, Delete)):
+            use_primary(self)
+        elif (
+            self.replica is not None
+            and monitor is not None
+            and isinstance(clause, Select)
+            and clause._for_update_arg is None  # noqa: SLF001
+            and not uses_primary_only(self)
+            and not self.info.get(_PRIMARY_READS_KEY)
+            and monitor.usable
+        ):
+            return self.replica.sync_engine
+        return super().get_bind(mapper, clause=clause, **kwargs)
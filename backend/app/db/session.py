@@ -1,4 +1,14 @@
-"""Database engine, session factory, and startup migration helpers."""
+"""Database engines, session factories, and startup migration helpers.
+
+`async_session_maker` always talks to the primary. `read_session_maker`
+builds sessions that serve plain reads from `DATABASE_REPLICA_URL` while the
+replica is fresh enough (see `app.db.replicas`); `get_session` hands those to
+GET/HEAD requests. Call `use_primary(session)` in a handler that must read
+data written by an earlier request.
+
+Request handlers, stream pollers (`stream_session_maker`) and the queue worker
+(`use_worker_pool`) each use a separately sized pool; see `app.db.pools`.
+"""
 
 from __future__ import annotations
 
@@ -9,19 +19,27 @@ from typing import TYPE_CHECKING
 from alembic.config import Config
 from alembic.script import ScriptDirectory
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
 from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app import models as _models
 from app.core.config import settings
-from app.core.logging import get_logger
+from app.core.logging import get_logger, get_request_method
+from app.db import board_versions as _board_versions
+from app.db import dashboard_rollup_invalidation as _dashboard_rollup_invalidation
+from app.db.pools import create_workload_engine
+from app.db.replicas import ReadRoutingSession, ReplicaLagMonitor
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator
 
 # Import model modules so SQLModel metadata is fully registered at startup.
 _MODEL_REGISTRY = _models
+# Importing the module registers the session hooks that bump board snapshot versions.
+_BOARD_VERSION_HOOKS = _board_versions
+# Likewise for the hooks that mark task-backed dashboard rollup hours stale.
+_DASHBOARD_ROLLUP_HOOKS = _dashboard_rollup_invalidation
 
 
 def _normalize_database_url(database_url: str) -> str:
@@ -33,18 +51,93 @@ def _normalize_database_url(database_url: str) -> str:
     return database_url
 
 
-async_engine: AsyncEngine = create_async_engine(
-    _normalize_database_url(settings.database_url),
-    pool_pre_ping=True,
+def _workload_engine(
+    database_url: str,
+    workload: str,
+    *,
+    pool_size: int,
+    max_overflow: int,
+) -> AsyncEngine:
+    return create_workload_engine(
+        _normalize_database_url(database_url),
+        workload=workload,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=settings.db_pool_timeout_seconds,
+    )
+
+
+# Request handlers and SSE/WebSocket stream polls draw from separate pools.
+async_engine: AsyncEngine = _workload_engine(
+    settings.database_url,
+    "api",
+    pool_size=settings.db_api_pool_size,
+    max_overflow=settings.db_api_max_overflow,
+)
+stream_engine: AsyncEngine = _workload_engine(
+    settings.database_url,
+    "stream",
+    pool_size=settings.db_stream_pool_size,
+    max_overflow=settings.db_stream_max_overflow,
 )
 async_session_maker = async_sessionmaker(
     async_engine,
     class_=AsyncSession,
     expire_on_commit=False,
 )
+replica_engine: AsyncEngine | None = None
+stream_replica_engine: AsyncEngine | None = None
+if settings.database_replica_url.strip():
+    replica_engine = _workload_engine(
+        settings.database_replica_url,
+        "api-replica",
+        pool_size=settings.db_api_pool_size,
+        max_overflow=settings.db_api_max_overflow,
+    )
+    stream_replica_engine = _workload_engine(
+        settings.database_replica_url,
+        "stream-replica",
+        pool_size=settings.db_stream_pool_size,
+        max_overflow=settings.db_stream_max_overflow,
+    )
+replica_monitor = ReplicaLagMonitor(
+    replica_engine,
+    max_lag_seconds=settings.database_replica_max_lag_seconds,
+    check_interval_seconds=settings.database_replica_lag_check_seconds,
+)
+read_session_maker = async_sessionmaker(
+    async_engine,
+    class_=AsyncSession,
+    sync_session_class=ReadRoutingSession,
+    expire_on_commit=False,
+    replica=replica_engine,
+    replica_monitor=replica_monitor,
+)
+# Stream generators poll on their own pool and, like GET handlers, may read the replica.
+stream_session_maker = async_sessionmaker(
+    stream_engine,
+    class_=AsyncSession,
+    sync_session_class=ReadRoutingSession,
+    expire_on_commit=False,
+    replica=stream_replica_engine,
+    replica_monitor=replica_monitor,
+)
+# Requests with these methods get replica-routed sessions from `get_session`.
+READ_ONLY_METHODS = frozenset({"GET", "HEAD"})
 logger = get_logger(__name__)
 
 
+def use_worker_pool() -> None:
+    """Rebind `async_session_maker` to a worker-sized pool (queue worker process only)."""
+    worker_engine = _workload_engine(
+        settings.database_url,
+        "worker",
+        pool_size=settings.db_worker_pool_size,
+        max_overflow=settings.db_worker_max_overflow,
+    )
+    async_session_maker.configure(bind=worker_engine)
+
+
 def _alembic_config() -> Config:
     alembic_ini = Path(__file__).resolve().parents[2] / "alembic.ini"
 
@@ -87,8 +180,13 @@ async def init_db() -> None:
 
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
-    """Yield a request-scoped async DB session with safe rollback on errors."""
-    async with async_session_maker() as session:
+    """Yield a request-scoped async DB session with safe rollback on errors.
+
+    GET/HEAD requests get a replica-routed session; writes made through it
+    still go to the primary.
+    """
+    read_only = get_request_method() in READ_ONLY_METHODS
+    async with (read_session_maker if read_only else async_session_maker)() as session:
         try:
             yield session
         finally:
@@ -0,0 +1,19 @@
+"""Dialect-specific `INSERT ... ON CONFLICT` constructors."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+if TYPE_CHECKING:
+    from sqlalchemy import Table
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+_INSERTS = {"postgresql": postgresql_insert, "sqlite": sqlite_insert}
+
+
+def upsert_insert(session: AsyncSession, table: Table) -> Any:
+    """Return an insert on `table` supporting `on_conflict_do_update` for the session's dialect."""
+    return _INSERTS[session.get_bind().dialect.name](table)
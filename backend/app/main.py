@@ -40,6 +40,7 @@ from app.api.recovery_ops import router as recovery_ops_router
 from app.api.runtime_ops import router as runtime_ops_router
 from app.api.skills_marketplace import router as skills_marketplace_router
 from app.api.souls_directory import router as souls_directory_router
+from app.api.streams import router as streams_router
 from app.api.tags import router as tags_router
 from app.api.task_custom_fields import router as task_custom_fields_router
 from app.api.tasks import router as tasks_router
@@ -602,6 +603,7 @@ api_v1.include_router(backups_router)
 api_v1.include_router(change_requests_router)
 api_v1.include_router(approvals_router)
 api_v1.include_router(tasks_router)
+api_v1.include_router(streams_router)
 api_v1.include_router(task_custom_fields_router)
 api_v1.include_router(tags_router)
 api_v1.include_router(users_router)
@@ -15,11 +15,18 @@ from app.models.board_webhooks import BoardWebhook
 from app.models.boards import Board
 from app.models.capabilities import Capability
 from app.models.change_requests import ChangeRequest
+from app.models.dashboard_rollups import (
+    BoardMetricsDirtyHour,
+    BoardMetricsRollup,
+    MetricsRollupWatermark,
+)
 from app.models.deterministic_evals import DeterministicEval
 from app.models.gateways import Gateway
 from app.models.gsd_runs import GSDRun
 from app.models.installations import InstallationRequest
+from app.models.latency_baselines import LatencyBaseline
 from app.models.pack_bindings import PackBinding
+from app.models.pack_eval_aggregates import PackEvalAggregate, PackEvalDailyAggregate
 from app.models.persona_presets import PersonaPreset
 from app.models.organization_board_access import OrganizationBoardAccess
 from app.models.organization_invite_board_access import OrganizationInviteBoardAccess
@@ -64,11 +71,17 @@ __all__ = [
     "Board",
     "Capability",
     "ChangeRequest",
+    "BoardMetricsDirtyHour",
+    "BoardMetricsRollup",
+    "MetricsRollupWatermark",
     "DeterministicEval",
     "Gateway",
     "GSDRun",
     "InstallationRequest",
+    "LatencyBaseline",
     "PackBinding",
+    "PackEvalAggregate",
+    "PackEvalDailyAggregate",
     "PersonaPreset",
     "PromptPack",
     "RecoveryIncident",
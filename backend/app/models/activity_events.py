@@ -5,6 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from uuid import UUID, uuid4
 
+from sqlalchemy import Index
 from sqlmodel import Field
 
 from app.core.time import utcnow
@@ -14,13 +15,18 @@ RUNTIME_ANNOTATION_TYPES = (datetime,)
 
 
 class ActivityEvent(QueryModel, table=True):
-    """Discrete activity event tied to tasks and agents."""
+    """Discrete activity event tied to tasks and agents.
+
+    On Postgres the table is range-partitioned by month on `created_at` (primary
+    key `(id, created_at)`); see `app.services.activity_archive`.
+    """
 
     __tablename__ = "activity_events"  # pyright: ignore[reportAssignmentType]
+    __table_args__ = (Index("ix_activity_events_task_id_created_at", "task_id", "created_at"),)
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     event_type: str = Field(index=True)
     message: str | None = None
     agent_id: UUID | None = Field(default=None, foreign_key="agents.id", index=True)
     task_id: UUID | None = Field(default=None, foreign_key="tasks.id", index=True)
-    created_at: datetime = Field(default_factory=utcnow)
+    created_at: datetime = Field(default_factory=utcnow, index=True)
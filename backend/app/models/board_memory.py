@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import JSON, Column
+from sqlalchemy import JSON, Column, Index
 from sqlmodel import Field
 
 from app.core.time import utcnow
@@ -18,6 +18,7 @@ class BoardMemory(QueryModel, table=True):
     """Persisted memory item attached directly to a board."""
 
     __tablename__ = "board_memory"  # pyright: ignore[reportAssignmentType]
+    __table_args__ = (Index("ix_board_memory_board_id_created_at", "board_id", "created_at"),)
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     board_id: UUID = Field(foreign_key="boards.id", index=True)
@@ -25,4 +26,6 @@ class BoardMemory(QueryModel, table=True):
     tags: list[str] | None = Field(default=None, sa_column=Column(JSON))
     is_chat: bool = Field(default=False, index=True)
     source: str | None = None
+    # Set for webhook payload previews so retention can remove them with the payload.
+    webhook_payload_id: UUID | None = Field(default=None, index=True)
     created_at: datetime = Field(default_factory=utcnow)
@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import JSON, Column
+from sqlalchemy import JSON, Column, Index, LargeBinary, text
 from sqlmodel import Field
 
 from app.core.time import utcnow
@@ -18,6 +18,20 @@ class BoardWebhookPayload(QueryModel, table=True):
     """Captured inbound webhook payload with request metadata."""
 
     __tablename__ = "board_webhook_payloads"  # pyright: ignore[reportAssignmentType]
+    __table_args__ = (
+        Index(
+            "ix_board_webhook_payloads_board_id_webhook_id_received_at",
+            "board_id",
+            "webhook_id",
+            "received_at",
+        ),
+        # Rows the compactor has not examined yet.
+        Index(
+            "ix_board_webhook_payloads_compression_unchecked",
+            "id",
+            postgresql_where=text("compression_checked_at IS NULL"),
+        ),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     board_id: UUID = Field(foreign_key="boards.id", index=True)
@@ -26,7 +40,13 @@ class BoardWebhookPayload(QueryModel, table=True):
         default=None,
         sa_column=Column(JSON),
     )
+    # Large bodies are moved here gzip-compressed by the compactor, leaving `payload` null.
+    payload_compressed: bytes | None = Field(default=None, sa_column=Column(LargeBinary))
     headers: dict[str, str] | None = Field(default=None, sa_column=Column(JSON))
     source_ip: str | None = None
     content_type: str | None = None
     received_at: datetime = Field(default_factory=utcnow, index=True)
+    # Set while a queued dispatch still needs the row; retention keeps it meanwhile.
+    dispatch_pending: bool = Field(default=False)
+    # When the compactor checked the body size; large bodies are compressed then.
+    compression_checked_at: datetime | None = Field(default=None)
@@ -23,5 +23,8 @@ class BoardWebhook(QueryModel, table=True):
     agent_id: UUID | None = Field(default=None, foreign_key="agents.id", index=True)
     description: str
     enabled: bool = Field(default=True, index=True)
+    # Stored payload retention; None keeps payloads regardless of age or count.
+    retention_max_age_days: int | None = None
+    retention_max_payloads: int | None = None
     created_at: datetime = Field(default_factory=utcnow)
     updated_at: datetime = Field(default_factory=utcnow)
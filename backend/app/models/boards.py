@@ -44,5 +44,16 @@ class Board(TenantScoped, table=True):
     block_status_changes_with_pending_approval: bool = Field(default=False)
     only_lead_can_change_status: bool = Field(default=False)
     max_agents: int = Field(default=1)
+    # Bumped on writes that change rendered snapshot rows; see app.db.board_versions.
+    snapshot_version: int = Field(default=0)
+    # Bumped on every task dependency write; keys the cached dependency graph.
+    dependency_version: int = Field(default=0)
+    # Set when deletion is requested; the queue worker then removes child rows in
+    # chunks and records its stage and per-table counts (see app.services.board_lifecycle).
+    deleting_at: datetime | None = Field(default=None, index=True)
+    deletion_progress: dict[str, object] | None = Field(
+        default=None,
+        sa_column=Column(JSON),
+    )
     created_at: datetime = Field(default_factory=utcnow)
     updated_at: datetime = Field(default_factory=utcnow)
@@ -0,0 +1,73 @@
+"""Hourly per-board dashboard metric rollups and their maintenance watermark."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID, uuid4
+
+from sqlalchemy import JSON, Column, UniqueConstraint
+from sqlmodel import Field
+
+from app.core.time import utcnow
+from app.models.base import QueryModel
+
+RUNTIME_ANNOTATION_TYPES = (datetime,)
+
+
+class BoardMetricsRollup(QueryModel, table=True):
+    """Closed-hour dashboard aggregates for one board."""
+
+    __tablename__ = "board_metrics_rollups"  # pyright: ignore[reportAssignmentType]
+    __table_args__ = (
+        UniqueConstraint(
+            "board_id",
+            "bucket_start",
+            name="uq_board_metrics_rollups_board_bucket",
+        ),
+    )
+
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    board_id: UUID = Field(foreign_key="boards.id", index=True)
+    bucket_start: datetime = Field(index=True)
+    throughput_count: int = Field(default=0)
+    cycle_time_count: int = Field(default=0)
+    cycle_time_sum_hours: float = Field(default=0.0)
+    # Log-bucketed histogram of cycle times (bucket index -> count) for medians.
+    cycle_time_digest: dict[str, int] = Field(
+        default_factory=dict,
+        sa_column=Column(JSON, nullable=False),
+    )
+    error_count: int = Field(default=0)
+    event_count: int = Field(default=0)
+    wip_inbox: int = Field(default=0)
+    wip_in_progress: int = Field(default=0)
+    wip_review: int = Field(default=0)
+    wip_done: int = Field(default=0)
+    computed_at: datetime = Field(default_factory=utcnow)
+
+
+class MetricsRollupWatermark(QueryModel, table=True):
+    """Half-open `[rolled_from, rolled_through)` hour window covered by a rollup job."""
+
+    __tablename__ = "metrics_rollup_watermarks"  # pyright: ignore[reportAssignmentType]
+
+    name: str = Field(primary_key=True)
+    rolled_from: datetime
+    rolled_through: datetime
+    updated_at: datetime = Field(default_factory=utcnow)
+
+
+class BoardMetricsDirtyHour(QueryModel, table=True):
+    """A closed board hour whose rollup no longer matches its tasks.
+
+    Written by the task write hooks in `app.db.dashboard_rollup_invalidation`;
+    duplicates are allowed. There is deliberately no foreign key to `boards`, so
+    rows marked while a board is being deleted never block the delete.
+    """
+
+    __tablename__ = "board_metrics_dirty_hours"  # pyright: ignore[reportAssignmentType]
+
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    board_id: UUID = Field(index=True)
+    bucket_start: datetime = Field(index=True)
+    marked_at: datetime = Field(default_factory=utcnow)
@@ -6,7 +6,7 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID, uuid4
 
-from sqlalchemy import JSON, Column
+from sqlalchemy import JSON, Column, Index
 from sqlmodel import Field
 
 from app.core.time import utcnow
@@ -19,6 +19,14 @@ class DeterministicEval(TenantScoped, table=True):
     """Evaluation output row used by promotion gates and score trending."""
 
     __tablename__ = "deterministic_evals"  # pyright: ignore[reportAssignmentType]
+    __table_args__ = (
+        Index(
+            "ix_deterministic_evals_org_pack_created_at",
+            "organization_id",
+            "pack_id",
+            "created_at",
+        ),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     run_telemetry_id: UUID = Field(foreign_key="run_telemetry.id", index=True)
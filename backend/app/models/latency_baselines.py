@@ -0,0 +1,39 @@
+"""Sliding-window latency baselines used by deterministic scoring."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID, uuid4
+
+from sqlalchemy import JSON, Column, UniqueConstraint
+from sqlmodel import Field
+
+from app.core.time import utcnow
+from app.models.tenancy import TenantScoped
+
+RUNTIME_ANNOTATION_TYPES = (datetime,)
+
+
+class LatencyBaseline(TenantScoped, table=True):
+    """Most recent run latencies for one (organization, pack_key, tier)."""
+
+    __tablename__ = "latency_baselines"  # pyright: ignore[reportAssignmentType]
+    __table_args__ = (
+        UniqueConstraint(
+            "organization_id",
+            "pack_key",
+            "tier",
+            name="uq_latency_baselines_org_pack_key_tier",
+        ),
+    )
+
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    organization_id: UUID = Field(foreign_key="organizations.id", index=True)
+    pack_key: str
+    tier: str
+    # Oldest first; the window slides by dropping from the front.
+    recent_latencies_ms: list[int] = Field(default_factory=list, sa_column=Column(JSON))
+    # The same samples in ascending order, so the median is a direct lookup.
+    sorted_latencies_ms: list[int] = Field(default_factory=list, sa_column=Column(JSON))
+    median_latency_ms: float | None = Field(default=None)
+    updated_at: datetime = Field(default_factory=utcnow)
@@ -0,0 +1,58 @@
+"""Running deterministic-eval aggregates per prompt pack, in total and per day."""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from uuid import UUID, uuid4
+
+from sqlalchemy import UniqueConstraint
+from sqlmodel import Field
+
+from app.core.time import utcnow
+from app.models.tenancy import TenantScoped
+
+RUNTIME_ANNOTATION_TYPES = (date, datetime)
+
+
+class PackEvalAggregate(TenantScoped, table=True):
+    """All-time eval totals for one pack within one organization."""
+
+    __tablename__ = "pack_eval_aggregates"  # pyright: ignore[reportAssignmentType]
+    __table_args__ = (
+        UniqueConstraint(
+            "organization_id",
+            "pack_id",
+            name="uq_pack_eval_aggregates_org_pack",
+        ),
+    )
+
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    organization_id: UUID = Field(foreign_key="organizations.id", index=True)
+    pack_id: UUID = Field(foreign_key="prompt_packs.id", index=True)
+    eval_count: int = Field(default=0)
+    score_sum: float = Field(default=0.0)
+    hard_regressions: int = Field(default=0)
+    last_eval_at: datetime | None = Field(default=None)
+    updated_at: datetime = Field(default_factory=utcnow)
+
+
+class PackEvalDailyAggregate(TenantScoped, table=True):
+    """Eval totals for one pack on one UTC day, summed for windowed summaries."""
+
+    __tablename__ = "pack_eval_daily_aggregates"  # pyright: ignore[reportAssignmentType]
+    __table_args__ = (
+        UniqueConstraint(
+            "organization_id",
+            "pack_id",
+            "day",
+            name="uq_pack_eval_daily_aggregates_org_pack_day",
+        ),
+    )
+
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    organization_id: UUID = Field(foreign_key="organizations.id", index=True)
+    pack_id: UUID = Field(foreign_key="prompt_packs.id", index=True)
+    day: date
+    eval_count: int = Field(default=0)
+    score_sum: float = Field(default=0.0)
+    hard_regressions: int = Field(default=0)
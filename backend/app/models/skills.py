@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Any
 from uuid import UUID, uuid4
 
-from sqlalchemy import JSON, Column, UniqueConstraint
+from sqlalchemy import JSON, Column, Index, UniqueConstraint, event
 from sqlmodel import Field
 
 from app.core.time import utcnow
@@ -13,6 +14,13 @@ from app.models.base import QueryModel
 from app.models.tenancy import TenantScoped
 
 RUNTIME_ANNOTATION_TYPES = (datetime,)
+UNCATEGORIZED_FACET = "uncategorized"
+
+
+def facet_key(value: str | None) -> str:
+    """Normalize a category/risk label into its indexed facet key."""
+    normalized = (value or "").strip().lower()
+    return normalized or UNCATEGORIZED_FACET
 
 
 class MarketplaceSkill(TenantScoped, table=True):
@@ -25,6 +33,8 @@ class MarketplaceSkill(TenantScoped, table=True):
             "source_url",
             name="uq_marketplace_skills_org_source_url",
         ),
+        Index("ix_marketplace_skills_org_category_key", "organization_id", "category_key"),
+        Index("ix_marketplace_skills_org_risk_key", "organization_id", "risk_key"),
     )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
@@ -33,8 +43,14 @@ class MarketplaceSkill(TenantScoped, table=True):
     description: str | None = Field(default=None)
     category: str | None = Field(default=None)
     risk: str | None = Field(default=None)
+    # `facet_key` of category/risk, kept in sync on every ORM write. On Postgres the
+    # table also has a generated `search_vector` column (migration f1c7a4e9b2d5).
+    category_key: str = Field(default=UNCATEGORIZED_FACET)
+    risk_key: str = Field(default=UNCATEGORIZED_FACET)
     source: str | None = Field(default=None)
     source_url: str
+    # Git blob hash of the pack file this skill was last synced from.
+    source_blob_sha: str | None = Field(default=None)
     metadata_: dict[str, object] = Field(
         default_factory=dict,
         sa_column=Column("metadata", JSON, nullable=False),
@@ -43,6 +59,13 @@ class MarketplaceSkill(TenantScoped, table=True):
     updated_at: datetime = Field(default_factory=utcnow)
 
 
+@event.listens_for(MarketplaceSkill, "before_insert")
+@event.listens_for(MarketplaceSkill, "before_update")
+def _sync_facet_keys(_mapper: Any, _connection: Any, target: MarketplaceSkill) -> None:
+    target.category_key = facet_key(target.category)
+    target.risk_key = facet_key(target.risk)
+
+
 class SkillPack(TenantScoped, table=True):
     """A pack repository URL that can be synced into marketplace skills."""
 
@@ -65,6 +88,14 @@ class SkillPack(TenantScoped, table=True):
         default_factory=dict,
         sa_column=Column("metadata", JSON, nullable=False),
     )
+    # Background sync state: queued -> running -> succeeded | failed.
+    sync_status: str | None = Field(default=None)
+    sync_requested_at: datetime | None = Field(default=None)
+    sync_started_at: datetime | None = Field(default=None)
+    sync_finished_at: datetime | None = Field(default=None)
+    sync_commit: str | None = Field(default=None)
+    sync_result: dict[str, object] | None = Field(default=None, sa_column=Column(JSON))
+    sync_error: str | None = Field(default=None)
     created_at: datetime = Field(default_factory=utcnow)
     updated_at: datetime = Field(default_factory=utcnow)
 
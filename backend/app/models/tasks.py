@@ -6,7 +6,7 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID, uuid4
 
-from sqlalchemy import JSON, Column, Text
+from sqlalchemy import JSON, Column, Index, Text
 from sqlmodel import Field
 
 from app.core.time import utcnow
@@ -19,6 +19,9 @@ class Task(TenantScoped, table=True):
     """Board-scoped task entity with ownership, status, and timing fields."""
 
     __tablename__ = "tasks"  # pyright: ignore[reportAssignmentType]
+    __table_args__ = (
+        Index("ix_tasks_board_id_status_updated_at", "board_id", "status", "updated_at"),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     board_id: UUID | None = Field(default=None, foreign_key="boards.id", index=True)
@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from uuid import UUID
 
-from sqlmodel import SQLModel
+from sqlmodel import Field, SQLModel
 
 from app.schemas.common import NonEmptyStr
 
@@ -18,6 +18,8 @@ class BoardWebhookCreate(SQLModel):
     description: NonEmptyStr
     enabled: bool = True
     agent_id: UUID | None = None
+    retention_max_age_days: int | None = Field(default=None, ge=1)
+    retention_max_payloads: int | None = Field(default=None, ge=1)
 
 
 class BoardWebhookUpdate(SQLModel):
@@ -26,6 +28,8 @@ class BoardWebhookUpdate(SQLModel):
     description: NonEmptyStr | None = None
     enabled: bool | None = None
     agent_id: UUID | None = None
+    retention_max_age_days: int | None = Field(default=None, ge=1)
+    retention_max_payloads: int | None = Field(default=None, ge=1)
 
 
 class BoardWebhookRead(SQLModel):
@@ -36,6 +40,8 @@ class BoardWebhookRead(SQLModel):
     agent_id: UUID | None = None
     description: str
     enabled: bool
+    retention_max_age_days: int | None = None
+    retention_max_payloads: int | None = None
     endpoint_path: str
     endpoint_url: str | None = None
     created_at: datetime
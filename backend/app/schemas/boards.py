@@ -100,5 +100,17 @@ class BoardRead(BoardBase):
 
     id: UUID
     organization_id: UUID
+    deleting_at: datetime | None = None
     created_at: datetime
     updated_at: datetime
+
+
+class BoardDeletionRead(SQLModel):
+    """Progress of a background board deletion."""
+
+    ok: bool = True
+    board_id: UUID
+    deleting_at: datetime | None = None
+    stage: str
+    deleted: dict[str, int] = Field(default_factory=dict)
+    error: str | None = None
@@ -12,6 +12,7 @@ from app.schemas.common import NonEmptyStr
 
 ScopeLiteral = Literal["global", "domain", "organization", "user"]
 TierLiteral = Literal["personal", "enterprise"]
+RUNTIME_RUN_BATCH_MAX_ITEMS = 500
 
 
 class RuntimeRunIngestRequest(BaseModel):
@@ -49,6 +50,22 @@ class RuntimeRunIngestResponse(BaseModel):
     queued_for_eval: bool
 
 
+class RuntimeRunBatchIngestRequest(BaseModel):
+    """Many run telemetry envelopes ingested in one transaction."""
+
+    items: list[RuntimeRunIngestRequest] = Field(
+        min_length=1,
+        max_length=RUNTIME_RUN_BATCH_MAX_ITEMS,
+    )
+
+
+class RuntimeRunBatchIngestResponse(BaseModel):
+    """Response payload for accepted batch telemetry ingestion."""
+
+    run_ids: list[UUID]
+    queued_for_eval: bool
+
+
 class PromptPackCreateRequest(BaseModel):
     """Create a versioned prompt pack with optional champion binding."""
 
@@ -113,6 +130,8 @@ class PackPromotionRequest(BaseModel):
     reason: str | None = None
     min_improvement_pct: float = Field(default=5.0, ge=0)
     require_zero_hard_regressions: bool = True
+    eval_window_days: int | None = Field(default=None, ge=1, le=365)
+    eval_last_n: int | None = Field(default=None, ge=1, le=10_000)
     force: bool = False
 
     @model_validator(mode="after")
@@ -121,6 +140,8 @@ class PackPromotionRequest(BaseModel):
         normalized = (self.scope_ref or "").strip()
         if self.scope in {"user", "domain"} and not normalized:
             raise ValueError("scope_ref is required for user and domain scopes")
+        if self.eval_window_days is not None and self.eval_last_n is not None:
+            raise ValueError("eval_window_days and eval_last_n are mutually exclusive")
         self.scope_ref = normalized or None
         return self
 
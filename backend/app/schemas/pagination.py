@@ -2,25 +2,59 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, TypeVar
+from typing import TYPE_CHECKING, Generic, TypeVar
 
 from fastapi import Query
+from fastapi_pagination.bases import RawParams
 from fastapi_pagination.customization import CustomizedPage, UseParamsFields
-from fastapi_pagination.limit_offset import LimitOffsetPage
+from fastapi_pagination.limit_offset import LimitOffsetPage, LimitOffsetParams
+from fastapi_pagination.types import GreaterEqualZero
 
 T = TypeVar("T")
 
 
+class KeysetLimitOffsetParams(LimitOffsetParams):
+    """Limit/offset params extended with an opaque keyset cursor.
+
+    `cursor` is the `next_cursor` value of a previous page. Listings that
+    support keyset pagination seek past it instead of applying `offset`;
+    `include_total=false` skips the `count(*)` query on any listing.
+    """
+
+    cursor: str | None = Query(
+        None,
+        description="Opaque cursor from a previous page's `next_cursor`.",
+    )
+    include_total: bool = Query(True, description="Compute the total item count.")
+
+    def to_raw_params(self) -> RawParams:
+        """Return raw params, honouring `include_total`."""
+        return RawParams(
+            limit=self.limit,
+            offset=self.offset,
+            include_total=self.include_total,
+        )
+
+
+class KeysetLimitOffsetPage(LimitOffsetPage[T], Generic[T]):
+    """Limit/offset page with an optional total and a keyset continuation cursor."""
+
+    total: GreaterEqualZero | None = None  # type: ignore[assignment]
+    next_cursor: str | None = None
+
+    __params_type__ = KeysetLimitOffsetParams
+
+
 # Project-wide default pagination response model.
 # - Keep `limit` / `offset` naming (matches existing API conventions).
 # - Cap list endpoints to 200 items per request (matches prior route-level constraints).
 if TYPE_CHECKING:
     # Type checkers treat this as a normal generic page type.
-    DefaultLimitOffsetPage = LimitOffsetPage
+    DefaultLimitOffsetPage = KeysetLimitOffsetPage
 else:
     # Runtime uses project-default query param bounds for all list endpoints.
     DefaultLimitOffsetPage = CustomizedPage[
-        LimitOffsetPage[T],
+        KeysetLimitOffsetPage[T],
         UseParamsFields(
             limit=Query(200, ge=1, le=200),
             offset=Query(0, ge=0),
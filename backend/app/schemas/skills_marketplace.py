@@ -88,11 +88,18 @@ class MarketplaceSkillActionResponse(SQLModel):
 
 
 class SkillPackSyncResponse(SQLModel):
-    """Pack sync summary payload."""
+    """Status and latest results of a background pack sync."""
 
     ok: bool = True
     pack_id: UUID
-    synced: int
-    created: int
-    updated: int
+    status: str | None = None
+    requested_at: datetime | None = None
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    commit: str | None = None
+    synced: int = 0
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
     warnings: list[str] = Field(default_factory=list)
+    error: str | None = None
@@ -0,0 +1,32 @@
+"""Schemas for multiplexed stream WebSocket control messages."""
+
+from __future__ import annotations
+
+from typing import Literal
+from uuid import UUID
+
+from sqlmodel import SQLModel
+
+StreamName = Literal["tasks", "board_memory", "group_memory", "approvals", "agents"]
+StreamAction = Literal["auth", "subscribe", "unsubscribe"]
+RUNTIME_ANNOTATION_TYPES = (UUID,)
+
+
+class StreamControlMessage(SQLModel):
+    """Client-to-server control message sent over the stream WebSocket.
+
+    `auth` messages carry a user bearer `token` or an `agent_token` for clients
+    that cannot set handshake headers. `subscribe`/`unsubscribe` address one
+    (stream, board) channel; `since`, `last_event_id`, `is_chat` and `delta`
+    mirror the query parameters and headers of the matching SSE route.
+    """
+
+    action: StreamAction
+    stream: StreamName | None = None
+    board_id: UUID | None = None
+    since: str | None = None
+    last_event_id: str | None = None
+    is_chat: bool | None = None
+    delta: bool = False
+    token: str | None = None
+    agent_token: str | None = None
@@ -27,6 +27,7 @@ NotebookProfile = Literal["enterprise", "personal", "auto"]
 NotebookGateState = Literal["ready", "retryable", "misconfig", "hard_fail"]
 TaskIterationVerdict = Literal["APPROVED", "REVISE", "ERROR"]
 STATUS_REQUIRED_ERROR = "status is required"
+TASK_BULK_MAX_ITEMS = 200
 # Keep these symbols as runtime globals so Pydantic can resolve
 # deferred annotations reliably.
 RUNTIME_ANNOTATION_TYPES = (datetime, UUID, NonEmptyStr, TagRef)
@@ -220,6 +221,37 @@ class TaskRead(TaskBase):
     custom_field_values: TaskCustomFieldValues | None = None
 
 
+class TaskBulkCreate(SQLModel):
+    """Payload for creating many tasks on one board in a single transaction."""
+
+    items: list[TaskCreate] = Field(min_length=1, max_length=TASK_BULK_MAX_ITEMS)
+
+
+class TaskBulkUpdateItem(TaskUpdate):
+    """Partial update for one task inside a bulk update."""
+
+    id: UUID
+
+
+class TaskBulkUpdate(SQLModel):
+    """Payload for updating many tasks on one board in a single transaction."""
+
+    items: list[TaskBulkUpdateItem] = Field(min_length=1, max_length=TASK_BULK_MAX_ITEMS)
+
+
+class TaskBulkRead(SQLModel):
+    """Tasks written by a bulk create or update, in request order."""
+
+    items: list[TaskRead] = Field(default_factory=list)
+
+
+class TaskVersionedRead(SQLModel):
+    """Full task payload paired with the content version used by delta task streams."""
+
+    task: TaskRead
+    task_version: str
+
+
 class TaskIterationRead(SQLModel):
     """Task iteration payload returned by arena iteration endpoints."""
 
@@ -0,0 +1,455 @@
+"""Monthly partition upkeep and archival for `activity_events`.
+
+On Postgres `activity_events` is range-partitioned by `created_at` into one
+table per calendar month (`activity_events_pYYYY_MM`) plus the historic
+partition holding every row from before partitioning was introduced. There is
+no default partition, so the queue worker keeps partitions created a few
+months ahead. When `activity_retention_months` is set it exports every month
+older than the retention window to a gzip-compressed JSONL file, detaches the
+partition with `DETACH PARTITION ... CONCURRENTLY` (which does not block
+writes to the other months) and drops it. Dropping a whole partition keeps
+the cleanup free of row-level deletes and table bloat.
+
+Rows that do not live in a dedicated monthly partition (the historic
+partition, or databases where the table is not partitioned) are exported the
+same way and then deleted in chunks of `activity_archive_batch_size` rows.
+
+An archive file is always fully written and renamed into place before any
+row it contains is removed, so an interrupted run can only leave rows behind
+for the next run, never lose them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import column, func, table, text, tuple_
+from sqlalchemy.exc import DBAPIError
+from sqlmodel import col, delete, select
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.time import utcnow
+from app.models.activity_events import ActivityEvent
+
+if TYPE_CHECKING:
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+logger = get_logger(__name__)
+
+PARENT_TABLE = "activity_events"
+PARTITION_PREFIX = "activity_events_p"
+_PARTITION_NAME = re.compile(rf"^{PARTITION_PREFIX}(\d{{4}})_(\d{{2}})$")
+
+
+def month_start(value: datetime) -> datetime:
+    """Return midnight on the first day of `value`'s month."""
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(value: datetime, months: int) -> datetime:
+    """Return the first day of the month `months` after `value`'s month."""
+    index = value.year * 12 + value.month - 1 + months
+    return month_start(value).replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(month: datetime) -> str:
+    """Return the monthly partition table name covering `month`."""
+    return f"{PARTITION_PREFIX}{month:%Y_%m}"
+
+
+def retention_cutoff(now: datetime, retention_months: int) -> datetime | None:
+    """Return the first instant that must stay in the database, or None to keep all."""
+    if retention_months <= 0:
+        return None
+    return add_months(now, -retention_months)
+
+
+@dataclass(frozen=True)
+class ActivityArchiveResult:
+    """Outcome of one archival job run."""
+
+    cutoff: datetime | None
+    partitions_created: int = 0
+    partitions_dropped: int = 0
+    rows_archived: int = 0
+    files: list[Path] = field(default_factory=list)
+
+
+async def is_partitioned(session: AsyncSession) -> bool:
+    """Return whether `activity_events` is a Postgres partitioned table."""
+    connection = await session.connection()
+    if connection.dialect.name != "postgresql":
+        return False
+    result = await session.execute(
+        text(
+            "SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(:name)",
+        ),
+        {"name": PARENT_TABLE},
+    )
+    return result.first() is not None
+
+
+async def _monthly_partitions(session: AsyncSession) -> dict[datetime, str]:
+    result = await session.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = to_regclass(:name)",
+        ),
+        {"name": PARENT_TABLE},
+    )
+    partitions: dict[datetime, str] = {}
+    for (name,) in result.all():
+        match = _PARTITION_NAME.match(name)
+        if match:
+            partitions[datetime(int(match[1]), int(match[2]), 1)] = name
+    return partitions
+
+
+async def ensure_partitions(
+    session: AsyncSession,
+    *,
+    now: datetime | None = None,
+    months_ahead: int | None = None,
+) -> int:
+    """Create any missing monthly partitions from this month through `months_ahead`.
+
+    Returns the number of partitions created. Months before the first monthly
+    partition belong to the historic partition and are left alone; a month
+    that cannot be created for any other reason is logged and skipped.
+    """
+    if not await is_partitioned(session):
+        return 0
+    current = month_start(now or utcnow())
+    ahead = settings.activity_partition_months_ahead if months_ahead is None else months_ahead
+    existing = await _monthly_partitions(session)
+    first = min(existing, default=None)
+    created = 0
+    for offset in range(ahead + 1):
+        start = add_months(current, offset)
+        if start in existing or (first is not None and start < first):
+            continue
+        name = partition_name(start)
+        try:
+            async with session.begin_nested():
+                await session.execute(
+                    text(
+                        f'CREATE TABLE "{name}" PARTITION OF {PARENT_TABLE} '
+                        f"FOR VALUES FROM ('{start.isoformat()}') "
+                        f"TO ('{add_months(start, 1).isoformat()}')",
+                    ),
+                )
+        except DBAPIError:
+            logger.warning(
+                "activity_archive.partition_create_failed",
+                extra={"partition": name},
+                exc_info=True,
+            )
+            continue
+        created += 1
+    await session.commit()
+    return created
+
+
+def _archive_path(directory: Path, month: datetime) -> Path:
+    """Return a not-yet-used archive file path for `month`."""
+    base = f"{PARENT_TABLE}_{month:%Y_%m}"
+    candidate = directory / f"{base}.jsonl.gz"
+    suffix = 1
+    while candidate.exists():
+        candidate = directory / f"{base}.{suffix}.jsonl.gz"
+        suffix += 1
+    return candidate
+
+
+def _event_record(row: Any) -> dict[str, object]:
+    return {
+        "id": str(row.id),
+        "event_type": row.event_type,
+        "message": row.message,
+        "agent_id": str(row.agent_id) if row.agent_id else None,
+        "task_id": str(row.task_id) if row.task_id else None,
+        "created_at": row.created_at.isoformat(),
+    }
+
+
+def _open_archive(path: Path) -> gzip.GzipFile:
+    return gzip.open(path, "wb")
+
+
+def _write_lines(handle: gzip.GzipFile, records: list[dict[str, object]]) -> None:
+    handle.write(
+        "".join(json.dumps(record, separators=(",", ":")) + "\n" for record in records).encode(),
+    )
+
+
+def _detached_table(name: str) -> Any:
+    """Return a table handle with the event columns for a detached partition."""
+    columns = ActivityEvent.__table__.columns  # type: ignore[attr-defined]
+    return table(name, *(column(item.name, item.type) for item in columns))
+
+
+async def export_range(
+    session: AsyncSession,
+    *,
+    start: datetime,
+    end: datetime,
+    directory: Path,
+    batch_size: int,
+    table_name: str | None = None,
+) -> tuple[Path | None, int]:
+    """Write events with `start <= created_at < end` to a new archive file.
+
+    Rows are read in `(created_at, id)` keyset pages so memory stays bounded.
+    `table_name` reads a detached partition instead of `activity_events`.
+    Returns `(path, row_count)`; no file is written for an empty range.
+    """
+    source = (
+        ActivityEvent.__table__  # type: ignore[attr-defined]
+        if table_name is None
+        else _detached_table(table_name)
+    )
+    in_range = (source.c.created_at >= start, source.c.created_at < end)
+    await asyncio.to_thread(directory.mkdir, parents=True, exist_ok=True)
+    path = _archive_path(directory, start)
+    partial = path.with_name(path.name + ".part")
+    handle: gzip.GzipFile | None = None
+    count = 0
+    last: tuple[Any, Any] | None = None
+    try:
+        while True:
+            statement = (
+                select(source)
+                .where(*in_range)
+                .order_by(source.c.created_at, source.c.id)
+                .limit(batch_size)
+            )
+            if last is not None:
+                statement = statement.where(
+                    tuple_(source.c.created_at, source.c.id) > tuple_(*last),
+                )
+            rows = (await session.execute(statement)).all()
+            if not rows:
+                break
+            if handle is None:
+                handle = await asyncio.to_thread(_open_archive, partial)
+            await asyncio.to_thread(_write_lines, handle, [_event_record(row) for row in rows])
+            count += len(rows)
+            last = (rows[-1].created_at, rows[-1].id)
+    except BaseException:
+        if handle is not None:
+            await asyncio.to_thread(handle.close)
+            await asyncio.to_thread(partial.unlink, missing_ok=True)
+        raise
+    if handle is None:
+        return None, 0
+    await asyncio.to_thread(handle.close)
+    await asyncio.to_thread(os.replace, partial, path)
+    return path, count
+
+
+async def _delete_range(
+    session: AsyncSession,
+    *,
+    start: datetime,
+    end: datetime,
+    batch_size: int,
+) -> None:
+    in_range = (
+        col(ActivityEvent.created_at) >= start,
+        col(ActivityEvent.created_at) < end,
+    )
+    while True:
+        batch = select(ActivityEvent.id).where(*in_range).limit(batch_size)
+        result = await session.exec(delete(ActivityEvent).where(col(ActivityEvent.id).in_(batch)))
+        await session.commit()
+        if not result.rowcount:
+            return
+
+
+async def _detached_partitions(session: AsyncSession) -> dict[datetime, str]:
+    """Return monthly tables left detached but not dropped by an interrupted run."""
+    result = await session.execute(
+        text(
+            "SELECT relname FROM pg_class "
+            "WHERE relkind = 'r' AND NOT relispartition AND pg_table_is_visible(oid) "
+            "AND starts_with(relname, :prefix)",
+        ),
+        {"prefix": PARTITION_PREFIX},
+    )
+    tables: dict[datetime, str] = {}
+    for (name,) in result.all():
+        match = _PARTITION_NAME.match(name)
+        if match:
+            tables[datetime(int(match[1]), int(match[2]), 1)] = name
+    return tables
+
+
+async def _detach_pending(session: AsyncSession, name: str) -> bool:
+    result = await session.execute(
+        text("SELECT inhdetachpending FROM pg_inherits WHERE inhrelid = to_regclass(:name)"),
+        {"name": f'"{name}"'},
+    )
+    return bool(result.scalar())
+
+
+async def _row_count(session: AsyncSession, name: str) -> int:
+    result = await session.execute(text(f'SELECT count(*) FROM "{name}"'))
+    return int(result.scalar_one())
+
+
+async def _execute_outside_transaction(session: AsyncSession, statement: str) -> None:
+    """Commit, then run `statement` on a connection without a transaction block."""
+    await session.commit()
+    connection = await session.connection(
+        execution_options={"isolation_level": "AUTOCOMMIT"},
+    )
+    await connection.execute(text(statement))
+    await session.commit()
+
+
+async def _archive_detached(
+    session: AsyncSession,
+    *,
+    month: datetime,
+    name: str,
+    directory: Path,
+    batch_size: int,
+) -> tuple[Path | None, int]:
+    path, count = await export_range(
+        session,
+        start=month,
+        end=add_months(month, 1),
+        directory=directory,
+        batch_size=batch_size,
+        table_name=name,
+    )
+    await session.execute(text(f'DROP TABLE "{name}"'))
+    await session.commit()
+    return path, count
+
+
+async def _archive_partition(
+    session: AsyncSession,
+    *,
+    month: datetime,
+    name: str,
+    directory: Path,
+    batch_size: int,
+) -> tuple[Path | None, int]:
+    path, count = await export_range(
+        session,
+        start=month,
+        end=add_months(month, 1),
+        directory=directory,
+        batch_size=batch_size,
+    )
+    # CONCURRENTLY cannot run in a transaction block; in exchange it only takes
+    # SHARE UPDATE EXCLUSIVE on the parent. A detach interrupted half-way
+    # leaves the partition pending and has to be finished with FINALIZE.
+    mode = "FINALIZE" if await _detach_pending(session, name) else "CONCURRENTLY"
+    await _execute_outside_transaction(
+        session,
+        f'ALTER TABLE {PARENT_TABLE} DETACH PARTITION "{name}" {mode}',
+    )
+    if await _row_count(session, name) == count:
+        await session.execute(text(f'DROP TABLE "{name}"'))
+        await session.commit()
+        return path, count
+    # Rows were written to the month between the export and the detach. The
+    # detached table takes no more writes, so export it again from there.
+    if path is not None:
+        await asyncio.to_thread(path.unlink)
+    return await _archive_detached(
+        session,
+        month=month,
+        name=name,
+        directory=directory,
+        batch_size=batch_size,
+    )
+
+
+async def archive_activity_events(
+    session: AsyncSession,
+    *,
+    now: datetime | None = None,
+) -> ActivityArchiveResult:
+    """Create upcoming partitions and archive every month past the retention window."""
+    now = now or utcnow()
+    created = await ensure_partitions(session, now=now)
+    cutoff = retention_cutoff(now, settings.activity_retention_months)
+    if cutoff is None:
+        return ActivityArchiveResult(cutoff=None, partitions_created=created)
+
+    directory = Path(settings.activity_archive_dir)
+    batch_size = settings.activity_archive_batch_size
+    files: list[Path] = []
+    rows = 0
+    dropped = 0
+    if await is_partitioned(session):
+        for month, name in sorted((await _monthly_partitions(session)).items()):
+            if add_months(month, 1) > cutoff:
+                continue
+            path, count = await _archive_partition(
+                session,
+                month=month,
+                name=name,
+                directory=directory,
+                batch_size=batch_size,
+            )
+            dropped += 1
+            rows += count
+            if path is not None:
+                files.append(path)
+        for month, name in sorted((await _detached_partitions(session)).items()):
+            path, count = await _archive_detached(
+                session,
+                month=month,
+                name=name,
+                directory=directory,
+                batch_size=batch_size,
+            )
+            dropped += 1
+            rows += count
+            if path is not None:
+                files.append(path)
+
+    # Whatever is still older than the cutoff lives outside a monthly partition.
+    oldest = (
+        await session.exec(
+            select(func.min(ActivityEvent.created_at)).where(
+                col(ActivityEvent.created_at) < cutoff,
+            ),
+        )
+    ).one()
+    month = month_start(oldest) if oldest is not None else cutoff
+    while month < cutoff:
+        end = min(add_months(month, 1), cutoff)
+        path, count = await export_range(
+            session,
+            start=month,
+            end=end,
+            directory=directory,
+            batch_size=batch_size,
+        )
+        if path is not None:
+            await _delete_range(session, start=month, end=end, batch_size=batch_size)
+            files.append(path)
+            rows += count
+        month = end
+    return ActivityArchiveResult(
+        cutoff=cutoff,
+        partitions_created=created,
+        partitions_dropped=dropped,
+        rows_archived=rows,
+        files=files,
+    )
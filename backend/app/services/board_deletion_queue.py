@@ -0,0 +1,83 @@
+"""Queue helpers for background board deletion jobs."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.services.queue import QueuedTask, enqueue_task, requeue_if_failed
+
+logger = get_logger(__name__)
+TASK_TYPE = "board_deletion"
+
+
+@dataclass(frozen=True)
+class QueuedBoardDeletion:
+    """Payload envelope for board deletion background jobs."""
+
+    board_id: UUID
+    queued_at: datetime
+    attempts: int = 0
+
+
+def _task_from_payload(payload: QueuedBoardDeletion) -> QueuedTask:
+    return QueuedTask(
+        task_type=TASK_TYPE,
+        payload={
+            "board_id": str(payload.board_id),
+            "queued_at": payload.queued_at.isoformat(),
+        },
+        created_at=payload.queued_at,
+        attempts=payload.attempts,
+    )
+
+
+def decode_board_deletion(task: QueuedTask) -> QueuedBoardDeletion:
+    """Decode generic queued task into a board deletion payload."""
+    if task.task_type != TASK_TYPE:
+        raise ValueError(f"Unexpected task_type={task.task_type!r}; expected {TASK_TYPE!r}")
+    payload: dict[str, Any] = task.payload
+    queued_at = payload.get("queued_at")
+    return QueuedBoardDeletion(
+        board_id=UUID(payload["board_id"]),
+        queued_at=(
+            datetime.fromisoformat(queued_at) if isinstance(queued_at, str) else datetime.now(UTC)
+        ),
+        attempts=int(payload.get("attempts", task.attempts)),
+    )
+
+
+def enqueue_board_deletion(payload: QueuedBoardDeletion) -> bool:
+    """Enqueue chunked deletion of one board."""
+    try:
+        enqueue_task(
+            _task_from_payload(payload),
+            settings.rq_queue_name,
+            redis_url=settings.rq_redis_url,
+        )
+        logger.info(
+            "board_deletion.queue.enqueued",
+            extra={"board_id": str(payload.board_id), "attempt": payload.attempts},
+        )
+        return True
+    except Exception as exc:
+        logger.warning(
+            "board_deletion.queue.enqueue_failed",
+            extra={"board_id": str(payload.board_id), "error": str(exc)},
+        )
+        return False
+
+
+def requeue_board_deletion(task: QueuedTask, *, delay_seconds: float = 0) -> bool:
+    """Requeue failed board deletion jobs with capped retry policy."""
+    return requeue_if_failed(
+        task,
+        settings.rq_queue_name,
+        max_retries=settings.rq_dispatch_max_retries,
+        redis_url=settings.rq_redis_url,
+        delay_seconds=delay_seconds,
+    )
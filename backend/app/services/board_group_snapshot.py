@@ -1,8 +1,15 @@
-"""Helpers for assembling board-group snapshot view models."""
+"""Helpers for assembling board-group snapshot view models.
+
+Each board's section of a group snapshot is cached per board and keyed on
+`boards.snapshot_version`, which `app.db.board_versions` bumps on every write
+that feeds the section. A group snapshot re-lists the group's boards, rebuilds
+only the sections whose board version moved, and merges them in board order.
+"""
 
 from __future__ import annotations
 
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 from uuid import UUID
 
@@ -10,6 +17,7 @@ from sqlalchemy import case, func
 from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.db.board_versions import has_uncommitted_bumps
 from app.models.agents import Agent
 from app.models.board_groups import BoardGroup
 from app.models.boards import Board
@@ -29,6 +37,7 @@ if TYPE_CHECKING:
 _STATUS_ORDER = {"in_progress": 0, "review": 1, "inbox": 2, "done": 3}
 _PRIORITY_ORDER = {"high": 0, "medium": 1, "low": 2}
 _RUNTIME_TYPE_REFERENCES = (UUID, AsyncSession)
+GROUP_SECTION_CACHE_MAX_ENTRIES = 1024
 
 
 def _status_weight_expr() -> ColumnElement[int]:
@@ -60,6 +69,22 @@ async def _boards_for_group(
     )
 
 
+async def _snapshot_versions(
+    session: AsyncSession,
+    board_ids: list[UUID],
+) -> dict[UUID, int]:
+    """Return current snapshot versions, bypassing possibly stale loaded boards."""
+    return dict(
+        list(
+            await session.exec(
+                select(col(Board.id), col(Board.snapshot_version)).where(
+                    col(Board.id).in_(board_ids),
+                ),
+            ),
+        ),
+    )
+
+
 async def _task_counts_by_board(
     session: AsyncSession,
     board_ids: list[UUID],
@@ -84,17 +109,33 @@ async def _ordered_tasks_for_boards(
     board_ids: list[UUID],
     *,
     include_done: bool,
+    per_board_task_limit: int,
 ) -> list[Task]:
-    """Return sorted tasks for boards, optionally excluding completed tasks."""
-    task_statement = select(Task).where(col(Task.board_id).in_(board_ids))
+    """Return the top `per_board_task_limit` tasks of each board in display order."""
+    if per_board_task_limit <= 0:
+        return []
+    rank = (
+        func.row_number()
+        .over(
+            partition_by=col(Task.board_id),
+            order_by=(
+                _status_weight_expr().asc(),
+                _priority_weight_expr().asc(),
+                col(Task.updated_at).desc(),
+                col(Task.created_at).desc(),
+            ),
+        )
+        .label("rank")
+    )
+    ranked_statement = select(col(Task.id), rank).where(col(Task.board_id).in_(board_ids))
     if not include_done:
-        task_statement = task_statement.where(col(Task.status) != "done")
-    task_statement = task_statement.order_by(
-        col(Task.board_id).asc(),
-        _status_weight_expr().asc(),
-        _priority_weight_expr().asc(),
-        col(Task.updated_at).desc(),
-        col(Task.created_at).desc(),
+        ranked_statement = ranked_statement.where(col(Task.status) != "done")
+    ranked = ranked_statement.subquery()
+    task_statement = (
+        select(Task)
+        .join(ranked, ranked.c.id == col(Task.id))
+        .where(ranked.c.rank <= per_board_task_limit)
+        .order_by(col(Task.board_id).asc(), ranked.c.rank.asc())
     )
     return list(await session.exec(task_statement))
 
@@ -164,24 +205,62 @@ def _task_summaries_by_board(
     return tasks_by_board
 
 
-async def build_group_snapshot(
+@dataclass(frozen=True, slots=True)
+class _SectionKey:
+    board_id: UUID
+    include_done: bool
+    per_board_task_limit: int
+
+
+@dataclass(frozen=True, slots=True)
+class _CachedSection:
+    version: int
+    section: BoardGroupBoardSnapshot
+
+
+class BoardGroupSectionCache:
+    """Bounded LRU of per-board group snapshot sections keyed by board version."""
+
+    def __init__(self, *, max_entries: int = GROUP_SECTION_CACHE_MAX_ENTRIES) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[_SectionKey, _CachedSection] = OrderedDict()
+
+    def get(self, key: _SectionKey, version: int) -> BoardGroupBoardSnapshot | None:
+        """Return the cached section for `key` if it was built at `version`."""
+        entry = self._entries.get(key)
+        if entry is None or entry.version != version:
+            return None
+        self._entries.move_to_end(key)
+        return entry.section
+
+    def put(self, key: _SectionKey, version: int, section: BoardGroupBoardSnapshot) -> None:
+        """Store `section`, replacing any other version cached under `key`."""
+        self._entries[key] = _CachedSection(version=version, section=section)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached section."""
+        self._entries.clear()
+
+
+_GROUP_SECTION_CACHE = BoardGroupSectionCache()
+
+
+def get_board_group_section_cache() -> BoardGroupSectionCache:
+    """Return the process-scoped board-group section cache."""
+    return _GROUP_SECTION_CACHE
+
+
+async def _build_board_sections(
     session: AsyncSession,
+    boards: list[Board],
     *,
-    group: BoardGroup,
-    exclude_board_id: UUID | None = None,
-    include_done: bool = False,
-    per_board_task_limit: int = 5,
-) -> BoardGroupSnapshot:
-    """Build a board-group snapshot with board/task summaries."""
-    boards = await _boards_for_group(
-        session,
-        group_id=group.id,
-        exclude_board_id=exclude_board_id,
-    )
-    if not boards:
-        return BoardGroupSnapshot(
-            group=BoardGroupRead.model_validate(group, from_attributes=True),
-        )
+    include_done: bool,
+    per_board_task_limit: int,
+) -> dict[UUID, BoardGroupBoardSnapshot]:
+    """Build group snapshot sections for `boards` with batched queries."""
     boards_by_id = {board.id: board for board in boards}
     board_ids = list(boards_by_id.keys())
     task_counts = await _task_counts_by_board(session, board_ids)
@@ -189,6 +268,7 @@ async def build_group_snapshot(
         session,
         board_ids,
         include_done=include_done,
+        per_board_task_limit=per_board_task_limit,
     )
     agent_name_by_id = await _agent_names(session, tasks)
     tag_state_by_task_id = await load_tag_state(
@@ -202,17 +282,60 @@ async def build_group_snapshot(
         tag_state_by_task_id=tag_state_by_task_id,
         per_board_task_limit=per_board_task_limit,
     )
-    snapshots = [
-        BoardGroupBoardSnapshot(
+    return {
+        board.id: BoardGroupBoardSnapshot(
             board=BoardRead.model_validate(board, from_attributes=True),
             task_counts=dict(task_counts.get(board.id, {})),
             tasks=tasks_by_board.get(board.id, []),
         )
         for board in boards
-    ]
+    }
+
+
+async def build_group_snapshot(
+    session: AsyncSession,
+    *,
+    group: BoardGroup,
+    exclude_board_id: UUID | None = None,
+    include_done: bool = False,
+    per_board_task_limit: int = 5,
+) -> BoardGroupSnapshot:
+    """Build a board-group snapshot with board/task summaries."""
+    boards = await _boards_for_group(
+        session,
+        group_id=group.id,
+        exclude_board_id=exclude_board_id,
+    )
+    if not boards:
+        return BoardGroupSnapshot(
+            group=BoardGroupRead.model_validate(group, from_attributes=True),
+        )
+    cache = get_board_group_section_cache()
+    versions = await _snapshot_versions(session, [board.id for board in boards])
+    sections: dict[UUID, BoardGroupBoardSnapshot] = {}
+    stale: list[Board] = []
+    for board in boards:
+        key = _SectionKey(board.id, include_done, per_board_task_limit)
+        section = cache.get(key, versions.get(board.id, -1))
+        if section is None:
+            stale.append(board)
+        else:
+            sections[board.id] = section
+    if stale:
+        rebuilt = await _build_board_sections(
+            session,
+            stale,
+            include_done=include_done,
+            per_board_task_limit=per_board_task_limit,
+        )
+        if not has_uncommitted_bumps(session, "snapshot_version"):
+            for board in stale:
+                key = _SectionKey(board.id, include_done, per_board_task_limit)
+                cache.put(key, versions.get(board.id, -1), rebuilt[board.id])
+        sections.update(rebuilt)
     return BoardGroupSnapshot(
         group=BoardGroupRead.model_validate(group, from_attributes=True),
-        boards=snapshots,
+        boards=[sections[board.id] for board in boards],
     )
 
 
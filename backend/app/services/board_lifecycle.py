@@ -2,16 +2,34 @@
 
 This module contains DB-backed board workflows that may also interact with the
 OpenClaw gateway. API routes should remain thin wrappers over these helpers.
+
+Board deletion runs in the background: `request_board_deletion` marks the
+board (`deleting_at`) and enqueues a job, and `run_board_deletion` then
+removes gateway agents and child rows stage by stage, in chunks of
+`board_deletion_batch_size` rows. Each chunk commits together with the
+board's `deletion_progress`, so a job that dies mid-way resumes at the
+recorded stage; `resume_stalled_board_deletions` re-queues deletions that
+have stopped making progress. Writes to a deleting board are rejected, and if
+a straggling row still blocks a delete, the next run starts over from the
+first stage.
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
 
-from fastapi import HTTPException, status
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import col, select
 
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.time import utcnow
 from app.db import crud
+from app.db.session import async_session_maker
 from app.models.activity_events import ActivityEvent
 from app.models.agents import Agent
 from app.models.approval_task_links import ApprovalTaskLink
@@ -20,6 +38,8 @@ from app.models.board_memory import BoardMemory
 from app.models.board_onboarding import BoardOnboardingSession
 from app.models.board_webhook_payloads import BoardWebhookPayload
 from app.models.board_webhooks import BoardWebhook
+from app.models.boards import Board
+from app.models.dashboard_rollups import BoardMetricsRollup
 from app.models.organization_board_access import OrganizationBoardAccess
 from app.models.organization_invite_board_access import OrganizationInviteBoardAccess
 from app.models.tag_assignments import TagAssignment
@@ -27,15 +47,25 @@ from app.models.task_custom_fields import BoardTaskCustomField, TaskCustomFieldV
 from app.models.task_dependencies import TaskDependency
 from app.models.task_fingerprints import TaskFingerprint
 from app.models.tasks import Task
-from app.schemas.common import OkResponse
+from app.schemas.boards import BoardDeletionRead
+from app.services.board_deletion_queue import (
+    QueuedBoardDeletion,
+    decode_board_deletion,
+    enqueue_board_deletion,
+)
 from app.services.openclaw.gateway_resolver import gateway_client_config, require_gateway_for_board
 from app.services.openclaw.gateway_rpc import OpenClawGatewayError
 from app.services.openclaw.provisioning import OpenClawGatewayProvisioner
 
 if TYPE_CHECKING:
+    from sqlalchemy import ColumnElement
     from sqlmodel.ext.asyncio.session import AsyncSession
+    from sqlmodel.sql.expression import SelectOfScalar
+
+    from app.services.queue import QueuedTask
 
-    from app.models.boards import Board
+logger = get_logger(__name__)
+GATEWAY_AGENTS_STAGE = "gateway_agents"
 
 
 def _is_missing_gateway_agent_error(exc: OpenClawGatewayError) -> bool:
@@ -49,113 +79,312 @@ def _is_missing_gateway_agent_error(exc: OpenClawGatewayError) -> bool:
     return "agent" in message and "not found" in message
 
 
-async def delete_board(session: AsyncSession, *, board: Board) -> OkResponse:
-    """Delete a board and all dependent records, cleaning gateway state when configured."""
-    agents = await Agent.objects.filter_by(board_id=board.id).all(session)
-    task_ids = list(await session.exec(select(Task.id).where(Task.board_id == board.id)))
-
-    if board.gateway_id:
-        gateway = await require_gateway_for_board(session, board, require_workspace_root=True)
-        # Ensure URL is present (required for gateway cleanup calls).
-        gateway_client_config(gateway)
-        for agent in agents:
-            try:
-                await OpenClawGatewayProvisioner().delete_agent_lifecycle(
-                    agent=agent,
-                    gateway=gateway,
-                )
-            except OpenClawGatewayError as exc:
-                if _is_missing_gateway_agent_error(exc):
-                    continue
-                raise HTTPException(
-                    status_code=status.HTTP_502_BAD_GATEWAY,
-                    detail=f"Gateway cleanup failed: {exc}",
-                ) from exc
-
-    if task_ids:
-        await crud.delete_where(
-            session,
-            ActivityEvent,
-            col(ActivityEvent.task_id).in_(task_ids),
-            commit=False,
-        )
-        await crud.delete_where(
-            session,
-            TagAssignment,
-            col(TagAssignment.task_id).in_(task_ids),
-            commit=False,
-        )
-        await crud.delete_where(
-            session,
-            TaskCustomFieldValue,
-            col(TaskCustomFieldValue.task_id).in_(task_ids),
-            commit=False,
-        )
-    # Keep teardown ordered around FK/reference chains so dependent rows are gone
-    # before deleting their parent task/agent/board records.
-    await crud.delete_where(
-        session,
+@dataclass(frozen=True)
+class _DeletionStage:
+    name: str
+    model: type[Any]
+    criteria: Callable[[UUID], ColumnElement[bool]]
+
+
+def _board_task_ids(board_id: UUID) -> SelectOfScalar[UUID]:
+    return select(Task.id).where(col(Task.board_id) == board_id)
+
+
+def _board_agent_ids(board_id: UUID) -> SelectOfScalar[UUID]:
+    return select(Agent.id).where(col(Agent.board_id) == board_id)
+
+
+# Ordered around FK/reference chains so dependent rows are gone before their
+# parent task/agent/board records.
+_DELETION_STAGES: tuple[_DeletionStage, ...] = (
+    _DeletionStage(
+        "task_activity_events",
+        ActivityEvent,
+        lambda board_id: col(ActivityEvent.task_id).in_(_board_task_ids(board_id)),
+    ),
+    _DeletionStage(
+        "tag_assignments",
+        TagAssignment,
+        lambda board_id: col(TagAssignment.task_id).in_(_board_task_ids(board_id)),
+    ),
+    _DeletionStage(
+        "task_custom_field_values",
+        TaskCustomFieldValue,
+        lambda board_id: col(TaskCustomFieldValue.task_id).in_(_board_task_ids(board_id)),
+    ),
+    _DeletionStage(
+        "task_dependencies",
         TaskDependency,
-        col(TaskDependency.board_id) == board.id,
-    )
-    await crud.delete_where(
-        session,
+        lambda board_id: col(TaskDependency.board_id) == board_id,
+    ),
+    _DeletionStage(
+        "task_fingerprints",
         TaskFingerprint,
-        col(TaskFingerprint.board_id) == board.id,
-    )
-
+        lambda board_id: col(TaskFingerprint.board_id) == board_id,
+    ),
     # Approvals can reference tasks and agents, so delete before both.
-    approval_ids = select(Approval.id).where(col(Approval.board_id) == board.id)
-    await crud.delete_where(
-        session,
+    _DeletionStage(
+        "approval_task_links",
         ApprovalTaskLink,
-        col(ApprovalTaskLink.approval_id).in_(approval_ids),
-        commit=False,
-    )
-    await crud.delete_where(session, Approval, col(Approval.board_id) == board.id)
-
-    await crud.delete_where(session, BoardMemory, col(BoardMemory.board_id) == board.id)
-    await crud.delete_where(
-        session,
+        lambda board_id: col(ApprovalTaskLink.approval_id).in_(
+            select(Approval.id).where(col(Approval.board_id) == board_id),
+        ),
+    ),
+    _DeletionStage(
+        "approvals",
+        Approval,
+        lambda board_id: col(Approval.board_id) == board_id,
+    ),
+    _DeletionStage(
+        "board_memory",
+        BoardMemory,
+        lambda board_id: col(BoardMemory.board_id) == board_id,
+    ),
+    _DeletionStage(
+        "board_webhook_payloads",
         BoardWebhookPayload,
-        col(BoardWebhookPayload.board_id) == board.id,
-    )
-    await crud.delete_where(session, BoardWebhook, col(BoardWebhook.board_id) == board.id)
-    await crud.delete_where(
-        session,
+        lambda board_id: col(BoardWebhookPayload.board_id) == board_id,
+    ),
+    _DeletionStage(
+        "board_webhooks",
+        BoardWebhook,
+        lambda board_id: col(BoardWebhook.board_id) == board_id,
+    ),
+    _DeletionStage(
+        "board_metrics_rollups",
+        BoardMetricsRollup,
+        lambda board_id: col(BoardMetricsRollup.board_id) == board_id,
+    ),
+    _DeletionStage(
+        "board_onboarding_sessions",
         BoardOnboardingSession,
-        col(BoardOnboardingSession.board_id) == board.id,
-    )
-    await crud.delete_where(
-        session,
+        lambda board_id: col(BoardOnboardingSession.board_id) == board_id,
+    ),
+    _DeletionStage(
+        "organization_board_access",
         OrganizationBoardAccess,
-        col(OrganizationBoardAccess.board_id) == board.id,
-    )
-    await crud.delete_where(
-        session,
+        lambda board_id: col(OrganizationBoardAccess.board_id) == board_id,
+    ),
+    _DeletionStage(
+        "organization_invite_board_access",
         OrganizationInviteBoardAccess,
-        col(OrganizationInviteBoardAccess.board_id) == board.id,
-    )
-    await crud.delete_where(
-        session,
+        lambda board_id: col(OrganizationInviteBoardAccess.board_id) == board_id,
+    ),
+    _DeletionStage(
+        "board_task_custom_fields",
         BoardTaskCustomField,
-        col(BoardTaskCustomField.board_id) == board.id,
+        lambda board_id: col(BoardTaskCustomField.board_id) == board_id,
+    ),
+    # Tasks reference agents and have dependent records; delete tasks before agents.
+    _DeletionStage(
+        "tasks",
+        Task,
+        lambda board_id: col(Task.board_id) == board_id,
+    ),
+    _DeletionStage(
+        "agent_activity_events",
+        ActivityEvent,
+        lambda board_id: col(ActivityEvent.agent_id).in_(_board_agent_ids(board_id)),
+    ),
+    _DeletionStage(
+        "agents",
+        Agent,
+        lambda board_id: col(Agent.board_id) == board_id,
+    ),
+)
+STAGE_NAMES: tuple[str, ...] = (
+    GATEWAY_AGENTS_STAGE,
+    *(stage.name for stage in _DELETION_STAGES),
+)
+
+
+def deletion_status(board: Board) -> BoardDeletionRead:
+    """Return the deletion progress recorded on `board`."""
+    progress = board.deletion_progress or {}
+    deleted = progress.get("deleted")
+    error = progress.get("error")
+    return BoardDeletionRead(
+        board_id=board.id,
+        deleting_at=board.deleting_at,
+        stage=str(progress.get("stage") or STAGE_NAMES[0]),
+        deleted=dict(deleted) if isinstance(deleted, dict) else {},
+        error=str(error) if error else None,
     )
 
-    # Tasks reference agents and have dependent records.
-    # Delete tasks before agents.
-    await crud.delete_where(session, Task, col(Task.board_id) == board.id)
-
-    if agents:
-        agent_ids = [agent.id for agent in agents]
-        await crud.delete_where(
-            session,
-            ActivityEvent,
-            col(ActivityEvent.agent_id).in_(agent_ids),
-            commit=False,
+
+def _set_progress(
+    board: Board,
+    *,
+    stage: str,
+    deleted: dict[str, int],
+    error: str | None = None,
+) -> None:
+    board.deletion_progress = {"stage": stage, "deleted": dict(deleted), "error": error}
+    board.updated_at = utcnow()
+
+
+async def request_board_deletion(session: AsyncSession, *, board: Board) -> BoardDeletionRead:
+    """Mark `board` as deleting and enqueue its background deletion."""
+    if board.deleting_at is None:
+        board.deleting_at = utcnow()
+        _set_progress(board, stage=STAGE_NAMES[0], deleted={})
+        session.add(board)
+        await session.commit()
+        # A failed enqueue is retried by `resume_stalled_board_deletions`.
+        enqueue_board_deletion(
+            QueuedBoardDeletion(board_id=board.id, queued_at=datetime.now(UTC)),
         )
-        await crud.delete_where(session, Agent, col(Agent.id).in_(agent_ids))
+    return deletion_status(board)
+
+
+async def _delete_gateway_agents(session: AsyncSession, board: Board) -> None:
+    if not board.gateway_id:
+        return
+    agents = await Agent.objects.filter_by(board_id=board.id).all(session)
+    if not agents:
+        return
+    gateway = await require_gateway_for_board(session, board, require_workspace_root=True)
+    # Ensure URL is present (required for gateway cleanup calls).
+    gateway_client_config(gateway)
+    for agent in agents:
+        try:
+            await OpenClawGatewayProvisioner().delete_agent_lifecycle(
+                agent=agent,
+                gateway=gateway,
+            )
+        except OpenClawGatewayError as exc:
+            if _is_missing_gateway_agent_error(exc):
+                continue
+            raise
+
+
+async def _delete_stage_chunk(
+    session: AsyncSession,
+    stage: _DeletionStage,
+    board_id: UUID,
+    *,
+    batch_size: int,
+) -> int:
+    ids = list(
+        await session.exec(
+            select(stage.model.id).where(stage.criteria(board_id)).limit(batch_size),
+        ),
+    )
+    if not ids:
+        return 0
+    await crud.delete_where(session, stage.model, col(stage.model.id).in_(ids))
+    return len(ids)
 
-    await session.delete(board)
-    await session.commit()
-    return OkResponse()
+
+async def run_board_deletion(
+    session: AsyncSession,
+    *,
+    board: Board,
+    batch_size: int | None = None,
+) -> BoardDeletionRead:
+    """Delete `board` and its dependent records, resuming at the recorded stage."""
+    batch_size = batch_size or settings.board_deletion_batch_size
+    status_before = deletion_status(board)
+    deleted = {name: int(count) for name, count in status_before.deleted.items()}
+    stage_name = status_before.stage if status_before.stage in STAGE_NAMES else STAGE_NAMES[0]
+
+    if stage_name == GATEWAY_AGENTS_STAGE:
+        try:
+            await _delete_gateway_agents(session, board)
+        except OpenClawGatewayError as exc:
+            _set_progress(board, stage=stage_name, deleted=deleted, error=str(exc))
+            session.add(board)
+            await session.commit()
+            raise
+        stage_name = _DELETION_STAGES[0].name
+        _set_progress(board, stage=stage_name, deleted=deleted)
+        session.add(board)
+        await session.commit()
+
+    remaining = _DELETION_STAGES[[stage.name for stage in _DELETION_STAGES].index(stage_name) :]
+    try:
+        for index, stage in enumerate(remaining):
+            while count := await _delete_stage_chunk(
+                session,
+                stage,
+                board.id,
+                batch_size=batch_size,
+            ):
+                deleted[stage.name] = deleted.get(stage.name, 0) + count
+                # The chunk and the progress that records it commit together.
+                _set_progress(board, stage=stage.name, deleted=deleted)
+                session.add(board)
+                await session.commit()
+            next_stage = remaining[index + 1].name if index + 1 < len(remaining) else stage.name
+            _set_progress(board, stage=next_stage, deleted=deleted)
+            session.add(board)
+            await session.commit()
+            logger.info(
+                "board.deletion.stage_complete",
+                extra={
+                    "board_id": str(board.id),
+                    "stage": stage.name,
+                    "deleted": deleted.get(stage.name, 0),
+                },
+            )
+
+        final = deletion_status(board)
+        await session.delete(board)
+        await session.commit()
+    except IntegrityError as exc:
+        # A row written after its stage finished still references the board or one
+        # of its children; resuming at the last stage would fail the same way.
+        await session.rollback()
+        await session.refresh(board)
+        _set_progress(board, stage=STAGE_NAMES[0], deleted=deleted, error=str(exc.orig))
+        session.add(board)
+        await session.commit()
+        logger.warning(
+            "board.deletion.restart",
+            extra={"board_id": str(board.id), "error": str(exc.orig)},
+        )
+        raise
+    logger.info("board.deletion.complete", extra={"board_id": str(board.id), "deleted": deleted})
+    return final
+
+
+async def execute_board_deletion(task: QueuedTask) -> None:
+    """Run one queued board deletion job."""
+    payload = decode_board_deletion(task)
+    async with async_session_maker() as session:
+        board = await Board.objects.by_id(payload.board_id).first(session)
+        if board is None or board.deleting_at is None:
+            logger.info(
+                "board.deletion.skip",
+                extra={"board_id": str(payload.board_id), "found": board is not None},
+            )
+            return
+        await run_board_deletion(session, board=board)
+
+
+async def resume_stalled_board_deletions(
+    session: AsyncSession,
+    *,
+    now: datetime | None = None,
+) -> int:
+    """Re-queue board deletions that have made no progress recently."""
+    now = now or utcnow()
+    cutoff = now - timedelta(seconds=settings.board_deletion_stale_seconds)
+    boards = list(
+        await session.exec(
+            select(Board)
+            .where(col(Board.deleting_at).is_not(None))
+            .where(col(Board.updated_at) < cutoff),
+        ),
+    )
+    resumed = 0
+    for board in boards:
+        # Touch the board so the next sweep waits a full stale window again.
+        board.updated_at = now
+        session.add(board)
+        await session.commit()
+        if enqueue_board_deletion(
+            QueuedBoardDeletion(board_id=board.id, queued_at=datetime.now(UTC)),
+        ):
+            resumed += 1
+    return resumed
@@ -1,12 +1,24 @@
-"""Helpers for assembling denormalized board snapshot response payloads."""
+"""Helpers for assembling denormalized board snapshot response payloads.
+
+Serialized snapshots are cached per `(board_id, snapshot_version)`. The version
+is bumped by `app.db.board_versions` on every write that changes rendered
+snapshot rows, so a cached body stays valid until the board changes or an
+agent's computed online status is due to lapse.
+"""
 
 from __future__ import annotations
 
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
 from typing import TYPE_CHECKING
 
 from sqlalchemy import func
 from sqlmodel import col, select
 
+from app.core.time import utcnow
+from app.db.board_versions import has_uncommitted_bumps
 from app.models.agents import Agent
 from app.models.approvals import Approval
 from app.models.board_memory import BoardMemory
@@ -16,6 +28,7 @@ from app.schemas.board_memory import BoardMemoryRead
 from app.schemas.boards import BoardRead
 from app.schemas.view_models import BoardSnapshot, TaskCardRead
 from app.services.approval_task_links import load_task_ids_by_approval, task_counts_for_board
+from app.services.openclaw.constants import stale_after_for_heartbeat_config
 from app.services.openclaw.provisioning_db import AgentLifecycleService
 from app.services.tags import TagState, load_tag_state
 from app.services.task_dependencies import (
@@ -204,3 +217,94 @@ async def build_board_snapshot(session: AsyncSession, board: Board) -> BoardSnap
         chat_messages=chat_reads,
         pending_approvals_count=pending_approvals_count,
     )
+
+
+SNAPSHOT_CACHE_MAX_ENTRIES = 256
+# Computed agent statuses that never lapse on their own.
+_TERMINAL_AGENT_STATUSES = frozenset({"deleting", "offline", "provisioning", "updating"})
+
+
+@dataclass(frozen=True, slots=True)
+class CachedBoardSnapshot:
+    """Serialized board snapshot with its HTTP validator."""
+
+    version: int
+    body: bytes
+    etag: str
+    expires_at: datetime | None
+
+    def matches(self, if_none_match: str | None) -> bool:
+        """Return whether an `If-None-Match` header value covers this snapshot."""
+        if not if_none_match:
+            return False
+        candidates = {value.strip().removeprefix("W/") for value in if_none_match.split(",")}
+        return "*" in candidates or self.etag in candidates
+
+
+class BoardSnapshotCache:
+    """Bounded LRU of serialized snapshots keyed by `(board_id, version)`."""
+
+    def __init__(self, *, max_entries: int = SNAPSHOT_CACHE_MAX_ENTRIES) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[UUID, CachedBoardSnapshot] = OrderedDict()
+
+    def get(self, board_id: UUID, version: int) -> CachedBoardSnapshot | None:
+        """Return the cached snapshot for `board_id` at `version`, if still valid."""
+        entry = self._entries.get(board_id)
+        if entry is None or entry.version != version:
+            return None
+        if entry.expires_at is not None and utcnow() >= entry.expires_at:
+            del self._entries[board_id]
+            return None
+        self._entries.move_to_end(board_id)
+        return entry
+
+    def put(self, board_id: UUID, entry: CachedBoardSnapshot) -> None:
+        """Store `entry`, replacing any other version cached for the board."""
+        self._entries[board_id] = entry
+        self._entries.move_to_end(board_id)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached snapshot."""
+        self._entries.clear()
+
+
+_BOARD_SNAPSHOT_CACHE = BoardSnapshotCache()
+
+
+def get_board_snapshot_cache() -> BoardSnapshotCache:
+    """Return the process-scoped board snapshot cache."""
+    return _BOARD_SNAPSHOT_CACHE
+
+
+def _status_expires_at(snapshot: BoardSnapshot) -> datetime | None:
+    """Return when the earliest online agent in `snapshot` would be computed offline."""
+    expiries = [
+        agent.last_seen_at + stale_after_for_heartbeat_config(agent.heartbeat_config)
+        for agent in snapshot.agents
+        if agent.last_seen_at is not None and agent.status not in _TERMINAL_AGENT_STATUSES
+    ]
+    return min(expiries, default=None)
+
+
+async def load_board_snapshot(session: AsyncSession, board: Board) -> CachedBoardSnapshot:
+    """Return the serialized snapshot for `board`, rebuilding only when it changed."""
+    cache = get_board_snapshot_cache()
+    version = board.snapshot_version
+    cached = cache.get(board.id, version)
+    if cached is not None:
+        return cached
+    snapshot = await build_board_snapshot(session, board)
+    body = snapshot.model_dump_json().encode()
+    digest = hashlib.sha256(body).hexdigest()[:32]
+    entry = CachedBoardSnapshot(
+        version=version,
+        body=body,
+        etag=f'"{digest}"',
+        expires_at=_status_expires_at(snapshot),
+    )
+    if not has_uncommitted_bumps(session, "snapshot_version"):
+        cache.put(board.id, entry)
+    return entry
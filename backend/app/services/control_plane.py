@@ -3,19 +3,24 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from statistics import median
+from datetime import timedelta
 from typing import Any
-from uuid import UUID
+from uuid import UUID, uuid4
 
+from sqlalchemy import and_, case, func, or_
 from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.time import utcnow
+from app.db.upsert import upsert_insert
 from app.models.deterministic_evals import DeterministicEval
 from app.models.pack_bindings import PackBinding
+from app.models.pack_eval_aggregates import PackEvalAggregate, PackEvalDailyAggregate
 from app.models.prompt_packs import PromptPack
 from app.models.promotion_events import PromotionEvent
 from app.models.run_telemetry import RunTelemetry
+from app.services.latency_baselines import lock_latency_baseline, observe_latency
+from app.services.pack_binding_cache import get_pack_binding_cache
 
 _SCOPE_PRIORITY = {
     "global": 1,
@@ -73,6 +78,11 @@ def normalize_scope_ref(scope: str, scope_ref: str | None, *, user_id: UUID | No
     return ""
 
 
+def invalidate_pack_binding_cache(*, tier: str, pack_key: str) -> None:
+    """Drop cached champion resolutions affected by a binding change."""
+    get_pack_binding_cache().invalidate(tier=tier, pack_key=pack_key)
+
+
 def _scope_priority(scope: str) -> int:
     return _SCOPE_PRIORITY.get(scope, 0)
 
@@ -97,7 +107,15 @@ def _passes_engineering_done_gate(checks: dict[str, Any]) -> tuple[bool, list[st
     return (len(missing) == 0, missing)
 
 
-async def resolve_pack_binding(
+def _detached_copy(binding: PackBinding, pack: PromptPack) -> tuple[PackBinding, PromptPack]:
+    # Cached results outlive the session that loaded them and are shared across requests.
+    return (
+        PackBinding.model_validate(binding.model_dump()),
+        PromptPack.model_validate(pack.model_dump()),
+    )
+
+
+async def _load_pack_binding(
     session: AsyncSession,
     *,
     organization_id: UUID,
@@ -106,55 +124,82 @@ async def resolve_pack_binding(
     tier: str,
     pack_key: str,
 ) -> ResolvedPackBinding | None:
-    """Resolve champion pack using precedence user -> org -> domain -> global."""
+    scope_filters = [
+        and_(col(PackBinding.scope) == "global", col(PackBinding.organization_id).is_(None)),
+        and_(
+            col(PackBinding.scope) == "domain",
+            col(PackBinding.organization_id).is_(None),
+            col(PackBinding.scope_ref) == domain,
+        ),
+        and_(
+            col(PackBinding.scope) == "organization",
+            col(PackBinding.organization_id) == organization_id,
+        ),
+    ]
+    if user_id is not None:
+        scope_filters.append(
+            and_(
+                col(PackBinding.scope) == "user",
+                col(PackBinding.organization_id) == organization_id,
+                col(PackBinding.scope_ref) == str(user_id),
+            ),
+        )
     rows = list(
         await session.exec(
-            select(PackBinding)
+            select(PackBinding, PromptPack)
+            .outerjoin(PromptPack, col(PromptPack.id) == col(PackBinding.champion_pack_id))
             .where(col(PackBinding.pack_key) == pack_key)
-            .where(col(PackBinding.tier) == tier),
+            .where(col(PackBinding.tier) == tier)
+            .where(or_(*scope_filters)),
         )
     )
     if not rows:
         return None
 
-    chain: list[tuple[str, PackBinding]] = []
-    for row in rows:
-        if row.scope == "global" and row.organization_id is None:
-            chain.append(("global", row))
-        elif row.scope == "domain" and row.organization_id is None and row.scope_ref == domain:
-            chain.append(("domain", row))
-        elif row.scope == "organization" and row.organization_id == organization_id:
-            chain.append(("organization", row))
-        elif (
-            row.scope == "user"
-            and user_id is not None
-            and row.organization_id == organization_id
-            and row.scope_ref == str(user_id)
-        ):
-            chain.append(("user", row))
-
-    if not chain:
-        return None
-
-    chain.sort(
-        key=lambda item: (
-            _scope_priority(item[0]),
-            item[1].updated_at,
-        ),
-    )
-    _scope, winner = chain[-1]
-    pack = await PromptPack.objects.by_id(winner.champion_pack_id).first(session)
+    rows.sort(key=lambda row: (_scope_priority(row[0].scope), row[0].updated_at))
+    winner, pack = rows[-1]
     if pack is None:
         return None
 
-    resolved_chain = [f"{scope}:{binding.id}" for scope, binding in chain]
+    binding, pack = _detached_copy(winner, pack)
     return ResolvedPackBinding(
-        binding=winner,
+        binding=binding,
         pack=pack,
-        resolved_chain=resolved_chain,
+        resolved_chain=[f"{row.scope}:{row.id}" for row, _pack in rows],
     )
 
 
+async def resolve_pack_binding(
+    session: AsyncSession,
+    *,
+    organization_id: UUID,
+    user_id: UUID | None,
+    domain: str,
+    tier: str,
+    pack_key: str,
+) -> ResolvedPackBinding | None:
+    """Resolve champion pack using precedence user -> org -> domain -> global.
+
+    Results are served from the process-local pack binding cache when fresh.
+    """
+    cache = get_pack_binding_cache()
+    key = (organization_id, user_id, domain, tier, pack_key)
+    hit, cached = cache.get(key)
+    if hit:
+        return cached
+    generation = cache.generation
+    resolved = await _load_pack_binding(
+        session,
+        organization_id=organization_id,
+        user_id=user_id,
+        domain=domain,
+        tier=tier,
+        pack_key=pack_key,
+    )
+    cache.put(key, resolved, generation=generation)
+    return resolved
+
+
 async def upsert_pack_binding(
     session: AsyncSession,
     *,
@@ -166,7 +211,12 @@ async def upsert_pack_binding(
     pack_key: str,
     champion_pack_id: UUID,
 ) -> tuple[PackBinding, UUID | None]:
-    """Create or update champion binding and return previous champion if present."""
+    """Create or update champion binding and return previous champion if present.
+
+    Invalidates cached resolutions for (tier, pack_key); callers should also call
+    `invalidate_pack_binding_cache` after committing.
+    """
+    invalidate_pack_binding_cache(tier=tier, pack_key=pack_key)
     organization_filter = (
         col(PackBinding.organization_id).is_(None)
         if organization_id is None
@@ -242,26 +292,134 @@ async def record_promotion_event(
     return row
 
 
+async def record_eval_aggregates(session: AsyncSession, evaluation: DeterministicEval) -> None:
+    """Fold a newly inserted eval into its pack's running aggregates.
+
+    Runs in the caller's transaction, so the aggregates commit with the eval row.
+    """
+    if evaluation.pack_id is None:
+        return
+    hard_regressions = 1 if evaluation.hard_regression else 0
+    now = utcnow()
+
+    totals: Any = PackEvalAggregate.__table__  # type: ignore[attr-defined]
+    statement: Any = upsert_insert(session, totals).values(
+        id=uuid4(),
+        organization_id=evaluation.organization_id,
+        pack_id=evaluation.pack_id,
+        eval_count=1,
+        score_sum=evaluation.score,
+        hard_regressions=hard_regressions,
+        last_eval_at=evaluation.created_at,
+        updated_at=now,
+    )
+    await session.exec(
+        statement.on_conflict_do_update(
+            index_elements=[totals.c.organization_id, totals.c.pack_id],
+            set_={
+                "eval_count": totals.c.eval_count + 1,
+                "score_sum": totals.c.score_sum + statement.excluded.score_sum,
+                "hard_regressions": totals.c.hard_regressions
+                + statement.excluded.hard_regressions,
+                "last_eval_at": statement.excluded.last_eval_at,
+                "updated_at": statement.excluded.updated_at,
+            },
+        ),
+    )
+
+    daily: Any = PackEvalDailyAggregate.__table__  # type: ignore[attr-defined]
+    statement = upsert_insert(session, daily).values(
+        id=uuid4(),
+        organization_id=evaluation.organization_id,
+        pack_id=evaluation.pack_id,
+        day=evaluation.created_at.date(),
+        eval_count=1,
+        score_sum=evaluation.score,
+        hard_regressions=hard_regressions,
+    )
+    await session.exec(
+        statement.on_conflict_do_update(
+            index_elements=[daily.c.organization_id, daily.c.pack_id, daily.c.day],
+            set_={
+                "eval_count": daily.c.eval_count + 1,
+                "score_sum": daily.c.score_sum + statement.excluded.score_sum,
+                "hard_regressions": daily.c.hard_regressions
+                + statement.excluded.hard_regressions,
+            },
+        ),
+    )
+
+
+def _eval_summary(count: int, score_sum: float, hard_regressions: int) -> EvalSummary:
+    if count == 0:
+        return EvalSummary(count=0, avg_score=0.0, hard_regressions=0)
+    return EvalSummary(count=count, avg_score=score_sum / count, hard_regressions=hard_regressions)
+
+
 async def eval_summary_for_pack(
     session: AsyncSession,
     *,
     organization_id: UUID,
     pack_id: UUID,
+    window_days: int | None = None,
+    last_n: int | None = None,
 ) -> EvalSummary:
-    """Return aggregate deterministic eval summary for one pack."""
-    rows = list(
-        await session.exec(
-            select(DeterministicEval)
+    """Return aggregate deterministic eval summary for one pack.
+
+    By default this reads the all-time running aggregate. `window_days` limits it
+    to evals from the last `window_days` UTC days (today included) using the daily
+    aggregates; `last_n` limits it to the pack's `last_n` most recent evals.
+    """
+    if window_days is not None and last_n is not None:
+        msg = "window_days and last_n are mutually exclusive"
+        raise ValueError(msg)
+
+    if last_n is not None:
+        recent = (
+            select(
+                col(DeterministicEval.score).label("score"),
+                col(DeterministicEval.hard_regression).label("hard_regression"),
+            )
             .where(col(DeterministicEval.organization_id) == organization_id)
-            .where(col(DeterministicEval.pack_id) == pack_id),
+            .where(col(DeterministicEval.pack_id) == pack_id)
+            .order_by(col(DeterministicEval.created_at).desc())
+            .limit(last_n)
+            .subquery()
         )
-    )
-    if not rows:
-        return EvalSummary(count=0, avg_score=0.0, hard_regressions=0)
-    count = len(rows)
-    avg_score = sum(row.score for row in rows) / count
-    hard_regressions = sum(1 for row in rows if row.hard_regression)
-    return EvalSummary(count=count, avg_score=avg_score, hard_regressions=hard_regressions)
+        count, score_sum, hard_regressions = (
+            await session.exec(
+                select(
+                    func.count(),
+                    func.coalesce(func.sum(recent.c.score), 0.0),
+                    func.coalesce(func.sum(case((recent.c.hard_regression, 1), else_=0)), 0),
+                ),
+            )
+        ).one()
+        return _eval_summary(int(count), float(score_sum), int(hard_regressions))
+
+    if window_days is not None:
+        since = utcnow().date() - timedelta(days=window_days - 1)
+        count, score_sum, hard_regressions = (
+            await session.exec(
+                select(
+                    func.coalesce(func.sum(PackEvalDailyAggregate.eval_count), 0),
+                    func.coalesce(func.sum(PackEvalDailyAggregate.score_sum), 0.0),
+                    func.coalesce(func.sum(PackEvalDailyAggregate.hard_regressions), 0),
+                )
+                .where(col(PackEvalDailyAggregate.organization_id) == organization_id)
+                .where(col(PackEvalDailyAggregate.pack_id) == pack_id)
+                .where(col(PackEvalDailyAggregate.day) >= since),
+            )
+        ).one()
+        return _eval_summary(int(count), float(score_sum), int(hard_regressions))
+
+    aggregate = await PackEvalAggregate.objects.filter_by(
+        organization_id=organization_id,
+        pack_id=pack_id,
+    ).first(session)
+    if aggregate is None:
+        return _eval_summary(0, 0.0, 0)
+    return _eval_summary(aggregate.eval_count, aggregate.score_sum, aggregate.hard_regressions)
 
 
 async def latest_non_current_pack_for_binding(
@@ -291,20 +449,15 @@ async def compute_deterministic_score(
     *,
     run: RunTelemetry,
 ) -> DeterministicScore:
-    """Compute deterministic score and regression flags from telemetry only."""
-    baseline_candidates = list(
-        await session.exec(
-            select(RunTelemetry)
-            .where(col(RunTelemetry.organization_id) == run.organization_id)
-            .where(col(RunTelemetry.pack_key) == run.pack_key)
-            .where(col(RunTelemetry.tier) == run.tier)
-            .where(col(RunTelemetry.id) != run.id)
-            .order_by(col(RunTelemetry.created_at).desc())
-            .limit(50),
-        )
-    )
-    baseline_latencies = [row.latency_ms for row in baseline_candidates if row.latency_ms > 0]
-    baseline_latency = median(baseline_latencies) if baseline_latencies else max(1, run.latency_ms)
+    """Compute deterministic score and regression flags from telemetry only.
+
+    The latency baseline is the median of the pack's recent run latencies; the
+    run's own latency is then added to that window, to be committed by the caller.
+    """
+    latency_baseline = await lock_latency_baseline(session, run)
+    baseline_latency = latency_baseline.median_latency_ms or max(1, run.latency_ms)
+    observe_latency(latency_baseline, run.latency_ms)
+    session.add(latency_baseline)
 
     latency_regression_pct = 0.0
     if baseline_latency > 0:
@@ -0,0 +1,90 @@
+"""Short-lived, single-flight cache for assembled dashboard metrics."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from uuid import UUID
+
+from app.core.config import settings
+from app.schemas.metrics import DashboardMetrics, DashboardRangeKey
+
+DashboardCacheKey = tuple[DashboardRangeKey, frozenset[UUID]]
+
+
+def dashboard_cache_key(
+    range_key: DashboardRangeKey,
+    board_ids: Iterable[UUID],
+) -> DashboardCacheKey:
+    """Return the cache key for a range over a resolved set of boards."""
+    return range_key, frozenset(board_ids)
+
+
+class DashboardMetricsCache:
+    """Caches dashboard payloads for `dashboard_cache_ttl_seconds`.
+
+    Keys are built from already-authorized board ids, so callers must resolve
+    access before reading. Concurrent misses for one key wait on a single
+    computation instead of each querying the database.
+    """
+
+    def __init__(self, *, max_entries: int = 256) -> None:
+        self._max_entries = max_entries
+        self._entries: dict[DashboardCacheKey, tuple[float, DashboardMetrics]] = {}
+        self._locks: dict[DashboardCacheKey, asyncio.Lock] = {}
+
+    def _fresh(self, key: DashboardCacheKey, ttl_seconds: float) -> DashboardMetrics | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at >= ttl_seconds:
+            return None
+        return value
+
+    def _prune(self, ttl_seconds: float) -> None:
+        now = time.monotonic()
+        expired = [key for key, (at, _) in self._entries.items() if now - at >= ttl_seconds]
+        for key in expired:
+            del self._entries[key]
+        while len(self._entries) >= self._max_entries:
+            oldest = min(self._entries, key=lambda key: self._entries[key][0])
+            del self._entries[oldest]
+        for key in [key for key, lock in self._locks.items() if not lock.locked()]:
+            if key not in self._entries:
+                del self._locks[key]
+
+    async def get_or_compute(
+        self,
+        key: DashboardCacheKey,
+        compute: Callable[[], Awaitable[DashboardMetrics]],
+    ) -> DashboardMetrics:
+        """Return the cached payload for `key`, computing it at most once per TTL."""
+        ttl_seconds = float(settings.dashboard_cache_ttl_seconds)
+        if ttl_seconds <= 0:
+            return await compute()
+        cached = self._fresh(key, ttl_seconds)
+        if cached is not None:
+            return cached
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            cached = self._fresh(key, ttl_seconds)
+            if cached is not None:
+                return cached
+            value = await compute()
+            self._prune(ttl_seconds)
+            self._entries[key] = (time.monotonic(), value)
+        return value
+
+    def clear(self) -> None:
+        """Drop every cached payload."""
+        self._entries.clear()
+
+
+_DASHBOARD_METRICS_CACHE = DashboardMetricsCache()
+
+
+def get_dashboard_metrics_cache() -> DashboardMetricsCache:
+    """Return the process-scoped dashboard metrics cache."""
+    return _DASHBOARD_METRICS_CACHE
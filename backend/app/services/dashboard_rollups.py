@@ -0,0 +1,477 @@
+"""Hourly per-board dashboard metric rollups.
+
+The queue worker aggregates each closed hour per board into
+`board_metrics_rollups` and records the covered window in a watermark row.
+Dashboard reads combine those rows with a live aggregation of only the hours
+the job has not covered yet (normally just the current, still-open hour).
+
+Task metrics keep the semantics of the live queries they replace: each task
+counts under its *current* status in the hour of its last update (inbox tasks
+in the hour they were created). When a task changes after its hours were
+rolled up, the write hooks in `app.db.dashboard_rollup_invalidation` mark the
+old hours dirty; reads aggregate dirty hours live and the next job run
+re-rolls them, so a task is never counted in two hours. Activity event counts
+are append-only and stay as rolled up.
+
+Cycle-time medians are served from a log-bucketed histogram ("digest") whose
+buckets grow by `DIGEST_GROWTH`, so merged digests answer quantiles within
+roughly half a bucket (~2.5%) without keeping individual durations.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Collection, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, cast
+from uuid import UUID
+
+from sqlalchemy import DateTime, case, func
+from sqlmodel import col, delete, select
+
+from app.core.config import settings
+from app.core.time import utcnow
+from app.models.activity_events import ActivityEvent
+from app.models.dashboard_rollups import (
+    BoardMetricsDirtyHour,
+    BoardMetricsRollup,
+    MetricsRollupWatermark,
+)
+from app.models.tasks import Task
+
+if TYPE_CHECKING:
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+ERROR_EVENT_PATTERN = "%failed"
+WATERMARK_NAME = "board_hourly"
+DIGEST_GROWTH = 1.05
+# Digest key for non-positive durations, which have no logarithm.
+DIGEST_ZERO_KEY = "zero"
+
+
+def hour_start(value: datetime) -> datetime:
+    """Return `value` truncated to the start of its hour."""
+    return value.replace(minute=0, second=0, microsecond=0)
+
+
+def _digest_key(hours: float) -> str:
+    if hours <= 0:
+        return DIGEST_ZERO_KEY
+    return str(math.floor(math.log(hours, DIGEST_GROWTH)))
+
+
+def _digest_value(key: str) -> float:
+    if key == DIGEST_ZERO_KEY:
+        return 0.0
+    return float(DIGEST_GROWTH ** (int(key) + 0.5))
+
+
+def digest_quantile(digest: dict[str, int], quantile: float) -> float | None:
+    """Return the approximate `quantile` of the durations recorded in `digest`.
+
+    Interpolates between neighbouring ranks like Postgres `percentile_cont`.
+    """
+    total = sum(digest.values())
+    if total <= 0:
+        return None
+    ordered = sorted((_digest_value(key), count) for key, count in digest.items())
+    rank = quantile * (total - 1)
+    lower_rank = math.floor(rank)
+
+    def _value_at(position: int) -> float:
+        seen = 0
+        for value, count in ordered:
+            seen += count
+            if seen > position:
+                return value
+        return ordered[-1][0]
+
+    lower = _value_at(lower_rank)
+    upper = _value_at(min(lower_rank + 1, total - 1))
+    return lower + (upper - lower) * (rank - lower_rank)
+
+
+@dataclass(slots=True)
+class HourlyMetrics:
+    """Additive dashboard aggregates for one hour (of one board or several)."""
+
+    throughput_count: int = 0
+    cycle_time_count: int = 0
+    cycle_time_sum_hours: float = 0.0
+    cycle_time_digest: dict[str, int] = field(default_factory=dict)
+    error_count: int = 0
+    event_count: int = 0
+    wip_inbox: int = 0
+    wip_in_progress: int = 0
+    wip_review: int = 0
+    wip_done: int = 0
+
+    def add_cycle_time(self, hours: float) -> None:
+        """Record one completed task's in-progress-to-review duration."""
+        self.cycle_time_count += 1
+        self.cycle_time_sum_hours += hours
+        key = _digest_key(hours)
+        self.cycle_time_digest[key] = self.cycle_time_digest.get(key, 0) + 1
+
+    def merge(self, other: HourlyMetrics) -> None:
+        """Add `other` into this accumulator."""
+        self.throughput_count += other.throughput_count
+        self.cycle_time_count += other.cycle_time_count
+        self.cycle_time_sum_hours += other.cycle_time_sum_hours
+        for key, count in other.cycle_time_digest.items():
+            self.cycle_time_digest[key] = self.cycle_time_digest.get(key, 0) + count
+        self.error_count += other.error_count
+        self.event_count += other.event_count
+        self.wip_inbox += other.wip_inbox
+        self.wip_in_progress += other.wip_in_progress
+        self.wip_review += other.wip_review
+        self.wip_done += other.wip_done
+
+    @classmethod
+    def from_rollup(cls, row: BoardMetricsRollup) -> HourlyMetrics:
+        """Build an accumulator from a stored rollup row."""
+        return cls(
+            throughput_count=row.throughput_count,
+            cycle_time_count=row.cycle_time_count,
+            cycle_time_sum_hours=row.cycle_time_sum_hours,
+            cycle_time_digest=dict(row.cycle_time_digest),
+            error_count=row.error_count,
+            event_count=row.event_count,
+            wip_inbox=row.wip_inbox,
+            wip_in_progress=row.wip_in_progress,
+            wip_review=row.wip_review,
+            wip_done=row.wip_done,
+        )
+
+    def to_rollup(self, *, board_id: UUID, bucket_start: datetime) -> BoardMetricsRollup:
+        """Build the rollup row persisting this accumulator."""
+        return BoardMetricsRollup(
+            board_id=board_id,
+            bucket_start=bucket_start,
+            throughput_count=self.throughput_count,
+            cycle_time_count=self.cycle_time_count,
+            cycle_time_sum_hours=self.cycle_time_sum_hours,
+            cycle_time_digest=dict(self.cycle_time_digest),
+            error_count=self.error_count,
+            event_count=self.event_count,
+            wip_inbox=self.wip_inbox,
+            wip_in_progress=self.wip_in_progress,
+            wip_review=self.wip_review,
+            wip_done=self.wip_done,
+        )
+
+
+def merge_metrics(items: Iterable[HourlyMetrics]) -> HourlyMetrics:
+    """Return the sum of `items`."""
+    total = HourlyMetrics()
+    for item in items:
+        total.merge(item)
+    return total
+
+
+@dataclass(frozen=True, slots=True)
+class RollupRunResult:
+    """Outcome of one rollup job run."""
+
+    window_start: datetime | None
+    window_end: datetime | None
+    row_count: int
+    rerolled_count: int = 0
+
+
+async def collect_hourly_metrics(
+    session: AsyncSession,
+    *,
+    start: datetime,
+    end: datetime,
+    board_ids: Collection[UUID] | None = None,
+) -> dict[tuple[UUID, datetime], HourlyMetrics]:
+    """Aggregate raw task/activity rows in `[start, end)` by `(board_id, hour)`.
+
+    `board_ids=None` aggregates every board.
+    """
+    if start >= end or (board_ids is not None and not board_ids):
+        return {}
+    metrics: dict[tuple[UUID, datetime], HourlyMetrics] = {}
+
+    def _slot(board_id: UUID | None, bucket: datetime) -> HourlyMetrics:
+        # Every statement filters on a non-null board, so `board_id` is always set.
+        return metrics.setdefault((cast("UUID", board_id), bucket), HourlyMetrics())
+
+    board_col = col(Task.board_id)
+    board_scope = board_col.is_not(None) if board_ids is None else board_col.in_(board_ids)
+
+    review_statement = (
+        select(board_col, Task.updated_at, Task.in_progress_at)
+        .where(col(Task.status) == "review")
+        .where(col(Task.updated_at) >= start)
+        .where(col(Task.updated_at) < end)
+        .where(board_scope)
+    )
+    for board_id, updated_at, in_progress_at in await session.exec(review_statement):
+        slot = _slot(board_id, hour_start(updated_at))
+        slot.throughput_count += 1
+        if in_progress_at is not None:
+            slot.add_cycle_time((updated_at - in_progress_at).total_seconds() / 3600.0)
+
+    event_bucket = func.date_trunc("hour", ActivityEvent.created_at, type_=DateTime).label(
+        "bucket",
+    )
+    error_case = case((col(ActivityEvent.event_type).like(ERROR_EVENT_PATTERN), 1), else_=0)
+    event_statement = (
+        select(board_col, event_bucket, func.sum(error_case), func.count())
+        .select_from(ActivityEvent)
+        .join(Task, col(ActivityEvent.task_id) == col(Task.id))
+        .where(col(ActivityEvent.created_at) >= start)
+        .where(col(ActivityEvent.created_at) < end)
+        .where(board_scope)
+        .group_by(board_col, event_bucket)
+    )
+    for board_id, bucket, errors, total in await session.exec(event_statement):
+        slot = _slot(board_id, bucket)
+        slot.error_count += int(errors or 0)
+        slot.event_count += int(total or 0)
+
+    inbox_bucket = func.date_trunc("hour", Task.created_at, type_=DateTime).label("bucket")
+    inbox_statement = (
+        select(board_col, inbox_bucket, func.count())
+        .where(col(Task.status) == "inbox")
+        .where(col(Task.created_at) >= start)
+        .where(col(Task.created_at) < end)
+        .where(board_scope)
+        .group_by(board_col, inbox_bucket)
+    )
+    for board_id, bucket, inbox in await session.exec(inbox_statement):
+        _slot(board_id, bucket).wip_inbox += int(inbox or 0)
+
+    status_bucket = func.date_trunc("hour", Task.updated_at, type_=DateTime).label("bucket")
+    status_col = col(Task.status)
+    status_statement = (
+        select(board_col, status_bucket, status_col, func.count())
+        .where(status_col.in_(("in_progress", "review", "done")))
+        .where(col(Task.updated_at) >= start)
+        .where(col(Task.updated_at) < end)
+        .where(board_scope)
+        .group_by(board_col, status_bucket, status_col)
+    )
+    for board_id, bucket, task_status, count in await session.exec(status_statement):
+        slot = _slot(board_id, bucket)
+        if task_status == "in_progress":
+            slot.wip_in_progress += int(count or 0)
+        elif task_status == "review":
+            slot.wip_review += int(count or 0)
+        else:
+            slot.wip_done += int(count or 0)
+    return metrics
+
+
+async def _dirty_hours(
+    session: AsyncSession,
+    *,
+    before: datetime,
+    board_ids: Collection[UUID] | None = None,
+) -> list[tuple[UUID, UUID, datetime]]:
+    """Return `(row id, board_id, hour)` for dirty hours starting before `before`."""
+    statement = select(
+        BoardMetricsDirtyHour.id,
+        BoardMetricsDirtyHour.board_id,
+        BoardMetricsDirtyHour.bucket_start,
+    ).where(col(BoardMetricsDirtyHour.bucket_start) < before)
+    if board_ids is not None:
+        statement = statement.where(col(BoardMetricsDirtyHour.board_id).in_(board_ids))
+    return list(await session.exec(statement))
+
+
+async def collect_dirty_hour_metrics(
+    session: AsyncSession,
+    hours: Collection[tuple[UUID, datetime]],
+) -> dict[tuple[UUID, datetime], HourlyMetrics]:
+    """Aggregate `(board_id, hour)` pairs live, in one pass over their span."""
+    if not hours:
+        return {}
+    buckets = [bucket for _, bucket in hours]
+    metrics = await collect_hourly_metrics(
+        session,
+        start=min(buckets),
+        end=max(buckets) + timedelta(hours=1),
+        board_ids={board_id for board_id, _ in hours},
+    )
+    return {key: values for key, values in metrics.items() if key in hours}
+
+
+async def _reroll_dirty_hours(
+    session: AsyncSession,
+    *,
+    rolled_from: datetime,
+    rolled_through: datetime,
+) -> int:
+    """Replace rollup rows of dirty hours inside the rolled window; return how many."""
+    dirty = await _dirty_hours(session, before=rolled_through)
+    if not dirty:
+        return 0
+    hours = {
+        (board_id, bucket)
+        for _, board_id, bucket in dirty
+        if rolled_from <= bucket < rolled_through
+    }
+    metrics = await collect_dirty_hour_metrics(session, hours)
+    for board_id, bucket in hours:
+        await session.exec(
+            delete(BoardMetricsRollup).where(
+                col(BoardMetricsRollup.board_id) == board_id,
+                col(BoardMetricsRollup.bucket_start) == bucket,
+            ),
+        )
+    session.add_all(
+        values.to_rollup(board_id=board_id, bucket_start=bucket)
+        for (board_id, bucket), values in metrics.items()
+    )
+    # Only the rows read above: marks committed meanwhile wait for the next run.
+    await session.exec(
+        delete(BoardMetricsDirtyHour).where(
+            col(BoardMetricsDirtyHour.id).in_([row_id for row_id, _, _ in dirty]),
+        ),
+    )
+    return len(hours)
+
+
+async def roll_up_closed_hours(
+    session: AsyncSession,
+    *,
+    now: datetime | None = None,
+) -> RollupRunResult:
+    """Roll up the next chunk of closed hours past the watermark and commit.
+
+    The first run starts `dashboard_rollup_backfill_hours` back. Each run covers at
+    most `dashboard_rollup_max_hours_per_run` hours and never the current hour, so
+    repeated runs walk forward until they catch up with the clock. Rows in the
+    chunk are replaced wholesale, which keeps a rerun after a crash idempotent.
+    Dirty hours behind the watermark are re-rolled first.
+    """
+    current_hour = hour_start(now or utcnow())
+    watermark = await session.get(MetricsRollupWatermark, WATERMARK_NAME)
+    if watermark is None:
+        window_start = current_hour - timedelta(hours=settings.dashboard_rollup_backfill_hours)
+        watermark = MetricsRollupWatermark(
+            name=WATERMARK_NAME,
+            rolled_from=window_start,
+            rolled_through=window_start,
+        )
+    else:
+        window_start = watermark.rolled_through
+    window_end = min(
+        current_hour,
+        window_start + timedelta(hours=settings.dashboard_rollup_max_hours_per_run),
+    )
+    rerolled = await _reroll_dirty_hours(
+        session,
+        rolled_from=watermark.rolled_from,
+        rolled_through=window_start,
+    )
+    if window_start >= window_end:
+        await session.commit()
+        return RollupRunResult(
+            window_start=None,
+            window_end=None,
+            row_count=0,
+            rerolled_count=rerolled,
+        )
+
+    # Hours in the window are rolled from current rows, which covers their marks.
+    window_marks = await _dirty_hours(session, before=window_end)
+    metrics = await collect_hourly_metrics(session, start=window_start, end=window_end)
+    await session.exec(
+        delete(BoardMetricsRollup).where(
+            col(BoardMetricsRollup.bucket_start) >= window_start,
+            col(BoardMetricsRollup.bucket_start) < window_end,
+        ),
+    )
+    if window_marks:
+        await session.exec(
+            delete(BoardMetricsDirtyHour).where(
+                col(BoardMetricsDirtyHour.id).in_([row_id for row_id, _, _ in window_marks]),
+            ),
+        )
+    session.add_all(
+        values.to_rollup(board_id=board_id, bucket_start=bucket)
+        for (board_id, bucket), values in metrics.items()
+    )
+    watermark.rolled_through = window_end
+    watermark.updated_at = utcnow()
+    session.add(watermark)
+    await session.commit()
+    return RollupRunResult(
+        window_start=window_start,
+        window_end=window_end,
+        row_count=len(metrics),
+        rerolled_count=rerolled,
+    )
+
+
+def _merge_into(
+    by_hour: dict[datetime, HourlyMetrics],
+    metrics: dict[tuple[UUID, datetime], HourlyMetrics],
+) -> None:
+    for (_, bucket), values in metrics.items():
+        by_hour.setdefault(bucket, HourlyMetrics()).merge(values)
+
+
+async def hourly_metrics(
+    session: AsyncSession,
+    board_ids: Collection[UUID],
+    *,
+    start: datetime,
+    end: datetime,
+) -> dict[datetime, HourlyMetrics]:
+    """Return metrics per hour summed across `board_ids` for `[hour(start), end)`.
+
+    Hours inside the watermark window are read from rollups unless marked dirty;
+    dirty hours and anything outside the window are aggregated live from the
+    raw tables.
+    """
+    if not board_ids:
+        return {}
+    start = hour_start(start)
+    by_hour: dict[datetime, HourlyMetrics] = {}
+    watermark = await session.get(MetricsRollupWatermark, WATERMARK_NAME)
+    if watermark is None:
+        rolled_from = rolled_through = start
+    else:
+        rolled_from = min(max(watermark.rolled_from, start), end)
+        rolled_through = max(min(watermark.rolled_through, end), rolled_from)
+
+    if rolled_from < rolled_through:
+        dirty = {
+            (board_id, bucket)
+            for _, board_id, bucket in await _dirty_hours(
+                session,
+                before=rolled_through,
+                board_ids=board_ids,
+            )
+            if bucket >= rolled_from
+        }
+        rows = await session.exec(
+            select(BoardMetricsRollup)
+            .where(col(BoardMetricsRollup.board_id).in_(board_ids))
+            .where(col(BoardMetricsRollup.bucket_start) >= rolled_from)
+            .where(col(BoardMetricsRollup.bucket_start) < rolled_through),
+        )
+        for row in rows:
+            if (row.board_id, row.bucket_start) in dirty:
+                continue
+            by_hour.setdefault(row.bucket_start, HourlyMetrics()).merge(
+                HourlyMetrics.from_rollup(row),
+            )
+        # Hours changed since they were rolled up are re-aggregated from current rows.
+        _merge_into(by_hour, await collect_dirty_hour_metrics(session, dirty))
+    for live_start, live_end in ((start, rolled_from), (rolled_through, end)):
+        if live_start < live_end:
+            live = await collect_hourly_metrics(
+                session,
+                start=live_start,
+                end=live_end,
+                board_ids=board_ids,
+            )
+            _merge_into(by_hour, live)
+    return by_hour
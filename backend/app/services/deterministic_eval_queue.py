@@ -13,6 +13,7 @@ from app.services.queue import QueuedTask, enqueue_task, requeue_if_failed
 
 logger = get_logger(__name__)
 TASK_TYPE = "deterministic_eval"
+BATCH_TASK_TYPE = "deterministic_eval_batch"
 
 
 @dataclass(frozen=True)
@@ -24,6 +25,15 @@ class QueuedDeterministicEval:
     attempts: int = 0
 
 
+@dataclass(frozen=True)
+class QueuedDeterministicEvalBatch:
+    """Payload envelope for evaluating many runs in one background job."""
+
+    run_telemetry_ids: tuple[UUID, ...]
+    queued_at: datetime
+    attempts: int = 0
+
+
 def _task_from_payload(payload: QueuedDeterministicEval) -> QueuedTask:
     return QueuedTask(
         task_type=TASK_TYPE,
@@ -36,6 +46,18 @@ def _task_from_payload(payload: QueuedDeterministicEval) -> QueuedTask:
     )
 
 
+def _batch_task_from_payload(payload: QueuedDeterministicEvalBatch) -> QueuedTask:
+    return QueuedTask(
+        task_type=BATCH_TASK_TYPE,
+        payload={
+            "run_telemetry_ids": [str(run_id) for run_id in payload.run_telemetry_ids],
+            "queued_at": payload.queued_at.isoformat(),
+        },
+        created_at=payload.queued_at,
+        attempts=payload.attempts,
+    )
+
+
 def decode_deterministic_eval(task: QueuedTask) -> QueuedDeterministicEval:
     """Decode generic queued task into deterministic evaluation payload."""
     if task.task_type not in {TASK_TYPE, "legacy"}:
@@ -74,8 +96,44 @@ def enqueue_deterministic_eval(payload: QueuedDeterministicEval) -> bool:
         return False
 
 
+def decode_deterministic_eval_batch(task: QueuedTask) -> QueuedDeterministicEvalBatch:
+    """Decode generic queued task into a batched deterministic evaluation payload."""
+    if task.task_type != BATCH_TASK_TYPE:
+        raise ValueError(f"Unexpected task_type={task.task_type!r}; expected {BATCH_TASK_TYPE!r}")
+    payload: dict[str, Any] = task.payload
+    queued_at = payload.get("queued_at")
+    return QueuedDeterministicEvalBatch(
+        run_telemetry_ids=tuple(UUID(run_id) for run_id in payload["run_telemetry_ids"]),
+        queued_at=(
+            datetime.fromisoformat(queued_at) if isinstance(queued_at, str) else datetime.now(UTC)
+        ),
+        attempts=int(payload.get("attempts", task.attempts)),
+    )
+
+
+def enqueue_deterministic_eval_batch(payload: QueuedDeterministicEvalBatch) -> bool:
+    """Enqueue one job that evaluates every run in `payload`."""
+    try:
+        enqueue_task(
+            _batch_task_from_payload(payload),
+            settings.rq_queue_name,
+            redis_url=settings.rq_redis_url,
+        )
+        logger.info(
+            "deterministic_eval.queue.batch_enqueued",
+            extra={"run_count": len(payload.run_telemetry_ids), "attempt": payload.attempts},
+        )
+        return True
+    except Exception as exc:
+        logger.warning(
+            "deterministic_eval.queue.batch_enqueue_failed",
+            extra={"run_count": len(payload.run_telemetry_ids), "error": str(exc)},
+        )
+        return False
+
+
 def requeue_deterministic_eval(task: QueuedTask, *, delay_seconds: float = 0) -> bool:
-    """Requeue failed deterministic eval jobs with capped retry policy."""
+    """Requeue failed deterministic eval jobs (single or batched) with capped retry policy."""
     return requeue_if_failed(
         task,
         settings.rq_queue_name,
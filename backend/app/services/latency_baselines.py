@@ -0,0 +1,111 @@
+"""Persisted sliding-window latency baselines for deterministic scoring.
+
+Each (organization, pack_key, tier) keeps its last `LATENCY_BASELINE_WINDOW`
+positive run latencies twice: in arrival order, so the oldest sample can be
+evicted, and in sorted order, so the median is read directly and each new
+sample is placed by binary search. Evaluations lock the row, read the median,
+and fold in their own latency in the same transaction as the eval row.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from typing import TYPE_CHECKING, Any
+from uuid import uuid4
+
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.time import utcnow
+from app.db.upsert import upsert_insert
+from app.models.latency_baselines import LatencyBaseline
+from app.models.run_telemetry import RunTelemetry
+
+if TYPE_CHECKING:
+    from sqlmodel.sql.expression import SelectOfScalar
+
+LATENCY_BASELINE_WINDOW = 50
+
+
+def _median(sorted_latencies: list[int]) -> float | None:
+    if not sorted_latencies:
+        return None
+    middle = len(sorted_latencies) // 2
+    if len(sorted_latencies) % 2:
+        return float(sorted_latencies[middle])
+    return (sorted_latencies[middle - 1] + sorted_latencies[middle]) / 2.0
+
+
+def observe_latency(baseline: LatencyBaseline, latency_ms: int) -> None:
+    """Slide `latency_ms` into the baseline window; non-positive latencies are ignored."""
+    if latency_ms <= 0:
+        return
+    # Fresh lists so the JSON columns are flagged as changed.
+    recent = [*baseline.recent_latencies_ms, latency_ms]
+    ordered = list(baseline.sorted_latencies_ms)
+    insort(ordered, latency_ms)
+    while len(recent) > LATENCY_BASELINE_WINDOW:
+        evicted = recent.pop(0)
+        del ordered[bisect_left(ordered, evicted)]
+    baseline.recent_latencies_ms = recent
+    baseline.sorted_latencies_ms = ordered
+    baseline.median_latency_ms = _median(ordered)
+    baseline.updated_at = utcnow()
+
+
+async def _seed_latencies(session: AsyncSession, run: RunTelemetry) -> list[int]:
+    """Return the latencies of runs recorded before the baseline existed, oldest first."""
+    rows = await session.exec(
+        select(RunTelemetry.latency_ms)
+        .where(col(RunTelemetry.organization_id) == run.organization_id)
+        .where(col(RunTelemetry.pack_key) == run.pack_key)
+        .where(col(RunTelemetry.tier) == run.tier)
+        .where(col(RunTelemetry.id) != run.id)
+        .where(col(RunTelemetry.created_at) <= run.created_at)
+        .where(col(RunTelemetry.latency_ms) > 0)
+        .order_by(col(RunTelemetry.created_at).desc())
+        .limit(LATENCY_BASELINE_WINDOW),
+    )
+    return list(reversed(list(rows)))
+
+
+async def lock_latency_baseline(session: AsyncSession, run: RunTelemetry) -> LatencyBaseline:
+    """Return the baseline for `run`'s pack and tier, locked for this transaction.
+
+    A missing baseline is created from the most recent earlier runs, so existing
+    deployments keep their history.
+    """
+
+    def _query() -> SelectOfScalar[LatencyBaseline]:
+        return (
+            select(LatencyBaseline)
+            .where(col(LatencyBaseline.organization_id) == run.organization_id)
+            .where(col(LatencyBaseline.pack_key) == run.pack_key)
+            .where(col(LatencyBaseline.tier) == run.tier)
+            .with_for_update()
+        )
+
+    baseline = (await session.exec(_query())).first()
+    if baseline is not None:
+        return baseline
+
+    recent = await _seed_latencies(session, run)
+    ordered = sorted(recent)
+    table: Any = LatencyBaseline.__table__  # type: ignore[attr-defined]
+    statement: Any = upsert_insert(session, table).values(
+        id=uuid4(),
+        organization_id=run.organization_id,
+        pack_key=run.pack_key,
+        tier=run.tier,
+        recent_latencies_ms=recent,
+        sorted_latencies_ms=ordered,
+        median_latency_ms=_median(ordered),
+        updated_at=utcnow(),
+    )
+    # A concurrent evaluation may have created it first; use that row instead.
+    await session.exec(
+        statement.on_conflict_do_nothing(
+            index_elements=[table.c.organization_id, table.c.pack_key, table.c.tier],
+        ),
+    )
+    return (await session.exec(_query())).one()
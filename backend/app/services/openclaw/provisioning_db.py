@@ -26,7 +26,8 @@ from app.core.logging import TRACE_LEVEL
 from app.core.time import utcnow
 from app.db import crud
 from app.db.pagination import paginate
-from app.db.session import async_session_maker
+from app.db.query_stats import query_stats_scope
+from app.db.session import stream_session_maker
 from app.models.activity_events import ActivityEvent
 from app.models.agents import Agent
 from app.models.approvals import Approval
@@ -95,6 +96,13 @@ from app.services.organizations import (
     list_accessible_board_ids,
     require_board_access,
 )
+from app.services.sse_replay import (
+    LAST_EVENT_ID_HEADER,
+    ReplayChannel,
+    ReplayCursor,
+    ReplayEntry,
+    get_replay_buffer,
+)
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator, Sequence
@@ -1550,6 +1558,48 @@ class AgentLifecycleService(OpenClawDBService):
 
         return await paginate(self.session, statement, transformer=_transform)
 
+    @staticmethod
+    def agent_stream_channel(board_id: UUID | None) -> ReplayChannel:
+        return ("agents", board_id)
+
+    async def poll_agent_stream(
+        self,
+        *,
+        board_id: UUID | None,
+        allowed_ids: set[UUID],
+        cursor: ReplayCursor,
+    ) -> list[dict[str, str]]:
+        """Fetch agent updates for one stream subscription and return undelivered messages."""
+        if board_id is not None:
+            agents = await self.fetch_agent_events(board_id, cursor.last_seen)
+        elif allowed_ids:
+            agents = await self.fetch_agent_events(None, cursor.last_seen)
+            agents = [agent for agent in agents if agent.board_id in allowed_ids]
+        else:
+            agents = []
+        buffer = get_replay_buffer()
+        entries: list[ReplayEntry] = []
+        for agent in agents:
+            # The stream matches either column, so its cursor is the later one.
+            changed_at = max(
+                (value for value in (agent.updated_at, agent.last_seen_at) if value is not None),
+                default=utcnow(),
+            )
+            channel = self.agent_stream_channel(agent.board_id)
+            key = (agent.id, agent.updated_at, agent.last_seen_at)
+            entry = buffer.lookup(channel, key)
+            if entry is None:
+                payload = {"agent": self.serialize_agent(agent)}
+                entry = buffer.record(
+                    channel,
+                    key=key,
+                    event="agent",
+                    data=json.dumps(payload),
+                    cursor=changed_at,
+                )
+            entries.append(entry)
+        return cursor.deliver(entries)
+
     async def stream_agents(
         self,
         *,
@@ -1559,35 +1609,36 @@ class AgentLifecycleService(OpenClawDBService):
         ctx: OrganizationContext,
     ) -> EventSourceResponse:
         since_dt = self.parse_since(since) or utcnow()
-        last_seen = since_dt
         board_ids = await list_accessible_board_ids(self.session, member=ctx.member, write=False)
         allowed_ids = set(board_ids)
         if board_id is not None:
             OpenClawAuthorizationPolicy.require_board_write_access(allowed=board_id in allowed_ids)
+        stream_board_ids = [board_id] if board_id is not None else board_ids
+        cursor = ReplayCursor(
+            get_replay_buffer(),
+            last_event_id=request.headers.get(LAST_EVENT_ID_HEADER),
+            since=since_dt,
+        )
 
         async def event_generator() -> AsyncIterator[dict[str, str]]:
-            nonlocal last_seen
+            for message in cursor.resume(
+                [self.agent_stream_channel(value) for value in stream_board_ids],
+            ):
+                yield message
             while True:
                 if await request.is_disconnected():
                     break
-                async with async_session_maker() as stream_session:
-                    stream_service = AgentLifecycleService(stream_session)
-                    stream_service.logger = self.logger
-                    if board_id is not None:
-                        agents = await stream_service.fetch_agent_events(
-                            board_id,
-                            last_seen,
+                async with stream_session_maker() as stream_session:
+                    with query_stats_scope():
+                        stream_service = AgentLifecycleService(stream_session)
+                        stream_service.logger = self.logger
+                        messages = await stream_service.poll_agent_stream(
+                            board_id=board_id,
+                            allowed_ids=allowed_ids,
+                            cursor=cursor,
                         )
-                    elif allowed_ids:
-                        agents = await stream_service.fetch_agent_events(None, last_seen)
-                        agents = [agent for agent in agents if agent.board_id in allowed_ids]
-                    else:
-                        agents = []
-                for agent in agents:
-                    updated_at = agent.updated_at or agent.last_seen_at or utcnow()
-                    last_seen = max(updated_at, last_seen)
-                    payload = {"agent": self.serialize_agent(agent)}
-                    yield {"event": "agent", "data": json.dumps(payload)}
+                for message in messages:
+                    yield message
                 await asyncio.sleep(2)
 
         return EventSourceResponse(event_generator(), ping=15)
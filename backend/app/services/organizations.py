@@ -15,6 +15,7 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.time import utcnow
 from app.db import crud
+from app.db.replicas import primary_reads, use_primary
 from app.models.boards import Board
 from app.models.organization_board_access import OrganizationBoardAccess
 from app.models.organization_invite_board_access import OrganizationInviteBoardAccess
@@ -278,10 +279,13 @@ async def ensure_member_for_user(
     user: User,
 ) -> OrganizationMember:
     """Ensure a user has some membership, creating one if necessary."""
-    existing = await get_active_membership(session, user)
+    # A membership created moments ago must not be missed on a lagging replica.
+    with primary_reads(session):
+        existing = await get_active_membership(session, user)
     if existing is not None:
         return existing
 
+    use_primary(session)
     # Serialize first-time provisioning per user to avoid concurrent duplicate org/member creation.
     await session.exec(
         select(User.id).where(col(User.id) == user.id).with_for_update(),
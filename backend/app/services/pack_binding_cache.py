@@ -0,0 +1,81 @@
+"""Process-local cache of resolved champion pack bindings."""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from app.core.config import settings
+
+if TYPE_CHECKING:
+    from app.services.control_plane import ResolvedPackBinding
+
+# (organization_id, user_id, domain, tier, pack_key)
+PackBindingCacheKey = tuple[UUID, UUID | None, str, str, str]
+
+
+class PackBindingCache:
+    """Caches `resolve_pack_binding` results for `pack_binding_cache_ttl_seconds`.
+
+    "No binding" results are cached too. Binding writes call `invalidate`, which
+    drops every entry for the affected (tier, pack_key) in this process; other
+    processes pick the change up once their entries expire. A lookup that
+    started before an invalidation cannot store its (possibly stale) result.
+    """
+
+    def __init__(self, *, max_entries: int = 4096) -> None:
+        self._max_entries = max_entries
+        self._entries: dict[PackBindingCacheKey, tuple[float, ResolvedPackBinding | None]] = {}
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """Return a token to pass to `put` for a lookup starting now."""
+        return self._generation
+
+    def get(self, key: PackBindingCacheKey) -> tuple[bool, ResolvedPackBinding | None]:
+        """Return `(hit, value)` for `key`."""
+        ttl_seconds = float(settings.pack_binding_cache_ttl_seconds)
+        entry = self._entries.get(key)
+        if entry is None or ttl_seconds <= 0:
+            return False, None
+        stored_at, value = entry
+        if time.monotonic() - stored_at >= ttl_seconds:
+            del self._entries[key]
+            return False, None
+        return True, value
+
+    def put(
+        self,
+        key: PackBindingCacheKey,
+        value: ResolvedPackBinding | None,
+        *,
+        generation: int,
+    ) -> None:
+        """Store `value` unless the cache was invalidated since `generation`."""
+        if generation != self._generation or settings.pack_binding_cache_ttl_seconds <= 0:
+            return
+        if len(self._entries) >= self._max_entries:
+            oldest = min(self._entries, key=lambda item: self._entries[item][0])
+            del self._entries[oldest]
+        self._entries[key] = (time.monotonic(), value)
+
+    def invalidate(self, *, tier: str, pack_key: str) -> None:
+        """Drop cached resolutions for one (tier, pack_key) across all scopes."""
+        self._generation += 1
+        for key in [key for key in self._entries if key[3] == tier and key[4] == pack_key]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop every cached resolution."""
+        self._generation += 1
+        self._entries.clear()
+
+
+_PACK_BINDING_CACHE = PackBindingCache()
+
+
+def get_pack_binding_cache() -> PackBindingCache:
+    """Return the process-scoped pack binding cache."""
+    return _PACK_BINDING_CACHE
@@ -9,14 +9,28 @@ from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 
 from app.core.config import settings
-from app.db.session import async_session_maker
+from app.db.session import async_session_maker, use_worker_pool
 from app.core.logging import get_logger
-from app.services.deterministic_eval_execution import execute_deterministic_eval
+from app.services.activity_archive import archive_activity_events
+from app.services.board_deletion_queue import TASK_TYPE as BOARD_DELETION_TASK_TYPE
+from app.services.board_deletion_queue import requeue_board_deletion
+from app.services.board_lifecycle import execute_board_deletion, resume_stalled_board_deletions
+from app.services.dashboard_rollups import roll_up_closed_hours
+from app.services.deterministic_eval_execution import (
+    execute_deterministic_eval,
+    execute_deterministic_eval_batch,
+)
+from app.services.deterministic_eval_queue import (
+    BATCH_TASK_TYPE as DETERMINISTIC_EVAL_BATCH_TASK_TYPE,
+)
 from app.services.deterministic_eval_queue import TASK_TYPE as DETERMINISTIC_EVAL_TASK_TYPE
 from app.services.deterministic_eval_queue import requeue_deterministic_eval
 from app.services.queue import QueuedTask, dequeue_task
 from app.services.runtime.migration_gate import is_scheduler_migration_ready
 from app.services.runtime.recovery_scheduler import RecoveryScheduler
+from app.services.skill_packs.queue import TASK_TYPE as SKILL_PACK_SYNC_TASK_TYPE
+from app.services.skill_packs.queue import requeue_skill_pack_sync
+from app.services.skill_packs.sync import execute_skill_pack_sync
 from app.services.task_mode_execution import execute_task_mode
 from app.services.task_mode_queue import (
     TASK_TYPE as TASK_MODE_TASK_TYPE,
@@ -29,6 +43,7 @@ from app.services.webhooks.dispatch import (
     requeue_webhook_queue_task,
 )
 from app.services.webhooks.queue import TASK_TYPE as WEBHOOK_TASK_TYPE
+from app.services.webhooks.retention import compact_webhook_payloads
 
 logger = get_logger(__name__)
 
@@ -66,6 +81,30 @@ _TASK_HANDLERS: dict[str, _TaskHandler] = {
         ),
         requeue=lambda task, delay: requeue_deterministic_eval(task, delay_seconds=delay),
     ),
+    DETERMINISTIC_EVAL_BATCH_TASK_TYPE: _TaskHandler(
+        handler=execute_deterministic_eval_batch,
+        attempts_to_delay=lambda attempts: min(
+            settings.rq_dispatch_retry_base_seconds * (2 ** max(0, attempts)),
+            settings.rq_dispatch_retry_max_seconds,
+        ),
+        requeue=lambda task, delay: requeue_deterministic_eval(task, delay_seconds=delay),
+    ),
+    BOARD_DELETION_TASK_TYPE: _TaskHandler(
+        handler=execute_board_deletion,
+        attempts_to_delay=lambda attempts: min(
+            settings.rq_dispatch_retry_base_seconds * (2 ** max(0, attempts)),
+            settings.rq_dispatch_retry_max_seconds,
+        ),
+        requeue=lambda task, delay: requeue_board_deletion(task, delay_seconds=delay),
+    ),
+    SKILL_PACK_SYNC_TASK_TYPE: _TaskHandler(
+        handler=execute_skill_pack_sync,
+        attempts_to_delay=lambda attempts: min(
+            settings.rq_dispatch_retry_base_seconds * (2 ** max(0, attempts)),
+            settings.rq_dispatch_retry_max_seconds,
+        ),
+        requeue=lambda task, delay: requeue_skill_pack_sync(task, delay_seconds=delay),
+    ),
 }
 
 
@@ -165,8 +204,95 @@ async def run_recovery_scheduler_once() -> bool:
     return True
 
 
+async def run_dashboard_rollup_once() -> bool:
+    """Roll up the next chunk of closed dashboard hours when enabled."""
+    if not settings.dashboard_rollup_enabled:
+        return False
+
+    if not await is_scheduler_migration_ready():
+        logger.info("queue.worker.dashboard_rollup_deferred_migrations_pending")
+        return False
+
+    async with async_session_maker() as session:
+        result = await roll_up_closed_hours(session)
+    logger.info(
+        "queue.worker.dashboard_rollup",
+        extra={
+            "window_start": result.window_start.isoformat() if result.window_start else None,
+            "window_end": result.window_end.isoformat() if result.window_end else None,
+            "row_count": result.row_count,
+            "rerolled_count": result.rerolled_count,
+        },
+    )
+    return True
+
+
+async def run_activity_archive_once() -> bool:
+    """Keep activity partitions ahead and archive months past retention when enabled."""
+    if not settings.activity_archive_enabled:
+        return False
+
+    if not await is_scheduler_migration_ready():
+        logger.info("queue.worker.activity_archive_deferred_migrations_pending")
+        return False
+
+    async with async_session_maker() as session:
+        result = await archive_activity_events(session)
+    logger.info(
+        "queue.worker.activity_archive",
+        extra={
+            "cutoff": result.cutoff.isoformat() if result.cutoff else None,
+            "partitions_created": result.partitions_created,
+            "partitions_dropped": result.partitions_dropped,
+            "rows_archived": result.rows_archived,
+            "files": [str(path) for path in result.files],
+        },
+    )
+    return True
+
+
+async def run_webhook_compaction_once() -> bool:
+    """Enforce webhook payload retention and compress large bodies when enabled."""
+    if not settings.webhook_compaction_enabled:
+        return False
+
+    if not await is_scheduler_migration_ready():
+        logger.info("queue.worker.webhook_compaction_deferred_migrations_pending")
+        return False
+
+    async with async_session_maker() as session:
+        result = await compact_webhook_payloads(session)
+    logger.info(
+        "queue.worker.webhook_compaction",
+        extra={
+            "webhook_count": result.webhook_count,
+            "payloads_deleted": result.payloads_deleted,
+            "memories_deleted": result.memories_deleted,
+            "payloads_compressed": result.payloads_compressed,
+        },
+    )
+    return True
+
+
+async def run_board_deletion_sweep_once() -> bool:
+    """Re-queue board deletions that stopped making progress."""
+    if not await is_scheduler_migration_ready():
+        logger.info("queue.worker.board_deletion_sweep_deferred_migrations_pending")
+        return False
+
+    async with async_session_maker() as session:
+        resumed = await resume_stalled_board_deletions(session)
+    if resumed:
+        logger.info("queue.worker.board_deletion_sweep", extra={"resumed": resumed})
+    return True
+
+
 async def _run_worker_loop() -> None:
     next_recovery_due_at = time.monotonic()
+    next_rollup_due_at = time.monotonic()
+    next_archive_due_at = time.monotonic()
+    next_compaction_due_at = time.monotonic()
+    next_deletion_sweep_due_at = time.monotonic()
     while True:
         try:
             now = time.monotonic()
@@ -176,6 +302,30 @@ async def _run_worker_loop() -> None:
                     int(settings.recovery_loop_interval_seconds),
                     1,
                 )
+            if settings.dashboard_rollup_enabled and now >= next_rollup_due_at:
+                await run_dashboard_rollup_once()
+                next_rollup_due_at = time.monotonic() + max(
+                    int(settings.dashboard_rollup_interval_seconds),
+                    1,
+                )
+            if settings.activity_archive_enabled and now >= next_archive_due_at:
+                await run_activity_archive_once()
+                next_archive_due_at = time.monotonic() + max(
+                    int(settings.activity_archive_interval_seconds),
+                    1,
+                )
+            if settings.webhook_compaction_enabled and now >= next_compaction_due_at:
+                await run_webhook_compaction_once()
+                next_compaction_due_at = time.monotonic() + max(
+                    int(settings.webhook_compaction_interval_seconds),
+                    1,
+                )
+            if now >= next_deletion_sweep_due_at:
+                await run_board_deletion_sweep_once()
+                next_deletion_sweep_due_at = time.monotonic() + max(
+                    int(settings.board_deletion_sweep_interval_seconds),
+                    1,
+                )
             await flush_queue(
                 block=True,
                 block_timeout=1,
@@ -194,6 +344,7 @@ def run_worker() -> None:
         "queue.worker.batch_started",
         extra={"throttle_seconds": settings.rq_dispatch_throttle_seconds},
     )
+    use_worker_pool()
     try:
         asyncio.run(_run_worker_loop())
     finally:
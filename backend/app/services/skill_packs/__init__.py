@@ -0,0 +1 @@
+"""Skill pack discovery, git mirrors, and background sync jobs."""
@@ -0,0 +1,580 @@
+"""Skill discovery inside a checked-out skill pack repository.
+
+A pack either ships a root `skills_index.json` (streamed, so large indexes
+stay cheap) or is scanned for `SKILL.md` files; each discovered skill becomes
+a `PackSkillCandidate` keyed by its GitHub tree URL.
+
+When the caller passes the git blob hashes of the checked-out files and the
+hashes recorded at the last sync, skills whose source file is unchanged are
+reported as unchanged without being parsed; the remaining `SKILL.md` files are
+parsed in a thread pool.
+"""
+
+from __future__ import annotations
+
+import ipaddress
+import json
+import re
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Iterator, TextIO
+from urllib.parse import unquote, urlparse
+
+ALLOWED_PACK_SOURCE_SCHEMES = {"https"}
+BRANCH_NAME_ALLOWED_RE = r"^[A-Za-z0-9._/\-]+$"
+SKILLS_INDEX_READ_CHUNK_BYTES = 16 * 1024
+SKILLS_INDEX_FILENAME = "skills_index.json"
+SKILL_FILENAME = "SKILL.md"
+SKILL_PARSE_MAX_WORKERS = 8
+
+
+class PackContentError(RuntimeError):
+    """The pack's source URL or repository contents cannot be read as skills."""
+
+
+def normalize_pack_branch(raw_branch: str | None) -> str:
+    """Return a safe branch name, falling back to `main`."""
+    if not raw_branch:
+        return "main"
+    normalized = raw_branch.strip()
+    if not normalized:
+        return "main"
+    if any(ch in normalized for ch in {"\n", "\r", "\t"}):
+        return "main"
+    if not re.match(BRANCH_NAME_ALLOWED_RE, normalized):
+        return "main"
+    return normalized
+
+
+@dataclass(frozen=True)
+class PackSkillCandidate:
+    """Single skill discovered in a pack repository."""
+
+    name: str
+    description: str | None
+    source_url: str
+    category: str | None = None
+    risk: str | None = None
+    source: str | None = None
+    metadata: dict[str, object] | None = None
+    # Git blob hash of the file the skill was read from, when known.
+    blob_sha: str | None = None
+
+
+def infer_skill_name(source_url: str) -> str:
+    """Derive a readable skill name from the last path segment of a URL."""
+    parsed = urlparse(source_url)
+    path = parsed.path.rstrip("/")
+    candidate = path.rsplit("/", maxsplit=1)[-1] if path else parsed.netloc
+    candidate = unquote(candidate).removesuffix(".git").replace("-", " ").replace("_", " ")
+    if candidate.strip():
+        return candidate.strip()
+    return "Skill"
+
+
+def _infer_skill_description(content: str) -> str | None:
+    lines = [line.strip() for line in content.splitlines()]
+    if not lines:
+        return None
+
+    in_frontmatter = False
+    for line in lines:
+        if line == "---":
+            in_frontmatter = not in_frontmatter
+            continue
+        if in_frontmatter:
+            if line.lower().startswith("description:"):
+                value = line.split(":", maxsplit=1)[-1].strip().strip("\"'")
+                return value or None
+            continue
+        if not line or line.startswith("#"):
+            continue
+        return line
+
+    return None
+
+
+def _infer_skill_display_name(content: str, fallback: str) -> str:
+    in_frontmatter = False
+    for raw_line in content.splitlines():
+        line = raw_line.strip()
+        if line == "---":
+            in_frontmatter = not in_frontmatter
+            continue
+        if in_frontmatter and line.lower().startswith("name:"):
+            value = line.split(":", maxsplit=1)[-1].strip().strip("\"'")
+            if value:
+                return value
+
+    for raw_line in content.splitlines():
+        line = raw_line.strip()
+        if line.startswith("#"):
+            heading = line.lstrip("#").strip()
+            if heading:
+                return heading
+
+    normalized_fallback = fallback.replace("-", " ").replace("_", " ").strip()
+    return normalized_fallback or "Skill"
+
+
+def _parse_skill_file(skill_file: Path, fallback: str) -> tuple[str, str | None]:
+    """Return the display name and description of one `SKILL.md`, reading it once."""
+    try:
+        content = skill_file.read_text(encoding="utf-8", errors="ignore")
+    except OSError:
+        return _infer_skill_display_name("", fallback=fallback), None
+    return _infer_skill_display_name(content, fallback=fallback), _infer_skill_description(content)
+
+
+def normalize_repo_source_url(source_url: str) -> str:
+    """Strip trailing slashes and `.git` from a repository URL."""
+    normalized = source_url.strip().rstrip("/")
+    if normalized.endswith(".git"):
+        return normalized[: -len(".git")]
+    return normalized
+
+
+def validate_pack_source_url(source_url: str) -> None:
+    """Validate that a skill pack source URL is safe to clone.
+
+    The current implementation is intentionally conservative:
+    - allow only https URLs
+    - block localhost
+    - block literal private/loopback/link-local IPs
+
+    Note: DNS-based private resolution is not checked here.
+    """
+
+    parsed = urlparse(source_url)
+    scheme = (parsed.scheme or "").lower()
+    if scheme not in ALLOWED_PACK_SOURCE_SCHEMES:
+        raise ValueError(f"Unsupported pack source URL scheme: {parsed.scheme!r}")
+
+    host = (parsed.hostname or "").strip().lower()
+    if not host:
+        raise ValueError("Pack source URL must include a hostname")
+
+    if host in {"localhost"}:
+        raise ValueError("Pack source URL hostname is not allowed")
+
+    if host != "github.com":
+        raise ValueError(
+            "Pack source URL must be a GitHub repository URL (https://github.com/<owner>/<repo>)"
+        )
+
+    path = parsed.path.strip("/")
+    if not path or path.count("/") < 1:
+        raise ValueError(
+            "Pack source URL must be a GitHub repository URL (https://github.com/<owner>/<repo>)"
+        )
+
+    try:
+        ip = ipaddress.ip_address(host)
+    except ValueError:
+        return
+
+    if ip.is_private or ip.is_loopback or ip.is_link_local or ip.is_reserved or ip.is_multicast:
+        raise ValueError("Pack source URL hostname is not allowed")
+
+
+def to_tree_source_url(repo_source_url: str, branch: str, rel_path: str) -> str:
+    """Return the GitHub tree URL of `rel_path` on `branch`."""
+    repo_url = normalize_repo_source_url(repo_source_url)
+    safe_branch = branch.strip() or "main"
+    rel = rel_path.strip().lstrip("/")
+    if not rel:
+        return f"{repo_url}/tree/{safe_branch}"
+    return f"{repo_url}/tree/{safe_branch}/{rel}"
+
+
+def _normalize_repo_path(path_value: str) -> str:
+    cleaned = path_value.strip().replace("\\", "/")
+    while cleaned.startswith("./"):
+        cleaned = cleaned[2:]
+    cleaned = cleaned.lstrip("/").rstrip("/")
+
+    lowered = cleaned.lower()
+    if lowered.endswith("/skill.md"):
+        cleaned = cleaned.rsplit("/", maxsplit=1)[0]
+    elif lowered == "skill.md":
+        cleaned = ""
+
+    return cleaned
+
+
+def _coerce_index_entries(payload: object) -> list[dict[str, object]]:
+    if isinstance(payload, list):
+        return [entry for entry in payload if isinstance(entry, dict)]
+
+    if isinstance(payload, dict):
+        entries = payload.get("skills")
+        if isinstance(entries, list):
+            return [entry for entry in entries if isinstance(entry, dict)]
+
+    return []
+
+
+class _StreamingJSONReader:
+    """Incrementally decode JSON content from a file object."""
+
+    def __init__(self, file_obj: TextIO):
+        self._file_obj = file_obj
+        self._buffer = ""
+        self._position = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill_buffer(self) -> None:
+        if self._eof:
+            return
+
+        chunk = self._file_obj.read(SKILLS_INDEX_READ_CHUNK_BYTES)
+        if not chunk:
+            self._eof = True
+            return
+        self._buffer += chunk
+
+    def _peek(self) -> str | None:
+        self._skip_whitespace()
+        if self._position >= len(self._buffer):
+            return None
+        return self._buffer[self._position]
+
+    def _skip_whitespace(self) -> None:
+        while True:
+            while self._position < len(self._buffer) and self._buffer[self._position].isspace():
+                self._position += 1
+
+            if self._position < len(self._buffer):
+                return
+
+            self._fill_buffer()
+            if self._position < len(self._buffer):
+                return
+            if self._eof:
+                return
+
+    def _decode_value(self) -> object:
+        self._skip_whitespace()
+
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+                self._position = end
+                return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise RuntimeError("skills_index.json is not valid JSON")
+                self._fill_buffer()
+                self._skip_whitespace()
+                if self._position >= len(self._buffer):
+                    if self._eof:
+                        raise RuntimeError("skills_index.json is not valid JSON")
+
+    def _consume_char(self, expected: str) -> None:
+        self._skip_whitespace()
+        if self._position >= len(self._buffer):
+            self._fill_buffer()
+            self._skip_whitespace()
+        if self._position >= len(self._buffer):
+            raise RuntimeError("skills_index.json is not valid JSON")
+
+        actual = self._buffer[self._position]
+        if actual != expected:
+            raise RuntimeError("skills_index.json is not valid JSON")
+        self._position += 1
+
+    def read_top_level_entries(self) -> list[dict[str, object]]:
+        self._fill_buffer()
+        self._skip_whitespace()
+        first = self._peek()
+        if first is None:
+            raise RuntimeError("skills_index.json is not valid JSON")
+
+        if first == "[":
+            self._position += 1
+            return list(self._read_array_values())
+        if first == "{":
+            self._position += 1
+            return list(self._read_skills_from_object())
+        raise RuntimeError("skills_index.json is not valid JSON")
+
+    def _read_array_values(self) -> Iterator[dict[str, object]]:
+        while True:
+            self._skip_whitespace()
+            current = self._peek()
+            if current is None:
+                if self._eof:
+                    raise RuntimeError("skills_index.json is not valid JSON")
+                continue
+            if current == "]":
+                self._position += 1
+                return
+
+            if current == ",":
+                self._position += 1
+                continue
+
+            entry = self._decode_value()
+            if isinstance(entry, dict):
+                yield entry
+            else:
+                raise RuntimeError("skills_index.json is not valid JSON")
+
+    def _read_skills_from_object(self) -> Iterator[dict[str, object]]:
+        while True:
+            self._skip_whitespace()
+            current = self._peek()
+            if current is None:
+                if self._eof:
+                    raise RuntimeError("skills_index.json is not valid JSON")
+                continue
+
+            if current == "}":
+                self._position += 1
+                return
+
+            key = self._decode_value()
+            if not isinstance(key, str):
+                raise RuntimeError("skills_index.json is not valid JSON")
+
+            self._skip_whitespace()
+            if self._peek() == ":":
+                self._position += 1
+            else:
+                self._consume_char(":")
+
+            if key == "skills":
+                self._skip_whitespace()
+                current = self._peek()
+                if current is None:
+                    if self._eof:
+                        raise RuntimeError("skills_index.json is not valid JSON")
+                    continue
+
+                if current != "[":
+                    value = self._decode_value()
+                    if isinstance(value, list):
+                        for entry in value:
+                            if isinstance(entry, dict):
+                                yield entry
+                            else:
+                                raise RuntimeError("skills_index.json is not valid JSON")
+                    continue
+
+                self._position += 1
+                yield from self._read_array_values()
+            else:
+                self._decode_value()
+
+            self._skip_whitespace()
+            current = self._peek()
+            if current == ",":
+                self._position += 1
+                continue
+            if current == "}":
+                self._position += 1
+                return
+
+
+def _collect_pack_skills_from_index(
+    *,
+    repo_dir: Path,
+    source_url: str,
+    branch: str,
+    discovery_warnings: list[str] | None = None,
+) -> list[PackSkillCandidate] | None:
+    index_file = repo_dir / SKILLS_INDEX_FILENAME
+    if not index_file.is_file():
+        return None
+
+    try:
+        with index_file.open(encoding="utf-8") as fp:
+            payload = _StreamingJSONReader(fp).read_top_level_entries()
+    except OSError as exc:
+        raise PackContentError("unable to read skills_index.json") from exc
+    except RuntimeError as exc:
+        if discovery_warnings is not None:
+            discovery_warnings.append(f"Failed to parse skills_index.json: {exc}")
+        return None
+
+    found: dict[str, PackSkillCandidate] = {}
+    for entry in _coerce_index_entries(payload):
+        indexed_path = entry.get("path")
+        has_indexed_path = False
+        rel_path = ""
+        resolved_skill_path: str | None = None
+        if isinstance(indexed_path, str) and indexed_path.strip():
+            has_indexed_path = True
+            rel_path = _normalize_repo_path(indexed_path)
+            resolved_skill_path = rel_path or None
+
+        indexed_source = entry.get("source_url")
+        candidate_source_url: str | None = None
+        resolved_metadata: dict[str, object] = {
+            "discovery_mode": "skills_index",
+            "pack_branch": branch,
+        }
+        if isinstance(indexed_source, str) and indexed_source.strip():
+            source_candidate = indexed_source.strip()
+            resolved_metadata["source_url"] = source_candidate
+            if source_candidate.startswith(("https://", "http://")):
+                parsed = urlparse(source_candidate)
+                if parsed.path:
+                    marker = "/tree/"
+                    marker_index = parsed.path.find(marker)
+                    if marker_index > 0:
+                        tree_suffix = parsed.path[marker_index + len(marker) :]
+                        slash_index = tree_suffix.find("/")
+                        candidate_path = tree_suffix[slash_index + 1 :] if slash_index >= 0 else ""
+                        resolved_skill_path = _normalize_repo_path(candidate_path)
+                candidate_source_url = source_candidate
+            else:
+                indexed_rel = _normalize_repo_path(source_candidate)
+                resolved_skill_path = resolved_skill_path or indexed_rel
+                resolved_metadata["resolved_path"] = indexed_rel
+                if indexed_rel:
+                    candidate_source_url = to_tree_source_url(source_url, branch, indexed_rel)
+        elif has_indexed_path:
+            resolved_metadata["resolved_path"] = rel_path
+            candidate_source_url = to_tree_source_url(source_url, branch, rel_path)
+            if rel_path:
+                resolved_skill_path = rel_path
+
+        if not candidate_source_url:
+            continue
+
+        indexed_name = entry.get("name")
+        if isinstance(indexed_name, str) and indexed_name.strip():
+            name = indexed_name.strip()
+        else:
+            fallback = Path(rel_path).name if rel_path else "Skill"
+            name = infer_skill_name(fallback)
+
+        indexed_description = entry.get("description")
+        description = (
+            indexed_description.strip()
+            if isinstance(indexed_description, str) and indexed_description.strip()
+            else None
+        )
+        indexed_category = entry.get("category")
+        category = (
+            indexed_category.strip()
+            if isinstance(indexed_category, str) and indexed_category.strip()
+            else None
+        )
+        indexed_risk = entry.get("risk")
+        risk = (
+            indexed_risk.strip() if isinstance(indexed_risk, str) and indexed_risk.strip() else None
+        )
+        source_label = resolved_skill_path
+
+        found[candidate_source_url] = PackSkillCandidate(
+            name=name,
+            description=description,
+            source_url=candidate_source_url,
+            category=category,
+            risk=risk,
+            source=source_label,
+            metadata=resolved_metadata,
+        )
+
+    return list(found.values())
+
+
+def _is_unchanged(
+    source_url: str,
+    blob_sha: str | None,
+    known_blob_shas: Mapping[str, str] | None,
+) -> bool:
+    return (
+        blob_sha is not None
+        and known_blob_shas is not None
+        and (known_blob_shas.get(source_url) == blob_sha)
+    )
+
+
+def collect_pack_skills_from_repo(
+    *,
+    repo_dir: Path,
+    source_url: str,
+    branch: str,
+    discovery_warnings: list[str] | None = None,
+    blob_shas: Mapping[str, str] | None = None,
+    known_blob_shas: Mapping[str, str] | None = None,
+    unchanged_source_urls: list[str] | None = None,
+) -> list[PackSkillCandidate]:
+    """Collect skills from `skills_index.json`, else from every non-hidden `SKILL.md`.
+
+    `blob_shas` maps repo-relative file paths to git blob hashes and
+    `known_blob_shas` maps skill source URLs to the hash recorded at the last
+    sync. Skills whose hash matches are left out of the result and their source
+    URLs appended to `unchanged_source_urls` instead.
+    """
+    blob_shas = blob_shas or {}
+    indexed = _collect_pack_skills_from_index(
+        repo_dir=repo_dir,
+        source_url=source_url,
+        branch=branch,
+        discovery_warnings=discovery_warnings,
+    )
+    if indexed is not None:
+        # Index entries change together with the index file.
+        index_blob_sha = blob_shas.get(SKILLS_INDEX_FILENAME)
+        changed: list[PackSkillCandidate] = []
+        for candidate in indexed:
+            if _is_unchanged(candidate.source_url, index_blob_sha, known_blob_shas):
+                if unchanged_source_urls is not None:
+                    unchanged_source_urls.append(candidate.source_url)
+                continue
+            changed.append(replace(candidate, blob_sha=index_blob_sha))
+        return changed
+
+    pending: list[tuple[Path, str, str, str, str | None]] = []
+    for skill_file in sorted(repo_dir.rglob(SKILL_FILENAME)):
+        rel_file = skill_file.relative_to(repo_dir)
+        # Skip hidden folders like .git, .github, etc.
+        if any(part.startswith(".") for part in rel_file.parts):
+            continue
+
+        skill_dir = skill_file.parent
+        rel_dir = "" if skill_dir == repo_dir else skill_dir.relative_to(repo_dir).as_posix()
+        tree_url = to_tree_source_url(source_url, branch, rel_dir)
+        blob_sha = blob_shas.get(rel_file.as_posix())
+        if _is_unchanged(tree_url, blob_sha, known_blob_shas):
+            if unchanged_source_urls is not None:
+                unchanged_source_urls.append(tree_url)
+            continue
+        fallback_name = infer_skill_name(source_url) if skill_dir == repo_dir else skill_dir.name
+        pending.append((skill_file, fallback_name, rel_dir, tree_url, blob_sha))
+
+    if not pending:
+        return []
+    with ThreadPoolExecutor(
+        max_workers=min(SKILL_PARSE_MAX_WORKERS, len(pending)),
+        thread_name_prefix="skill-parse",
+    ) as pool:
+        parsed = list(
+            pool.map(lambda item: _parse_skill_file(item[0], fallback=item[1]), pending),
+        )
+
+    return [
+        PackSkillCandidate(
+            name=name,
+            description=description,
+            source_url=tree_url,
+            metadata={
+                "discovery_mode": "skills_md",
+                "pack_branch": branch,
+                "skill_dir": rel_dir,
+            },
+            blob_sha=blob_sha,
+        )
+        for (_file, _fallback, rel_dir, tree_url, blob_sha), (name, description) in zip(
+            pending,
+            parsed,
+            strict=True,
+        )
+    ]
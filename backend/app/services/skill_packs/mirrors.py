@@ -0,0 +1,165 @@
+"""Persistent bare git mirrors of skill pack repositories.
+
+Each pack source URL gets one `git clone --mirror` under
+`SKILL_PACK_MIRROR_DIR`; later syncs only `git fetch --prune` into it, so
+repeated syncs transfer just the new objects. Every git call runs as an
+asyncio subprocess with a timeout, never on the event loop thread.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import shutil
+import tarfile
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.services.skill_packs.discovery import normalize_repo_source_url
+
+logger = get_logger(__name__)
+
+GIT_REV_PARSE_TIMEOUT_SECONDS = 10
+# Never let git wait for credentials on a terminal that does not exist.
+_GIT_ENV = {**os.environ, "GIT_TERMINAL_PROMPT": "0"}
+_MIRROR_LOCKS: dict[Path, asyncio.Lock] = {}
+
+
+class GitCommandError(RuntimeError):
+    """A git subprocess failed or timed out."""
+
+
+async def run_git(*args: str, timeout: float) -> str:
+    """Run `git <args>` and return its stdout, raising `GitCommandError` on failure."""
+    try:
+        process = await asyncio.create_subprocess_exec(
+            "git",
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=_GIT_ENV,
+        )
+    except FileNotFoundError as exc:
+        raise GitCommandError("git binary not available on the server") from exc
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
+    except TimeoutError as exc:
+        process.kill()
+        await process.wait()
+        raise GitCommandError(f"timed out running git {args[0]}") from exc
+    if process.returncode != 0:
+        detail = stderr.decode(errors="replace").strip()
+        message = f"git {args[0]} failed"
+        if detail:
+            message = f"{message}: {detail.splitlines()[0][:200]}"
+        raise GitCommandError(message)
+    return stdout.decode(errors="replace").strip()
+
+
+def mirror_path(source_url: str) -> Path:
+    """Return the mirror directory used for `source_url`."""
+    digest = hashlib.sha256(normalize_repo_source_url(source_url).encode()).hexdigest()
+    return Path(settings.skill_pack_mirror_dir) / f"{digest[:24]}.git"
+
+
+async def update_mirror(source_url: str) -> Path:
+    """Create the mirror of `source_url` or fetch new objects into it."""
+    path = mirror_path(source_url)
+    lock = _MIRROR_LOCKS.setdefault(path, asyncio.Lock())
+    timeout = settings.skill_pack_git_timeout_seconds
+    async with lock:
+        if (path / "HEAD").is_file():
+            await run_git("--git-dir", str(path), "fetch", "--prune", "--quiet", timeout=timeout)
+            return path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        staging = path.with_name(f"{path.name}.tmp")
+        shutil.rmtree(staging, ignore_errors=True)
+        try:
+            await run_git("clone", "--mirror", "--quiet", source_url, str(staging), timeout=timeout)
+        except GitCommandError:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        # A half-written clone is never mistaken for a usable mirror.
+        staging.rename(path)
+        logger.info("skill_pack.mirror.created", extra={"source_url": source_url})
+        return path
+
+
+async def resolve_branch(mirror: Path, requested_branch: str) -> tuple[str, str]:
+    """Return `(branch, commit)` for `requested_branch`, else the default branch."""
+    git_dir = str(mirror)
+    try:
+        commit = await run_git(
+            "--git-dir",
+            git_dir,
+            "rev-parse",
+            "--verify",
+            f"refs/heads/{requested_branch}^{{commit}}",
+            timeout=GIT_REV_PARSE_TIMEOUT_SECONDS,
+        )
+        return requested_branch, commit
+    except GitCommandError:
+        pass
+    default_branch = await run_git(
+        "--git-dir",
+        git_dir,
+        "symbolic-ref",
+        "--short",
+        "HEAD",
+        timeout=GIT_REV_PARSE_TIMEOUT_SECONDS,
+    )
+    commit = await run_git(
+        "--git-dir",
+        git_dir,
+        "rev-parse",
+        "--verify",
+        "HEAD^{commit}",
+        timeout=GIT_REV_PARSE_TIMEOUT_SECONDS,
+    )
+    return default_branch, commit
+
+
+async def list_blob_shas(mirror: Path, commit: str, *, names: set[str]) -> dict[str, str]:
+    """Map repo-relative paths of files named in `names` to their blob hashes at `commit`."""
+    listing = await run_git(
+        "--git-dir",
+        str(mirror),
+        "ls-tree",
+        "-r",
+        "-z",
+        commit,
+        timeout=settings.skill_pack_git_timeout_seconds,
+    )
+    blob_shas: dict[str, str] = {}
+    for record in listing.split("\0"):
+        # "<mode> <type> <sha>\t<path>"
+        header, _, path = record.partition("\t")
+        parts = header.split()
+        if len(parts) == 3 and parts[1] == "blob" and path.rsplit("/", 1)[-1] in names:
+            blob_shas[path] = parts[2]
+    return blob_shas
+
+
+def _extract_archive(archive: Path, destination: Path) -> None:
+    with tarfile.open(archive) as tar:
+        tar.extractall(destination, filter="data")
+
+
+async def export_tree(mirror: Path, commit: str, destination: Path) -> None:
+    """Write the files of `commit` into `destination` (no `.git` directory)."""
+    with TemporaryDirectory(prefix="skill-pack-archive-") as tmp_dir:
+        archive = Path(tmp_dir) / "tree.tar"
+        await run_git(
+            "--git-dir",
+            str(mirror),
+            "archive",
+            "--format=tar",
+            "-o",
+            str(archive),
+            commit,
+            timeout=settings.skill_pack_git_timeout_seconds,
+        )
+        await asyncio.to_thread(_extract_archive, archive, destination)
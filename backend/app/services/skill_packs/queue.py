@@ -0,0 +1,83 @@
+"""Queue helpers for background skill pack sync jobs."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.services.queue import QueuedTask, enqueue_task, requeue_if_failed
+
+logger = get_logger(__name__)
+TASK_TYPE = "skill_pack_sync"
+
+
+@dataclass(frozen=True)
+class QueuedSkillPackSync:
+    """Payload envelope for skill pack sync background jobs."""
+
+    pack_id: UUID
+    queued_at: datetime
+    attempts: int = 0
+
+
+def _task_from_payload(payload: QueuedSkillPackSync) -> QueuedTask:
+    return QueuedTask(
+        task_type=TASK_TYPE,
+        payload={
+            "pack_id": str(payload.pack_id),
+            "queued_at": payload.queued_at.isoformat(),
+        },
+        created_at=payload.queued_at,
+        attempts=payload.attempts,
+    )
+
+
+def decode_skill_pack_sync(task: QueuedTask) -> QueuedSkillPackSync:
+    """Decode generic queued task into a skill pack sync payload."""
+    if task.task_type != TASK_TYPE:
+        raise ValueError(f"Unexpected task_type={task.task_type!r}; expected {TASK_TYPE!r}")
+    payload: dict[str, Any] = task.payload
+    queued_at = payload.get("queued_at")
+    return QueuedSkillPackSync(
+        pack_id=UUID(payload["pack_id"]),
+        queued_at=(
+            datetime.fromisoformat(queued_at) if isinstance(queued_at, str) else datetime.now(UTC)
+        ),
+        attempts=int(payload.get("attempts", task.attempts)),
+    )
+
+
+def enqueue_skill_pack_sync(payload: QueuedSkillPackSync) -> bool:
+    """Enqueue a sync of one skill pack."""
+    try:
+        enqueue_task(
+            _task_from_payload(payload),
+            settings.rq_queue_name,
+            redis_url=settings.rq_redis_url,
+        )
+        logger.info(
+            "skill_pack_sync.queue.enqueued",
+            extra={"pack_id": str(payload.pack_id), "attempt": payload.attempts},
+        )
+        return True
+    except Exception as exc:
+        logger.warning(
+            "skill_pack_sync.queue.enqueue_failed",
+            extra={"pack_id": str(payload.pack_id), "error": str(exc)},
+        )
+        return False
+
+
+def requeue_skill_pack_sync(task: QueuedTask, *, delay_seconds: float = 0) -> bool:
+    """Requeue failed skill pack sync jobs with capped retry policy."""
+    return requeue_if_failed(
+        task,
+        settings.rq_queue_name,
+        max_retries=settings.rq_dispatch_max_retries,
+        redis_url=settings.rq_redis_url,
+        delay_seconds=delay_seconds,
+    )
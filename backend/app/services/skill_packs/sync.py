@@ -0,0 +1,340 @@
+"""Background sync of skill packs into marketplace skills.
+
+`request_skill_pack_sync` marks a pack as queued and enqueues a job; the queue
+worker then runs `run_skill_pack_sync`, which refreshes the pack's bare git
+mirror (see `app.services.skill_packs.mirrors`), exports the resolved commit,
+and discovers skills from it. Skills whose source file has the same git blob
+hash as at their last sync are not re-parsed or re-written; the rest are
+written with one `INSERT ... ON CONFLICT (organization_id, source_url)` per
+chunk. Status, timing, and the result counts are stored on the pack so
+`sync_status` can report them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import TYPE_CHECKING, Any
+from uuid import UUID, uuid4
+
+from sqlalchemy import Text, cast, or_
+from sqlmodel import col, select
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.time import utcnow
+from app.db.session import async_session_maker
+from app.db.upsert import upsert_insert
+from app.models.skills import MarketplaceSkill, SkillPack, facet_key
+from app.schemas.skills_marketplace import SkillPackSyncResponse
+from app.services.skill_packs.discovery import (
+    SKILL_FILENAME,
+    SKILLS_INDEX_FILENAME,
+    PackContentError,
+    PackSkillCandidate,
+    collect_pack_skills_from_repo,
+    normalize_pack_branch,
+    validate_pack_source_url,
+)
+from app.services.skill_packs.mirrors import (
+    GitCommandError,
+    export_tree,
+    list_blob_shas,
+    resolve_branch,
+    update_mirror,
+)
+from app.services.skill_packs.queue import (
+    QueuedSkillPackSync,
+    decode_skill_pack_sync,
+    enqueue_skill_pack_sync,
+)
+
+if TYPE_CHECKING:
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+    from app.services.queue import QueuedTask
+
+logger = get_logger(__name__)
+
+SYNC_QUEUED = "queued"
+SYNC_RUNNING = "running"
+SYNC_SUCCEEDED = "succeeded"
+SYNC_FAILED = "failed"
+# Rows per upsert statement (about a dozen bind parameters each).
+UPSERT_CHUNK_SIZE = 500
+
+
+@dataclass(frozen=True)
+class PackDiscovery:
+    """Outcome of discovering skills at one commit of a pack repository."""
+
+    changed: list[PackSkillCandidate]
+    unchanged: list[str]
+    warnings: list[str]
+    commit: str
+
+
+def sync_status(pack: SkillPack) -> SkillPackSyncResponse:
+    """Return the current sync state of `pack`."""
+    result = pack.sync_result or {}
+    warnings = result.get("warnings")
+
+    def _count(key: str) -> int:
+        value = result.get(key)
+        return value if isinstance(value, int) else 0
+
+    return SkillPackSyncResponse(
+        ok=pack.sync_status != SYNC_FAILED,
+        pack_id=pack.id,
+        status=pack.sync_status,
+        requested_at=pack.sync_requested_at,
+        started_at=pack.sync_started_at,
+        finished_at=pack.sync_finished_at,
+        commit=pack.sync_commit,
+        synced=_count("synced"),
+        created=_count("created"),
+        updated=_count("updated"),
+        unchanged=_count("unchanged"),
+        warnings=[str(item) for item in warnings] if isinstance(warnings, list) else [],
+        error=pack.sync_error,
+    )
+
+
+async def request_skill_pack_sync(session: AsyncSession, pack: SkillPack) -> SkillPackSyncResponse:
+    """Queue a sync of `pack` unless one is already queued or running."""
+    now = utcnow()
+    stale_before = now - timedelta(seconds=settings.skill_pack_sync_stale_seconds)
+    if (
+        pack.sync_status in {SYNC_QUEUED, SYNC_RUNNING}
+        and pack.sync_requested_at is not None
+        and pack.sync_requested_at > stale_before
+    ):
+        return sync_status(pack)
+
+    pack.sync_status = SYNC_QUEUED
+    pack.sync_requested_at = now
+    pack.sync_error = None
+    session.add(pack)
+    await session.commit()
+    if not enqueue_skill_pack_sync(
+        QueuedSkillPackSync(pack_id=pack.id, queued_at=datetime.now(UTC)),
+    ):
+        pack.sync_status = SYNC_FAILED
+        pack.sync_finished_at = utcnow()
+        pack.sync_error = "unable to queue pack sync"
+        session.add(pack)
+        await session.commit()
+    return sync_status(pack)
+
+
+async def discover_pack_skills(
+    *,
+    source_url: str,
+    branch: str,
+    known_blob_shas: Mapping[str, str] | None = None,
+) -> PackDiscovery:
+    """Refresh the pack mirror and discover skills at the tip of `branch`.
+
+    Falls back to the repository's default branch when `branch` does not exist.
+    Skills whose `known_blob_shas` entry matches the current file are reported
+    as unchanged without being parsed.
+    """
+    # Defense-in-depth: validate again at point of use before invoking git.
+    try:
+        validate_pack_source_url(source_url)
+    except ValueError as exc:
+        raise PackContentError(str(exc)) from exc
+    requested_branch = normalize_pack_branch(branch)
+    mirror = await update_mirror(source_url)
+    used_branch, commit = await resolve_branch(mirror, requested_branch)
+    warnings: list[str] = []
+    if used_branch != requested_branch:
+        warnings.append(
+            f"branch {requested_branch!r} not found; synced default branch {used_branch!r}",
+        )
+    blob_shas = await list_blob_shas(
+        mirror,
+        commit,
+        names={SKILL_FILENAME, SKILLS_INDEX_FILENAME},
+    )
+    unchanged: list[str] = []
+    with TemporaryDirectory(prefix="skill-pack-sync-") as tmp_dir:
+        repo_dir = Path(tmp_dir)
+        await export_tree(mirror, commit, repo_dir)
+        changed = await asyncio.to_thread(
+            collect_pack_skills_from_repo,
+            repo_dir=repo_dir,
+            source_url=source_url,
+            branch=normalize_pack_branch(used_branch),
+            discovery_warnings=warnings,
+            blob_shas=blob_shas,
+            known_blob_shas=known_blob_shas,
+            unchanged_source_urls=unchanged,
+        )
+    return PackDiscovery(changed=changed, unchanged=unchanged, warnings=warnings, commit=commit)
+
+
+async def _known_blob_shas(session: AsyncSession, organization_id: UUID) -> dict[str, str]:
+    rows = await session.exec(
+        select(MarketplaceSkill.source_url, MarketplaceSkill.source_blob_sha)
+        .where(col(MarketplaceSkill.organization_id) == organization_id)
+        .where(col(MarketplaceSkill.source_blob_sha).is_not(None)),
+    )
+    return {source_url: blob_sha for source_url, blob_sha in rows if blob_sha is not None}
+
+
+def _upsert_row(
+    organization_id: UUID,
+    candidate: PackSkillCandidate,
+    now: datetime,
+) -> dict[str, Any]:
+    return {
+        "id": uuid4(),
+        "organization_id": organization_id,
+        "source_url": candidate.source_url,
+        "name": candidate.name,
+        "description": candidate.description,
+        "category": candidate.category,
+        "risk": candidate.risk,
+        # Core inserts bypass the ORM hook that keeps facet keys in sync.
+        "category_key": facet_key(candidate.category),
+        "risk_key": facet_key(candidate.risk),
+        "source": candidate.source,
+        "source_blob_sha": candidate.blob_sha,
+        "metadata": candidate.metadata or {},
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+async def _upsert_pack_skills(
+    session: AsyncSession,
+    *,
+    organization_id: UUID,
+    candidates: list[PackSkillCandidate],
+) -> tuple[int, int]:
+    """Insert or update `candidates`, returning `(created, updated)` row counts."""
+    if not candidates:
+        return 0, 0
+    table = MarketplaceSkill.__table__  # type: ignore[attr-defined]
+    now = utcnow()
+    created = 0
+    updated = 0
+    for start in range(0, len(candidates), UPSERT_CHUNK_SIZE):
+        chunk = candidates[start : start + UPSERT_CHUNK_SIZE]
+        rows = [_upsert_row(organization_id, candidate, now) for candidate in chunk]
+        inserted_ids = {row["id"] for row in rows}
+        statement: Any = upsert_insert(session, table).values(rows)
+        excluded = statement.excluded
+        compared = ("name", "description", "category", "risk", "source", "source_blob_sha")
+        statement = statement.on_conflict_do_update(
+            index_elements=[table.c.organization_id, table.c.source_url],
+            set_={
+                **{name: excluded[name] for name in compared},
+                "category_key": excluded.category_key,
+                "risk_key": excluded.risk_key,
+                "metadata": excluded.metadata,
+                "updated_at": excluded.updated_at,
+            },
+            # Identical rows are left alone; JSON has no equality operator on Postgres.
+            where=or_(
+                *(table.c[name].is_distinct_from(excluded[name]) for name in compared),
+                cast(table.c.metadata, Text).is_distinct_from(cast(excluded.metadata, Text)),
+            ),
+        ).returning(table.c.id)
+        result = await session.exec(statement)
+        for (skill_id,) in result:
+            # Updated rows keep their id; only inserted rows carry one generated here.
+            if skill_id in inserted_ids:
+                created += 1
+            else:
+                updated += 1
+    return created, updated
+
+
+def _finish(pack: SkillPack, *, status: str, error: str | None = None) -> None:
+    pack.sync_status = status
+    pack.sync_finished_at = utcnow()
+    pack.sync_error = error
+
+
+async def run_skill_pack_sync(session: AsyncSession, pack: SkillPack) -> SkillPackSyncResponse:
+    """Sync `pack` now, recording progress and results on the pack row.
+
+    Git, pack-content, and validation failures are recorded as a failed sync;
+    other discovery errors are recorded and re-raised so the worker can retry.
+    """
+    pack.sync_status = SYNC_RUNNING
+    pack.sync_started_at = utcnow()
+    pack.sync_finished_at = None
+    pack.sync_error = None
+    session.add(pack)
+    await session.commit()
+
+    known_blob_shas = await _known_blob_shas(session, pack.organization_id)
+    # Do not hold a transaction open while git runs.
+    await session.commit()
+    try:
+        discovery = await discover_pack_skills(
+            source_url=pack.source_url,
+            branch=pack.branch,
+            known_blob_shas=known_blob_shas,
+        )
+    except (GitCommandError, PackContentError) as exc:
+        _finish(pack, status=SYNC_FAILED, error=str(exc))
+        session.add(pack)
+        await session.commit()
+        logger.warning(
+            "skill_pack.sync.failed",
+            extra={"pack_id": str(pack.id), "error": str(exc)},
+        )
+        return sync_status(pack)
+    except Exception as exc:
+        _finish(pack, status=SYNC_FAILED, error=str(exc) or type(exc).__name__)
+        session.add(pack)
+        await session.commit()
+        raise
+
+    created, updated = await _upsert_pack_skills(
+        session,
+        organization_id=pack.organization_id,
+        candidates=discovery.changed,
+    )
+    synced = len(discovery.changed) + len(discovery.unchanged)
+    pack.sync_commit = discovery.commit
+    pack.sync_result = {
+        "synced": synced,
+        "created": created,
+        "updated": updated,
+        "unchanged": len(discovery.unchanged),
+        "warnings": discovery.warnings,
+    }
+    _finish(pack, status=SYNC_SUCCEEDED)
+    session.add(pack)
+    await session.commit()
+    logger.info(
+        "skill_pack.sync.succeeded",
+        extra={
+            "pack_id": str(pack.id),
+            "commit": discovery.commit,
+            "synced": synced,
+            "skills_created": created,
+            "skills_updated": updated,
+        },
+    )
+    return sync_status(pack)
+
+
+async def execute_skill_pack_sync(task: QueuedTask) -> None:
+    """Run one queued skill pack sync job."""
+    payload = decode_skill_pack_sync(task)
+    async with async_session_maker() as session:
+        pack = await SkillPack.objects.by_id(payload.pack_id).first(session)
+        if pack is None:
+            logger.info("skill_pack.sync.skip", extra={"pack_id": str(payload.pack_id)})
+            return
+        await run_skill_pack_sync(session, pack)
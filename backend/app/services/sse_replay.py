@@ -0,0 +1,281 @@
+"""Replay ring buffers and Last-Event-ID resume support for SSE streams.
+
+Every streamed SSE message gets a monotonic event id of the form
+``<generation>-<seq>-<cursor_us>``:
+
+- ``generation`` identifies the process-scoped buffer that issued the id,
+- ``seq`` is a monotonic sequence number shared by all channels,
+- ``cursor_us`` is the DB cursor (``created_at``/``updated_at``) of the
+  message in microseconds since the epoch.
+
+Reconnecting clients send the last id back as ``Last-Event-ID``. When the id
+was issued by this process and the channel buffer still covers it, missed
+messages are replayed straight from memory. Otherwise the stream falls back
+to polling the database from the cursor encoded in the id.
+
+Within a connection, messages are deduplicated by event id rather than by
+``seq``: a connection whose poll ran earlier may record an event after this
+connection has already delivered a higher ``seq``, and that event must still
+be delivered. At most ``sse_replay_max_channels`` channels are buffered; the
+least recently written one is dropped first.
+"""
+
+from __future__ import annotations
+
+import secrets
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from app.core.config import settings
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Iterable
+
+LAST_EVENT_ID_HEADER = "last-event-id"
+_EPOCH = datetime(1970, 1, 1)  # noqa: DTZ001
+_EVENT_ID_PARTS = 3
+
+ReplayChannel = tuple[object, ...]
+
+
+def _cursor_to_micros(value: datetime) -> int:
+    return (value.replace(tzinfo=None) - _EPOCH) // timedelta(microseconds=1)
+
+
+def _micros_to_cursor(value: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=value)
+
+
+@dataclass(frozen=True, slots=True)
+class ReplayEntry:
+    """One buffered SSE message."""
+
+    seq: int
+    event_id: str
+    event: str
+    data: str
+    cursor: datetime
+    meta: object | None = None
+
+    def message(self) -> dict[str, str]:
+        """Return the message in `EventSourceResponse` dict form."""
+        return {"id": self.event_id, "event": self.event, "data": self.data}
+
+
+@dataclass(frozen=True, slots=True)
+class ReplayPosition:
+    """Decoded `Last-Event-ID` value."""
+
+    seq: int
+    cursor: datetime
+    same_generation: bool
+
+
+class _ChannelBuffer:
+    def __init__(self, max_entries: int, *, evicted_through: int) -> None:
+        self.entries: deque[ReplayEntry] = deque()
+        self.by_key: dict[Hashable, ReplayEntry] = {}
+        self.keys: deque[Hashable] = deque()
+        self.max_entries = max_entries
+        # Nothing issued before the buffer existed can be replayed from it.
+        self.evicted_through = evicted_through
+
+    def append(self, key: Hashable, entry: ReplayEntry) -> None:
+        self.entries.append(entry)
+        self.keys.append(key)
+        self.by_key[key] = entry
+        while len(self.entries) > self.max_entries:
+            evicted = self.entries.popleft()
+            evicted_key = self.keys.popleft()
+            if self.by_key.get(evicted_key) is evicted:
+                del self.by_key[evicted_key]
+            self.evicted_through = evicted.seq
+
+
+class SseReplayBuffer:
+    """Process-scoped bounded replay buffers keyed by stream channel.
+
+    A channel is a tuple such as ``("tasks", board_id)``. Messages are recorded
+    once per (channel, key) so concurrent connections watching the same board
+    share both the event id and the serialized payload.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int | None = None,
+        max_channels: int | None = None,
+    ) -> None:
+        self.generation = secrets.token_hex(4)
+        self._max_entries = max(
+            1,
+            max_entries if max_entries is not None else settings.sse_replay_buffer_size,
+        )
+        self._max_channels = max(
+            1,
+            max_channels if max_channels is not None else settings.sse_replay_max_channels,
+        )
+        self._next_seq = 0
+        # Ordered from least to most recently written.
+        self._channels: dict[ReplayChannel, _ChannelBuffer] = {}
+
+    def _channel_for_write(self, channel: ReplayChannel) -> _ChannelBuffer:
+        buffer = self._channels.pop(channel, None)
+        if buffer is None:
+            buffer = _ChannelBuffer(self._max_entries, evicted_through=self._next_seq)
+        self._channels[channel] = buffer
+        while len(self._channels) > self._max_channels:
+            del self._channels[next(iter(self._channels))]
+        return buffer
+
+    def lookup(self, channel: ReplayChannel, key: Hashable) -> ReplayEntry | None:
+        """Return the buffered entry for `key`, if it has already been recorded."""
+        buffer = self._channels.get(channel)
+        if buffer is None:
+            return None
+        return buffer.by_key.get(key)
+
+    def record(
+        self,
+        channel: ReplayChannel,
+        *,
+        key: Hashable,
+        event: str,
+        data: str,
+        cursor: datetime,
+        meta: object | None = None,
+    ) -> ReplayEntry:
+        """Record a message, returning the existing entry when `key` is known.
+
+        `meta` carries stream-specific data shared with every connection that
+        delivers the entry (e.g. alternative payload encodings).
+        """
+        existing = self.lookup(channel, key)
+        if existing is not None:
+            return existing
+        buffer = self._channel_for_write(channel)
+        self._next_seq += 1
+        seq = self._next_seq
+        entry = ReplayEntry(
+            seq=seq,
+            event_id=f"{self.generation}-{seq}-{_cursor_to_micros(cursor)}",
+            event=event,
+            data=data,
+            cursor=cursor,
+            meta=meta,
+        )
+        buffer.append(key, entry)
+        return entry
+
+    def parse_event_id(self, value: str | None) -> ReplayPosition | None:
+        """Decode a `Last-Event-ID` header value issued by any replay buffer."""
+        if not value:
+            return None
+        parts = value.strip().split("-")
+        if len(parts) != _EVENT_ID_PARTS:
+            return None
+        generation, raw_seq, raw_cursor = parts
+        try:
+            seq = int(raw_seq)
+            cursor = _micros_to_cursor(int(raw_cursor))
+        except (ValueError, OverflowError):
+            return None
+        if seq < 0:
+            return None
+        return ReplayPosition(
+            seq=seq,
+            cursor=cursor,
+            same_generation=generation == self.generation,
+        )
+
+    def replay(
+        self,
+        channels: Iterable[ReplayChannel],
+        *,
+        after_seq: int,
+    ) -> list[ReplayEntry] | None:
+        """Return buffered entries newer than `after_seq`, or None when a gap exists."""
+        entries: list[ReplayEntry] = []
+        for channel in channels:
+            buffer = self._channels.get(channel)
+            if buffer is None:
+                continue
+            if buffer.evicted_through > after_seq:
+                return None
+            entries.extend(entry for entry in buffer.entries if entry.seq > after_seq)
+        entries.sort(key=lambda entry: entry.seq)
+        return entries
+
+    def clear(self) -> None:
+        """Drop all buffered entries (test helper)."""
+        self._channels.clear()
+
+
+class ReplayCursor:
+    """Per-connection stream position backed by the shared replay buffer."""
+
+    def __init__(
+        self,
+        buffer: SseReplayBuffer,
+        *,
+        last_event_id: str | None,
+        since: datetime,
+        render: Callable[[ReplayEntry], dict[str, str]] | None = None,
+    ) -> None:
+        self._buffer = buffer
+        self._render = render or ReplayEntry.message
+        self._position = buffer.parse_event_id(last_event_id)
+        self.last_seq = 0
+        self.last_seen = since
+        # Event ids delivered on this connection that a poll from `last_seen`
+        # can still return; older ids are pruned once `last_seen` passes them.
+        self._delivered: dict[str, datetime] = {}
+        self._pruned_before: datetime | None = None
+        # Entries issued before `Last-Event-ID` were delivered to the client's
+        # previous connection.
+        self._resumed_through = 0
+        if self._position is not None:
+            self.last_seen = self._position.cursor
+            if self._position.same_generation:
+                self.last_seq = self._resumed_through = self._position.seq
+
+    def resume(self, channels: Iterable[ReplayChannel]) -> list[dict[str, str]]:
+        """Return buffered messages missed since `Last-Event-ID`, if still buffered."""
+        position = self._position
+        if position is None or not position.same_generation:
+            return []
+        entries = self._buffer.replay(channels, after_seq=position.seq)
+        if entries is None:
+            return []
+        return self.deliver(entries)
+
+    def deliver(self, entries: Iterable[ReplayEntry]) -> list[dict[str, str]]:
+        """Return messages not yet delivered on this connection, in id order."""
+        messages: list[dict[str, str]] = []
+        for entry in sorted(entries, key=lambda item: item.seq):
+            self.last_seen = max(self.last_seen, entry.cursor)
+            if (
+                entry.event_id in self._delivered
+                or entry.seq <= self._resumed_through
+                or (self._pruned_before is not None and entry.cursor < self._pruned_before)
+            ):
+                continue
+            self._delivered[entry.event_id] = entry.cursor
+            self.last_seq = max(self.last_seq, entry.seq)
+            messages.append(self._render(entry))
+        # Polls only return rows at or after `last_seen`.
+        self._pruned_before = self.last_seen
+        for event_id, cursor in list(self._delivered.items()):
+            if cursor < self.last_seen:
+                del self._delivered[event_id]
+        return messages
+
+
+_REPLAY_BUFFER = SseReplayBuffer()
+
+
+def get_replay_buffer() -> SseReplayBuffer:
+    """Return process-scoped SSE replay buffer singleton."""
+    return _REPLAY_BUFFER
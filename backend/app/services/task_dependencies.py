@@ -1,9 +1,16 @@
-"""Task-dependency helpers for validation, querying, and replacement."""
+"""Task-dependency helpers for validation, querying, and replacement.
+
+Dependency edges are held per board in an in-memory `DependencyGraph` keyed on
+`boards.dependency_version`, which is bumped on every `task_dependencies`
+write. Edits only pay for a version lookup plus a walk of the subgraph
+reachable from the new dependencies, and dependents come from reverse edges.
+"""
 
 from __future__ import annotations
 
-from collections import defaultdict
-from collections.abc import Mapping, Sequence
+from collections import OrderedDict, defaultdict
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
 from typing import Final
 from uuid import UUID
 
@@ -12,10 +19,13 @@ from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.db import crud
+from app.db.board_versions import has_uncommitted_bumps
+from app.models.boards import Board
 from app.models.task_dependencies import TaskDependency
 from app.models.tasks import Task
 
 DONE_STATUS: Final[str] = "done"
+DEPENDENCY_GRAPH_CACHE_MAX_ENTRIES: Final[int] = 256
 _RUNTIME_TYPE_REFERENCES = (UUID, AsyncSession, Mapping, Sequence)
 
 
@@ -108,25 +118,114 @@ async def blocked_by_for_task(
     return blocked_by_dependency_ids(dependency_ids=dep_ids, status_by_id=status_by_id)
 
 
-def _has_cycle(nodes: Sequence[UUID], edges: Mapping[UUID, set[UUID]]) -> bool:
-    """Detect cycles in a directed dependency graph."""
-    visited: set[UUID] = set()
-    in_stack: set[UUID] = set()
-
-    def dfs(current: UUID) -> bool:
-        if current in in_stack:
-            return True
-        if current in visited:
-            return False
-        visited.add(current)
-        in_stack.add(current)
-        for nxt in edges.get(current, set()):
-            if dfs(nxt):
+@dataclass(slots=True)
+class DependencyGraph:
+    """Forward and reverse task dependency edges for one board."""
+
+    version: int
+    depends_on: dict[UUID, set[UUID]] = field(default_factory=dict)
+    dependents: dict[UUID, set[UUID]] = field(default_factory=dict)
+
+    @classmethod
+    def from_edges(
+        cls,
+        edges: Iterable[tuple[UUID, UUID]],
+        *,
+        version: int,
+    ) -> DependencyGraph:
+        """Build a graph from `(task_id, depends_on_task_id)` pairs."""
+        graph = cls(version=version)
+        for task_id, depends_on_task_id in edges:
+            graph.depends_on.setdefault(task_id, set()).add(depends_on_task_id)
+            graph.dependents.setdefault(depends_on_task_id, set()).add(task_id)
+        return graph
+
+    def reaches(self, starts: Iterable[UUID], target: UUID) -> bool:
+        """Return whether `target` is reachable from `starts` along depends-on edges."""
+        stack = list(starts)
+        visited: set[UUID] = set()
+        while stack:
+            current = stack.pop()
+            if current == target:
                 return True
-        in_stack.remove(current)
+            if current in visited:
+                continue
+            visited.add(current)
+            stack.extend(self.depends_on.get(current, ()))
         return False
 
-    return any(dfs(start_node) for start_node in nodes)
+    def would_create_cycle(self, task_id: UUID, depends_on_task_ids: Iterable[UUID]) -> bool:
+        """Return whether replacing `task_id`'s dependencies would close a cycle.
+
+        Only the subgraph reachable from the proposed dependencies is walked; the
+        task's current outgoing edges are irrelevant because any path through
+        them has to reach `task_id` first.
+        """
+        return self.reaches(depends_on_task_ids, task_id)
+
+    def dependents_of(self, task_id: UUID) -> set[UUID]:
+        """Return ids of tasks that directly depend on `task_id`."""
+        return set(self.dependents.get(task_id, ()))
+
+
+class DependencyGraphCache:
+    """Bounded LRU of per-board dependency graphs keyed by dependency version."""
+
+    def __init__(self, *, max_entries: int = DEPENDENCY_GRAPH_CACHE_MAX_ENTRIES) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[UUID, DependencyGraph] = OrderedDict()
+
+    def get(self, board_id: UUID, version: int) -> DependencyGraph | None:
+        """Return the cached graph for `board_id` if it was built at `version`."""
+        graph = self._entries.get(board_id)
+        if graph is None or graph.version != version:
+            return None
+        self._entries.move_to_end(board_id)
+        return graph
+
+    def put(self, board_id: UUID, graph: DependencyGraph) -> None:
+        """Store `graph`, replacing any other version cached for the board."""
+        self._entries[board_id] = graph
+        self._entries.move_to_end(board_id)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached graph."""
+        self._entries.clear()
+
+
+_DEPENDENCY_GRAPH_CACHE = DependencyGraphCache()
+
+
+def get_dependency_graph_cache() -> DependencyGraphCache:
+    """Return the process-scoped dependency graph cache."""
+    return _DEPENDENCY_GRAPH_CACHE
+
+
+async def load_dependency_graph(session: AsyncSession, *, board_id: UUID) -> DependencyGraph:
+    """Return the board's dependency graph, reloading edges only after they changed."""
+    version = (
+        await session.exec(
+            select(col(Board.dependency_version)).where(col(Board.id) == board_id),
+        )
+    ).one_or_none()
+    if version is None:
+        return DependencyGraph(version=-1)
+    cache = get_dependency_graph_cache()
+    cached = cache.get(board_id, version)
+    if cached is not None:
+        return cached
+    rows = await session.exec(
+        select(
+            col(TaskDependency.task_id),
+            col(TaskDependency.depends_on_task_id),
+        ).where(col(TaskDependency.board_id) == board_id),
+    )
+    graph = DependencyGraph.from_edges(rows, version=version)
+    if not has_uncommitted_bumps(session, "dependency_version"):
+        cache.put(board_id, graph)
+    return graph
 
 
 async def validate_dependency_update(
@@ -164,27 +263,10 @@ async def validate_dependency_update(
             },
         )
 
-    # Rebuild the board-wide graph and overlay the pending edit for this task so
-    # validation catches indirect cycles created through existing edges.
-    task_ids = list(
-        await session.exec(
-            select(col(Task.id)).where(col(Task.board_id) == board_id),
-        ),
-    )
-    rows = list(
-        await session.exec(
-            select(
-                col(TaskDependency.task_id),
-                col(TaskDependency.depends_on_task_id),
-            ).where(col(TaskDependency.board_id) == board_id),
-        ),
-    )
-    edges: dict[UUID, set[UUID]] = defaultdict(set)
-    for src, dst in rows:
-        edges[src].add(dst)
-    edges[task_id] = set(normalized)
-
-    if _has_cycle(task_ids, edges):
+    # The edit closes a cycle exactly when the task is already reachable from
+    # one of its new dependencies through existing edges.
+    graph = await load_dependency_graph(session, board_id=board_id)
+    if graph.would_create_cycle(task_id, normalized):
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Dependency cycle detected. Remove the cycle before saving.",
@@ -193,6 +275,39 @@ async def validate_dependency_update(
     return normalized
 
 
+async def validate_new_task_dependencies(
+    session: AsyncSession,
+    *,
+    board_id: UUID,
+    depends_on_task_ids: Sequence[Sequence[UUID]],
+) -> tuple[list[list[UUID]], dict[UUID, str]]:
+    """Validate dependency lists for tasks that are about to be created.
+
+    New tasks have no dependents yet, so they cannot close a cycle and only
+    existence on the board needs checking; one query covers every list. Returns
+    the normalized lists together with the status of every dependency.
+    """
+    normalized = [_dedupe_uuid_list(values) for values in depends_on_task_ids]
+    requested = _dedupe_uuid_list([dep_id for values in normalized for dep_id in values])
+    status_by_id = await dependency_status_by_id(
+        session,
+        board_id=board_id,
+        dependency_ids=requested,
+    )
+    for index, values in enumerate(normalized):
+        missing = [dep_id for dep_id in values if dep_id not in status_by_id]
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail={
+                    "message": "One or more dependency tasks were not found on this board.",
+                    "index": index,
+                    "missing_task_ids": [str(value) for value in missing],
+                },
+            )
+    return normalized, status_by_id
+
+
 async def replace_task_dependencies(
     session: AsyncSession,
     *,
@@ -232,9 +347,5 @@ async def dependent_task_ids(
     dependency_task_id: UUID,
 ) -> list[UUID]:
     """Return task ids that depend on the provided dependency task id."""
-    rows = await session.exec(
-        select(col(TaskDependency.task_id))
-        .where(col(TaskDependency.board_id) == board_id)
-        .where(col(TaskDependency.depends_on_task_id) == dependency_task_id),
-    )
-    return list(rows)
+    graph = await load_dependency_graph(session, board_id=board_id)
+    return list(graph.dependents_of(dependency_task_id))
@@ -28,6 +28,7 @@ from app.services.webhooks.queue import (
     decode_webhook_task,
     requeue_if_failed,
 )
+from app.services.webhooks.retention import stored_payload
 
 logger = get_logger(__name__)
 
@@ -59,9 +60,10 @@ def _webhook_message(
     webhook: BoardWebhook,
     payload: BoardWebhookPayload,
 ) -> str:
-    preview = _build_payload_preview(payload.payload)
+    payload_value = stored_payload(payload)
+    preview = _build_payload_preview(payload_value)
     policy = evaluate_ingress_policy(
-        payload=payload.payload,
+        payload=payload_value,
         headers=_coerce_payload_headers(payload),
         owner_user_id=settings.telegram_owner_user_id,
         bot_username=settings.telegram_bot_username,
@@ -199,6 +201,9 @@ async def _process_single_item(item: QueuedInboundDelivery) -> None:
 
         board, webhook, payload = loaded
         await _notify_target_agent(session=session, board=board, webhook=webhook, payload=payload)
+        # Retention may delete the payload from now on.
+        payload.dispatch_pending = False
+        session.add(payload)
         await session.commit()
 
 
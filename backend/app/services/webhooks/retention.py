@@ -0,0 +1,231 @@
+"""Retention and compaction for stored board webhook payloads.
+
+Each webhook may cap its stored payloads by age (`retention_max_age_days`)
+and by count (`retention_max_payloads`). The queue worker periodically
+deletes payloads past either limit, together with the `BoardMemory` preview
+written for each payload at ingest, in chunks of
+`webhook_compaction_batch_size` rows so no single transaction grows large.
+Payloads still queued for dispatch (`dispatch_pending`) are kept until the
+dispatch worker is done with them, or until they are older than
+`webhook_dispatch_pending_max_age_seconds` in case the queued job was lost.
+
+Each payload body is checked once, in id order, and stamped with
+`compression_checked_at`. Bodies whose JSON text is at least
+`webhook_payload_compress_min_chars` long are rewritten as gzip-compressed
+bytes in `payload_compressed`; readers go through `stored_payload` so
+compression stays invisible to the API and the dispatch worker. Lowering the
+threshold therefore only affects payloads received afterwards.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from sqlalchemy import Text, cast, func, null, or_, update
+from sqlmodel import col, select
+
+from app.core.config import settings
+from app.core.time import utcnow
+from app.db import crud
+from app.models.board_memory import BoardMemory
+from app.models.board_webhook_payloads import BoardWebhookPayload
+from app.models.board_webhooks import BoardWebhook
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+PayloadValue = dict[str, object] | list[object] | str | int | float | bool | None
+
+
+def compress_payload(value: object) -> bytes:
+    """Return `value` serialized as gzip-compressed JSON."""
+    return gzip.compress(json.dumps(value, separators=(",", ":")).encode())
+
+
+def stored_payload(row: BoardWebhookPayload) -> PayloadValue:
+    """Return the payload body of `row`, inflating it when it was compressed."""
+    compressed = getattr(row, "payload_compressed", None)
+    if compressed is not None:
+        value: PayloadValue = json.loads(gzip.decompress(compressed))
+        return value
+    return row.payload
+
+
+@dataclass(frozen=True)
+class WebhookCompactionResult:
+    """Outcome of one compaction run."""
+
+    webhook_count: int = 0
+    payloads_deleted: int = 0
+    memories_deleted: int = 0
+    payloads_compressed: int = 0
+
+
+async def _delete_payloads(session: AsyncSession, payload_ids: list[UUID]) -> tuple[int, int]:
+    memories = await crud.delete_where(
+        session,
+        BoardMemory,
+        col(BoardMemory.webhook_payload_id).in_(payload_ids),
+    )
+    payloads = await crud.delete_where(
+        session,
+        BoardWebhookPayload,
+        col(BoardWebhookPayload.id).in_(payload_ids),
+        commit=True,
+    )
+    return payloads, memories
+
+
+async def _enforce_retention(
+    session: AsyncSession,
+    webhook: BoardWebhook,
+    *,
+    now: datetime,
+    batch_size: int,
+) -> tuple[int, int]:
+    """Delete payloads of `webhook` past its age or count limit, oldest first."""
+    newest_first = (
+        col(BoardWebhookPayload.received_at).desc(),
+        col(BoardWebhookPayload.id).desc(),
+    )
+    pending_cutoff = now - timedelta(seconds=settings.webhook_dispatch_pending_max_age_seconds)
+    deletable = or_(
+        col(BoardWebhookPayload.dispatch_pending).is_(False),
+        col(BoardWebhookPayload.received_at) < pending_cutoff,
+    )
+    expired = []
+    if webhook.retention_max_payloads is not None:
+        over_limit = (
+            select(BoardWebhookPayload.id)
+            .where(col(BoardWebhookPayload.webhook_id) == webhook.id)
+            .order_by(*newest_first)
+            .offset(webhook.retention_max_payloads)
+        )
+        expired.append(
+            select(BoardWebhookPayload.id)
+            .where(col(BoardWebhookPayload.id).in_(over_limit))
+            .where(deletable)
+            .limit(batch_size),
+        )
+    if webhook.retention_max_age_days is not None:
+        cutoff = now - timedelta(days=webhook.retention_max_age_days)
+        expired.append(
+            select(BoardWebhookPayload.id)
+            .where(col(BoardWebhookPayload.webhook_id) == webhook.id)
+            .where(col(BoardWebhookPayload.received_at) < cutoff)
+            .where(deletable)
+            .limit(batch_size),
+        )
+    payloads_deleted = 0
+    memories_deleted = 0
+    for statement in expired:
+        while True:
+            payload_ids = list(await session.exec(statement))
+            if not payload_ids:
+                break
+            payloads, memories = await _delete_payloads(session, payload_ids)
+            payloads_deleted += payloads
+            memories_deleted += memories
+    return payloads_deleted, memories_deleted
+
+
+async def _compress_large_payloads(
+    session: AsyncSession,
+    *,
+    min_chars: int,
+    batch_size: int,
+    now: datetime,
+) -> int:
+    if min_chars <= 0:
+        return 0
+    unchecked = (
+        select(
+            BoardWebhookPayload.id,
+            func.length(cast(BoardWebhookPayload.payload, Text)),
+        )
+        .where(col(BoardWebhookPayload.compression_checked_at).is_(None))
+        .order_by(col(BoardWebhookPayload.id))
+        .limit(batch_size)
+    )
+    compressed = 0
+    last_id: UUID | None = None
+    while True:
+        statement = unchecked
+        if last_id is not None:
+            statement = statement.where(col(BoardWebhookPayload.id) > last_id)
+        rows = list(await session.exec(statement))
+        if not rows:
+            return compressed
+        checked_ids = [payload_id for payload_id, _size in rows]
+        large_ids = [
+            payload_id for payload_id, size in rows if size is not None and size >= min_chars
+        ]
+        last_id = checked_ids[-1]
+        if large_ids:
+            bodies = await session.exec(
+                select(BoardWebhookPayload.id, BoardWebhookPayload.payload).where(
+                    col(BoardWebhookPayload.id).in_(large_ids),
+                ),
+            )
+            for payload_id, value in list(bodies):
+                await session.exec(
+                    update(BoardWebhookPayload)
+                    .where(col(BoardWebhookPayload.id) == payload_id)
+                    .values(payload=null(), payload_compressed=compress_payload(value)),
+                )
+        await session.exec(
+            update(BoardWebhookPayload)
+            .where(col(BoardWebhookPayload.id).in_(checked_ids))
+            .values(compression_checked_at=now),
+        )
+        await session.commit()
+        compressed += len(large_ids)
+
+
+async def compact_webhook_payloads(
+    session: AsyncSession,
+    *,
+    now: datetime | None = None,
+) -> WebhookCompactionResult:
+    """Apply every webhook's retention policy, then compress remaining large bodies."""
+    now = now or utcnow()
+    batch_size = settings.webhook_compaction_batch_size
+    webhooks = list(
+        await session.exec(
+            select(BoardWebhook).where(
+                or_(
+                    col(BoardWebhook.retention_max_age_days).is_not(None),
+                    col(BoardWebhook.retention_max_payloads).is_not(None),
+                ),
+            ),
+        ),
+    )
+    payloads_deleted = 0
+    memories_deleted = 0
+    for webhook in webhooks:
+        payloads, memories = await _enforce_retention(
+            session,
+            webhook,
+            now=now,
+            batch_size=batch_size,
+        )
+        payloads_deleted += payloads
+        memories_deleted += memories
+    compressed = await _compress_large_payloads(
+        session,
+        min_chars=settings.webhook_payload_compress_min_chars,
+        batch_size=batch_size,
+        now=now,
+    )
+    return WebhookCompactionResult(
+        webhook_count=len(webhooks),
+        payloads_deleted=payloads_deleted,
+        memories_deleted=memories_deleted,
+        payloads_compressed=compressed,
+    )
@@ -0,0 +1,64 @@
+"""add feed and stream composite indexes
+
+Revision ID: 3c8e1d7a5f20
+Revises: f2a9c7b1d4e3
+Create Date: 2026-03-02 09:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3c8e1d7a5f20"
+down_revision = "f2a9c7b1d4e3"
+branch_labels = None
+depends_on = None
+
+# (index name, table, columns)
+INDEXES: tuple[tuple[str, str, list[str]], ...] = (
+    # Activity feeds filter and order on created_at; task streams additionally
+    # restrict to the board's task ids.
+    ("ix_activity_events_created_at", "activity_events", ["created_at"]),
+    ("ix_activity_events_task_id_created_at", "activity_events", ["task_id", "created_at"]),
+    # Board memory streams poll by board and created_at cursor.
+    ("ix_board_memory_board_id_created_at", "board_memory", ["board_id", "created_at"]),
+    # Task streams and dashboard series filter by board, status and updated_at range.
+    (
+        "ix_tasks_board_id_status_updated_at",
+        "tasks",
+        ["board_id", "status", "updated_at"],
+    ),
+    # Webhook payload listings filter by board + webhook and order by received_at.
+    (
+        "ix_board_webhook_payloads_board_id_webhook_id_received_at",
+        "board_webhook_payloads",
+        ["board_id", "webhook_id", "received_at"],
+    ),
+)
+
+
+def upgrade() -> None:
+    """Create hot-query indexes without blocking writes on Postgres."""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Drop hot-query indexes created by this revision."""
+    with op.get_context().autocommit_block():
+        for name, table, _columns in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,71 @@
+"""add dashboard metric rollups
+
+Revision ID: 7d4b2e9c1a36
+Revises: 3c8e1d7a5f20
+Create Date: 2026-03-03 09:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "7d4b2e9c1a36"
+down_revision = "3c8e1d7a5f20"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create hourly per-board rollup and rollup watermark tables."""
+    op.create_table(
+        "board_metrics_rollups",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("board_id", sa.Uuid(), nullable=False),
+        sa.Column("bucket_start", sa.DateTime(), nullable=False),
+        sa.Column("throughput_count", sa.Integer(), nullable=False),
+        sa.Column("cycle_time_count", sa.Integer(), nullable=False),
+        sa.Column("cycle_time_sum_hours", sa.Float(), nullable=False),
+        sa.Column("cycle_time_digest", sa.JSON(), nullable=False),
+        sa.Column("error_count", sa.Integer(), nullable=False),
+        sa.Column("event_count", sa.Integer(), nullable=False),
+        sa.Column("wip_inbox", sa.Integer(), nullable=False),
+        sa.Column("wip_in_progress", sa.Integer(), nullable=False),
+        sa.Column("wip_review", sa.Integer(), nullable=False),
+        sa.Column("wip_done", sa.Integer(), nullable=False),
+        sa.Column("computed_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["board_id"], ["boards.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "board_id",
+            "bucket_start",
+            name="uq_board_metrics_rollups_board_bucket",
+        ),
+    )
+    op.create_index(
+        "ix_board_metrics_rollups_board_id",
+        "board_metrics_rollups",
+        ["board_id"],
+    )
+    op.create_index(
+        "ix_board_metrics_rollups_bucket_start",
+        "board_metrics_rollups",
+        ["bucket_start"],
+    )
+    op.create_table(
+        "metrics_rollup_watermarks",
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("rolled_from", sa.DateTime(), nullable=False),
+        sa.Column("rolled_through", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+    )
+
+
+def downgrade() -> None:
+    """Drop dashboard rollup tables."""
+    op.drop_table("metrics_rollup_watermarks")
+    op.drop_index("ix_board_metrics_rollups_bucket_start", table_name="board_metrics_rollups")
+    op.drop_index("ix_board_metrics_rollups_board_id", table_name="board_metrics_rollups")
+    op.drop_table("board_metrics_rollups")
@@ -0,0 +1,37 @@
+"""Add snapshot_version counter to boards.
+
+Revision ID: 9e3c5a7d2b14
+Revises: 7d4b2e9c1a36
+Create Date: 2026-03-04 09:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9e3c5a7d2b14"
+down_revision = "7d4b2e9c1a36"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add boards.snapshot_version, starting every existing board at zero."""
+    op.add_column(
+        "boards",
+        sa.Column(
+            "snapshot_version",
+            sa.Integer(),
+            nullable=False,
+            server_default=sa.text("0"),
+        ),
+    )
+    op.alter_column("boards", "snapshot_version", server_default=None)
+
+
+def downgrade() -> None:
+    """Remove boards.snapshot_version column."""
+    op.drop_column("boards", "snapshot_version")
@@ -0,0 +1,40 @@
+"""Add background sync state to skill packs.
+
+Revision ID: a2d8e5f1c3b7
+Revises: f1c7a4e9b2d5
+Create Date: 2026-03-10 09:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a2d8e5f1c3b7"
+down_revision = "f1c7a4e9b2d5"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add sync status, timing, and result columns to skill_packs."""
+    op.add_column("skill_packs", sa.Column("sync_status", sa.String(), nullable=True))
+    op.add_column("skill_packs", sa.Column("sync_requested_at", sa.DateTime(), nullable=True))
+    op.add_column("skill_packs", sa.Column("sync_started_at", sa.DateTime(), nullable=True))
+    op.add_column("skill_packs", sa.Column("sync_finished_at", sa.DateTime(), nullable=True))
+    op.add_column("skill_packs", sa.Column("sync_commit", sa.String(), nullable=True))
+    op.add_column("skill_packs", sa.Column("sync_result", sa.JSON(), nullable=True))
+    op.add_column("skill_packs", sa.Column("sync_error", sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    """Remove skill pack sync state columns."""
+    op.drop_column("skill_packs", "sync_error")
+    op.drop_column("skill_packs", "sync_result")
+    op.drop_column("skill_packs", "sync_commit")
+    op.drop_column("skill_packs", "sync_finished_at")
+    op.drop_column("skill_packs", "sync_started_at")
+    op.drop_column("skill_packs", "sync_requested_at")
+    op.drop_column("skill_packs", "sync_status")
@@ -0,0 +1,61 @@
+"""Track pending dispatch and compression checks on webhook payloads.
+
+Revision ID: a8f3c6e2d9b4
+Revises: e4c9a2f7b1d8
+Create Date: 2026-03-14 09:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a8f3c6e2d9b4"
+down_revision = "e4c9a2f7b1d8"
+branch_labels = None
+depends_on = None
+
+UNCHECKED_INDEX = "ix_board_webhook_payloads_compression_unchecked"
+
+
+def upgrade() -> None:
+    """Add dispatch_pending and compression_checked_at, indexing unchecked rows."""
+    op.add_column(
+        "board_webhook_payloads",
+        sa.Column(
+            "dispatch_pending",
+            sa.Boolean(),
+            nullable=False,
+            server_default=sa.false(),
+        ),
+    )
+    op.alter_column("board_webhook_payloads", "dispatch_pending", server_default=None)
+    op.add_column(
+        "board_webhook_payloads",
+        sa.Column("compression_checked_at", sa.DateTime(), nullable=True),
+    )
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            UNCHECKED_INDEX,
+            "board_webhook_payloads",
+            ["id"],
+            postgresql_where=sa.text("compression_checked_at IS NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop the dispatch and compression tracking columns."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            UNCHECKED_INDEX,
+            table_name="board_webhook_payloads",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column("board_webhook_payloads", "compression_checked_at")
+    op.drop_column("board_webhook_payloads", "dispatch_pending")
@@ -0,0 +1,37 @@
+"""Add dependency_version counter to boards.
+
+Revision ID: b41f6c8e2a57
+Revises: 9e3c5a7d2b14
+Create Date: 2026-03-05 09:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b41f6c8e2a57"
+down_revision = "9e3c5a7d2b14"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add boards.dependency_version, starting every existing board at zero."""
+    op.add_column(
+        "boards",
+        sa.Column(
+            "dependency_version",
+            sa.Integer(),
+            nullable=False,
+            server_default=sa.text("0"),
+        ),
+    )
+    op.alter_column("boards", "dependency_version", server_default=None)
+
+
+def downgrade() -> None:
+    """Remove boards.dependency_version column."""
+    op.drop_column("boards", "dependency_version")
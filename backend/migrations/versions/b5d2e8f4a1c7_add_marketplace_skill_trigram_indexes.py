@@ -0,0 +1,42 @@
+"""Add trigram indexes for marketplace skill substring search.
+
+Revision ID: b5d2e8f4a1c7
+Revises: a8f3c6e2d9b4
+Create Date: 2026-03-15 09:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b5d2e8f4a1c7"
+down_revision = "a8f3c6e2d9b4"
+branch_labels = None
+depends_on = None
+
+# `name` already has ix_marketplace_skills_name_trgm from f1c7a4e9b2d5.
+COLUMNS: tuple[str, ...] = ("description", "category", "risk", "source")
+
+
+def upgrade() -> None:
+    """Index the remaining searchable columns for ILIKE substring matches."""
+    if op.get_context().dialect.name != "postgresql":
+        return
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        for column in COLUMNS:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_marketplace_skills_{column}_trgm "
+                f"ON marketplace_skills USING gin ({column} gin_trgm_ops)",
+            )
+
+
+def downgrade() -> None:
+    """Drop the substring search indexes created by this revision."""
+    if op.get_context().dialect.name != "postgresql":
+        return
+    with op.get_context().autocommit_block():
+        for column in reversed(COLUMNS):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS ix_marketplace_skills_{column}_trgm")
@@ -0,0 +1,31 @@
+"""Record the source blob hash of pack-synced marketplace skills.
+
+Revision ID: b6e1f4a8d2c9
+Revises: a2d8e5f1c3b7
+Create Date: 2026-03-10 12:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b6e1f4a8d2c9"
+down_revision = "a2d8e5f1c3b7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add source_blob_sha to marketplace_skills."""
+    op.add_column(
+        "marketplace_skills",
+        sa.Column("source_blob_sha", sa.String(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Remove source_blob_sha from marketplace_skills."""
+    op.drop_column("marketplace_skills", "source_blob_sha")
@@ -0,0 +1,147 @@
+"""Add running per-pack deterministic eval aggregates.
+
+Revision ID: c3f7a1d9e4b2
+Revises: b6e1f4a8d2c9
+Create Date: 2026-03-11 12:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c3f7a1d9e4b2"
+down_revision = "b6e1f4a8d2c9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create pack eval aggregate tables and backfill them from existing evals."""
+    op.create_table(
+        "pack_eval_aggregates",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("organization_id", sa.Uuid(), nullable=False),
+        sa.Column("pack_id", sa.Uuid(), nullable=False),
+        sa.Column("eval_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("score_sum", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("hard_regressions", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("last_eval_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["organization_id"], ["organizations.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["pack_id"], ["prompt_packs.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "organization_id",
+            "pack_id",
+            name="uq_pack_eval_aggregates_org_pack",
+        ),
+    )
+    op.create_index(
+        "ix_pack_eval_aggregates_organization_id",
+        "pack_eval_aggregates",
+        ["organization_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_pack_eval_aggregates_pack_id",
+        "pack_eval_aggregates",
+        ["pack_id"],
+        unique=False,
+    )
+
+    op.create_table(
+        "pack_eval_daily_aggregates",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("organization_id", sa.Uuid(), nullable=False),
+        sa.Column("pack_id", sa.Uuid(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("eval_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("score_sum", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("hard_regressions", sa.Integer(), nullable=False, server_default="0"),
+        sa.ForeignKeyConstraint(["organization_id"], ["organizations.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["pack_id"], ["prompt_packs.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "organization_id",
+            "pack_id",
+            "day",
+            name="uq_pack_eval_daily_aggregates_org_pack_day",
+        ),
+    )
+    op.create_index(
+        "ix_pack_eval_daily_aggregates_organization_id",
+        "pack_eval_daily_aggregates",
+        ["organization_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_pack_eval_daily_aggregates_pack_id",
+        "pack_eval_daily_aggregates",
+        ["pack_id"],
+        unique=False,
+    )
+
+    # Serves "last N evals for a pack" without scanning the pack's full history.
+    op.create_index(
+        "ix_deterministic_evals_org_pack_created_at",
+        "deterministic_evals",
+        ["organization_id", "pack_id", "created_at"],
+        unique=False,
+    )
+
+    if op.get_context().dialect.name != "postgresql":
+        return
+    op.execute(
+        """
+        INSERT INTO pack_eval_aggregates (
+            id, organization_id, pack_id, eval_count, score_sum,
+            hard_regressions, last_eval_at, updated_at
+        )
+        SELECT
+            gen_random_uuid(), organization_id, pack_id, count(*), sum(score),
+            sum(CASE WHEN hard_regression THEN 1 ELSE 0 END), max(created_at),
+            (now() AT TIME ZONE 'utc')
+        FROM deterministic_evals
+        WHERE pack_id IS NOT NULL
+        GROUP BY organization_id, pack_id
+        """,
+    )
+    op.execute(
+        """
+        INSERT INTO pack_eval_daily_aggregates (
+            id, organization_id, pack_id, day, eval_count, score_sum, hard_regressions
+        )
+        SELECT
+            gen_random_uuid(), organization_id, pack_id, CAST(created_at AS DATE), count(*),
+            sum(score), sum(CASE WHEN hard_regression THEN 1 ELSE 0 END)
+        FROM deterministic_evals
+        WHERE pack_id IS NOT NULL
+        GROUP BY organization_id, pack_id, CAST(created_at AS DATE)
+        """,
+    )
+
+
+def downgrade() -> None:
+    """Drop pack eval aggregate tables and the recent-evals index."""
+    op.drop_index(
+        "ix_deterministic_evals_org_pack_created_at",
+        table_name="deterministic_evals",
+    )
+    op.drop_index(
+        "ix_pack_eval_daily_aggregates_pack_id",
+        table_name="pack_eval_daily_aggregates",
+    )
+    op.drop_index(
+        "ix_pack_eval_daily_aggregates_organization_id",
+        table_name="pack_eval_daily_aggregates",
+    )
+    op.drop_table("pack_eval_daily_aggregates")
+    op.drop_index("ix_pack_eval_aggregates_pack_id", table_name="pack_eval_aggregates")
+    op.drop_index(
+        "ix_pack_eval_aggregates_organization_id",
+        table_name="pack_eval_aggregates",
+    )
+    op.drop_table("pack_eval_aggregates")
@@ -0,0 +1,175 @@
+"""Partition activity_events by month on Postgres.
+
+The existing table is attached, rather than copied, as the "historic"
+partition covering everything before the cutover (next UTC month); only
+months from the cutover on get real partitions. The only full-table work,
+building the `(id, created_at)` key and validating the cutover check, runs
+concurrently outside the migration transaction.
+
+There is deliberately no DEFAULT partition: Postgres refuses
+`DETACH PARTITION ... CONCURRENTLY` while one exists, and creating a new
+monthly partition would have to scan it. Rows must therefore fall into a
+partition that exists; the worker keeps them created months ahead.
+
+Revision ID: c5e2a8f1d3b6
+Revises: b41f6c8e2a57
+Create Date: 2026-03-06 09:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c5e2a8f1d3b6"
+down_revision = "b41f6c8e2a57"
+branch_labels = None
+depends_on = None
+
+# Partitions are created this many months ahead at migration time; the worker
+# keeps extending the window afterwards.
+MONTHS_AHEAD = 3
+
+# (index name, columns, partial predicate)
+INDEXES: tuple[tuple[str, list[str], str | None], ...] = (
+    ("ix_activity_events_agent_id", ["agent_id"], None),
+    ("ix_activity_events_event_type", ["event_type"], None),
+    ("ix_activity_events_task_id", ["task_id"], None),
+    ("ix_activity_events_created_at", ["created_at"], None),
+    ("ix_activity_events_task_id_created_at", ["task_id", "created_at"], None),
+    ("ix_activity_events_event_type_created_at", ["event_type", "created_at"], None),
+    (
+        "ix_activity_events_task_comment_task_id_created_at",
+        ["task_id", "created_at"],
+        "event_type = 'task.comment'",
+    ),
+)
+
+
+HISTORIC_TABLE = "activity_events_historic"
+HISTORIC_PKEY_INDEX = "activity_events_historic_pkey"
+HISTORIC_CHECK = "activity_events_historic_before_cutover"
+
+
+def _create_indexes() -> None:
+    for name, columns, where in INDEXES:
+        op.create_index(
+            name,
+            "activity_events",
+            columns,
+            postgresql_where=sa.text(where) if where else None,
+        )
+
+
+def _historic_index_name(name: str) -> str:
+    return name.replace("ix_activity_events", f"ix_{HISTORIC_TABLE}", 1)
+
+
+def _cutover() -> datetime:
+    """Return the first month that gets its own partition (next UTC month)."""
+    now = datetime.now(UTC)
+    if now.month == 12:
+        return datetime(now.year + 1, 1, 1)
+    return datetime(now.year, now.month + 1, 1)
+
+
+def upgrade() -> None:
+    """Turn activity_events into a RANGE(created_at) table around the existing rows."""
+    if op.get_context().dialect.name != "postgresql":
+        return
+    cutover = _cutover().isoformat()
+    # Unique constraints on a partitioned table must include the partition key,
+    # and the check lets the attach below skip scanning the historic rows. Both
+    # need a pass over the table, so run them without blocking writes.
+    with op.get_context().autocommit_block():
+        op.execute(
+            f"CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS {HISTORIC_PKEY_INDEX} "
+            "ON activity_events (id, created_at)",
+        )
+        op.execute(
+            f"ALTER TABLE activity_events ADD CONSTRAINT {HISTORIC_CHECK} "
+            f"CHECK (created_at < '{cutover}') NOT VALID",
+        )
+        op.execute(f"ALTER TABLE activity_events VALIDATE CONSTRAINT {HISTORIC_CHECK}")
+
+    # Everything below only touches the catalog.
+    op.execute(
+        "ALTER TABLE activity_events DROP CONSTRAINT activity_events_pkey, "
+        f"ADD CONSTRAINT {HISTORIC_PKEY_INDEX} PRIMARY KEY USING INDEX {HISTORIC_PKEY_INDEX}",
+    )
+    for name, _columns, _where in INDEXES:
+        op.execute(f"ALTER INDEX {name} RENAME TO {_historic_index_name(name)}")
+    op.rename_table("activity_events", HISTORIC_TABLE)
+    op.execute(
+        """
+        CREATE TABLE activity_events (
+            id UUID NOT NULL,
+            event_type VARCHAR NOT NULL,
+            message VARCHAR,
+            agent_id UUID REFERENCES agents (id),
+            task_id UUID REFERENCES tasks (id),
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+        """,
+    )
+    _create_indexes()
+    op.execute(
+        f"""
+        DO $$
+        DECLARE
+            month_start TIMESTAMP := TIMESTAMP '{cutover}';
+            last_month TIMESTAMP :=
+                date_trunc('month', now() AT TIME ZONE 'utc') + interval '{MONTHS_AHEAD} months';
+        BEGIN
+            WHILE month_start <= last_month LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF activity_events '
+                    'FOR VALUES FROM (%L) TO (%L)',
+                    'activity_events_p' || to_char(month_start, 'YYYY_MM'),
+                    month_start,
+                    month_start + interval '1 month'
+                );
+                month_start := month_start + interval '1 month';
+            END LOOP;
+        END $$
+        """,
+    )
+    # The historic rows become the partition for everything before the cutover.
+    # Its existing indexes and foreign keys match the parent's and are attached
+    # as-is. The check stays: it is what lets this attach skip scanning the
+    # historic rows, and keeping it means a re-attach after a manual detach is
+    # just as cheap.
+    op.execute(
+        f"ALTER TABLE activity_events ATTACH PARTITION {HISTORIC_TABLE} "
+        f"FOR VALUES FROM (MINVALUE) TO ('{cutover}')",
+    )
+
+
+def downgrade() -> None:
+    """Fold the monthly partitions back into the historic table."""
+    if op.get_context().dialect.name != "postgresql":
+        return
+    op.execute(f"ALTER TABLE activity_events DETACH PARTITION {HISTORIC_TABLE}")
+    op.execute(f"ALTER TABLE {HISTORIC_TABLE} DROP CONSTRAINT {HISTORIC_CHECK}")
+    op.execute(
+        f"""
+        INSERT INTO {HISTORIC_TABLE}
+            (id, event_type, message, agent_id, task_id, created_at)
+        SELECT id, event_type, message, agent_id, task_id, created_at
+        FROM activity_events
+        """,
+    )
+    # Dropping the parent drops every monthly partition with it.
+    op.drop_table("activity_events")
+    op.rename_table(HISTORIC_TABLE, "activity_events")
+    op.execute(
+        f"ALTER TABLE activity_events DROP CONSTRAINT {HISTORIC_PKEY_INDEX}, "
+        "ADD CONSTRAINT activity_events_pkey PRIMARY KEY (id)",
+    )
+    for name, _columns, _where in INDEXES:
+        op.execute(f"ALTER INDEX {_historic_index_name(name)} RENAME TO {name}")
@@ -0,0 +1,66 @@
+"""Add webhook payload retention policy and compression columns.
+
+Revision ID: d7a3f9c2e6b1
+Revises: c5e2a8f1d3b6
+Create Date: 2026-03-07 09:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "d7a3f9c2e6b1"
+down_revision = "c5e2a8f1d3b6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add retention limits, compressed payload storage, and memory-to-payload links."""
+    op.add_column(
+        "board_webhooks",
+        sa.Column("retention_max_age_days", sa.Integer(), nullable=True),
+    )
+    op.add_column(
+        "board_webhooks",
+        sa.Column("retention_max_payloads", sa.Integer(), nullable=True),
+    )
+    op.add_column(
+        "board_webhook_payloads",
+        sa.Column("payload_compressed", sa.LargeBinary(), nullable=True),
+    )
+    op.add_column(
+        "board_memory",
+        sa.Column("webhook_payload_id", sa.Uuid(), nullable=True),
+    )
+    op.create_index(
+        "ix_board_memory_webhook_payload_id",
+        "board_memory",
+        ["webhook_payload_id"],
+    )
+    if op.get_context().dialect.name == "postgresql":
+        # Existing previews only reference their payload through a `payload:<id>` tag.
+        op.execute(
+            """
+            UPDATE board_memory
+            SET webhook_payload_id = (
+                SELECT CAST(substring(tag FROM 9) AS UUID)
+                FROM json_array_elements_text(board_memory.tags) AS tag
+                WHERE tag ~ '^payload:[0-9a-f-]{36}$'
+                LIMIT 1
+            )
+            WHERE source = 'webhook' AND json_typeof(tags) = 'array'
+            """,
+        )
+
+
+def downgrade() -> None:
+    """Remove webhook retention and compression columns."""
+    op.drop_index("ix_board_memory_webhook_payload_id", table_name="board_memory")
+    op.drop_column("board_memory", "webhook_payload_id")
+    op.drop_column("board_webhook_payloads", "payload_compressed")
+    op.drop_column("board_webhooks", "retention_max_payloads")
+    op.drop_column("board_webhooks", "retention_max_age_days")
@@ -0,0 +1,53 @@
+"""Add persisted sliding-window latency baselines.
+
+Revision ID: d8b2e6f4a1c3
+Revises: c3f7a1d9e4b2
+Create Date: 2026-03-12 12:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "d8b2e6f4a1c3"
+down_revision = "c3f7a1d9e4b2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create latency_baselines; rows are seeded lazily from run telemetry."""
+    op.create_table(
+        "latency_baselines",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("organization_id", sa.Uuid(), nullable=False),
+        sa.Column("pack_key", sa.String(), nullable=False),
+        sa.Column("tier", sa.String(), nullable=False),
+        sa.Column("recent_latencies_ms", sa.JSON(), nullable=False),
+        sa.Column("sorted_latencies_ms", sa.JSON(), nullable=False),
+        sa.Column("median_latency_ms", sa.Float(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["organization_id"], ["organizations.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "organization_id",
+            "pack_key",
+            "tier",
+            name="uq_latency_baselines_org_pack_key_tier",
+        ),
+    )
+    op.create_index(
+        "ix_latency_baselines_organization_id",
+        "latency_baselines",
+        ["organization_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop latency_baselines."""
+    op.drop_index("ix_latency_baselines_organization_id", table_name="latency_baselines")
+    op.drop_table("latency_baselines")
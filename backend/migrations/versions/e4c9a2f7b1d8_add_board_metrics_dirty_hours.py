@@ -0,0 +1,56 @@
+"""Track dashboard rollup hours invalidated by task writes.
+
+Revision ID: e4c9a2f7b1d8
+Revises: d8b2e6f4a1c3
+Create Date: 2026-03-13 12:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e4c9a2f7b1d8"
+down_revision = "d8b2e6f4a1c3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create board_metrics_dirty_hours."""
+    op.create_table(
+        "board_metrics_dirty_hours",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        # No foreign key: marks written during board deletion must not block it.
+        sa.Column("board_id", sa.Uuid(), nullable=False),
+        sa.Column("bucket_start", sa.DateTime(), nullable=False),
+        sa.Column("marked_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_board_metrics_dirty_hours_board_id",
+        "board_metrics_dirty_hours",
+        ["board_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_board_metrics_dirty_hours_bucket_start",
+        "board_metrics_dirty_hours",
+        ["bucket_start"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop board_metrics_dirty_hours."""
+    op.drop_index(
+        "ix_board_metrics_dirty_hours_bucket_start",
+        table_name="board_metrics_dirty_hours",
+    )
+    op.drop_index(
+        "ix_board_metrics_dirty_hours_board_id",
+        table_name="board_metrics_dirty_hours",
+    )
+    op.drop_table("board_metrics_dirty_hours")
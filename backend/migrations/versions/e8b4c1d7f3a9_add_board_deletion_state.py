@@ -0,0 +1,32 @@
+"""Add board deletion state for chunked background deletion.
+
+Revision ID: e8b4c1d7f3a9
+Revises: d7a3f9c2e6b1
+Create Date: 2026-03-08 09:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e8b4c1d7f3a9"
+down_revision = "d7a3f9c2e6b1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add deletion marker and progress columns to boards."""
+    op.add_column("boards", sa.Column("deleting_at", sa.DateTime(), nullable=True))
+    op.add_column("boards", sa.Column("deletion_progress", sa.JSON(), nullable=True))
+    op.create_index("ix_boards_deleting_at", "boards", ["deleting_at"])
+
+
+def downgrade() -> None:
+    """Remove board deletion state columns."""
+    op.drop_index("ix_boards_deleting_at", table_name="boards")
+    op.drop_column("boards", "deletion_progress")
+    op.drop_column("boards", "deleting_at")
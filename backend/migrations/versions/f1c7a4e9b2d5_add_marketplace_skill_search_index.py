@@ -0,0 +1,98 @@
+"""Add normalized facet keys and a search index for marketplace skills.
+
+Revision ID: f1c7a4e9b2d5
+Revises: e8b4c1d7f3a9
+Create Date: 2026-03-09 09:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "f1c7a4e9b2d5"
+down_revision = "e8b4c1d7f3a9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add category/risk facet keys and, on Postgres, a weighted search vector."""
+    op.add_column(
+        "marketplace_skills",
+        sa.Column(
+            "category_key",
+            sa.String(),
+            nullable=False,
+            server_default="uncategorized",
+        ),
+    )
+    op.add_column(
+        "marketplace_skills",
+        sa.Column(
+            "risk_key",
+            sa.String(),
+            nullable=False,
+            server_default="uncategorized",
+        ),
+    )
+    op.execute(
+        """
+        UPDATE marketplace_skills
+        SET category_key = COALESCE(NULLIF(LOWER(TRIM(category)), ''), 'uncategorized'),
+            risk_key = COALESCE(NULLIF(LOWER(TRIM(risk)), ''), 'uncategorized')
+        """,
+    )
+    op.create_index(
+        "ix_marketplace_skills_org_category_key",
+        "marketplace_skills",
+        ["organization_id", "category_key"],
+    )
+    op.create_index(
+        "ix_marketplace_skills_org_risk_key",
+        "marketplace_skills",
+        ["organization_id", "risk_key"],
+    )
+    if op.get_context().dialect.name != "postgresql":
+        return
+    # Name ranks above category/risk, which rank above description/source.
+    op.execute(
+        """
+        ALTER TABLE marketplace_skills ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('simple', coalesce(name, '')), 'A')
+            || setweight(
+                to_tsvector('simple', coalesce(category, '') || ' ' || coalesce(risk, '')),
+                'B'
+            )
+            || setweight(
+                to_tsvector('simple', coalesce(description, '') || ' ' || coalesce(source, '')),
+                'C'
+            )
+        ) STORED
+        """,
+    )
+    op.execute(
+        "CREATE INDEX ix_marketplace_skills_search_vector "
+        "ON marketplace_skills USING gin (search_vector)",
+    )
+    # Substring matches on skill names (e.g. "lint" in "eslint-fix") use trigrams.
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX ix_marketplace_skills_name_trgm "
+        "ON marketplace_skills USING gin (name gin_trgm_ops)",
+    )
+
+
+def downgrade() -> None:
+    """Remove marketplace skill search index and facet keys."""
+    if op.get_context().dialect.name == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_marketplace_skills_name_trgm")
+        op.execute("DROP INDEX IF EXISTS ix_marketplace_skills_search_vector")
+        op.drop_column("marketplace_skills", "search_vector")
+    op.drop_index("ix_marketplace_skills_org_risk_key", table_name="marketplace_skills")
+    op.drop_index("ix_marketplace_skills_org_category_key", table_name="marketplace_skills")
+    op.drop_column("marketplace_skills", "risk_key")
+    op.drop_column("marketplace_skills", "category_key")
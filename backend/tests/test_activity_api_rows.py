@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
+from datetime import datetime
 from uuid import uuid4
 
 import pytest
 
-from app.api.activity import _coerce_task_comment_rows
+from app.api import activity as activity_api
+from app.api.activity import _coerce_task_comment_rows, _fetch_task_comment_events
 from app.models.activity_events import ActivityEvent
 from app.models.agents import Agent
 from app.models.boards import Board
@@ -87,3 +90,57 @@ def test_coerce_task_comment_rows_rejects_invalid_values():
         match="Expected \\(ActivityEvent, Task, Board, Agent \\| None\\) rows",
     ):
         _coerce_task_comment_rows([(uuid4(), task, board, None)])
+
+
+class _FakeSessionMaker:
+    def __call__(self) -> _FakeSessionMaker:
+        return self
+
+    async def __aenter__(self) -> object:
+        return object()
+
+    async def __aexit__(self, *_args: object) -> None:
+        return None
+
+
+@pytest.mark.asyncio
+async def test_fetch_task_comment_events_skips_query_without_boards() -> None:
+    class _ExplodingSession:
+        async def exec(self, _statement: object) -> object:
+            raise AssertionError("no query expected without accessible boards")
+
+    rows = await _fetch_task_comment_events(
+        _ExplodingSession(),  # type: ignore[arg-type]
+        datetime(2026, 3, 1),
+        board_ids=frozenset(),
+    )
+    assert rows == []
+
+
+@pytest.mark.asyncio
+async def test_feed_poller_shares_rows_for_identical_access_sets(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    board = _make_board()
+    row = (_make_event(), _make_task(board.id), board, None)
+    calls: list[frozenset] = []
+
+    async def _fake_fetch(_session, _since, *, board_ids):
+        calls.append(board_ids)
+        return [row]
+
+    monkeypatch.setattr(activity_api, "_fetch_task_comment_events", _fake_fetch)
+    monkeypatch.setattr(activity_api, "stream_session_maker", _FakeSessionMaker())
+    poller = activity_api._TaskCommentFeedPoller(ttl_seconds=60)
+    since = datetime(2026, 3, 1)
+    board_ids = frozenset({board.id})
+
+    first, second = await asyncio.gather(
+        poller.fetch(board_ids, since),
+        poller.fetch(frozenset({board.id}), since),
+    )
+    other = await poller.fetch(frozenset({board.id, uuid4()}), since)
+
+    assert first == second == other == [row]
+    assert len(calls) == 2
+    assert calls[0] == board_ids
@@ -0,0 +1,204 @@
+# ruff: noqa: S101
+from __future__ import annotations
+
+import gzip
+import json
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.activity_events import ActivityEvent
+from app.services import activity_archive, queue_worker
+from app.services.activity_archive import (
+    ActivityArchiveResult,
+    add_months,
+    archive_activity_events,
+    partition_name,
+    retention_cutoff,
+)
+
+NOW = datetime(2026, 3, 15, 12, 0)
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+def _read_archive(path: Path) -> list[dict[str, object]]:
+    with gzip.open(path, "rt") as handle:
+        return [json.loads(line) for line in handle]
+
+
+def test_month_arithmetic_and_cutoff() -> None:
+    assert add_months(NOW, -3) == datetime(2025, 12, 1)
+    assert add_months(datetime(2025, 12, 31, 23), 1) == datetime(2026, 1, 1)
+    assert partition_name(datetime(2026, 2, 1)) == "activity_events_p2026_02"
+    assert retention_cutoff(NOW, 2) == datetime(2026, 1, 1)
+    assert retention_cutoff(NOW, 0) is None
+
+
+@pytest.mark.asyncio
+async def test_archive_exports_months_past_retention_then_deletes_them(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    monkeypatch.setattr(activity_archive.settings, "activity_retention_months", 2)
+    monkeypatch.setattr(activity_archive.settings, "activity_archive_dir", str(tmp_path))
+    monkeypatch.setattr(activity_archive.settings, "activity_archive_batch_size", 2)
+    # A file left by an earlier run for the same month is never overwritten.
+    (tmp_path / "activity_events_2025_11.jsonl.gz").write_bytes(b"earlier")
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            session.add_all(
+                [
+                    ActivityEvent(event_type="task.comment", created_at=datetime(2025, 11, 2)),
+                    ActivityEvent(event_type="task.updated", created_at=datetime(2025, 11, 9)),
+                    ActivityEvent(event_type="task.updated", created_at=datetime(2025, 11, 30)),
+                    ActivityEvent(event_type="task.created", created_at=datetime(2025, 12, 31)),
+                    ActivityEvent(event_type="task.created", created_at=datetime(2026, 1, 1)),
+                    ActivityEvent(event_type="task.comment", created_at=datetime(2026, 3, 1)),
+                ],
+            )
+            await session.commit()
+
+            result = await archive_activity_events(session, now=NOW)
+
+            remaining = sorted(
+                event.created_at for event in await session.exec(select(ActivityEvent))
+            )
+    finally:
+        await engine.dispose()
+
+    assert result.cutoff == datetime(2026, 1, 1)
+    assert result.rows_archived == 4
+    assert result.partitions_created == 0
+    assert [path.name for path in result.files] == [
+        "activity_events_2025_11.1.jsonl.gz",
+        "activity_events_2025_12.jsonl.gz",
+    ]
+    november = _read_archive(result.files[0])
+    assert [row["created_at"] for row in november] == [
+        "2025-11-02T00:00:00",
+        "2025-11-09T00:00:00",
+        "2025-11-30T00:00:00",
+    ]
+    assert november[0]["event_type"] == "task.comment"
+    assert remaining == [datetime(2026, 1, 1), datetime(2026, 3, 1)]
+    assert not list(tmp_path.glob("*.part"))
+
+
+@pytest.mark.asyncio
+async def test_archive_keeps_everything_without_retention(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    monkeypatch.setattr(activity_archive.settings, "activity_retention_months", 0)
+    monkeypatch.setattr(activity_archive.settings, "activity_archive_dir", str(tmp_path))
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            session.add(ActivityEvent(event_type="task.created", created_at=datetime(2020, 1, 1)))
+            await session.commit()
+
+            result = await archive_activity_events(session, now=NOW)
+            count = len(list(await session.exec(select(ActivityEvent))))
+    finally:
+        await engine.dispose()
+
+    assert result == ActivityArchiveResult(cutoff=None)
+    assert count == 1
+    assert not list(tmp_path.iterdir())
+
+
+@pytest.mark.asyncio
+async def test_run_activity_archive_once_respects_flag(monkeypatch: pytest.MonkeyPatch) -> None:
+    sessions: list[object] = []
+
+    class _SessionContext:
+        async def __aenter__(self) -> object:
+            return object()
+
+        async def __aexit__(self, *_args: object) -> bool:
+            return False
+
+    async def _archive(session: object) -> ActivityArchiveResult:
+        sessions.append(session)
+        return ActivityArchiveResult(cutoff=None)
+
+    async def _ready() -> bool:
+        return True
+
+    monkeypatch.setattr(queue_worker.settings, "activity_archive_enabled", True)
+    monkeypatch.setattr(queue_worker, "is_scheduler_migration_ready", _ready)
+    monkeypatch.setattr(queue_worker, "archive_activity_events", _archive)
+    monkeypatch.setattr(queue_worker, "async_session_maker", _SessionContext)
+
+    assert await queue_worker.run_activity_archive_once() is True
+
+    monkeypatch.setattr(queue_worker.settings, "activity_archive_enabled", False)
+
+    assert await queue_worker.run_activity_archive_once() is False
+    assert len(sessions) == 1
+
+
+@pytest.mark.asyncio
+async def test_partition_is_detached_concurrently_and_late_rows_are_re_exported(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    statements: list[str] = []
+    exports: list[str | None] = []
+    first_export = tmp_path / "activity_events_2025_11.jsonl.gz"
+    first_export.write_bytes(b"stale")
+
+    class _Session:
+        async def execute(self, statement: object, *_args: object) -> None:
+            statements.append(str(statement))
+
+        async def commit(self) -> None:
+            return None
+
+    async def _export(_session: object, **kwargs: object) -> tuple[Path, int]:
+        exports.append(kwargs.get("table_name"))  # type: ignore[arg-type]
+        if kwargs.get("table_name") is None:
+            return first_export, 3
+        return tmp_path / "activity_events_2025_11.1.jsonl.gz", 4
+
+    async def _outside_transaction(_session: object, statement: str) -> None:
+        statements.append(statement)
+
+    async def _not_pending(_session: object, _name: str) -> bool:
+        return False
+
+    async def _count(_session: object, _name: str) -> int:
+        # One row landed in the month after the first export.
+        return 4
+
+    monkeypatch.setattr(activity_archive, "export_range", _export)
+    monkeypatch.setattr(activity_archive, "_execute_outside_transaction", _outside_transaction)
+    monkeypatch.setattr(activity_archive, "_detach_pending", _not_pending)
+    monkeypatch.setattr(activity_archive, "_row_count", _count)
+
+    path, count = await activity_archive._archive_partition(
+        _Session(),  # type: ignore[arg-type]
+        month=datetime(2025, 11, 1),
+        name="activity_events_p2025_11",
+        directory=tmp_path,
+        batch_size=10,
+    )
+
+    assert statements == [
+        'ALTER TABLE activity_events DETACH PARTITION "activity_events_p2025_11" CONCURRENTLY',
+        'DROP TABLE "activity_events_p2025_11"',
+    ]
+    assert exports == [None, "activity_events_p2025_11"]
+    assert (path.name, count) == ("activity_events_2025_11.1.jsonl.gz", 4)
+    assert not first_export.exists()
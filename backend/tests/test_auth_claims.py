@@ -17,6 +17,7 @@ class _FakeSession:
     added: list[Any] = field(default_factory=list)
     committed: int = 0
     refreshed: list[Any] = field(default_factory=list)
+    info: dict[str, Any] = field(default_factory=dict)
 
     def add(self, value: Any) -> None:
         self.added.append(value)
@@ -0,0 +1,131 @@
+# ruff: noqa: S101
+from __future__ import annotations
+
+from datetime import timedelta
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.time import utcnow
+from app.models.board_groups import BoardGroup
+from app.models.boards import Board
+from app.models.organizations import Organization
+from app.models.tasks import Task
+from app.schemas.view_models import BoardGroupBoardSnapshot
+from app.services import board_group_snapshot
+from app.services.board_group_snapshot import BoardGroupSectionCache, build_group_snapshot
+
+
+async def _setup() -> (
+    tuple[AsyncEngine, async_sessionmaker[AsyncSession], BoardGroup, Board, Board]
+):
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+    org = Organization(id=uuid4(), name="org")
+    group = BoardGroup(organization_id=org.id, name="g", slug="g")
+    alpha = Board(organization_id=org.id, name="Alpha", slug="alpha", board_group_id=group.id)
+    beta = Board(organization_id=org.id, name="beta", slug="beta", board_group_id=group.id)
+    now = utcnow()
+    async with session_maker() as session:
+        session.add(org)
+        session.add(group)
+        session.add(alpha)
+        session.add(beta)
+        session.add_all(
+            [
+                Task(board_id=alpha.id, title="a-inbox", status="inbox", updated_at=now),
+                Task(board_id=alpha.id, title="a-review", status="review", updated_at=now),
+                Task(
+                    board_id=alpha.id,
+                    title="a-high",
+                    status="in_progress",
+                    priority="high",
+                    updated_at=now - timedelta(hours=1),
+                ),
+                Task(
+                    board_id=alpha.id,
+                    title="a-low",
+                    status="in_progress",
+                    priority="low",
+                    updated_at=now,
+                ),
+                Task(board_id=alpha.id, title="a-done", status="done", updated_at=now),
+                Task(board_id=beta.id, title="b-inbox", status="inbox", updated_at=now),
+            ],
+        )
+        await session.commit()
+    return engine, session_maker, group, alpha, beta
+
+
+def _titles(section: BoardGroupBoardSnapshot) -> list[str]:
+    return [task.title for task in section.tasks]
+
+
+@pytest.mark.asyncio
+async def test_group_snapshot_orders_and_limits_tasks_per_board(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(board_group_snapshot, "_GROUP_SECTION_CACHE", BoardGroupSectionCache())
+    engine, session_maker, group, alpha, beta = await _setup()
+
+    async with session_maker() as session:
+        limited = await build_group_snapshot(session, group=group, per_board_task_limit=3)
+        with_done = await build_group_snapshot(
+            session,
+            group=group,
+            include_done=True,
+            per_board_task_limit=10,
+        )
+        excluded = await build_group_snapshot(session, group=group, exclude_board_id=alpha.id)
+
+    assert [item.board.id for item in limited.boards] == [alpha.id, beta.id]
+    assert _titles(limited.boards[0]) == ["a-high", "a-low", "a-review"]
+    assert _titles(limited.boards[1]) == ["b-inbox"]
+    assert limited.boards[0].task_counts == {
+        "done": 1,
+        "in_progress": 2,
+        "inbox": 1,
+        "review": 1,
+    }
+    assert _titles(with_done.boards[0])[-1] == "a-done"
+    assert [item.board.id for item in excluded.boards] == [beta.id]
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_group_snapshot_rebuilds_only_changed_boards(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(board_group_snapshot, "_GROUP_SECTION_CACHE", BoardGroupSectionCache())
+    engine, session_maker, group, alpha, beta = await _setup()
+    rebuilt: list[list[UUID]] = []
+    real_build = board_group_snapshot._build_board_sections
+
+    async def _tracking_build(
+        session: AsyncSession,
+        boards: list[Board],
+        **kwargs: object,
+    ) -> dict[UUID, BoardGroupBoardSnapshot]:
+        rebuilt.append([board.id for board in boards])
+        return await real_build(session, boards, **kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(board_group_snapshot, "_build_board_sections", _tracking_build)
+
+    async with session_maker() as session:
+        first = await build_group_snapshot(session, group=group)
+        second = await build_group_snapshot(session, group=group)
+
+        session.add(Task(board_id=beta.id, title="b-urgent", status="in_progress"))
+        await session.commit()
+        third = await build_group_snapshot(session, group=group)
+
+    assert rebuilt == [[alpha.id, beta.id], [beta.id]]
+    assert second == first
+    assert third.boards[0] is first.boards[0]
+    assert _titles(third.boards[1]) == ["b-urgent", "b-inbox"]
+    await engine.dispose()
@@ -0,0 +1,234 @@
+# ruff: noqa: S101
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from datetime import timedelta
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel, col, delete, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api.boards import router as boards_router
+from app.api.deps import get_board_for_actor_read
+from app.core.time import utcnow
+from app.db import board_versions
+from app.db.session import get_session
+from app.models.agents import Agent
+from app.models.board_webhook_payloads import BoardWebhookPayload
+from app.models.boards import Board
+from app.models.organizations import Organization
+from app.models.tag_assignments import TagAssignment
+from app.models.tags import Tag
+from app.models.tasks import Task
+from app.schemas.agents import AgentRead
+from app.schemas.board_memory import BoardMemoryRead
+from app.schemas.boards import BoardRead
+from app.schemas.tags import TagRef
+from app.schemas.view_models import BoardSnapshot, TaskCardRead
+from app.services import board_snapshot
+from app.services.board_snapshot import BoardSnapshotCache, CachedBoardSnapshot
+
+
+async def _setup() -> tuple[AsyncEngine, async_sessionmaker[AsyncSession], Board]:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+    org = Organization(id=uuid4(), name="org")
+    board = Board(id=uuid4(), organization_id=org.id, name="b", slug="b")
+    async with session_maker() as session:
+        session.add(org)
+        session.add(board)
+        await session.commit()
+    return engine, session_maker, board
+
+
+async def _version(session_maker: async_sessionmaker[AsyncSession], board_id: UUID) -> int:
+    async with session_maker() as session:
+        return (
+            await session.exec(select(Board.snapshot_version).where(col(Board.id) == board_id))
+        ).one()
+
+
+@pytest.mark.asyncio
+async def test_writes_to_snapshot_tables_bump_board_version() -> None:
+    engine, session_maker, board = await _setup()
+    other_board_id = uuid4()
+    versions: list[int] = [await _version(session_maker, board.id)]
+
+    async with session_maker() as session:
+        task = Task(board_id=board.id, title="t")
+        tag = Tag(organization_id=board.organization_id, name="urgent", slug="urgent")
+        session.add(task)
+        session.add(tag)
+        await session.commit()
+        versions.append(await _version(session_maker, board.id))
+
+        # Rows that reference the board only through a task still bump it.
+        session.add(TagAssignment(task_id=task.id, tag_id=tag.id))
+        await session.commit()
+        versions.append(await _version(session_maker, board.id))
+
+        tag.name = "critical"
+        session.add(tag)
+        await session.commit()
+        versions.append(await _version(session_maker, board.id))
+
+        await session.exec(delete(TagAssignment).where(col(TagAssignment.task_id) == task.id))
+        await session.commit()
+        versions.append(await _version(session_maker, board.id))
+
+        # Tables outside the snapshot leave the version alone.
+        session.add(
+            BoardWebhookPayload(board_id=board.id, webhook_id=uuid4(), payload={"a": 1}),
+        )
+        await session.commit()
+        versions.append(await _version(session_maker, board.id))
+
+        session.add(Task(board_id=other_board_id, title="elsewhere"))
+        await session.commit()
+        versions.append(await _version(session_maker, board.id))
+
+    assert versions[:5] == sorted(set(versions[:5]))
+    assert versions[5] == versions[4]
+    assert versions[6] == versions[4]
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_only_rendered_agent_changes_bump_board_version() -> None:
+    engine, session_maker, board = await _setup()
+
+    async with session_maker() as session:
+        agent = Agent(
+            board_id=board.id,
+            gateway_id=uuid4(),
+            name="worker",
+            status="online",
+            last_seen_at=utcnow(),
+        )
+        session.add(agent)
+        await session.commit()
+        before = await _version(session_maker, board.id)
+
+        # Presence touch of a live agent and unrendered columns: no bump.
+        agent.last_seen_at = utcnow()
+        agent.updated_at = utcnow()
+        await session.commit()
+        agent.agent_token_hash = "hash"
+        await session.commit()
+        assert await _version(session_maker, board.id) == before
+
+        # A touch that brings a lapsed agent back online changes its status.
+        lapsed = Agent(
+            board_id=board.id,
+            gateway_id=uuid4(),
+            name="sleeper",
+            status="online",
+            last_seen_at=utcnow() - timedelta(days=1),
+        )
+        session.add(lapsed)
+        await session.commit()
+        before = await _version(session_maker, board.id)
+        lapsed.last_seen_at = utcnow()
+        await session.commit()
+        assert await _version(session_maker, board.id) > before
+
+    await engine.dispose()
+
+
+def test_unrendered_columns_are_not_part_of_snapshot_schemas() -> None:
+    schemas = {
+        "agents": AgentRead,
+        "board_memory": BoardMemoryRead,
+        "boards": BoardRead,
+        "tags": TagRef,
+        "tasks": TaskCardRead,
+    }
+    unrendered = board_versions._UNRENDERED_COLUMNS  # noqa: SLF001
+    assert set(unrendered) == set(schemas)
+    for table_name, columns in unrendered.items():
+        assert not columns & set(schemas[table_name].model_fields), table_name
+
+
+def test_cache_misses_on_new_version_and_lapsed_agent_status() -> None:
+    cache = BoardSnapshotCache(max_entries=2)
+    board_id = uuid4()
+    entry = CachedBoardSnapshot(version=3, body=b"{}", etag='"abc"', expires_at=None)
+    cache.put(board_id, entry)
+
+    assert cache.get(board_id, 3) is entry
+    assert cache.get(board_id, 4) is None
+
+    cache.put(
+        board_id,
+        CachedBoardSnapshot(
+            version=4,
+            body=b"{}",
+            etag='"def"',
+            expires_at=utcnow() - timedelta(seconds=1),
+        ),
+    )
+    assert cache.get(board_id, 4) is None
+    assert entry.matches('W/"abc", "zzz"')
+    assert entry.matches("*")
+    assert not entry.matches(None)
+
+
+@pytest.mark.asyncio
+async def test_snapshot_endpoint_answers_conditional_requests(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    engine, session_maker, board = await _setup()
+    monkeypatch.setattr(board_snapshot, "_BOARD_SNAPSHOT_CACHE", BoardSnapshotCache())
+    builds: list[UUID] = []
+    real_build = board_snapshot.build_board_snapshot
+
+    async def _counting_build(session: AsyncSession, target: Board) -> BoardSnapshot:
+        builds.append(target.id)
+        return await real_build(session, target)
+
+    monkeypatch.setattr(board_snapshot, "build_board_snapshot", _counting_build)
+
+    app = FastAPI()
+    api_v1 = APIRouter(prefix="/api/v1")
+    api_v1.include_router(boards_router)
+    app.include_router(api_v1)
+
+    async def _override_get_session() -> AsyncIterator[AsyncSession]:
+        async with session_maker() as session:
+            yield session
+
+    async def _override_board(board_id: str) -> Board:
+        async with session_maker() as session:
+            loaded = await session.get(Board, UUID(board_id))
+        assert loaded is not None
+        return loaded
+
+    app.dependency_overrides[get_session] = _override_get_session
+    app.dependency_overrides[get_board_for_actor_read] = _override_board
+    url = f"/api/v1/boards/{board.id}/snapshot"
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        first = await client.get(url)
+        etag = first.headers["ETag"]
+        unchanged = await client.get(url, headers={"If-None-Match": etag})
+
+        async with session_maker() as session:
+            session.add(Task(board_id=board.id, title="new work"))
+            await session.commit()
+        changed = await client.get(url, headers={"If-None-Match": etag})
+
+    assert first.status_code == 200
+    assert first.json()["board"]["id"] == str(board.id)
+    assert unchanged.status_code == 304
+    assert unchanged.content == b""
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert [task["title"] for task in changed.json()["tasks"]] == ["new work"]
+    assert builds == [board.id, board.id]
+    await engine.dispose()
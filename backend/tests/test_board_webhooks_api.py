@@ -209,6 +209,7 @@ async def test_ingest_board_webhook_stores_payload_and_enqueues_for_lead_dispatc
             assert memory_items[0].tags is not None
             assert f"webhook:{webhook.id}" in memory_items[0].tags
             assert f"payload:{payload_id}" in memory_items[0].tags
+            assert memory_items[0].webhook_payload_id == payload_id
             assert f"Payload ID: {payload_id}" in memory_items[0].content
 
         assert len(enqueued) == 1
@@ -1,118 +1,274 @@
 # ruff: noqa: INP001, S101
-"""Regression tests for board deletion cleanup behavior."""
+"""Regression tests for background board deletion."""
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 from types import SimpleNamespace
 from typing import Any
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel, col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 import app.services.board_lifecycle as board_lifecycle
-from app.api import boards
+from app.api import board_webhooks, boards, deps
+from app.api.deps import ActorContext
+from app.db import crud
+from app.models.activity_events import ActivityEvent
+from app.models.agents import Agent
+from app.models.board_memory import BoardMemory
 from app.models.boards import Board
+from app.models.organization_board_access import OrganizationBoardAccess
+from app.models.organizations import Organization
+from app.models.tag_assignments import TagAssignment
+from app.models.tasks import Task
 from app.services.openclaw.gateway_rpc import OpenClawGatewayError
 
-_NO_EXEC_RESULTS_ERROR = "No more exec_results left for session.exec"
+NOW = datetime(2026, 3, 8, 12, 0)
 
 
-@dataclass
-class _FakeSession:
-    exec_results: list[object]
-    executed: list[object] = field(default_factory=list)
-    deleted: list[object] = field(default_factory=list)
-    committed: int = 0
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
 
-    async def exec(self, statement: object) -> object | None:
-        is_dml = statement.__class__.__name__ in {"Delete", "Update", "Insert"}
-        if is_dml:
-            self.executed.append(statement)
-            return None
-        if not self.exec_results:
-            raise AssertionError(_NO_EXEC_RESULTS_ERROR)
-        return self.exec_results.pop(0)
 
-    async def execute(self, statement: object) -> None:
-        self.executed.append(statement)
+async def _seed(session: AsyncSession, *, gateway_id: UUID | None = None) -> Board:
+    org = Organization(id=uuid4(), name="org")
+    board = Board(organization_id=org.id, name="Demo Board", slug="demo", gateway_id=gateway_id)
+    agent = Agent(board_id=board.id, gateway_id=gateway_id or uuid4(), name="worker")
+    session.add_all([org, board, agent])
+    for index in range(5):
+        task = Task(board_id=board.id, title=f"task {index}", assigned_agent_id=agent.id)
+        session.add(task)
+        session.add(TagAssignment(task_id=task.id, tag_id=uuid4()))
+        session.add(ActivityEvent(event_type="task.created", task_id=task.id))
+    session.add(ActivityEvent(event_type="agent.online", agent_id=agent.id))
+    session.add(OrganizationBoardAccess(organization_member_id=uuid4(), board_id=board.id))
+    # Rows of another board must survive.
+    other = Board(organization_id=org.id, name="Other", slug="other")
+    session.add_all([other, Task(board_id=other.id, title="keep")])
+    await session.commit()
+    return board
 
-    async def delete(self, value: object) -> None:
-        self.deleted.append(value)
 
-    async def commit(self) -> None:
-        self.committed += 1
+async def _count(session: AsyncSession, model: type[Any]) -> int:
+    return len(list(await session.exec(select(model.id))))
 
 
 @pytest.mark.asyncio
-async def test_delete_board_cleans_org_board_access_rows() -> None:
-    """Deleting a board should clear org-board access rows before commit."""
-    session: Any = _FakeSession(exec_results=[[], []])
-    board = Board(
-        id=uuid4(),
-        organization_id=uuid4(),
-        name="Demo Board",
-        slug="demo-board",
-        gateway_id=None,
+async def test_delete_endpoint_marks_board_and_enqueues_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    enqueued: list[UUID] = []
+    monkeypatch.setattr(
+        board_lifecycle,
+        "enqueue_board_deletion",
+        lambda payload: enqueued.append(payload.board_id) or True,
     )
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            board = await _seed(session)
 
-    await boards.delete_board(
-        session=session,
-        board=board,
-    )
+            first = await boards.delete_board(session=session, board=board)
+            second = await boards.delete_board(session=session, board=board)
+            task_count = await _count(session, Task)
+    finally:
+        await engine.dispose()
 
-    deleted_table_names = [statement.table.name for statement in session.executed]
-    assert "organization_board_access" in deleted_table_names
-    assert "organization_invite_board_access" in deleted_table_names
-    assert "board_task_custom_fields" in deleted_table_names
-    assert board in session.deleted
-    assert session.committed == 1
+    assert enqueued == [board.id]
+    assert first.deleting_at is not None
+    assert first.stage == board_lifecycle.GATEWAY_AGENTS_STAGE
+    assert second.deleting_at == first.deleting_at
+    # Nothing is deleted inside the request.
+    assert task_count == 6
 
 
 @pytest.mark.asyncio
-async def test_delete_board_cleans_tag_assignments_before_tasks() -> None:
-    """Deleting a board should remove task-linked rows before deleting tasks."""
-    session: Any = _FakeSession(exec_results=[[], [uuid4()]])
-    board = Board(
-        id=uuid4(),
-        organization_id=uuid4(),
-        name="Demo Board",
-        slug="demo-board",
-        gateway_id=None,
-    )
+async def test_run_board_deletion_removes_children_in_chunks() -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            board = await _seed(session)
+            board.deleting_at = NOW
 
-    await boards.delete_board(
-        session=session,
-        board=board,
-    )
+            result = await board_lifecycle.run_board_deletion(session, board=board, batch_size=2)
 
-    deleted_table_names = [statement.table.name for statement in session.executed]
-    assert "tag_assignments" in deleted_table_names
-    assert "task_custom_field_values" in deleted_table_names
-    assert deleted_table_names.index("tag_assignments") < deleted_table_names.index("tasks")
-    assert deleted_table_names.index("task_custom_field_values") < deleted_table_names.index(
-        "tasks"
-    )
+            remaining_boards = list(await session.exec(select(Board.slug)))
+            remaining_tasks = list(await session.exec(select(Task.title)))
+            counts = {
+                model.__name__: await _count(session, model)
+                for model in (Agent, ActivityEvent, TagAssignment, OrganizationBoardAccess)
+            }
+    finally:
+        await engine.dispose()
+
+    assert remaining_boards == ["other"]
+    assert remaining_tasks == ["keep"]
+    assert counts == {
+        "Agent": 0,
+        "ActivityEvent": 0,
+        "TagAssignment": 0,
+        "OrganizationBoardAccess": 0,
+    }
+    assert result.deleted["tasks"] == 5
+    assert result.deleted["tag_assignments"] == 5
+    assert result.deleted["task_activity_events"] == 5
+    assert result.deleted["agent_activity_events"] == 1
+    assert result.deleted["organization_board_access"] == 1
 
 
 @pytest.mark.asyncio
-async def test_delete_board_ignores_missing_gateway_agent(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Deleting a board should continue when gateway reports agent not found."""
-    session: Any = _FakeSession(exec_results=[[]])
-    board = Board(
-        id=uuid4(),
-        organization_id=uuid4(),
-        name="Demo Board",
-        slug="demo-board",
-        gateway_id=uuid4(),
-    )
-    agent = SimpleNamespace(id=uuid4(), board_id=board.id)
+async def test_run_board_deletion_resumes_at_recorded_stage(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    real_delete_where = crud.delete_where
+    calls = {"tasks": 0}
+
+    async def _crash_on_second_task_chunk(
+        session: AsyncSession,
+        model: type[Any],
+        *criteria: object,
+        **kwargs: Any,
+    ) -> int:
+        if model is Task:
+            calls["tasks"] += 1
+            if calls["tasks"] == 2:
+                raise RuntimeError("worker died")
+        return await real_delete_where(session, model, *criteria, **kwargs)
+
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            board = await _seed(session)
+            board_id = board.id
+            board.deleting_at = NOW
+            monkeypatch.setattr(board_lifecycle.crud, "delete_where", _crash_on_second_task_chunk)
+            with pytest.raises(RuntimeError, match="worker died"):
+                await board_lifecycle.run_board_deletion(session, board=board, batch_size=3)
+
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            reloaded = await Board.objects.by_id(board_id).first(session)
+            assert reloaded is not None
+            interrupted = board_lifecycle.deletion_status(reloaded)
+            tasks_left = await _count(session, Task)
+
+            result = await board_lifecycle.run_board_deletion(session, board=reloaded)
+            boards_left = await _count(session, Board)
+    finally:
+        await engine.dispose()
+
+    assert interrupted.stage == "tasks"
+    assert interrupted.deleted["tasks"] == 3
+    assert tasks_left == 3  # two of the deleted board plus the other board's task
+    assert result.deleted["tasks"] == 5
+    assert calls["tasks"] == 3
+    assert boards_left == 1
+
+
+@pytest.mark.asyncio
+async def test_run_board_deletion_restarts_when_a_late_row_blocks_the_board(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _enforce_foreign_keys(dbapi_connection: Any, _record: Any) -> None:
+        dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    real_delete_stage_chunk = board_lifecycle._delete_stage_chunk  # noqa: SLF001
+    late_rows: list[UUID] = []
+
+    async def _write_after_memory_stage(
+        session: AsyncSession,
+        stage: Any,
+        board_id: UUID,
+        *,
+        batch_size: int,
+    ) -> int:
+        if stage.name == "board_webhooks" and not late_rows:
+            # A webhook preview that landed after the board_memory stage finished.
+            memory = BoardMemory(board_id=board_id, content="late webhook")
+            session.add(memory)
+            await session.commit()
+            late_rows.append(memory.id)
+        return await real_delete_stage_chunk(session, stage, board_id, batch_size=batch_size)
+
+    monkeypatch.setattr(board_lifecycle, "_delete_stage_chunk", _write_after_memory_stage)
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            org = Organization(id=uuid4(), name="org")
+            session.add(org)
+            await session.flush()
+            board = Board(organization_id=org.id, name="Demo Board", slug="demo")
+            session.add(board)
+            await session.commit()
+            board.deleting_at = NOW
+
+            with pytest.raises(IntegrityError):
+                await board_lifecycle.run_board_deletion(session, board=board)
+            restarted = board_lifecycle.deletion_status(board)
+
+            result = await board_lifecycle.run_board_deletion(session, board=board)
+            boards_left = await _count(session, Board)
+            memory_left = await _count(session, BoardMemory)
+    finally:
+        await engine.dispose()
+
+    assert len(late_rows) == 1
+    assert restarted.stage == board_lifecycle.STAGE_NAMES[0]
+    assert restarted.error is not None
+    assert result.deleted["board_memory"] == 1
+    assert boards_left == 0
+    assert memory_left == 0
+
+
+@pytest.mark.asyncio
+async def test_deleting_board_rejects_writes_and_webhook_ingest() -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            board = await _seed(session)
+            board.deleting_at = NOW
+            session.add(board)
+            await session.commit()
+            agent = (await session.exec(select(Agent))).one()
+            actor = ActorContext(actor_type="agent", agent=agent)
+
+            with pytest.raises(HTTPException) as write_exc:
+                await deps.get_board_for_actor_write(board.id, session=session, actor=actor)
+            with pytest.raises(HTTPException) as ingest_exc:
+                await board_webhooks.ingest_board_webhook(
+                    request=SimpleNamespace(),  # type: ignore[arg-type]
+                    webhook_id=uuid4(),
+                    board=board,
+                    session=session,
+                )
+    finally:
+        await engine.dispose()
+
+    assert write_exc.value.status_code == 409
+    assert ingest_exc.value.status_code == 410
+
+
+@pytest.mark.asyncio
+async def test_gateway_cleanup_ignores_missing_agents_and_records_failures(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     gateway = SimpleNamespace(url="ws://gateway.example/ws", token=None, workspace_root="/tmp")
+    errors = ['agent "mc-worker" not found', "gateway unreachable"]
     called = {"delete_agent_lifecycle": 0}
 
-    async def _fake_all(_session: object) -> list[object]:
-        return [agent]
-
     async def _fake_require_gateway_for_board(
         _session: object,
         _board: object,
@@ -122,23 +278,10 @@ async def test_delete_board_ignores_missing_gateway_agent(monkeypatch: pytest.Mo
         _ = require_workspace_root
         return gateway
 
-    async def _fake_delete_agent_lifecycle(
-        _self: object,
-        *,
-        agent: object,
-        gateway: object,
-        delete_files: bool = True,
-        delete_session: bool = True,
-    ) -> str | None:
-        _ = (agent, gateway, delete_files, delete_session)
+    async def _fake_delete_agent_lifecycle(_self: object, **_kwargs: object) -> str | None:
         called["delete_agent_lifecycle"] += 1
-        raise OpenClawGatewayError('agent "mc-worker" not found')
+        raise OpenClawGatewayError(errors.pop())
 
-    monkeypatch.setattr(
-        board_lifecycle.Agent,
-        "objects",
-        SimpleNamespace(filter_by=lambda **_kwargs: SimpleNamespace(all=_fake_all)),
-    )
     monkeypatch.setattr(
         board_lifecycle,
         "require_gateway_for_board",
@@ -150,12 +293,75 @@ async def test_delete_board_ignores_missing_gateway_agent(monkeypatch: pytest.Mo
         "delete_agent_lifecycle",
         _fake_delete_agent_lifecycle,
     )
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            board = await _seed(session, gateway_id=uuid4())
+            board.deleting_at = NOW
+
+            with pytest.raises(OpenClawGatewayError):
+                await board_lifecycle.run_board_deletion(session, board=board)
+            failed = board_lifecycle.deletion_status(board)
+
+            await board_lifecycle.run_board_deletion(session, board=board)
+            boards_left = await _count(session, Board)
+    finally:
+        await engine.dispose()
+
+    assert failed.stage == board_lifecycle.GATEWAY_AGENTS_STAGE
+    assert failed.error == "gateway unreachable"
+    assert called["delete_agent_lifecycle"] == 2
+    assert boards_left == 1
 
-    await boards.delete_board(
-        session=session,
-        board=board,
+
+@pytest.mark.asyncio
+async def test_resume_stalled_board_deletions_requeues_only_stale_boards(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    enqueued: list[UUID] = []
+    monkeypatch.setattr(
+        board_lifecycle,
+        "enqueue_board_deletion",
+        lambda payload: enqueued.append(payload.board_id) or True,
     )
+    monkeypatch.setattr(board_lifecycle.settings, "board_deletion_stale_seconds", 300)
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            org_id = uuid4()
+            stale = Board(
+                organization_id=org_id,
+                name="stale",
+                slug="stale",
+                deleting_at=NOW - timedelta(hours=1),
+                updated_at=NOW - timedelta(minutes=10),
+            )
+            active = Board(
+                organization_id=org_id,
+                name="active",
+                slug="active",
+                deleting_at=NOW - timedelta(hours=1),
+                updated_at=NOW - timedelta(minutes=1),
+            )
+            idle = Board(
+                organization_id=org_id,
+                name="idle",
+                slug="idle",
+                updated_at=NOW - timedelta(days=1),
+            )
+            session.add_all([stale, active, idle])
+            await session.commit()
+
+            first = await board_lifecycle.resume_stalled_board_deletions(session, now=NOW)
+            # The sweep touches what it re-queued, so an immediate rerun is a no-op.
+            second = await board_lifecycle.resume_stalled_board_deletions(session, now=NOW)
+            deleting = list(
+                await session.exec(select(Board.slug).where(col(Board.deleting_at).is_not(None))),
+            )
+    finally:
+        await engine.dispose()
 
-    assert called["delete_agent_lifecycle"] == 1
-    assert board in session.deleted
-    assert session.committed == 1
+    assert first == 1
+    assert second == 0
+    assert enqueued == [stale.id]
+    assert sorted(deleting) == ["active", "stale"]
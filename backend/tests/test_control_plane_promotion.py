@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from datetime import datetime, timedelta
 from uuid import uuid4
 
 import pytest
@@ -10,6 +11,7 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.api import packs as packs_api
 from app.core.auth import AuthContext
+from app.core.time import utcnow
 from app.models.deterministic_evals import DeterministicEval
 from app.models.organization_members import OrganizationMember
 from app.models.organizations import Organization
@@ -23,6 +25,7 @@ from app.schemas.control_plane import (
     PackRollbackRequest,
     PromptPackCreateRequest,
 )
+from app.services.control_plane import eval_summary_for_pack, record_eval_aggregates
 from app.services.organizations import OrganizationContext
 
 
@@ -62,6 +65,7 @@ async def _add_eval(
     pack_key: str,
     score: float,
     hard_regression: bool,
+    created_at: datetime | None = None,
 ) -> None:
     run = RunTelemetry(
         organization_id=organization_id,
@@ -82,23 +86,24 @@ async def _add_eval(
     )
     session.add(run)
     await session.flush()
-    session.add(
-        DeterministicEval(
-            run_telemetry_id=run.id,
-            organization_id=organization_id,
-            pack_id=pack_id,
-            pack_key=pack_key,
-            tier="personal",
-            success_bool=True,
-            retries=0,
-            latency_regression_pct=0.0,
-            format_contract_compliance=True,
-            approval_gate_compliance=True,
-            score=score,
-            hard_regression=hard_regression,
-            details={},
-        )
+    evaluation = DeterministicEval(
+        run_telemetry_id=run.id,
+        organization_id=organization_id,
+        pack_id=pack_id,
+        pack_key=pack_key,
+        tier="personal",
+        success_bool=True,
+        retries=0,
+        latency_regression_pct=0.0,
+        format_contract_compliance=True,
+        approval_gate_compliance=True,
+        score=score,
+        hard_regression=hard_regression,
+        details={},
+        created_at=created_at or utcnow(),
     )
+    session.add(evaluation)
+    await record_eval_aggregates(session, evaluation)
 
 
 @pytest.mark.asyncio
@@ -182,6 +187,77 @@ async def test_promote_pack_blocks_on_regression() -> None:
         await engine.dispose()
 
 
+@pytest.mark.asyncio
+async def test_eval_summary_reads_running_and_windowed_aggregates() -> None:
+    engine = await _make_engine()
+    try:
+        async with await _make_session(engine) as session:
+            org, _user, _member = await _seed_org_user(session)
+            pack = PromptPack(
+                organization_id=org.id,
+                scope="organization",
+                scope_ref="",
+                tier="personal",
+                pack_key="engineering-delivery-pack",
+                version=1,
+                policy={},
+                pack_metadata={},
+            )
+            session.add(pack)
+            await session.flush()
+            now = utcnow()
+            for score, hard_regression, age in (
+                (40.0, True, timedelta(days=10)),
+                (80.0, False, timedelta(days=2)),
+                (90.0, False, timedelta(minutes=5)),
+                (100.0, False, timedelta(0)),
+            ):
+                await _add_eval(
+                    session,
+                    organization_id=org.id,
+                    pack_id=pack.id,
+                    pack_key="engineering-delivery-pack",
+                    score=score,
+                    hard_regression=hard_regression,
+                    created_at=now - age,
+                )
+            await session.commit()
+
+            total = await eval_summary_for_pack(session, organization_id=org.id, pack_id=pack.id)
+            last_week = await eval_summary_for_pack(
+                session,
+                organization_id=org.id,
+                pack_id=pack.id,
+                window_days=7,
+            )
+            last_two = await eval_summary_for_pack(
+                session,
+                organization_id=org.id,
+                pack_id=pack.id,
+                last_n=2,
+            )
+            other = await eval_summary_for_pack(session, organization_id=org.id, pack_id=uuid4())
+
+            assert (total.count, total.avg_score, total.hard_regressions) == (4, 77.5, 1)
+            assert (last_week.count, last_week.avg_score, last_week.hard_regressions) == (
+                3,
+                90.0,
+                0,
+            )
+            assert (last_two.count, last_two.avg_score, last_two.hard_regressions) == (2, 95.0, 0)
+            assert (other.count, other.avg_score) == (0, 0.0)
+            with pytest.raises(ValueError, match="mutually exclusive"):
+                await eval_summary_for_pack(
+                    session,
+                    organization_id=org.id,
+                    pack_id=pack.id,
+                    window_days=7,
+                    last_n=2,
+                )
+    finally:
+        await engine.dispose()
+
+
 @pytest.mark.asyncio
 async def test_create_pack_applies_tier_policy_preset_when_policy_empty() -> None:
     engine = await _make_engine()
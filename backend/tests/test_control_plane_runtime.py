@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+from typing import Any
 from uuid import uuid4
 
 import pytest
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
-from sqlmodel import SQLModel
+from sqlmodel import SQLModel, col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.api import runtime as runtime_api
@@ -15,8 +16,15 @@ from app.models.organization_members import OrganizationMember
 from app.models.organizations import Organization
 from app.models.pack_bindings import PackBinding
 from app.models.prompt_packs import PromptPack
+from app.models.run_telemetry import RunTelemetry
 from app.models.users import User
-from app.services.control_plane import resolve_pack_binding
+from app.schemas.control_plane import RuntimeRunBatchIngestRequest, RuntimeRunIngestRequest
+from app.services.control_plane import (
+    ResolvedPackBinding,
+    resolve_pack_binding,
+    upsert_pack_binding,
+)
+from app.services.deterministic_eval_queue import QueuedDeterministicEvalBatch
 
 
 async def _make_engine() -> AsyncEngine:
@@ -207,3 +215,173 @@ async def test_runtime_pack_resolve_blocks_cross_org_board_access() -> None:
             assert exc.value.status_code == 403
     finally:
         await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_resolved_binding_is_cached_until_binding_write() -> None:
+    engine = await _make_engine()
+    try:
+        async with await _make_session(engine) as session:
+            org = Organization(id=uuid4(), name="org")
+            first_pack = PromptPack(
+                organization_id=org.id,
+                scope="organization",
+                tier="personal",
+                pack_key="cache-pack",
+                version=1,
+            )
+            second_pack = PromptPack(
+                organization_id=org.id,
+                scope="organization",
+                tier="personal",
+                pack_key="cache-pack",
+                version=2,
+            )
+            # Another organization's binding never takes part in resolution.
+            other_binding = PackBinding(
+                organization_id=uuid4(),
+                scope="organization",
+                tier="personal",
+                pack_key="cache-pack",
+                champion_pack_id=second_pack.id,
+            )
+            session.add_all([org, first_pack, second_pack, other_binding])
+            binding, _ = await upsert_pack_binding(
+                session,
+                organization_id=org.id,
+                created_by_user_id=None,
+                scope="organization",
+                scope_ref="",
+                tier="personal",
+                pack_key="cache-pack",
+                champion_pack_id=first_pack.id,
+            )
+            await session.commit()
+
+            async def _resolve() -> ResolvedPackBinding:
+                resolved = await resolve_pack_binding(
+                    session,
+                    organization_id=org.id,
+                    user_id=None,
+                    domain="",
+                    tier="personal",
+                    pack_key="cache-pack",
+                )
+                assert resolved is not None
+                return resolved
+
+            first = await _resolve()
+            # Writes that bypass the control plane are not seen until the entry expires.
+            binding.champion_pack_id = second_pack.id
+            session.add(binding)
+            await session.commit()
+            cached = await _resolve()
+
+            await upsert_pack_binding(
+                session,
+                organization_id=org.id,
+                created_by_user_id=None,
+                scope="organization",
+                scope_ref="",
+                tier="personal",
+                pack_key="cache-pack",
+                champion_pack_id=second_pack.id,
+            )
+            await session.commit()
+            refreshed = await _resolve()
+    finally:
+        await engine.dispose()
+
+    assert first is cached
+    assert first.pack.id == first_pack.id
+    assert first.resolved_chain == [f"organization:{binding.id}"]
+    assert refreshed.pack.id == second_pack.id
+
+
+@pytest.mark.asyncio
+async def test_batch_ingest_resolves_once_per_key_and_enqueues_one_job(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    engine = await _make_engine()
+    resolve_calls: list[tuple[str, str]] = []
+    queued: list[QueuedDeterministicEvalBatch] = []
+
+    async def _counting_resolve(session: AsyncSession, **kwargs: Any) -> ResolvedPackBinding | None:
+        resolve_calls.append((kwargs["tier"], kwargs["pack_key"]))
+        return await resolve_pack_binding(session, **kwargs)
+
+    def _capture(payload: QueuedDeterministicEvalBatch) -> bool:
+        queued.append(payload)
+        return True
+
+    monkeypatch.setattr(runtime_api, "resolve_pack_binding", _counting_resolve)
+    monkeypatch.setattr(runtime_api, "enqueue_deterministic_eval_batch", _capture)
+    try:
+        async with await _make_session(engine) as session:
+            org = Organization(id=uuid4(), name="org")
+            user = User(id=uuid4(), clerk_user_id="clerk-batch", email="batch@example.com")
+            member = OrganizationMember(organization_id=org.id, user_id=user.id, role="owner")
+            pack = PromptPack(
+                organization_id=org.id,
+                scope="organization",
+                tier="personal",
+                pack_key="batch-pack",
+                version=1,
+            )
+            session.add_all([org, user, member, pack])
+            await upsert_pack_binding(
+                session,
+                organization_id=org.id,
+                created_by_user_id=None,
+                scope="organization",
+                scope_ref="",
+                tier="personal",
+                pack_key="batch-pack",
+                champion_pack_id=pack.id,
+            )
+            await session.commit()
+            actor = ActorContext(actor_type="user", user=user)
+
+            items = [
+                RuntimeRunIngestRequest(pack_key="batch-pack", success_bool=True, latency_ms=100),
+                RuntimeRunIngestRequest(pack_key="batch-pack", success_bool=False, latency_ms=90),
+                RuntimeRunIngestRequest(
+                    pack_key="batch-pack",
+                    tier="enterprise",
+                    success_bool=True,
+                ),
+            ]
+            response = await runtime_api.ingest_runtime_runs(
+                payload=RuntimeRunBatchIngestRequest(items=items),
+                session=session,
+                actor=actor,
+            )
+            batch_resolve_calls = list(resolve_calls)
+            runs = {
+                run.id: run
+                for run in await session.exec(
+                    select(RunTelemetry).where(col(RunTelemetry.id).in_(response.run_ids)),
+                )
+            }
+
+            with pytest.raises(HTTPException) as exc:
+                await runtime_api.ingest_runtime_runs(
+                    payload=RuntimeRunBatchIngestRequest(
+                        items=[*items[:1], items[0].model_copy(update={"board_id": uuid4()})],
+                    ),
+                    session=session,
+                    actor=actor,
+                )
+            run_count = len(list(await session.exec(select(RunTelemetry.id))))
+    finally:
+        await engine.dispose()
+
+    assert response.queued_for_eval is True
+    assert len(response.run_ids) == 3
+    assert [payload.run_telemetry_ids for payload in queued] == [tuple(response.run_ids)]
+    assert batch_resolve_calls == [("personal", "batch-pack"), ("enterprise", "batch-pack")]
+    assert [runs[run_id].pack_id for run_id in response.run_ids] == [pack.id, pack.id, None]
+    assert all(run.organization_id == org.id for run in runs.values())
+    assert exc.value.status_code == 404
+    assert exc.value.detail == {"message": "Not Found", "index": 1}
+    assert run_count == 3
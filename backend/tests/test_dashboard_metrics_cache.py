@@ -0,0 +1,119 @@
+# ruff: noqa: S101
+from __future__ import annotations
+
+import asyncio
+from typing import Any, cast
+from uuid import uuid4
+
+import pytest
+
+from app.api import metrics as metrics_api
+from app.schemas.metrics import DashboardMetrics
+from app.services import dashboard_metrics_cache
+from app.services.dashboard_metrics_cache import DashboardMetricsCache, dashboard_cache_key
+
+
+def _payload(label: str) -> DashboardMetrics:
+    return cast("DashboardMetrics", label)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_computation(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(dashboard_metrics_cache.settings, "dashboard_cache_ttl_seconds", 5.0)
+    cache = DashboardMetricsCache()
+    board_a, board_b = uuid4(), uuid4()
+    calls = {"count": 0}
+
+    async def _compute() -> DashboardMetrics:
+        calls["count"] += 1
+        await asyncio.sleep(0.01)
+        return _payload("fresh")
+
+    results = await asyncio.gather(
+        cache.get_or_compute(dashboard_cache_key("24h", [board_a, board_b]), _compute),
+        cache.get_or_compute(dashboard_cache_key("24h", [board_b, board_a]), _compute),
+        cache.get_or_compute(dashboard_cache_key("24h", [board_a, board_b]), _compute),
+    )
+    other_range = await cache.get_or_compute(dashboard_cache_key("7d", [board_a]), _compute)
+
+    assert results == [_payload("fresh")] * 3
+    assert other_range == _payload("fresh")
+    assert calls["count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_entries_expire_after_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(dashboard_metrics_cache.settings, "dashboard_cache_ttl_seconds", 5.0)
+    clock = {"now": 100.0}
+    monkeypatch.setattr(dashboard_metrics_cache.time, "monotonic", lambda: clock["now"])
+    cache = DashboardMetricsCache()
+    key = dashboard_cache_key("24h", [uuid4()])
+    values = iter([_payload("first"), _payload("second")])
+
+    async def _compute() -> DashboardMetrics:
+        return next(values)
+
+    assert await cache.get_or_compute(key, _compute) == _payload("first")
+    clock["now"] += 4.9
+    assert await cache.get_or_compute(key, _compute) == _payload("first")
+    clock["now"] += 0.2
+    assert await cache.get_or_compute(key, _compute) == _payload("second")
+
+
+@pytest.mark.asyncio
+async def test_zero_ttl_disables_caching(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(dashboard_metrics_cache.settings, "dashboard_cache_ttl_seconds", 0)
+    cache = DashboardMetricsCache()
+    key = dashboard_cache_key("24h", [])
+    calls = {"count": 0}
+
+    async def _compute() -> DashboardMetrics:
+        calls["count"] += 1
+        return _payload("fresh")
+
+    await cache.get_or_compute(key, _compute)
+    await cache.get_or_compute(key, _compute)
+
+    assert calls["count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_dashboard_endpoint_caches_by_resolved_board_ids(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(dashboard_metrics_cache.settings, "dashboard_cache_ttl_seconds", 5.0)
+    cache = DashboardMetricsCache()
+    monkeypatch.setattr(metrics_api, "get_dashboard_metrics_cache", lambda: cache)
+    board_id = uuid4()
+    computed: list[tuple[str, list[Any]]] = []
+
+    async def _resolve(*_args: Any, **_kwargs: Any) -> list[Any]:
+        return [board_id]
+
+    async def _compute(range_key: str, board_ids: list[Any]) -> DashboardMetrics:
+        computed.append((range_key, board_ids))
+        return _payload(range_key)
+
+    monkeypatch.setattr(metrics_api, "_resolve_dashboard_board_ids", _resolve)
+    monkeypatch.setattr(metrics_api, "_compute_dashboard_metrics", _compute)
+
+    ctx = cast("Any", object())
+    session = cast("Any", object())
+    # A direct board filter and a group filter that resolve to the same board share an entry.
+    first = await metrics_api.dashboard_metrics(
+        range_key="24h",
+        board_id=board_id,
+        group_id=None,
+        session=session,
+        ctx=ctx,
+    )
+    second = await metrics_api.dashboard_metrics(
+        range_key="24h",
+        board_id=None,
+        group_id=uuid4(),
+        session=session,
+        ctx=ctx,
+    )
+
+    assert first == second == _payload("24h")
+    assert computed == [("24h", [board_id])]
@@ -0,0 +1,287 @@
+# ruff: noqa: S101
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event, func
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api import metrics as metrics_api
+from app.core.config import settings
+from app.db import dashboard_rollup_invalidation  # noqa: F401  (registers the write hooks)
+from app.models.activity_events import ActivityEvent
+from app.models.boards import Board
+from app.models.dashboard_rollups import (
+    BoardMetricsDirtyHour,
+    BoardMetricsRollup,
+    MetricsRollupWatermark,
+)
+from app.models.organizations import Organization
+from app.models.tasks import Task
+from app.services import dashboard_rollups
+from app.services.dashboard_rollups import (
+    HourlyMetrics,
+    collect_hourly_metrics,
+    digest_quantile,
+    hourly_metrics,
+    roll_up_closed_hours,
+)
+
+NOW = datetime(2026, 3, 10, 15, 30)
+
+
+def _date_trunc(unit: str, value: str | None) -> str | None:
+    # SQLite stand-in for Postgres date_trunc('hour', ...) on stored timestamps.
+    if value is None:
+        return None
+    assert unit == "hour"
+    return f"{value[:13]}:00:00.000000"
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _register(dbapi_connection: Any, _record: Any) -> None:
+        dbapi_connection.create_function("date_trunc", 2, _date_trunc)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+async def _seed(session: AsyncSession) -> Board:
+    org = Organization(id=uuid4(), name="org")
+    board = Board(id=uuid4(), organization_id=org.id, name="b", slug="b")
+    closed = Task(
+        board_id=board.id,
+        title="closed hour",
+        status="review",
+        in_progress_at=datetime(2026, 3, 10, 8, 20),
+        updated_at=datetime(2026, 3, 10, 10, 20),
+    )
+    current = Task(
+        board_id=board.id,
+        title="current hour",
+        status="review",
+        in_progress_at=datetime(2026, 3, 10, 11, 10),
+        updated_at=datetime(2026, 3, 10, 15, 10),
+    )
+    inbox = Task(
+        board_id=board.id,
+        title="inbox",
+        status="inbox",
+        created_at=datetime(2026, 3, 10, 9, 5),
+        updated_at=datetime(2026, 3, 10, 9, 5),
+    )
+    session.add_all([org, board, closed, current, inbox])
+    session.add_all(
+        [
+            ActivityEvent(
+                event_type="task.run_failed",
+                task_id=closed.id,
+                created_at=datetime(2026, 3, 10, 10, 25),
+            ),
+            ActivityEvent(
+                event_type="task.updated",
+                task_id=closed.id,
+                created_at=datetime(2026, 3, 10, 10, 26),
+            ),
+            ActivityEvent(
+                event_type="task.updated",
+                task_id=current.id,
+                created_at=datetime(2026, 3, 10, 15, 5),
+            ),
+        ],
+    )
+    await session.commit()
+    return board
+
+
+def test_digest_quantile_tracks_exact_median() -> None:
+    metrics = HourlyMetrics()
+    for hours in (0.5, 2.0, 3.0, 40.0, 100.0):
+        metrics.add_cycle_time(hours)
+    other = HourlyMetrics()
+    other.add_cycle_time(0.0)
+    metrics.merge(other)
+
+    median = digest_quantile(metrics.cycle_time_digest, 0.5)
+
+    assert median is not None
+    assert median == pytest.approx(2.5, rel=0.05)
+    assert digest_quantile(metrics.cycle_time_digest, 0.0) == 0.0
+    assert digest_quantile({}, 0.5) is None
+
+
+def test_digest_quantile_interpolates_between_ranks() -> None:
+    metrics = HourlyMetrics()
+    metrics.add_cycle_time(1.0)
+    metrics.add_cycle_time(3.0)
+
+    # Matches percentile_cont over [1, 3] rather than picking either sample.
+    assert digest_quantile(metrics.cycle_time_digest, 0.5) == pytest.approx(2.0, rel=0.05)
+    assert digest_quantile(metrics.cycle_time_digest, 0.25) == pytest.approx(1.5, rel=0.05)
+    assert digest_quantile(metrics.cycle_time_digest, 1.0) == pytest.approx(3.0, rel=0.05)
+
+
+@pytest.mark.asyncio
+async def test_rollup_job_advances_watermark_and_is_idempotent(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "dashboard_rollup_backfill_hours", 24)
+    monkeypatch.setattr(settings, "dashboard_rollup_max_hours_per_run", 20)
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+    async with session_maker() as session:
+        board = await _seed(session)
+
+        first = await roll_up_closed_hours(session, now=NOW)
+        second = await roll_up_closed_hours(session, now=NOW)
+        caught_up = await roll_up_closed_hours(session, now=NOW)
+
+        assert first.window_start == datetime(2026, 3, 9, 15)
+        assert first.window_end == datetime(2026, 3, 10, 11)
+        assert second.window_end == datetime(2026, 3, 10, 15)
+        assert caught_up.row_count == 0
+
+        # Rewinding the watermark replays the chunk without duplicating rows.
+        watermark = await session.get(MetricsRollupWatermark, dashboard_rollups.WATERMARK_NAME)
+        assert watermark is not None
+        watermark.rolled_through = datetime(2026, 3, 10, 9)
+        session.add(watermark)
+        await session.commit()
+        await roll_up_closed_hours(session, now=NOW)
+
+        rows = {
+            row.bucket_start: row
+            for row in await session.exec(
+                select(BoardMetricsRollup).where(BoardMetricsRollup.board_id == board.id),
+            )
+        }
+        assert sorted(rows) == [datetime(2026, 3, 10, 9), datetime(2026, 3, 10, 10)]
+        assert rows[datetime(2026, 3, 10, 9)].wip_inbox == 1
+        closed_hour = rows[datetime(2026, 3, 10, 10)]
+        assert closed_hour.throughput_count == 1
+        assert closed_hour.cycle_time_sum_hours == pytest.approx(2.0)
+        assert (closed_hour.error_count, closed_hour.event_count) == (1, 2)
+        assert (await session.exec(select(func.count()).select_from(BoardMetricsRollup))).one() == 2
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_hourly_metrics_combine_rollups_with_live_tail(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "dashboard_rollup_backfill_hours", 12)
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+    async with session_maker() as session:
+        board = await _seed(session)
+        start = NOW - timedelta(hours=24)
+        live_only = await hourly_metrics(session, [board.id], start=start, end=NOW)
+
+        await roll_up_closed_hours(session, now=NOW)
+        # Moving the closed-hour task to the current hour takes it out of its rolled-up hour.
+        closed = (await session.exec(select(Task).where(Task.title == "closed hour"))).one()
+        closed.status = "done"
+        closed.updated_at = NOW
+        session.add(closed)
+        await session.commit()
+        combined = await hourly_metrics(session, [board.id], start=start, end=NOW)
+        tail = await collect_hourly_metrics(
+            session,
+            start=datetime(2026, 3, 10, 15),
+            end=NOW,
+            board_ids=[board.id],
+        )
+        assert await hourly_metrics(session, [], start=start, end=NOW) == {}
+
+    moved_from = combined[datetime(2026, 3, 10, 10)]
+    assert (moved_from.throughput_count, moved_from.cycle_time_count) == (0, 0)
+    assert moved_from.wip_review == 0
+    assert moved_from.event_count == live_only[datetime(2026, 3, 10, 10)].event_count
+    assert combined[datetime(2026, 3, 10, 9)] == live_only[datetime(2026, 3, 10, 9)]
+    assert combined[datetime(2026, 3, 10, 15)] == tail[(board.id, datetime(2026, 3, 10, 15))]
+    assert combined[datetime(2026, 3, 10, 15)].throughput_count == 1
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_task_edits_after_rollup_re_roll_their_old_hours(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "dashboard_rollup_backfill_hours", 12)
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+    async with session_maker() as session:
+        board = await _seed(session)
+        await roll_up_closed_hours(session, now=NOW)
+        closed = (await session.exec(select(Task).where(Task.title == "closed hour"))).one()
+        inbox = (await session.exec(select(Task).where(Task.title == "inbox"))).one()
+        # Still in review but touched again in a later (also closed) hour ...
+        closed.updated_at = datetime(2026, 3, 10, 12, 40)
+        # ... and an inbox task that moved to done.
+        inbox.status = "done"
+        inbox.updated_at = datetime(2026, 3, 10, 13, 15)
+        session.add_all([closed, inbox])
+        await session.commit()
+        marked = len(list(await session.exec(select(BoardMetricsDirtyHour.id))))
+
+        start = datetime(2026, 3, 10, 4)
+        live = await collect_hourly_metrics(session, start=start, end=NOW, board_ids=[board.id])
+        read_before_job = await hourly_metrics(session, [board.id], start=start, end=NOW)
+        result = await roll_up_closed_hours(session, now=NOW)
+        read_after_job = await hourly_metrics(session, [board.id], start=start, end=NOW)
+        rows = {
+            row.bucket_start: row
+            for row in await session.exec(
+                select(BoardMetricsRollup).where(BoardMetricsRollup.board_id == board.id),
+            )
+        }
+        remaining_marks = list(await session.exec(select(BoardMetricsDirtyHour.bucket_start)))
+    await engine.dispose()
+
+    expected = {bucket: values for (_, bucket), values in live.items()}
+    assert marked > 0
+    assert read_before_job == expected
+    assert read_after_job == expected
+    assert result.rerolled_count == 4  # hours 9, 10, 12 and 13
+    # Only marks for the still-open hour wait for that hour to be rolled up.
+    assert all(bucket >= datetime(2026, 3, 10, 15) for bucket in remaining_marks)
+    # Hour 10 keeps only its activity events; hour 9 lost its inbox task.
+    assert rows[datetime(2026, 3, 10, 10)].throughput_count == 0
+    assert rows[datetime(2026, 3, 10, 10)].event_count == 2
+    assert datetime(2026, 3, 10, 9) not in rows
+    assert sum(values.throughput_count for values in read_after_job.values()) == 2
+
+
+@pytest.mark.asyncio
+async def test_dashboard_metrics_assemble_from_hourly_metrics(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "dashboard_rollup_backfill_hours", 12)
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+    async with session_maker() as session:
+        board = await _seed(session)
+        await roll_up_closed_hours(session, now=NOW)
+    monkeypatch.setattr(metrics_api, "utcnow", lambda: NOW)
+    monkeypatch.setattr(metrics_api, "read_session_maker", session_maker)
+
+    result = await metrics_api._compute_dashboard_metrics("24h", [board.id])
+
+    throughput = {point.period: point.value for point in result.throughput.primary.points}
+    assert throughput[datetime(2026, 3, 10, 10)] == 1
+    assert throughput[datetime(2026, 3, 10, 15)] == 1
+    assert sum(point.value for point in result.throughput.comparison.points) == 0
+    error_rate = {point.period: point.value for point in result.error_rate.primary.points}
+    assert error_rate[datetime(2026, 3, 10, 10)] == pytest.approx(50.0)
+    assert result.kpis.error_rate_pct == pytest.approx(100 / 3)
+    assert result.kpis.median_cycle_time_hours_7d == pytest.approx(3.0, rel=0.05)
+    await engine.dispose()
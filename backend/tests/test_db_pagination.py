@@ -0,0 +1,130 @@
+# ruff: noqa: S101
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi_pagination import add_pagination
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel, col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.db.pagination import KeysetOrder, decode_cursor, encode_cursor, paginate
+from app.models.board_memory import BoardMemory
+from app.models.boards import Board
+from app.models.organizations import Organization
+from app.schemas.board_memory import BoardMemoryRead
+from app.schemas.pagination import DefaultLimitOffsetPage
+
+MEMORY_KEYSET = KeysetOrder(col(BoardMemory.created_at), col(BoardMemory.id))
+
+
+async def _seed(engine: AsyncEngine) -> list[BoardMemory]:
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+    org = Organization(id=uuid4(), name="org")
+    board = Board(id=uuid4(), organization_id=org.id, name="b", slug="b")
+    base = datetime(2026, 3, 1, 12, 0, 0)
+    # Two pairs share a timestamp so the id tiebreaker is exercised.
+    rows = [
+        BoardMemory(
+            board_id=board.id,
+            content=f"m{index}",
+            created_at=base + timedelta(seconds=index // 2),
+        )
+        for index in range(5)
+    ]
+    async with session_maker() as session:
+        session.add(org)
+        session.add(board)
+        session.add_all(rows)
+        await session.commit()
+    return sorted(rows, key=lambda row: (row.created_at, row.id.hex), reverse=True)
+
+
+def _build_app(engine: AsyncEngine) -> FastAPI:
+    app = FastAPI()
+    session_maker = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+
+    async def _session() -> AsyncIterator[AsyncSession]:
+        async with session_maker() as session:
+            yield session
+
+    session_dep = Depends(_session)
+
+    @app.get("/memory", response_model=DefaultLimitOffsetPage[BoardMemoryRead])
+    async def _keyset(session: AsyncSession = session_dep) -> object:
+        statement = select(BoardMemory).order_by(col(BoardMemory.created_at).desc())
+        return await paginate(session, statement, keyset=MEMORY_KEYSET)
+
+    @app.get("/offset-only", response_model=DefaultLimitOffsetPage[BoardMemoryRead])
+    async def _offset_only(session: AsyncSession = session_dep) -> object:
+        return await paginate(session, select(BoardMemory))
+
+    add_pagination(app)
+    return app
+
+
+def test_cursor_round_trip() -> None:
+    row_id = uuid4()
+    timestamp = datetime(2026, 3, 1, 12, 0, 0, 123456)
+
+    assert decode_cursor(encode_cursor(timestamp, row_id)) == (timestamp, row_id)
+
+
+def test_cursor_for_reads_leading_entity_of_joined_rows() -> None:
+    memory = BoardMemory(board_id=uuid4(), content="x", created_at=datetime(2026, 3, 1))
+
+    assert MEMORY_KEYSET.cursor_for((memory, object())) == MEMORY_KEYSET.cursor_for(memory)
+    assert MEMORY_KEYSET.cursor_for((None, memory)) is None
+
+
+@pytest.mark.asyncio
+async def test_keyset_pages_walk_listing_without_gaps_or_duplicates() -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    expected = await _seed(engine)
+    app = _build_app(engine)
+
+    seen: list[UUID] = []
+    totals: list[int | None] = []
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        params: dict[str, str | int] = {"limit": 2}
+        while True:
+            response = await client.get("/memory", params=params)
+            assert response.status_code == 200
+            body = response.json()
+            seen.extend(UUID(item["id"]) for item in body["items"])
+            totals.append(body["total"])
+            if body["next_cursor"] is None:
+                break
+            params = {"limit": 2, "cursor": body["next_cursor"], "include_total": "false"}
+
+    assert seen == [row.id for row in expected]
+    assert totals[0] == len(expected)
+    assert totals[1:] == [None] * (len(totals) - 1)
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_keyset_cursor_errors() -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    expected = await _seed(engine)
+    app = _build_app(engine)
+    cursor = encode_cursor(expected[0].created_at, expected[0].id)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        malformed = await client.get("/memory", params={"cursor": "not-a-cursor"})
+        unsupported = await client.get("/offset-only", params={"cursor": cursor})
+        offset_only = await client.get("/offset-only", params={"include_total": "false"})
+
+    assert malformed.status_code == 422
+    assert unsupported.status_code == 400
+    assert offset_only.status_code == 200
+    assert offset_only.json()["total"] is None
+    assert offset_only.json()["next_cursor"] is None
+    await engine.dispose()
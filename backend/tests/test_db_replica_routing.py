@@ -0,0 +1,139 @@
+# ruff: noqa: S101
+from __future__ import annotations
+
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.logging import reset_request_route_context, set_request_route_context
+from app.db import session as db_session
+from app.db.replicas import ReadRoutingSession, ReplicaLagMonitor, primary_reads, use_primary
+from app.models.organizations import Organization
+
+
+async def _engine_with_org(path: Path, name: str) -> AsyncEngine:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    async with AsyncSession(engine) as session:
+        session.add(Organization(id=uuid4(), name=name))
+        await session.commit()
+    return engine
+
+
+async def _names(session: AsyncSession) -> set[str]:
+    return set(await session.exec(select(Organization.name)))
+
+
+@pytest.mark.asyncio
+async def test_reads_use_fresh_replica_and_writes_pin_session_to_primary(
+    tmp_path: Path,
+) -> None:
+    primary = await _engine_with_org(tmp_path / "primary.db", "primary")
+    replica = await _engine_with_org(tmp_path / "replica.db", "replica")
+    monitor = ReplicaLagMonitor(replica, max_lag_seconds=5, check_interval_seconds=60)
+    maker = async_sessionmaker(
+        primary,
+        class_=AsyncSession,
+        sync_session_class=ReadRoutingSession,
+        expire_on_commit=False,
+        replica=replica,
+        replica_monitor=monitor,
+    )
+    try:
+        # Nothing is routed to the replica before its lag has been measured.
+        async with maker() as session:
+            assert await _names(session) == {"primary"}
+        await monitor.refresh()
+        assert monitor.lag_seconds == 0.0
+
+        async with maker() as session:
+            assert await _names(session) == {"replica"}
+            locked = await session.exec(select(Organization.name).with_for_update())
+            assert set(locked) == {"primary"}
+            session.add(Organization(id=uuid4(), name="written"))
+            await session.commit()
+            assert await _names(session) == {"primary", "written"}
+
+        async with maker() as session:
+            use_primary(session)
+            assert await _names(session) == {"primary", "written"}
+
+        # `primary_reads` only covers the statements inside the block.
+        async with maker() as session:
+            with primary_reads(session):
+                assert await _names(session) == {"primary", "written"}
+            assert await _names(session) == {"replica"}
+
+        monitor.lag_seconds = 30.0
+        async with maker() as session:
+            assert await _names(session) == {"primary", "written"}
+    finally:
+        await primary.dispose()
+        await replica.dispose()
+
+
+@pytest.mark.asyncio
+async def test_unmeasurable_lag_keeps_reads_on_primary(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    replica = await _engine_with_org(tmp_path / "replica.db", "replica")
+    monitor = ReplicaLagMonitor(replica, max_lag_seconds=5, check_interval_seconds=60)
+    try:
+        await monitor.refresh()
+        assert monitor.usable
+
+        # A standby whose WAL receiver is gone and has nothing replayed yields NULL.
+        async def _no_lag() -> None:
+            return None
+
+        monkeypatch.setattr(monitor, "_measure", _no_lag)
+        await monitor.refresh()
+        assert monitor.lag_seconds is None
+        assert not monitor.usable
+    finally:
+        await replica.dispose()
+
+
+@pytest.mark.asyncio
+async def test_get_session_routes_only_safe_methods_to_read_sessions(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    opened: list[str] = []
+
+    class _Maker:
+        def __init__(self, label: str) -> None:
+            self.label = label
+
+        def __call__(self) -> _Maker:
+            opened.append(self.label)
+            return self
+
+        async def __aenter__(self) -> _Maker:
+            return self
+
+        async def __aexit__(self, *_args: object) -> bool:
+            return False
+
+        @staticmethod
+        def in_transaction() -> bool:
+            return False
+
+    monkeypatch.setattr(db_session, "async_session_maker", _Maker("primary"))
+    monkeypatch.setattr(db_session, "read_session_maker", _Maker("read"))
+
+    for method in ("GET", "POST", None):
+        tokens = set_request_route_context(method, "/api/v1/boards")
+        try:
+            generator = db_session.get_session()
+            await generator.__anext__()
+            await generator.aclose()
+        finally:
+            reset_request_route_context(tokens)
+
+    assert opened == ["read", "primary", "primary"]
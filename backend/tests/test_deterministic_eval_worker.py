@@ -147,3 +147,56 @@ async def test_deterministic_eval_worker_scores_successful_run(
             assert row.latency_regression_pct < 0
     finally:
         await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_deterministic_eval_batch_worker_evaluates_each_run_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+    monkeypatch.setattr(deterministic_eval_execution, "async_session_maker", session_maker)
+
+    try:
+        async with session_maker() as session:
+            org = Organization(id=uuid4(), name="org")
+            session.add(org)
+            runs = [
+                RunTelemetry(
+                    id=uuid4(),
+                    organization_id=org.id,
+                    pack_key="batch-pack",
+                    tier="personal",
+                    success_bool=success,
+                    retries=0,
+                    latency_ms=100,
+                    format_contract_passed=True,
+                    approval_gate_passed=True,
+                    checks={},
+                    run_metadata={},
+                )
+                for success in (True, False)
+            ]
+            session.add_all(runs)
+            await session.commit()
+
+        task = QueuedTask(
+            task_type="deterministic_eval_batch",
+            payload={
+                "run_telemetry_ids": [str(run.id) for run in runs],
+                "queued_at": datetime.now(UTC).isoformat(),
+            },
+            created_at=datetime.now(UTC),
+            attempts=0,
+        )
+        await deterministic_eval_execution.execute_deterministic_eval_batch(task)
+        # A retried batch does not evaluate runs twice.
+        await deterministic_eval_execution.execute_deterministic_eval_batch(task)
+
+        async with session_maker() as session:
+            rows = list(await session.exec(select(DeterministicEval)))
+            assert sorted(row.run_telemetry_id for row in rows) == sorted(run.id for run in runs)
+            hard_by_run = {row.run_telemetry_id: row.hard_regression for row in rows}
+            assert hard_by_run == {runs[0].id: False, runs[1].id: True}
+    finally:
+        await engine.dispose()
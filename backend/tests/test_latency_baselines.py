@@ -0,0 +1,87 @@
+# ruff: noqa: INP001, S101
+"""Sliding-window latency baselines used by deterministic scoring."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from statistics import median
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.time import utcnow
+from app.models.latency_baselines import LatencyBaseline
+from app.models.organizations import Organization
+from app.models.run_telemetry import RunTelemetry
+from app.services import latency_baselines
+from app.services.control_plane import compute_deterministic_score
+
+
+def test_observe_latency_keeps_window_and_median_in_step(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(latency_baselines, "LATENCY_BASELINE_WINDOW", 5)
+    baseline = LatencyBaseline(organization_id=uuid4(), pack_key="pack", tier="personal")
+    samples = [300, 100, 0, 500, 200, 100, 900, 400, -5, 250]
+
+    for latency in samples:
+        latency_baselines.observe_latency(baseline, latency)
+
+    window = [latency for latency in samples if latency > 0][-5:]
+    assert baseline.recent_latencies_ms == window
+    assert baseline.sorted_latencies_ms == sorted(window)
+    assert baseline.median_latency_ms == median(window)
+
+
+def _run(organization_id: UUID, latency_ms: int, **kwargs: object) -> RunTelemetry:
+    return RunTelemetry(
+        organization_id=organization_id,
+        pack_key="engineering-delivery-pack",
+        tier="personal",
+        success_bool=True,
+        retries=0,
+        latency_ms=latency_ms,
+        format_contract_passed=True,
+        approval_gate_passed=True,
+        checks={},
+        run_metadata={},
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_baseline_is_seeded_once_then_slides_with_each_evaluation() -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            org = Organization(name="org")
+            session.add(org)
+            start = utcnow() - timedelta(minutes=10)
+            history = [
+                _run(org.id, latency, created_at=start + timedelta(minutes=index))
+                for index, latency in enumerate((100, 300, 0))
+            ]
+            first = _run(org.id, 150, created_at=start + timedelta(minutes=5))
+            # Recorded after `first`, so it is not part of the seeded history.
+            later = _run(org.id, 50, created_at=start + timedelta(minutes=6))
+            session.add_all([*history, first, later])
+            await session.commit()
+
+            first_score = await compute_deterministic_score(session, run=first)
+            await session.commit()
+            later_score = await compute_deterministic_score(session, run=later)
+            await session.commit()
+            baselines = list(await session.exec(select(LatencyBaseline)))
+    finally:
+        await engine.dispose()
+
+    assert first_score.details["baseline_latency_ms"] == 200.0
+    assert later_score.details["baseline_latency_ms"] == 150.0
+    assert len(baselines) == 1
+    assert baselines[0].recent_latencies_ms == [100, 300, 150, 50]
+    assert baselines[0].median_latency_ms == 125.0
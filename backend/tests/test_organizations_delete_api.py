@@ -4,15 +4,24 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from datetime import datetime
 from typing import Any
 from uuid import uuid4
 
 import pytest
 from fastapi import HTTPException, status
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.api import organizations
+from app.models.boards import Board
+from app.models.dashboard_rollups import BoardMetricsRollup
 from app.models.organization_members import OrganizationMember
 from app.models.organizations import Organization
+from app.models.tasks import Task
+from app.models.users import User
 from app.services.organizations import OrganizationContext
 
 
@@ -61,6 +70,7 @@ async def test_delete_my_org_cleans_dependents_before_organization_delete() -> N
         "board_memory",
         "board_webhook_payloads",
         "board_webhooks",
+        "board_metrics_rollups",
         "board_onboarding_sessions",
         "organization_board_access",
         "organization_invite_board_access",
@@ -103,3 +113,44 @@ async def test_delete_my_org_requires_owner_role() -> None:
     assert exc_info.value.status_code == status.HTTP_403_FORBIDDEN
     assert session.executed == []
     assert session.committed == 0
+
+
+@pytest.mark.asyncio
+async def test_delete_my_org_passes_foreign_key_checks() -> None:
+    """Every row referencing the organization's boards is deleted before the boards."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _enforce_foreign_keys(dbapi_connection: Any, _record: Any) -> None:
+        dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            org = Organization(id=uuid4(), name="org")
+            user = User(clerk_user_id="owner", email="owner@example.com")
+            member = OrganizationMember(organization_id=org.id, user_id=user.id, role="owner")
+            board = Board(organization_id=org.id, name="Board", slug="board")
+            session.add_all([org, user])
+            await session.flush()
+            session.add_all([member, board])
+            await session.flush()
+            session.add_all(
+                [
+                    Task(board_id=board.id, title="task"),
+                    BoardMetricsRollup(board_id=board.id, bucket_start=datetime(2026, 3, 1, 12)),
+                ],
+            )
+            await session.commit()
+
+            await organizations.delete_my_org(
+                session=session,
+                ctx=OrganizationContext(organization=org, member=member),
+            )
+
+            assert list(await session.exec(select(Board.id))) == []
+            assert list(await session.exec(select(BoardMetricsRollup.id))) == []
+            assert list(await session.exec(select(Organization.id))) == []
+    finally:
+        await engine.dispose()
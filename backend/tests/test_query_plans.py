@@ -0,0 +1,106 @@
+# ruff: noqa: S101
+"""EXPLAIN harness for hot feed, stream and dashboard queries.
+
+Each representative query is planned against a schema built from model
+metadata; a plain full-table scan of the hot table fails the test so index
+regressions show up before they reach production.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import asc, create_engine, desc, func, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.sql import Select
+from sqlmodel import SQLModel, col, select
+
+from app import models  # noqa: F401
+from app.models.activity_events import ActivityEvent
+from app.models.board_memory import BoardMemory
+from app.models.board_webhook_payloads import BoardWebhookPayload
+from app.models.tasks import Task
+
+SINCE = datetime(2026, 3, 1)
+BOARD_ID = uuid4()
+
+
+@pytest.fixture(scope="module")
+def engine() -> Engine:
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    return engine
+
+
+def _plan(engine: Engine, statement: Select[tuple[object, ...]]) -> list[str]:
+    compiled = statement.compile(engine, compile_kwargs={"literal_binds": True})
+    with engine.connect() as conn:
+        rows = conn.execute(text(f"EXPLAIN QUERY PLAN {compiled}")).all()
+    return [str(row[-1]) for row in rows]
+
+
+def _assert_index_plan(engine: Engine, statement: object, *, table: str, index: str) -> None:
+    plan = _plan(engine, statement)  # type: ignore[arg-type]
+    full_scans = [
+        detail for detail in plan if detail.startswith(f"SCAN {table}") and "INDEX" not in detail
+    ]
+    assert not full_scans, f"sequential scan on {table}: {plan}"
+    assert any(index in detail for detail in plan), f"{index} not used: {plan}"
+
+
+QUERIES = {
+    "activity_feed": (
+        select(ActivityEvent).order_by(desc(col(ActivityEvent.created_at))).limit(50),
+        "activity_events",
+        "ix_activity_events_created_at",
+    ),
+    "task_stream_events": (
+        select(ActivityEvent)
+        .where(col(ActivityEvent.task_id).in_([uuid4(), uuid4()]))
+        .where(col(ActivityEvent.created_at) >= SINCE)
+        .order_by(asc(col(ActivityEvent.created_at))),
+        "activity_events",
+        "ix_activity_events_task_id_created_at",
+    ),
+    "board_memory_stream": (
+        select(BoardMemory)
+        .where(col(BoardMemory.board_id) == BOARD_ID)
+        .where(col(BoardMemory.created_at) >= SINCE)
+        .order_by(col(BoardMemory.created_at)),
+        "board_memory",
+        "ix_board_memory_board_id_created_at",
+    ),
+    "dashboard_throughput": (
+        select(func.count())
+        .select_from(Task)
+        .where(col(Task.board_id).in_([BOARD_ID]))
+        .where(col(Task.status) == "review")
+        .where(col(Task.updated_at) >= SINCE),
+        "tasks",
+        "ix_tasks_board_id_status_updated_at",
+    ),
+    "webhook_payloads": (
+        select(BoardWebhookPayload)
+        .where(col(BoardWebhookPayload.board_id) == BOARD_ID)
+        .where(col(BoardWebhookPayload.webhook_id) == uuid4())
+        .order_by(col(BoardWebhookPayload.received_at).desc())
+        .limit(50),
+        "board_webhook_payloads",
+        "ix_board_webhook_payloads_board_id_webhook_id_received_at",
+    ),
+}
+
+
+@pytest.mark.parametrize("name", sorted(QUERIES))
+def test_hot_query_uses_index(engine: Engine, name: str) -> None:
+    statement, table, index = QUERIES[name]
+    _assert_index_plan(engine, statement, table=table, index=index)
+
+
+def test_harness_flags_sequential_scans(engine: Engine) -> None:
+    statement = select(BoardMemory).where(col(BoardMemory.content) == "x")
+
+    with pytest.raises(AssertionError, match="sequential scan on board_memory"):
+        _assert_index_plan(engine, statement, table="board_memory", index="ix_unused")
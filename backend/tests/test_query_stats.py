@@ -0,0 +1,183 @@
+# ruff: noqa: S101
+from __future__ import annotations
+
+import asyncio
+import logging
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sse_starlette.sse import EventSourceResponse
+from starlette.requests import Request
+
+from app.api import tasks as tasks_api
+from app.core import error_handling
+from app.core.error_handling import RequestIdMiddleware
+from app.core.time import utcnow
+from app.db import query_stats
+from app.db.query_stats import current_query_stats, instrument_engine
+
+
+class _CaptureHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+@pytest.mark.asyncio
+async def test_request_counts_statements_flags_repeats_and_sets_debug_headers(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(query_stats.settings, "sql_n_plus_one_threshold", 3)
+    monkeypatch.setattr(query_stats.settings, "sql_slow_statement_ms", 0)
+    monkeypatch.setattr(query_stats.settings, "sql_debug_headers", True)
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    instrument_engine(engine)
+    capture = _CaptureHandler()
+    query_stats.logger.addHandler(capture)
+    seen: list[int] = []
+
+    async def app(scope, receive, send):  # type: ignore[no-untyped-def]
+        async with engine.connect() as conn:
+            for item_id in range(4):
+                await conn.execute(text("SELECT :item_id"), {"item_id": item_id})
+            await conn.execute(text("SELECT 1"))
+        stats = current_query_stats()
+        assert stats is not None
+        seen.append(stats.statement_count)
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    sent: list[dict[str, object]] = []
+
+    async def send(message):  # type: ignore[no-untyped-def]
+        sent.append(message)
+
+    request_scope = {"type": "http", "method": "GET", "path": "/api/v1/tasks", "headers": []}
+    try:
+        await RequestIdMiddleware(app)(request_scope, lambda: None, send)
+        # Statements outside a request are not attributed to any request.
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 2"))
+    finally:
+        query_stats.logger.removeHandler(capture)
+        await engine.dispose()
+
+    assert seen == [5]
+    assert current_query_stats() is None
+    headers = dict(sent[0]["headers"])  # type: ignore[arg-type]
+    assert headers[b"x-db-query-count"] == b"5"
+    assert float(headers[b"x-db-time-ms"]) >= 0
+    repeated = [record for record in capture.records if record.getMessage() == "sql.n_plus_one"]
+    assert len(repeated) == 1
+    assert repeated[0].path == "/api/v1/tasks"  # type: ignore[attr-defined]
+    assert repeated[0].statement == "SELECT ?"  # type: ignore[attr-defined]
+
+
+@pytest.mark.asyncio
+async def test_slow_statements_are_logged_and_failures_keep_timers_balanced(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(query_stats.settings, "sql_slow_statement_ms", 1)
+    monkeypatch.setattr(query_stats, "perf_counter", iter([0.0, 10.0, 10.5]).__next__)
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    instrument_engine(engine)
+    capture = _CaptureHandler()
+    query_stats.logger.addHandler(capture)
+    try:
+        async with engine.connect() as conn:
+            with pytest.raises(Exception, match="no such table"):
+                await conn.execute(text("SELECT * FROM missing_table"))
+            await conn.execute(text("SELECT 1"))
+            pending = conn.sync_connection.info[query_stats._STARTED_AT_KEY]
+    finally:
+        query_stats.logger.removeHandler(capture)
+        await engine.dispose()
+
+    assert pending == []
+    slow = [record for record in capture.records if record.getMessage() == "sql.statement.slow"]
+    assert len(slow) == 1
+    assert slow[0].duration_ms == pytest.approx(500.0)  # type: ignore[attr-defined]
+    assert slow[0].request_id is None  # type: ignore[attr-defined]
+
+
+@pytest.mark.asyncio
+async def test_task_stream_polls_do_not_read_as_n_plus_one(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    monkeypatch.setattr(query_stats.settings, "sql_n_plus_one_threshold", 3)
+    monkeypatch.setattr(query_stats.settings, "sql_slow_statement_ms", 0)
+    monkeypatch.setattr(error_handling.settings, "sql_debug_headers", True)
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'stream.db'}")
+    instrument_engine(engine)
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    monkeypatch.setattr(
+        tasks_api,
+        "stream_session_maker",
+        async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False),
+    )
+    polls = 0
+    poll_task_stream = tasks_api.poll_task_stream
+
+    async def _counting_poll(*args: Any, **kwargs: Any) -> list[dict[str, str]]:
+        nonlocal polls
+        messages = await poll_task_stream(*args, **kwargs)
+        polls += 1
+        return messages
+
+    monkeypatch.setattr(tasks_api, "poll_task_stream", _counting_poll)
+    sleep = asyncio.sleep
+    monkeypatch.setattr(tasks_api.asyncio, "sleep", lambda _seconds: sleep(0))
+
+    async def receive() -> dict[str, object]:
+        # The client stays connected for several polls, then goes away.
+        while polls < 5:
+            await sleep(0)
+        return {"type": "http.disconnect"}
+
+    async def app(scope, receive, send):  # type: ignore[no-untyped-def]
+        request = Request(scope, receive)
+        generator = tasks_api._task_event_generator(
+            request=request,
+            board_id=uuid4(),
+            since_dt=utcnow(),
+        )
+        await EventSourceResponse(generator, ping=15)(scope, receive, send)
+
+    sent: list[dict[str, object]] = []
+
+    async def send(message):  # type: ignore[no-untyped-def]
+        sent.append(message)
+
+    capture = _CaptureHandler()
+    query_stats.logger.addHandler(capture)
+    error_handling.logger.addHandler(capture)
+    error_handling.logger.setLevel(logging.DEBUG)
+    request_scope = {"type": "http", "method": "GET", "path": "/api/v1/tasks/stream", "headers": []}
+    try:
+        await RequestIdMiddleware(app)(request_scope, receive, send)
+    finally:
+        query_stats.logger.removeHandler(capture)
+        error_handling.logger.removeHandler(capture)
+        await engine.dispose()
+
+    assert polls >= 5
+    messages = [record.getMessage() for record in capture.records]
+    assert "sql.n_plus_one" not in messages
+    headers = dict(sent[0]["headers"])  # type: ignore[arg-type]
+    assert b"x-db-query-count" not in headers
+    complete = next(
+        record for record in capture.records if record.getMessage() == "http.request.complete"
+    )
+    # Every poll's statements still count toward the request.
+    assert complete.db_query_count >= 5  # type: ignore[attr-defined]
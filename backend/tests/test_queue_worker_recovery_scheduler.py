@@ -4,6 +4,7 @@ from __future__ import annotations
 import pytest
 
 from app.services import queue_worker
+from app.services.dashboard_rollups import RollupRunResult
 
 
 class _SessionContext:
@@ -94,3 +95,27 @@ async def test_run_recovery_scheduler_once_skips_when_migrations_pending(
     executed = await queue_worker.run_recovery_scheduler_once()
 
     assert executed is False
+
+
+@pytest.mark.asyncio
+async def test_run_dashboard_rollup_once_rolls_up_when_enabled(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sessions: list[object] = []
+
+    async def _roll_up(session):
+        sessions.append(session)
+        return RollupRunResult(window_start=None, window_end=None, row_count=0)
+
+    monkeypatch.setattr(queue_worker.settings, "dashboard_rollup_enabled", True)
+    monkeypatch.setattr(queue_worker, "is_scheduler_migration_ready", _ready_true, raising=False)
+    monkeypatch.setattr(queue_worker, "roll_up_closed_hours", _roll_up)
+    monkeypatch.setattr(queue_worker, "async_session_maker", lambda: _SessionContext())
+
+    assert await queue_worker.run_dashboard_rollup_once() is True
+    assert len(sessions) == 1
+
+    monkeypatch.setattr(queue_worker.settings, "dashboard_rollup_enabled", False)
+
+    assert await queue_worker.run_dashboard_rollup_once() is False
+    assert len(sessions) == 1
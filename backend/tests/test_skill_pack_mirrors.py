@@ -0,0 +1,161 @@
+# ruff: noqa: INP001, S101
+"""Git-backed skill pack sync tests: cached mirrors and incremental re-sync."""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.organizations import Organization
+from app.models.skills import MarketplaceSkill, SkillPack
+from app.services.skill_packs import discovery, mirrors
+from app.services.skill_packs import sync as skill_pack_sync
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        [
+            "git",
+            "-C",
+            str(repo),
+            "-c",
+            "user.name=test",
+            "-c",
+            "user.email=test@example.com",
+            *args,
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+
+def _commit_skill(repo: Path, name: str, body: str = "") -> str:
+    skill_dir = repo / "skills" / name
+    skill_dir.mkdir(parents=True, exist_ok=True)
+    (skill_dir / "SKILL.md").write_text(f"# {name}\n{body}", encoding="utf-8")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-q", "-m", f"add {name}")
+    return _git(repo, "rev-parse", "HEAD")
+
+
+@pytest.mark.asyncio
+async def test_mirror_is_cloned_once_then_fetched_incrementally(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(mirrors.settings, "skill_pack_mirror_dir", str(tmp_path / "mirrors"))
+    origin = tmp_path / "origin"
+    origin.mkdir()
+    _git(origin, "init", "-q", "-b", "trunk")
+    first_commit = _commit_skill(origin, "alpha")
+
+    mirror = await mirrors.update_mirror(str(origin))
+    branch, commit = await mirrors.resolve_branch(mirror, "main")
+    assert mirror == mirrors.mirror_path(f"{origin}/")
+    # "main" does not exist, so the default branch is used.
+    assert (branch, commit) == ("trunk", first_commit)
+
+    second_commit = _commit_skill(origin, "beta")
+    calls: list[tuple[str, ...]] = []
+    real_run_git = mirrors.run_git
+
+    async def _recording_run_git(*args: str, timeout: float) -> str:
+        calls.append(args)
+        return await real_run_git(*args, timeout=timeout)
+
+    monkeypatch.setattr(mirrors, "run_git", _recording_run_git)
+    assert await mirrors.update_mirror(str(origin)) == mirror
+    branch, commit = await mirrors.resolve_branch(mirror, "trunk")
+    export_dir = tmp_path / "export"
+    export_dir.mkdir()
+    await mirrors.export_tree(mirror, commit, export_dir)
+
+    assert calls[0][:3] == ("--git-dir", str(mirror), "fetch")
+    assert not any("clone" in call for call in calls)
+    assert (branch, commit) == ("trunk", second_commit)
+    assert sorted(path.parent.name for path in export_dir.rglob("SKILL.md")) == ["alpha", "beta"]
+    assert not (export_dir / ".git").exists()
+
+
+@pytest.mark.asyncio
+async def test_failed_clone_leaves_no_mirror(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(mirrors.settings, "skill_pack_mirror_dir", str(tmp_path / "mirrors"))
+    missing = tmp_path / "missing"
+
+    with pytest.raises(mirrors.GitCommandError, match="git clone failed"):
+        await mirrors.update_mirror(str(missing))
+
+    assert list((tmp_path / "mirrors").iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_resync_parses_and_writes_only_changed_skills(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(mirrors.settings, "skill_pack_mirror_dir", str(tmp_path / "mirrors"))
+    # Local repositories are not valid pack sources outside tests.
+    monkeypatch.setattr(skill_pack_sync, "validate_pack_source_url", lambda _url: None)
+    parsed: list[str] = []
+    real_parse = discovery._parse_skill_file  # noqa: SLF001
+
+    def _recording_parse(skill_file: Path, fallback: str) -> tuple[str, str | None]:
+        parsed.append(skill_file.parent.name)
+        return real_parse(skill_file, fallback=fallback)
+
+    monkeypatch.setattr(discovery, "_parse_skill_file", _recording_parse)
+    origin = tmp_path / "origin"
+    origin.mkdir()
+    _git(origin, "init", "-q", "-b", "main")
+    _commit_skill(origin, "alpha")
+    _commit_skill(origin, "beta")
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            org = Organization(name="org")
+            pack = SkillPack(organization_id=org.id, name="pack", source_url=str(origin))
+            session.add_all([org, pack])
+            await session.commit()
+
+            first = await skill_pack_sync.run_skill_pack_sync(session, pack)
+            parsed_first = sorted(parsed)
+            parsed.clear()
+            second = await skill_pack_sync.run_skill_pack_sync(session, pack)
+            parsed_second = list(parsed)
+            _commit_skill(origin, "beta", body="Now with a description.\n")
+            third = await skill_pack_sync.run_skill_pack_sync(session, pack)
+            parsed_third = list(parsed)
+
+            skills = {
+                skill.name: skill
+                for skill in await session.exec(
+                    select(MarketplaceSkill).execution_options(populate_existing=True),
+                )
+            }
+    finally:
+        await engine.dispose()
+
+    assert (first.status, first.synced, first.created, first.updated) == ("succeeded", 2, 2, 0)
+    assert parsed_first == ["alpha", "beta"]
+    assert (second.synced, second.created, second.updated, second.unchanged) == (2, 0, 0, 2)
+    assert parsed_second == []
+    assert (third.synced, third.created, third.updated, third.unchanged) == (2, 0, 1, 1)
+    assert parsed_third == ["beta"]
+    assert skills["beta"].description == "Now with a description."
+    assert skills["beta"].category_key == "uncategorized"
+    assert skills["alpha"].source_blob_sha is not None
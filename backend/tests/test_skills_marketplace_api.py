@@ -4,12 +4,14 @@
 from __future__ import annotations
 
 import json
+from dataclasses import replace
 from pathlib import Path
 from uuid import uuid4
 
 import pytest
 from fastapi import APIRouter, FastAPI
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlmodel import SQLModel, col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -17,8 +19,8 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 from app.api.deps import require_org_admin
 from app.api.gateways import router as gateways_router
 from app.api.skills_marketplace import (
-    PackSkillCandidate,
-    _collect_pack_skills_from_repo,
+    _search_filter,
+    _search_tsquery,
     _validate_pack_source_url,
 )
 from app.api.skills_marketplace import router as skills_marketplace_router
@@ -28,6 +30,14 @@ from app.models.organization_members import OrganizationMember
 from app.models.organizations import Organization
 from app.models.skills import GatewayInstalledSkill, MarketplaceSkill, SkillPack
 from app.services.organizations import OrganizationContext
+from app.services.skill_packs import sync as skill_pack_sync
+from app.services.skill_packs.discovery import (
+    PackContentError,
+    PackSkillCandidate,
+    collect_pack_skills_from_repo,
+)
+from app.services.skill_packs.mirrors import GitCommandError
+from app.services.skill_packs.queue import QueuedSkillPackSync
 
 
 async def _make_engine() -> AsyncEngine:
@@ -282,7 +292,111 @@ async def test_list_marketplace_skills_marks_installed_cards() -> None:
 
 
 @pytest.mark.asyncio
-async def test_sync_pack_clones_and_upserts_skills(monkeypatch: pytest.MonkeyPatch) -> None:
+async def test_list_marketplace_skills_filters_by_facet_keys_and_pages_with_total() -> None:
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(
+        engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+    try:
+        async with session_maker() as session:
+            organization, gateway = await _seed_base(session)
+            skills = [
+                MarketplaceSkill(
+                    organization_id=organization.id,
+                    name=f"Skill {index}",
+                    category=category,
+                    risk=risk,
+                    source_url=f"https://example.com/skills/{index}",
+                )
+                for index, (category, risk) in enumerate(
+                    [
+                        ("  Testing ", "LOW"),
+                        ("testing", "high"),
+                        ("TESTING", "low"),
+                        (None, "low"),
+                        ("  ", None),
+                    ],
+                )
+            ]
+            session.add_all(skills)
+            await session.commit()
+            # Keys follow later edits too.
+            skills[1].risk = " Low"
+            session.add(skills[1])
+            await session.commit()
+            keys = [(skill.category_key, skill.risk_key) for skill in skills]
+
+        app = _build_test_app(session_maker, organization=organization)
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url="http://testserver",
+        ) as client:
+            testing_low = await client.get(
+                "/api/v1/skills/marketplace",
+                params={
+                    "gateway_id": str(gateway.id),
+                    "category": "Testing",
+                    "risk": "low",
+                    "limit": 2,
+                },
+            )
+            uncategorized = await client.get(
+                "/api/v1/skills/marketplace",
+                params={"gateway_id": str(gateway.id), "category": "uncategorized"},
+            )
+            past_end = await client.get(
+                "/api/v1/skills/marketplace",
+                params={"gateway_id": str(gateway.id), "limit": 2, "offset": 10},
+            )
+    finally:
+        await engine.dispose()
+
+    assert keys == [
+        ("testing", "low"),
+        ("testing", "low"),
+        ("testing", "low"),
+        ("uncategorized", "low"),
+        ("uncategorized", "uncategorized"),
+    ]
+    assert testing_low.status_code == 200
+    assert len(testing_low.json()) == 2
+    assert testing_low.headers["X-Total-Count"] == "3"
+    assert sorted(card["name"] for card in uncategorized.json()) == ["Skill 3", "Skill 4"]
+    assert past_end.json() == []
+    assert past_end.headers["X-Total-Count"] == "5"
+
+
+def test_search_tsquery_prefix_matches_every_word() -> None:
+    assert _search_tsquery("  Lint  fix!") == "lint:* & fix:*"
+    assert _search_tsquery("snake_case") == "snake:* & case:*"
+    assert _search_tsquery("':*&|") is None
+
+
+def test_postgres_search_keeps_substring_matches_on_every_column() -> None:
+    condition, ordering = _search_filter("lint", dialect_name="postgresql")
+    sql = str(condition.compile(dialect=postgresql.dialect()))
+
+    assert "marketplace_skills.search_vector @@ to_tsquery" in sql
+    for column in ("name", "description", "category", "risk", "source"):
+        assert f"marketplace_skills.{column} ILIKE" in sql
+    assert len(ordering) == 1
+
+
+def test_sqlite_search_matches_substrings_without_ranking() -> None:
+    condition, ordering = _search_filter("lint", dialect_name="sqlite")
+    sql = str(condition.compile(dialect=postgresql.dialect()))
+
+    assert "to_tsquery" not in sql
+    assert sql.count("ILIKE") == 5
+    assert ordering == []
+
+
+@pytest.mark.asyncio
+async def test_sync_pack_queues_job_and_worker_upserts_skills(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     engine = await _make_engine()
     session_maker = async_sessionmaker(
         engine,
@@ -322,35 +436,75 @@ async def test_sync_pack_clones_and_upserts_skills(monkeypatch: pytest.MonkeyPat
             ),
         ]
 
-        def _fake_collect_pack_skills(source_url: str) -> list[PackSkillCandidate]:
+        enqueued: list[QueuedSkillPackSync] = []
+        worker_sessions: list[AsyncSession] = []
+
+        async def _fake_discover_pack_skills(
+            *,
+            source_url: str,
+            branch: str,
+            known_blob_shas: dict[str, str],
+        ) -> skill_pack_sync.PackDiscovery:
             assert source_url == "https://github.com/sickn33/antigravity-awesome-skills"
-            return collected
+            assert branch == "main"
+            # No transaction is held open while git runs.
+            assert not any(session.in_transaction() for session in worker_sessions)
+            return skill_pack_sync.PackDiscovery(
+                changed=collected,
+                unchanged=[],
+                warnings=[],
+                commit="abc123",
+            )
 
         monkeypatch.setattr(
-            "app.api.skills_marketplace._collect_pack_skills",
-            _fake_collect_pack_skills,
+            skill_pack_sync,
+            "enqueue_skill_pack_sync",
+            lambda payload: enqueued.append(payload) or True,
         )
+        monkeypatch.setattr(skill_pack_sync, "discover_pack_skills", _fake_discover_pack_skills)
 
         async with AsyncClient(
             transport=ASGITransport(app=app),
             base_url="http://testserver",
         ) as client:
-            first_sync = await client.post(f"/api/v1/skills/packs/{pack.id}/sync")
-            second_sync = await client.post(f"/api/v1/skills/packs/{pack.id}/sync")
-
-        assert first_sync.status_code == 200
-        first_body = first_sync.json()
-        assert first_body["pack_id"] == str(pack.id)
-        assert first_body["synced"] == 2
-        assert first_body["created"] == 2
-        assert first_body["updated"] == 0
-
-        assert second_sync.status_code == 200
-        second_body = second_sync.json()
-        assert second_body["pack_id"] == str(pack.id)
-        assert second_body["synced"] == 2
-        assert second_body["created"] == 0
-        assert second_body["updated"] == 0
+            queued = await client.post(f"/api/v1/skills/packs/{pack.id}/sync")
+            # A sync that is already queued is not queued twice.
+            requeued = await client.post(f"/api/v1/skills/packs/{pack.id}/sync")
+
+            async with session_maker() as session:
+                worker_sessions.append(session)
+                stored = await SkillPack.objects.by_id(pack.id).first(session)
+                assert stored is not None
+                first_run = await skill_pack_sync.run_skill_pack_sync(session, stored)
+                second_run = await skill_pack_sync.run_skill_pack_sync(session, stored)
+                collected[1] = replace(collected[1], description="Beta, revised")
+                collected.append(
+                    PackSkillCandidate(
+                        name="Skill Gamma",
+                        description=None,
+                        source_url="https://github.com/sickn33/antigravity-awesome-skills/tree/main/skills/gamma",
+                    ),
+                )
+                third_run = await skill_pack_sync.run_skill_pack_sync(session, stored)
+
+            status_response = await client.get(f"/api/v1/skills/packs/{pack.id}/sync")
+
+        assert queued.status_code == 200
+        assert queued.json()["status"] == "queued"
+        assert requeued.json()["requested_at"] == queued.json()["requested_at"]
+        assert [payload.pack_id for payload in enqueued] == [pack.id]
+
+        assert first_run.status == "succeeded"
+        assert (first_run.synced, first_run.created, first_run.updated) == (2, 2, 0)
+        assert (second_run.synced, second_run.created, second_run.updated) == (2, 0, 0)
+        assert (third_run.synced, third_run.created, third_run.updated) == (3, 1, 1)
+
+        assert status_response.status_code == 200
+        status_body = status_response.json()
+        assert status_body["status"] == "succeeded"
+        assert status_body["commit"] == "abc123"
+        assert status_body["synced"] == 3
+        assert status_body["finished_at"] is not None
 
         async with session_maker() as session:
             synced_skills = (
@@ -360,7 +514,7 @@ async def test_sync_pack_clones_and_upserts_skills(monkeypatch: pytest.MonkeyPat
                     ),
                 )
             ).all()
-            assert len(synced_skills) == 2
+            assert len(synced_skills) == 3
             by_source = {skill.source_url: skill for skill in synced_skills}
             assert (
                 by_source[
@@ -384,7 +538,7 @@ async def test_sync_pack_clones_and_upserts_skills(monkeypatch: pytest.MonkeyPat
                 by_source[
                     "https://github.com/sickn33/antigravity-awesome-skills/tree/main/skills/beta"
                 ].description
-                == "Beta description"
+                == "Beta, revised"
             )
             assert (
                 by_source[
@@ -396,6 +550,46 @@ async def test_sync_pack_clones_and_upserts_skills(monkeypatch: pytest.MonkeyPat
         await engine.dispose()
 
 
+@pytest.mark.asyncio
+async def test_sync_records_git_failures_and_reraises_unexpected_errors(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    errors: list[Exception] = [
+        GitCommandError("git fetch failed"),
+        PackContentError("unable to read skills_index.json"),
+        RuntimeError("unexpected"),
+    ]
+
+    async def _failing_discover_pack_skills(**_kwargs: object) -> skill_pack_sync.PackDiscovery:
+        raise errors.pop(0)
+
+    monkeypatch.setattr(skill_pack_sync, "discover_pack_skills", _failing_discover_pack_skills)
+    try:
+        async with session_maker() as session:
+            organization, _gateway = await _seed_base(session)
+            pack = SkillPack(
+                organization_id=organization.id,
+                name="Pack",
+                source_url="https://github.com/org/repo",
+            )
+            session.add(pack)
+            await session.commit()
+
+            git_failure = await skill_pack_sync.run_skill_pack_sync(session, pack)
+            content_failure = await skill_pack_sync.run_skill_pack_sync(session, pack)
+            with pytest.raises(RuntimeError, match="unexpected"):
+                await skill_pack_sync.run_skill_pack_sync(session, pack)
+
+        assert (git_failure.status, git_failure.error) == ("failed", "git fetch failed")
+        assert content_failure.error == "unable to read skills_index.json"
+        assert pack.sync_status == "failed"
+        assert pack.sync_error == "unexpected"
+    finally:
+        await engine.dispose()
+
+
 def test_validate_pack_source_url_allows_https_github_repo_with_optional_dot_git() -> None:
     _validate_pack_source_url("https://github.com/org/repo")
     _validate_pack_source_url("https://github.com/org/repo.git")
@@ -750,7 +944,7 @@ def test_collect_pack_skills_from_repo_uses_root_index_when_present(tmp_path: Pa
         encoding="utf-8",
     )
 
-    skills = _collect_pack_skills_from_repo(
+    skills = collect_pack_skills_from_repo(
         repo_dir=repo_dir,
         source_url="https://github.com/sickn33/antigravity-awesome-skills",
         branch="main",
@@ -805,7 +999,7 @@ def test_collect_pack_skills_from_repo_supports_root_skill_md(tmp_path: Path) ->
         encoding="utf-8",
     )
 
-    skills = _collect_pack_skills_from_repo(
+    skills = collect_pack_skills_from_repo(
         repo_dir=repo_dir,
         source_url="https://github.com/rohunvora/x-research-skill",
         branch="main",
@@ -830,7 +1024,7 @@ def test_collect_pack_skills_from_repo_supports_top_level_skill_folders(
     (first / "SKILL.md").write_text("# Content Idea Generator\n", encoding="utf-8")
     (second / "SKILL.md").write_text("# Homepage Audit\n", encoding="utf-8")
 
-    skills = _collect_pack_skills_from_repo(
+    skills = collect_pack_skills_from_repo(
         repo_dir=repo_dir,
         source_url="https://github.com/BrianRWagner/ai-marketing-skills",
         branch="main",
@@ -847,6 +1041,30 @@ def test_collect_pack_skills_from_repo_supports_top_level_skill_folders(
     )
 
 
+def test_collect_pack_skills_from_repo_skips_unchanged_blobs(tmp_path: Path) -> None:
+    repo_dir = tmp_path / "repo"
+    for name in ("alpha", "beta"):
+        (repo_dir / "skills" / name).mkdir(parents=True)
+        (repo_dir / "skills" / name / "SKILL.md").write_text(f"# {name}\n", encoding="utf-8")
+    source_url = "https://github.com/example/pack"
+    unchanged: list[str] = []
+
+    skills = collect_pack_skills_from_repo(
+        repo_dir=repo_dir,
+        source_url=source_url,
+        branch="main",
+        blob_shas={"skills/alpha/SKILL.md": "sha-a", "skills/beta/SKILL.md": "sha-b2"},
+        known_blob_shas={
+            f"{source_url}/tree/main/skills/alpha": "sha-a",
+            f"{source_url}/tree/main/skills/beta": "sha-b1",
+        },
+        unchanged_source_urls=unchanged,
+    )
+
+    assert unchanged == [f"{source_url}/tree/main/skills/alpha"]
+    assert [(skill.name, skill.blob_sha) for skill in skills] == [("beta", "sha-b2")]
+
+
 def test_collect_pack_skills_from_repo_streams_large_index(tmp_path: Path) -> None:
     repo_dir = tmp_path / "repo"
     repo_dir.mkdir()
@@ -869,7 +1087,7 @@ def test_collect_pack_skills_from_repo_streams_large_index(tmp_path: Path) -> No
         encoding="utf-8",
     )
 
-    skills = _collect_pack_skills_from_repo(
+    skills = collect_pack_skills_from_repo(
         repo_dir=repo_dir,
         source_url="https://github.com/example/oversized-pack",
         branch="main",
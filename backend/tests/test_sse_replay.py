@@ -0,0 +1,132 @@
+# ruff: noqa: S101
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from app.services.sse_replay import ReplayCursor, SseReplayBuffer
+
+
+def _ts(offset_seconds: int = 0) -> datetime:
+    return datetime(2026, 3, 1, 12, 0, 0) + timedelta(seconds=offset_seconds)
+
+
+def test_record_is_idempotent_per_key_and_ids_are_monotonic() -> None:
+    buffer = SseReplayBuffer(max_entries=10)
+    channel = ("tasks", uuid4())
+
+    first = buffer.record(channel, key="a", event="task", data="{}", cursor=_ts())
+    again = buffer.record(channel, key="a", event="task", data="{}", cursor=_ts())
+    second = buffer.record(channel, key="b", event="task", data="{}", cursor=_ts())
+
+    assert again is first
+    assert second.seq > first.seq
+    assert buffer.lookup(channel, "b") is second
+
+
+def test_event_id_round_trips_seq_and_cursor() -> None:
+    buffer = SseReplayBuffer(max_entries=10)
+    cursor = datetime(2026, 3, 1, 12, 0, 0, 123456)
+    entry = buffer.record(("tasks", uuid4()), key="a", event="task", data="{}", cursor=cursor)
+
+    position = buffer.parse_event_id(entry.event_id)
+
+    assert position is not None
+    assert position.seq == entry.seq
+    assert position.cursor == cursor
+    assert position.same_generation is True
+    other = SseReplayBuffer(max_entries=10).parse_event_id(entry.event_id)
+    assert other is not None
+    assert other.same_generation is False
+
+
+def test_parse_event_id_rejects_garbage() -> None:
+    buffer = SseReplayBuffer(max_entries=10)
+    assert buffer.parse_event_id(None) is None
+    assert buffer.parse_event_id("") is None
+    assert buffer.parse_event_id("abc") is None
+    assert buffer.parse_event_id("gen-x-1") is None
+
+
+def test_cursor_resumes_from_buffer_after_last_event_id() -> None:
+    buffer = SseReplayBuffer(max_entries=10)
+    channel = ("board_memory", uuid4(), None)
+    entries = [
+        buffer.record(channel, key=index, event="memory", data=str(index), cursor=_ts(index))
+        for index in range(4)
+    ]
+
+    cursor = ReplayCursor(buffer, last_event_id=entries[1].event_id, since=_ts(-60))
+    messages = cursor.resume([channel])
+
+    assert [message["data"] for message in messages] == ["2", "3"]
+    assert messages[-1]["id"] == entries[3].event_id
+    assert cursor.last_seen == _ts(3)
+    assert cursor.deliver(entries) == []
+
+
+def test_cursor_falls_back_to_db_cursor_when_buffer_was_evicted() -> None:
+    buffer = SseReplayBuffer(max_entries=2)
+    channel = ("tasks", uuid4())
+    entries = [
+        buffer.record(channel, key=index, event="task", data=str(index), cursor=_ts(index))
+        for index in range(5)
+    ]
+
+    cursor = ReplayCursor(buffer, last_event_id=entries[0].event_id, since=_ts(-60))
+
+    assert cursor.resume([channel]) == []
+    assert cursor.last_seen == _ts(0)
+
+
+def test_cursor_uses_encoded_cursor_for_ids_from_other_processes() -> None:
+    foreign = SseReplayBuffer(max_entries=10)
+    entry = foreign.record(("tasks", uuid4()), key="a", event="task", data="{}", cursor=_ts(5))
+    buffer = SseReplayBuffer(max_entries=10)
+
+    cursor = ReplayCursor(buffer, last_event_id=entry.event_id, since=_ts(-60))
+
+    assert cursor.resume([("tasks", uuid4())]) == []
+    assert cursor.last_seen == _ts(5)
+    assert cursor.last_seq == 0
+
+
+def test_deliver_merges_channels_in_id_order_without_duplicates() -> None:
+    buffer = SseReplayBuffer(max_entries=10)
+    board_a = ("task_comments", uuid4())
+    board_b = ("task_comments", uuid4())
+    first = buffer.record(board_b, key="b1", event="comment", data="b1", cursor=_ts(2))
+    second = buffer.record(board_a, key="a1", event="comment", data="a1", cursor=_ts(1))
+    cursor = ReplayCursor(buffer, last_event_id=None, since=_ts(0))
+
+    messages = cursor.deliver([second, first])
+
+    assert [message["data"] for message in messages] == ["b1", "a1"]
+    assert cursor.deliver([first, second]) == []
+    assert cursor.last_seen == _ts(2)
+
+
+def test_deliver_keeps_entries_with_a_lower_id_first_seen_later() -> None:
+    buffer = SseReplayBuffer(max_entries=10)
+    board_a = ("agents", uuid4())
+    board_b = ("agents", uuid4())
+    # Recorded by another connection's poll before this connection saw the row.
+    earlier = buffer.record(board_a, key="a1", event="agent", data="a1", cursor=_ts(2))
+    later = buffer.record(board_b, key="b1", event="agent", data="b1", cursor=_ts(2))
+    cursor = ReplayCursor(buffer, last_event_id=None, since=_ts(0))
+
+    assert [message["data"] for message in cursor.deliver([later])] == ["b1"]
+    assert [message["data"] for message in cursor.deliver([earlier, later])] == ["a1"]
+    assert cursor.deliver([earlier, later]) == []
+
+
+def test_record_evicts_least_recently_written_channel() -> None:
+    buffer = SseReplayBuffer(max_entries=10, max_channels=2)
+    first, second, third = (("tasks", uuid4()) for _ in range(3))
+    old = buffer.record(first, key="a", event="task", data="{}", cursor=_ts())
+    buffer.record(second, key="a", event="task", data="{}", cursor=_ts())
+    buffer.record(first, key="b", event="task", data="{}", cursor=_ts())
+    buffer.record(third, key="a", event="task", data="{}", cursor=_ts())
+
+    assert buffer.lookup(first, "a") is old
+    assert buffer.lookup(second, "a") is None
@@ -0,0 +1,150 @@
+# ruff: noqa: S101
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException, status
+
+from app.api import streams as streams_api
+from app.api.deps import ActorContext
+from app.services.sse_replay import ReplayCursor, SseReplayBuffer
+
+
+class _FakeWebSocket:
+    def __init__(self) -> None:
+        self.sent: list[dict[str, Any]] = []
+
+    async def send_text(self, text: str) -> None:
+        self.sent.append(json.loads(text))
+
+
+class _FakeSessionMaker:
+    def __call__(self) -> _FakeSessionMaker:
+        return self
+
+    async def __aenter__(self) -> object:
+        return object()
+
+    async def __aexit__(self, *_args: object) -> None:
+        return None
+
+
+def _connection() -> tuple[streams_api.StreamConnection, _FakeWebSocket]:
+    websocket = _FakeWebSocket()
+    caller = streams_api.StreamActor(actor=ActorContext(actor_type="user"))
+    return streams_api.StreamConnection(websocket, caller), websocket  # type: ignore[arg-type]
+
+
+def _subscription(buffer: SseReplayBuffer, **kwargs: Any) -> streams_api.StreamSubscription:
+    return streams_api.StreamSubscription(
+        stream=kwargs.get("stream", "tasks"),
+        board_id=kwargs.get("board_id", uuid4()),
+        is_chat=None,
+        cursor=ReplayCursor(buffer, last_event_id=None, since=datetime(2026, 3, 1)),
+    )
+
+
+def test_event_frame_embeds_serialized_data() -> None:
+    board_id = uuid4()
+    subscription = _subscription(SseReplayBuffer(max_entries=10), board_id=board_id)
+
+    frame = json.loads(
+        streams_api.event_frame(
+            subscription,
+            {"id": "g-1-0", "event": "task", "data": '{"task": {"title": "x"}}'},
+        ),
+    )
+
+    assert frame == {
+        "type": "event",
+        "stream": "tasks",
+        "board_id": str(board_id),
+        "is_chat": None,
+        "id": "g-1-0",
+        "event": "task",
+        "data": {"task": {"title": "x"}},
+    }
+
+
+@pytest.mark.asyncio
+async def test_invalid_control_message_returns_error_frame() -> None:
+    connection, websocket = _connection()
+
+    await connection.handle('{"action": "subscribe", "stream": "nope"}')
+    await connection.handle("not json")
+
+    assert [frame["status"] for frame in websocket.sent] == [422, 422]
+    assert connection.subscriptions == {}
+
+
+@pytest.mark.asyncio
+async def test_subscribe_and_unsubscribe_round_trip(monkeypatch: pytest.MonkeyPatch) -> None:
+    buffer = SseReplayBuffer(max_entries=10)
+    board_id = uuid4()
+
+    async def _authorize(_session: object, **_kwargs: object) -> streams_api.StreamSubscription:
+        return _subscription(buffer, board_id=board_id)
+
+    monkeypatch.setattr(streams_api, "async_session_maker", _FakeSessionMaker())
+    monkeypatch.setattr(streams_api, "authorize_subscription", _authorize)
+    connection, websocket = _connection()
+    message = {"stream": "tasks", "board_id": str(board_id)}
+
+    await connection.handle(json.dumps({"action": "subscribe", **message}))
+    assert websocket.sent[-1]["type"] == "subscribed"
+    assert list(connection.subscriptions) == [("tasks", board_id, None)]
+
+    await connection.handle(json.dumps({"action": "unsubscribe", **message}))
+    assert websocket.sent[-1]["type"] == "unsubscribed"
+    assert connection.subscriptions == {}
+
+
+@pytest.mark.asyncio
+async def test_subscribe_surfaces_access_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def _authorize(_session: object, **_kwargs: object) -> streams_api.StreamSubscription:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
+
+    monkeypatch.setattr(streams_api, "async_session_maker", _FakeSessionMaker())
+    monkeypatch.setattr(streams_api, "authorize_subscription", _authorize)
+    connection, websocket = _connection()
+
+    await connection.handle(
+        json.dumps({"action": "subscribe", "stream": "approvals", "board_id": str(uuid4())}),
+    )
+
+    assert websocket.sent[-1]["type"] == "error"
+    assert websocket.sent[-1]["status"] == status.HTTP_403_FORBIDDEN
+    assert connection.subscriptions == {}
+
+
+@pytest.mark.asyncio
+async def test_poll_once_forwards_messages_per_subscription(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    buffer = SseReplayBuffer(max_entries=10)
+    subscription = _subscription(buffer)
+    entry = buffer.record(
+        ("tasks", subscription.board_id),
+        key="a",
+        event="task",
+        data='{"n": 1}',
+        cursor=datetime(2026, 3, 1, 0, 0, 1),
+    )
+
+    async def _poll(_session: object) -> list[dict[str, str]]:
+        return subscription.cursor.deliver([entry])
+
+    monkeypatch.setattr(streams_api, "stream_session_maker", _FakeSessionMaker())
+    monkeypatch.setattr(subscription, "poll", _poll)
+    connection, websocket = _connection()
+    connection.subscriptions[subscription.key] = subscription
+
+    await connection.poll_once()
+    await connection.poll_once()
+
+    assert [frame["data"] for frame in websocket.sent] == [{"n": 1}]
+    assert websocket.sent[0]["id"] == entry.event_id
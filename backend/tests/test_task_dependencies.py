@@ -37,30 +37,61 @@ def test_blocked_by_dependency_ids_flags_not_done_and_missing_status():
 
 
 @pytest.mark.parametrize(
-    ("nodes", "edges", "expected"),
+    ("edges", "task_id", "depends_on", "expected"),
     [
-        # A -> B -> C (acyclic)
+        # A -> B -> C exists; C -> A closes a cycle.
         (
-            [UUID(int=1), UUID(int=2), UUID(int=3)],
-            {UUID(int=1): {UUID(int=2)}, UUID(int=2): {UUID(int=3)}},
-            False,
+            [(UUID(int=1), UUID(int=2)), (UUID(int=2), UUID(int=3))],
+            UUID(int=3),
+            [UUID(int=1)],
+            True,
         ),
-        # A -> B -> C -> A (cycle)
+        # A -> B -> C exists; A -> C stays acyclic.
         (
-            [UUID(int=1), UUID(int=2), UUID(int=3)],
-            {UUID(int=1): {UUID(int=2)}, UUID(int=2): {UUID(int=3)}, UUID(int=3): {UUID(int=1)}},
-            True,
+            [(UUID(int=1), UUID(int=2)), (UUID(int=2), UUID(int=3))],
+            UUID(int=1),
+            [UUID(int=3)],
+            False,
         ),
-        # Self-loop (cycle)
+        # Replacing A's own edges never counts them toward a cycle.
         (
-            [UUID(int=1)],
-            {UUID(int=1): {UUID(int=1)}},
-            True,
+            [(UUID(int=1), UUID(int=2))],
+            UUID(int=1),
+            [UUID(int=3)],
+            False,
         ),
     ],
 )
-def test_has_cycle(nodes, edges, expected):
-    assert task_dependencies._has_cycle(nodes, edges) is expected
+def test_dependency_graph_would_create_cycle(edges, task_id, depends_on, expected):
+    graph = task_dependencies.DependencyGraph.from_edges(edges, version=0)
+    assert graph.would_create_cycle(task_id, depends_on) is expected
+
+
+def test_dependency_graph_tracks_reverse_edges():
+    a, b, c = uuid4(), uuid4(), uuid4()
+    graph = task_dependencies.DependencyGraph.from_edges([(a, c), (b, c)], version=3)
+
+    assert graph.dependents_of(c) == {a, b}
+    assert graph.dependents_of(a) == set()
+
+
+def test_dependency_graph_cache_is_keyed_by_version():
+    cache = task_dependencies.DependencyGraphCache(max_entries=1)
+    board_a, board_b = uuid4(), uuid4()
+    graph = task_dependencies.DependencyGraph(version=2)
+    cache.put(board_a, graph)
+
+    assert cache.get(board_a, 2) is graph
+    assert cache.get(board_a, 3) is None
+    cache.put(board_b, task_dependencies.DependencyGraph(version=0))
+    assert cache.get(board_a, 2) is None
+
+
+def _patch_graph(monkeypatch, edges):
+    async def _fake_load(_session, *, board_id):
+        return task_dependencies.DependencyGraph.from_edges(edges, version=0)
+
+    monkeypatch.setattr(task_dependencies, "load_dependency_graph", _fake_load)
 
 
 @dataclass
@@ -244,13 +275,10 @@ async def test_validate_dependency_update_rejects_cycles(monkeypatch):
     # existing_ids contains dependency
     existing_ids = {task_b}
 
-    # task_ids list on board
-    all_task_ids = [task_a, task_b]
-
     # existing edges: B depends on A, then set A depends on B => cycle
-    existing_edges = [(task_b, task_a)]
+    _patch_graph(monkeypatch, [(task_b, task_a)])
 
-    session = _FakeSession(exec_results=[existing_ids, all_task_ids, existing_edges])
+    session = _FakeSession(exec_results=[existing_ids])
 
     with pytest.raises(task_dependencies.HTTPException) as exc:
         await task_dependencies.validate_dependency_update(
@@ -264,17 +292,16 @@ async def test_validate_dependency_update_rejects_cycles(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_validate_dependency_update_returns_deduped_ids_when_ok():
+async def test_validate_dependency_update_returns_deduped_ids_when_ok(monkeypatch):
     board_id = uuid4()
     task_id = uuid4()
     dep1 = uuid4()
     dep2 = uuid4()
 
     existing_ids = {dep1, dep2}
-    all_task_ids = [task_id, dep1, dep2]
-    existing_edges: list[tuple[UUID, UUID]] = []
+    _patch_graph(monkeypatch, [])
 
-    session = _FakeSession(exec_results=[existing_ids, all_task_ids, existing_edges])
+    session = _FakeSession(exec_results=[existing_ids])
 
     normalized = await task_dependencies.validate_dependency_update(
         session,
@@ -312,12 +339,13 @@ async def test_replace_task_dependencies_deletes_then_adds(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_dependent_task_ids_returns_rows_as_list():
+async def test_dependent_task_ids_uses_reverse_edges(monkeypatch):
     board_id = uuid4()
     dep_task_id = uuid4()
     dependent_id = uuid4()
+    _patch_graph(monkeypatch, [(dependent_id, dep_task_id)])
 
-    session = _FakeSession(exec_results=[[dependent_id]])
+    session = _FakeSession(exec_results=[])
     result = await task_dependencies.dependent_task_ids(
         session,
         board_id=board_id,
@@ -191,3 +191,48 @@ async def test_dependency_queries_and_replace_and_dependents() -> None:
             assert blocked2 == [t3]
     finally:
         await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_dependency_graph_reloads_only_after_dependency_writes() -> None:
+    engine = await _make_engine()
+    try:
+        async with await _make_session(engine) as session:
+            board_id = uuid4()
+            t1, t2, t3 = uuid4(), uuid4(), uuid4()
+            await _seed_board_and_tasks(session, board_id=board_id, task_ids=[t1, t2, t3])
+            session.add(TaskDependency(board_id=board_id, task_id=t1, depends_on_task_id=t2))
+            await session.commit()
+
+            first = await td.load_dependency_graph(session, board_id=board_id)
+            assert first.depends_on == {t1: {t2}}
+
+            # Task edits leave the dependency version (and cached graph) alone.
+            task3 = await session.get(Task, t3)
+            assert task3 is not None
+            task3.status = td.DONE_STATUS
+            await session.commit()
+            assert await td.load_dependency_graph(session, board_id=board_id) is first
+
+            # A pending, uncommitted edit is visible but never cached.
+            await td.replace_task_dependencies(
+                session, board_id=board_id, task_id=t2, depends_on_task_ids=[t3]
+            )
+            pending = await td.load_dependency_graph(session, board_id=board_id)
+            assert pending.dependents_of(t3) == {t2}
+            await session.rollback()
+
+            reloaded = await td.load_dependency_graph(session, board_id=board_id)
+            assert reloaded.version == first.version
+            assert reloaded.dependents_of(t3) == set()
+
+            await td.replace_task_dependencies(
+                session, board_id=board_id, task_id=t2, depends_on_task_ids=[t3]
+            )
+            await session.commit()
+            updated = await td.load_dependency_graph(session, board_id=board_id)
+            assert updated.version > first.version
+            assert updated.depends_on == {t1: {t2}, t2: {t3}}
+            assert updated.would_create_cycle(t3, [t1])
+    finally:
+        await engine.dispose()
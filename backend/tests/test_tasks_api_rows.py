@@ -1,13 +1,25 @@
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
+from typing import Any
 from uuid import uuid4
 
 import pytest
 
-from app.api.tasks import _coerce_task_event_rows, _task_event_payload
+from app.api import tasks as tasks_api
+from app.api.tasks import (
+    _coerce_task_event_rows,
+    _delta_renderer,
+    _task_event_delta,
+    _task_event_payload,
+)
 from app.models.activity_events import ActivityEvent
 from app.models.tasks import Task
+from app.schemas.tags import TagRef
+from app.schemas.tasks import TaskRead
+from app.services.sse_replay import SseReplayBuffer
+from app.services.tags import TagState
 
 
 @dataclass
@@ -143,3 +155,126 @@ def test_task_event_payload_includes_notebook_gate_fields() -> None:
     assert isinstance(task_payload, dict)
     assert task_payload["notebook_gate_state"] == "retryable"
     assert task_payload["notebook_gate_reason"] == "auth_expired"
+
+
+def _updated_payload(task: Task) -> dict[str, object]:
+    event = ActivityEvent(event_type="task.updated", task_id=task.id)
+    return _task_event_payload(
+        event,
+        task,
+        deps_map={},
+        dep_status={},
+        tag_state_by_task_id={},
+    )
+
+
+def test_task_event_payload_matches_full_task_read() -> None:
+    task = Task(board_id=uuid4(), title="Parity", arena_config={"agents": ["a"]})
+    dependency_id = uuid4()
+    tag = TagRef(id=uuid4(), name="Ops", slug="ops", color="ff0000")
+    payload = _task_event_payload(
+        ActivityEvent(event_type="task.updated", task_id=task.id),
+        task,
+        deps_map={task.id: [dependency_id]},
+        dep_status={dependency_id: "inbox"},
+        tag_state_by_task_id={task.id: TagState(tag_ids=[tag.id], tags=[tag])},
+        custom_field_values_by_task_id={task.id: {"points": 3}},
+    )
+
+    expected = (
+        TaskRead.model_validate(task, from_attributes=True)
+        .model_copy(
+            update={
+                "depends_on_task_ids": [dependency_id],
+                "tag_ids": [tag.id],
+                "tags": [tag],
+                "blocked_by_task_ids": [dependency_id],
+                "is_blocked": True,
+                "custom_field_values": {"points": 3},
+            },
+        )
+        .model_dump(mode="json")
+    )
+    assert payload["task"] == expected
+
+
+def test_task_event_payload_reuses_columns_until_row_changes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    validations: list[object] = []
+
+    class _CountingTaskRead(TaskRead):
+        @classmethod
+        def model_validate(cls, obj: object, **kwargs: Any) -> TaskRead:
+            validations.append(obj)
+            return TaskRead.model_validate(obj, **kwargs)
+
+    monkeypatch.setattr(tasks_api, "TaskRead", _CountingTaskRead)
+    task = Task(board_id=uuid4(), title="Cached", arena_config={"agents": ["a"]})
+
+    first = _updated_payload(task)
+    second = _updated_payload(task)
+    task.arena_config = {"agents": ["a", "b"]}
+    third = _updated_payload(task)
+
+    assert len(validations) == 2
+    assert first["task"] == second["task"]
+    assert isinstance(third["task"], dict)
+    assert third["task"]["arena_config"]["agents"] == ["a", "b"]
+
+
+def test_task_event_delta_diffs_against_previous_version() -> None:
+    task = Task(board_id=uuid4(), title="Delta me", status="inbox")
+    first_payload = _updated_payload(task)
+    first = _task_event_delta(first_payload)
+    task.status = "in_progress"
+    second_payload = _updated_payload(task)
+    second = _task_event_delta(second_payload)
+
+    assert first is not None and second is not None
+    assert first.base_version is None
+    assert first.data is None
+    assert first_payload["task_version"] == first.version
+    assert second.base_version == first.version
+    assert second.version != first.version
+    assert second.data is not None
+    delta_payload = json.loads(second.data)
+    assert delta_payload["changes"] == {"status": "in_progress"}
+    assert delta_payload["task_id"] == str(task.id)
+    assert "task" not in delta_payload
+
+
+def test_task_event_delta_skips_comment_payloads() -> None:
+    payload = {"type": "task.comment", "activity": {}, "comment": {}}
+    assert _task_event_delta(payload) is None
+
+
+def test_delta_renderer_sends_full_task_first_then_changes() -> None:
+    buffer = SseReplayBuffer(max_entries=10)
+    channel = ("tasks", uuid4())
+    task = Task(board_id=uuid4(), title="Render me", status="inbox")
+    entries = []
+    for status in ("inbox", "in_progress", "review"):
+        task.status = status
+        payload = _updated_payload(task)
+        meta = _task_event_delta(payload)
+        entries.append(
+            buffer.record(
+                channel,
+                key=status,
+                event="task",
+                data=json.dumps(payload),
+                cursor=task.created_at,
+                meta=meta,
+            ),
+        )
+
+    render = _delta_renderer()
+    late_render = _delta_renderer()
+    messages = [json.loads(render(entry)["data"]) for entry in entries]
+    late_message = json.loads(late_render(entries[2])["data"])
+
+    assert messages[0]["task"]["status"] == "inbox"
+    assert messages[1]["changes"] == {"status": "in_progress"}
+    assert messages[2]["changes"] == {"status": "review"}
+    assert late_message["task"]["status"] == "review"
@@ -0,0 +1,332 @@
+# ruff: noqa: S101
+from __future__ import annotations
+
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel, col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api import tasks as tasks_api
+from app.api.deps import ActorContext
+from app.core.auth import AuthContext
+from app.models.activity_events import ActivityEvent
+from app.models.agents import Agent
+from app.models.boards import Board
+from app.models.gateways import Gateway
+from app.models.organizations import Organization
+from app.models.tag_assignments import TagAssignment
+from app.models.tags import Tag
+from app.models.task_dependencies import TaskDependency
+from app.models.tasks import Task
+from app.schemas.tasks import TaskBulkCreate, TaskBulkUpdate, TaskBulkUpdateItem, TaskCreate
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+async def _seed(session: AsyncSession) -> tuple[Board, Agent, Agent, Tag, Task]:
+    org = Organization(id=uuid4(), name="org")
+    gateway = Gateway(
+        organization_id=org.id,
+        name="gateway",
+        url="https://gateway.local",
+        workspace_root="/tmp/workspace",
+    )
+    board = Board(organization_id=org.id, name="board", slug="board", gateway_id=gateway.id)
+    lead = Agent(
+        name="lead",
+        board_id=board.id,
+        gateway_id=gateway.id,
+        is_board_lead=True,
+        openclaw_session_id="lead-session",
+    )
+    worker = Agent(
+        name="worker",
+        board_id=board.id,
+        gateway_id=gateway.id,
+        openclaw_session_id="worker-session",
+    )
+    tag = Tag(organization_id=org.id, name="import", slug="import")
+    done_task = Task(board_id=board.id, title="shipped", status="done")
+    session.add_all([org, gateway, board, lead, worker, tag, done_task])
+    await session.commit()
+    return board, lead, worker, tag, done_task
+
+
+def _capture_notifications(monkeypatch: pytest.MonkeyPatch) -> list[tuple[str, str]]:
+    sent: list[tuple[str, str]] = []
+
+    async def _config(_self: object, _board: Board) -> object:
+        return object()
+
+    async def _send_lead(**kwargs: Any) -> None:
+        sent.append((kwargs["session_key"], kwargs["message"]))
+
+    async def _send_agent(**kwargs: Any) -> None:
+        sent.append((kwargs["session_key"], kwargs["message"]))
+
+    monkeypatch.setattr(
+        tasks_api.GatewayDispatchService,
+        "optional_gateway_config_for_board",
+        _config,
+    )
+    monkeypatch.setattr(tasks_api, "_send_lead_task_message", _send_lead)
+    monkeypatch.setattr(tasks_api, "_send_agent_task_message", _send_agent)
+    return sent
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_writes_all_tasks_and_consolidates_notifications(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sent = _capture_notifications(monkeypatch)
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            board, _lead, worker, tag, done_task = await _seed(session)
+            payload = TaskBulkCreate(
+                items=[
+                    TaskCreate(title="one", tag_ids=[tag.id, tag.id]),
+                    TaskCreate(
+                        title="two",
+                        status="in_progress",
+                        assigned_agent_id=worker.id,
+                        depends_on_task_ids=[done_task.id],
+                    ),
+                    TaskCreate(title="three", assigned_agent_id=worker.id),
+                ],
+            )
+
+            result = await tasks_api.bulk_create_tasks(
+                payload=payload,
+                board=board,
+                session=session,
+                auth=AuthContext(actor_type="user", user=None),
+            )
+
+            assert [item.title for item in result.items] == ["one", "two", "three"]
+            assert result.items[0].tag_ids == [tag.id]
+            assert result.items[1].depends_on_task_ids == [done_task.id]
+            assert result.items[1].is_blocked is False
+            new_ids = [item.id for item in result.items]
+            deps = list(await session.exec(select(TaskDependency)))
+            assert [(dep.task_id, dep.depends_on_task_id) for dep in deps] == [
+                (new_ids[1], done_task.id),
+            ]
+            assert len(list(await session.exec(select(TagAssignment)))) == 1
+            created_events = list(
+                await session.exec(
+                    select(ActivityEvent).where(col(ActivityEvent.event_type) == "task.created"),
+                ),
+            )
+            assert {event.task_id for event in created_events} == set(new_ids)
+
+        # One message to the lead covering all three tasks, one to the worker for two.
+        assert [session_key for session_key, _ in sent] == ["lead-session", "worker-session"]
+        assert "NEW TASKS ADDED (3)" in sent[0][1]
+        assert "TASKS ASSIGNED (2)" in sent[1][1]
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_rejects_batch_with_item_index(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _capture_notifications(monkeypatch)
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            board, _lead, worker, _tag, _done = await _seed(session)
+            inbox_dependency = Task(board_id=board.id, title="open work")
+            session.add(inbox_dependency)
+            await session.commit()
+            payload = TaskBulkCreate(
+                items=[
+                    TaskCreate(title="fine"),
+                    TaskCreate(
+                        title="blocked",
+                        assigned_agent_id=worker.id,
+                        depends_on_task_ids=[inbox_dependency.id],
+                    ),
+                ],
+            )
+
+            with pytest.raises(HTTPException) as exc:
+                await tasks_api.bulk_create_tasks(
+                    payload=payload,
+                    board=board,
+                    session=session,
+                    auth=AuthContext(actor_type="user", user=None),
+                )
+
+            assert exc.value.status_code == 409
+            assert isinstance(exc.value.detail, dict)
+            assert exc.value.detail["index"] == 1
+            titles = set(await session.exec(select(Task.title)))
+            assert titles == {"shipped", "open work"}
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_bulk_tag_errors_carry_item_index(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _capture_notifications(monkeypatch)
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            board, _lead, _worker, tag, done_task = await _seed(session)
+            unknown_tag_id = uuid4()
+
+            with pytest.raises(HTTPException) as create_exc:
+                await tasks_api.bulk_create_tasks(
+                    payload=TaskBulkCreate(
+                        items=[
+                            TaskCreate(title="fine", tag_ids=[tag.id]),
+                            TaskCreate(title="bad", tag_ids=[tag.id, unknown_tag_id]),
+                        ],
+                    ),
+                    board=board,
+                    session=session,
+                    auth=AuthContext(actor_type="user", user=None),
+                )
+            with pytest.raises(HTTPException) as update_exc:
+                await tasks_api.bulk_update_tasks(
+                    payload=TaskBulkUpdate(
+                        items=[
+                            TaskBulkUpdateItem(id=done_task.id, tag_ids=[unknown_tag_id]),
+                        ],
+                    ),
+                    board=board,
+                    session=session,
+                    actor=ActorContext(actor_type="user", user=None),
+                )
+
+            for exc in (create_exc, update_exc):
+                assert exc.value.status_code == 404
+                assert isinstance(exc.value.detail, dict)
+                assert exc.value.detail["missing_tag_ids"] == [str(unknown_tag_id)]
+            assert create_exc.value.detail["index"] == 1
+            assert update_exc.value.detail["index"] == 0
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_applies_items_in_one_transaction(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sent = _capture_notifications(monkeypatch)
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            board, _lead, worker, _tag, _done = await _seed(session)
+            first = Task(board_id=board.id, title="first")
+            second = Task(board_id=board.id, title="second")
+            session.add_all([first, second])
+            await session.commit()
+            actor = ActorContext(actor_type="user", user=None)
+
+            result = await tasks_api.bulk_update_tasks(
+                payload=TaskBulkUpdate(
+                    items=[
+                        TaskBulkUpdateItem(id=first.id, assigned_agent_id=worker.id),
+                        TaskBulkUpdateItem(
+                            id=second.id,
+                            assigned_agent_id=worker.id,
+                            priority="high",
+                            depends_on_task_ids=[first.id],
+                        ),
+                    ],
+                ),
+                board=board,
+                session=session,
+                actor=actor,
+            )
+
+            assert [item.assigned_agent_id for item in result.items] == [worker.id, None]
+            # The dependency edit from item 2 sees item 1's still-open task and blocks.
+            assert result.items[1].priority == "high"
+            assert result.items[1].blocked_by_task_ids == [first.id]
+            assert [session_key for session_key, _ in sent] == ["worker-session"]
+            assert "TASKS ASSIGNED (1)" in sent[0][1]
+
+            with pytest.raises(HTTPException) as exc:
+                await tasks_api.bulk_update_tasks(
+                    payload=TaskBulkUpdate(
+                        items=[
+                            TaskBulkUpdateItem(id=second.id, title="renamed"),
+                            TaskBulkUpdateItem(id=first.id, depends_on_task_ids=[second.id]),
+                        ],
+                    ),
+                    board=board,
+                    session=session,
+                    actor=actor,
+                )
+            assert exc.value.status_code == 409
+            assert isinstance(exc.value.detail, dict)
+            assert exc.value.detail["index"] == 1
+            await session.rollback()
+            titles = set(await session.exec(select(Task.title)))
+            assert "renamed" not in titles
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_rejects_duplicate_and_foreign_task_ids() -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            board, _lead, _worker, _tag, done_task = await _seed(session)
+            actor = ActorContext(actor_type="user", user=None)
+            foreign_id: UUID = uuid4()
+
+            with pytest.raises(HTTPException) as duplicate:
+                await tasks_api.bulk_update_tasks(
+                    payload=TaskBulkUpdate(
+                        items=[
+                            TaskBulkUpdateItem(id=done_task.id, title="a"),
+                            TaskBulkUpdateItem(id=done_task.id, title="b"),
+                        ],
+                    ),
+                    board=board,
+                    session=session,
+                    actor=actor,
+                )
+            with pytest.raises(HTTPException) as missing:
+                await tasks_api.bulk_update_tasks(
+                    payload=TaskBulkUpdate(items=[TaskBulkUpdateItem(id=foreign_id)]),
+                    board=board,
+                    session=session,
+                    actor=actor,
+                )
+
+            assert duplicate.value.status_code == 422
+            assert missing.value.status_code == 404
+            assert isinstance(missing.value.detail, dict)
+            assert missing.value.detail["missing_task_ids"] == [str(foreign_id)]
+    finally:
+        await engine.dispose()
+
+
+def test_bulk_routes_are_matched_before_task_id_routes() -> None:
+    paths = [
+        (route.path, sorted(route.methods))
+        for route in tasks_api.router.routes
+        if hasattr(route, "methods")
+    ]
+    prefix = "/boards/{board_id}/tasks"
+    assert paths.index((f"{prefix}/bulk", ["PATCH"])) < paths.index(
+        (f"{prefix}/{{task_id}}", ["PATCH"]),
+    )
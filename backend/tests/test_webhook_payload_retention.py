@@ -0,0 +1,255 @@
+# ruff: noqa: S101
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel, col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api import board_webhooks
+from app.models.board_memory import BoardMemory
+from app.models.board_webhook_payloads import BoardWebhookPayload
+from app.models.board_webhooks import BoardWebhook
+from app.models.boards import Board
+from app.models.organizations import Organization
+from app.services import queue_worker
+from app.services.webhooks import retention
+from app.services.webhooks.retention import WebhookCompactionResult, compact_webhook_payloads
+
+NOW = datetime(2026, 3, 15, 12, 0)
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+async def _seed(
+    session: AsyncSession,
+    *,
+    max_age_days: int | None,
+    max_payloads: int | None,
+    ages_days: list[int],
+) -> tuple[BoardWebhook, list[UUID]]:
+    org = Organization(id=uuid4(), name="org")
+    board = Board(organization_id=org.id, name="b", slug="b")
+    webhook = BoardWebhook(
+        board_id=board.id,
+        description="triage",
+        retention_max_age_days=max_age_days,
+        retention_max_payloads=max_payloads,
+    )
+    session.add_all([org, board, webhook])
+    payload_ids: list[UUID] = []
+    for age in ages_days:
+        payload = BoardWebhookPayload(
+            board_id=board.id,
+            webhook_id=webhook.id,
+            payload={"age": age},
+            received_at=NOW - timedelta(days=age),
+        )
+        session.add(payload)
+        session.add(
+            BoardMemory(
+                board_id=board.id,
+                content=f"preview {age}",
+                source="webhook",
+                webhook_payload_id=payload.id,
+            ),
+        )
+        payload_ids.append(payload.id)
+    await session.commit()
+    return webhook, payload_ids
+
+
+async def _remaining_ages(session: AsyncSession) -> tuple[list[object], list[str]]:
+    payloads = await session.exec(select(BoardWebhookPayload))
+    memories = await session.exec(select(BoardMemory.content))
+    return (
+        sorted(row.payload["age"] for row in payloads),  # type: ignore[index]
+        sorted(memories),
+    )
+
+
+@pytest.mark.asyncio
+async def test_compaction_enforces_age_and_count_limits_in_chunks(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(retention.settings, "webhook_compaction_batch_size", 2)
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            await _seed(session, max_age_days=30, max_payloads=3, ages_days=[1, 2, 3, 4, 40, 50])
+            # Payloads of webhooks without a policy are left alone.
+            await _seed(session, max_age_days=None, max_payloads=None, ages_days=[400])
+
+            result = await compact_webhook_payloads(session, now=NOW)
+            ages, memories = await _remaining_ages(session)
+    finally:
+        await engine.dispose()
+
+    assert result.webhook_count == 1
+    assert result.payloads_deleted == 3
+    assert result.memories_deleted == 3
+    assert ages == [1, 2, 3, 400]
+    assert memories == ["preview 1", "preview 2", "preview 3", "preview 400"]
+
+
+@pytest.mark.asyncio
+async def test_compaction_keeps_payloads_still_queued_for_dispatch(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(retention.settings, "webhook_dispatch_pending_max_age_seconds", 86400 * 45)
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            _webhook, payload_ids = await _seed(
+                session,
+                max_age_days=30,
+                max_payloads=1,
+                ages_days=[1, 2, 40, 50],
+            )
+            # Ages 2 and 40 are still queued; age 50 was queued too long ago.
+            for payload_id in (payload_ids[1], payload_ids[2], payload_ids[3]):
+                payload = await session.get(BoardWebhookPayload, payload_id)
+                assert payload is not None
+                payload.dispatch_pending = True
+                session.add(payload)
+            await session.commit()
+
+            result = await compact_webhook_payloads(session, now=NOW)
+            ages, _memories = await _remaining_ages(session)
+    finally:
+        await engine.dispose()
+
+    assert result.payloads_deleted == 1
+    assert ages == [1, 2, 40]
+
+
+@pytest.mark.asyncio
+async def test_compaction_compresses_large_bodies_transparently(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(retention.settings, "webhook_payload_compress_min_chars", 200)
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            webhook, payload_ids = await _seed(
+                session,
+                max_age_days=None,
+                max_payloads=None,
+                ages_days=[1],
+            )
+            large = BoardWebhookPayload(
+                board_id=webhook.board_id,
+                webhook_id=webhook.id,
+                payload={"text": "x" * 500, "items": [1, 2, 3]},
+            )
+            session.add(large)
+            await session.commit()
+
+            result = await compact_webhook_payloads(session, now=NOW)
+            session.expunge_all()
+            rows = {
+                row.id: row
+                for row in await session.exec(
+                    select(BoardWebhookPayload).where(
+                        col(BoardWebhookPayload.id).in_([large.id, *payload_ids]),
+                    ),
+                )
+            }
+    finally:
+        await engine.dispose()
+
+    assert result.payloads_compressed == 1
+    assert rows[large.id].payload is None
+    assert rows[large.id].payload_compressed is not None
+    assert board_webhooks._to_payload_read(rows[large.id]).payload == {
+        "text": "x" * 500,
+        "items": [1, 2, 3],
+    }
+    assert rows[payload_ids[0]].payload_compressed is None
+    assert board_webhooks._to_payload_read(rows[payload_ids[0]]).payload == {"age": 1}
+    assert all(row.compression_checked_at == NOW for row in rows.values())
+
+
+@pytest.mark.asyncio
+async def test_compaction_checks_each_body_once_in_id_batches(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(retention.settings, "webhook_payload_compress_min_chars", 200)
+    monkeypatch.setattr(retention.settings, "webhook_compaction_batch_size", 2)
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            webhook, _payload_ids = await _seed(
+                session,
+                max_age_days=None,
+                max_payloads=None,
+                ages_days=[1, 2, 3],
+            )
+            session.add_all(
+                [
+                    BoardWebhookPayload(
+                        board_id=webhook.board_id,
+                        webhook_id=webhook.id,
+                        payload={"text": "x" * 500},
+                    )
+                    for _ in range(2)
+                ],
+            )
+            await session.commit()
+
+            first = await compact_webhook_payloads(session, now=NOW)
+            again = await compact_webhook_payloads(session, now=NOW)
+            unchecked = list(
+                await session.exec(
+                    select(BoardWebhookPayload.id).where(
+                        col(BoardWebhookPayload.compression_checked_at).is_(None),
+                    ),
+                ),
+            )
+    finally:
+        await engine.dispose()
+
+    assert first.payloads_compressed == 2
+    assert again.payloads_compressed == 0
+    assert unchecked == []
+
+
+@pytest.mark.asyncio
+async def test_run_webhook_compaction_once_respects_flag(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sessions: list[object] = []
+
+    class _SessionContext:
+        async def __aenter__(self) -> object:
+            return object()
+
+        async def __aexit__(self, *_args: object) -> bool:
+            return False
+
+    async def _compact(session: object) -> WebhookCompactionResult:
+        sessions.append(session)
+        return WebhookCompactionResult()
+
+    async def _ready() -> bool:
+        return True
+
+    monkeypatch.setattr(queue_worker.settings, "webhook_compaction_enabled", True)
+    monkeypatch.setattr(queue_worker, "is_scheduler_migration_ready", _ready)
+    monkeypatch.setattr(queue_worker, "compact_webhook_payloads", _compact)
+    monkeypatch.setattr(queue_worker, "async_session_maker", _SessionContext)
+
+    assert await queue_worker.run_webhook_compaction_once() is True
+
+    monkeypatch.setattr(queue_worker.settings, "webhook_compaction_enabled", False)
+
+    assert await queue_worker.run_webhook_compaction_once() is False
+    assert len(sessions) == 1
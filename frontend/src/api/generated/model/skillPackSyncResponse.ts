@@ -6,13 +6,20 @@
  */
 
 /**
- * Pack sync summary payload.
+ * Status and latest results of a background pack sync.
  */
 export interface SkillPackSyncResponse {
-  created: number;
+  commit?: string | null;
+  created?: number;
+  error?: string | null;
+  finished_at?: string | null;
   ok?: boolean;
   pack_id: string;
-  synced: number;
-  updated: number;
+  requested_at?: string | null;
+  started_at?: string | null;
+  status?: string | null;
+  synced?: number;
+  unchanged?: number;
+  updated?: number;
   warnings?: string[];
 }
@@ -1689,7 +1689,9 @@ export const useUpdateSkillPackApiV1SkillsPacksPackIdPatch = <
   );
 };
 /**
- * Clone a pack repository and upsert discovered skills from `skills/**\/SKILL.md`.
+ * Queue a background sync of skills from the pack repository.
+ *
+ * Returns the pack's sync status; poll `GET /packs/{pack_id}/sync` for results.
  * @summary Sync Skill Pack
  */
 export type syncSkillPackApiV1SkillsPacksPackIdSyncPostResponse200 = {
@@ -1808,3 +1810,241 @@ export const useSyncSkillPackApiV1SkillsPacksPackIdSyncPost = <
     queryClient,
   );
 };
+/**
+ * Return the status and latest results of the pack's background sync.
+ * @summary Get Skill Pack Sync
+ */
+export type getSkillPackSyncApiV1SkillsPacksPackIdSyncGetResponse200 = {
+  data: SkillPackSyncResponse;
+  status: 200;
+};
+
+export type getSkillPackSyncApiV1SkillsPacksPackIdSyncGetResponse422 = {
+  data: HTTPValidationError;
+  status: 422;
+};
+
+export type getSkillPackSyncApiV1SkillsPacksPackIdSyncGetResponseSuccess =
+  getSkillPackSyncApiV1SkillsPacksPackIdSyncGetResponse200 & {
+    headers: Headers;
+  };
+export type getSkillPackSyncApiV1SkillsPacksPackIdSyncGetResponseError =
+  getSkillPackSyncApiV1SkillsPacksPackIdSyncGetResponse422 & {
+    headers: Headers;
+  };
+
+export type getSkillPackSyncApiV1SkillsPacksPackIdSyncGetResponse =
+  | getSkillPackSyncApiV1SkillsPacksPackIdSyncGetResponseSuccess
+  | getSkillPackSyncApiV1SkillsPacksPackIdSyncGetResponseError;
+
+export const getGetSkillPackSyncApiV1SkillsPacksPackIdSyncGetUrl = (
+  packId: string,
+) => {
+  return `/api/v1/skills/packs/${packId}/sync`;
+};
+
+export const getSkillPackSyncApiV1SkillsPacksPackIdSyncGet = async (
+  packId: string,
+  options?: RequestInit,
+): Promise<getSkillPackSyncApiV1SkillsPacksPackIdSyncGetResponse> => {
+  return customFetch<getSkillPackSyncApiV1SkillsPacksPackIdSyncGetResponse>(
+    getGetSkillPackSyncApiV1SkillsPacksPackIdSyncGetUrl(packId),
+    {
+      ...options,
+      method: "GET",
+    },
+  );
+};
+
+export const getGetSkillPackSyncApiV1SkillsPacksPackIdSyncGetQueryKey = (
+  packId: string,
+) => {
+  return [`/api/v1/skills/packs/${packId}/sync`] as const;
+};
+
+export const getGetSkillPackSyncApiV1SkillsPacksPackIdSyncGetQueryOptions = <
+  TData = Awaited<
+    ReturnType<typeof getSkillPackSyncApiV1SkillsPacksPackIdSyncGet>
+  >,
+  TError = HTTPValidationError,
+>(
+  packId: string,
+  options?: {
+    query?: Partial<
+      UseQueryOptions<
+        Awaited<
+          ReturnType<typeof getSkillPackSyncApiV1SkillsPacksPackIdSyncGet>
+        >,
+        TError,
+        TData
+      >
+    >;
+    request?: SecondParameter<typeof customFetch>;
+  },
+) => {
+  const { query: queryOptions, request: requestOptions } = options ?? {};
+
+  const queryKey =
+    queryOptions?.queryKey ??
+    getGetSkillPackSyncApiV1SkillsPacksPackIdSyncGetQueryKey(packId);
+
+  const queryFn: QueryFunction<
+    Awaited<ReturnType<typeof getSkillPackSyncApiV1SkillsPacksPackIdSyncGet>>
+  > = ({ signal }) =>
+    getSkillPackSyncApiV1SkillsPacksPackIdSyncGet(packId, {
+      signal,
+      ...requestOptions,
+    });
+
+  return {
+    queryKey,
+    queryFn,
+    enabled: !!packId,
+    ...queryOptions,
+  } as UseQueryOptions<
+    Awaited<ReturnType<typeof getSkillPackSyncApiV1SkillsPacksPackIdSyncGet>>,
+    TError,
+    TData
+  > & { queryKey: DataTag<QueryKey, TData, TError> };
+};
+
+export type GetSkillPackSyncApiV1SkillsPacksPackIdSyncGetQueryResult =
+  NonNullable<
+    Awaited<ReturnType<typeof getSkillPackSyncApiV1SkillsPacksPackIdSyncGet>>
+  >;
+export type GetSkillPackSyncApiV1SkillsPacksPackIdSyncGetQueryError =
+  HTTPValidationError;
+
+export function useGetSkillPackSyncApiV1SkillsPacksPackIdSyncGet<
+  TData = Awaited<
+    ReturnType<typeof getSkillPackSyncApiV1SkillsPacksPackIdSyncGet>
+  >,
+  TError = HTTPValidationError,
+>(
+  packId: string,
+  options: {
+    query: Partial<
+      UseQueryOptions<
+        Awaited<
+          ReturnType<typeof getSkillPackSyncApiV1SkillsPacksPackIdSyncGet>
+        >,
+        TError,
+        TData
+      >
+    > &
+      Pick<
+        DefinedInitialDataOptions<
+          Awaited<
+            ReturnType<typeof getSkillPackSyncApiV1SkillsPacksPackIdSyncGet>
+          >,
+          TError,
+          Awaited<
+            ReturnType<typeof getSkillPackSyncApiV1SkillsPacksPackIdSyncGet>
+          >
+        >,
+        "initialData"
+      >;
+    request?: SecondParameter<typeof customFetch>;
+  },
+  queryClient?: QueryClient,
+): DefinedUseQueryResult<TData, TError> & {
+  queryKey: DataTag<QueryKey, TData, TError>;
+};
+export function useGetSkillPackSyncApiV1SkillsPacksPackIdSyncGet<
+  TData = Awaited<
+    ReturnType<typeof getSkillPackSyncApiV1SkillsPacksPackIdSyncGet>
+  >,
+  TError = HTTPValidationError,
+>(
+  packId: string,
+  options?: {
+    query?: Partial<
+      UseQueryOptions<
+        Awaited<
+          ReturnType<typeof getSkillPackSyncApiV1SkillsPacksPackIdSyncGet>
+        >,
+        TError,
+        TData
+      >
+    > &
+      Pick<
+        UndefinedInitialDataOptions<
+          Awaited<
+            ReturnType<typeof getSkillPackSyncApiV1SkillsPacksPackIdSyncGet>
+          >,
+          TError,
+          Awaited<
+            ReturnType<typeof getSkillPackSyncApiV1SkillsPacksPackIdSyncGet>
+          >
+        >,
+        "initialData"
+      >;
+    request?: SecondParameter<typeof customFetch>;
+  },
+  queryClient?: QueryClient,
+): UseQueryResult<TData, TError> & {
+  queryKey: DataTag<QueryKey, TData, TError>;
+};
+export function useGetSkillPackSyncApiV1SkillsPacksPackIdSyncGet<
+  TData = Awaited<
+    ReturnType<typeof getSkillPackSyncApiV1SkillsPacksPackIdSyncGet>
+  >,
+  TError = HTTPValidationError,
+>(
+  packId: string,
+  options?: {
+    query?: Partial<
+      UseQueryOptions<
+        Awaited<
+          ReturnType<typeof getSkillPackSyncApiV1SkillsPacksPackIdSyncGet>
+        >,
+        TError,
+        TData
+      >
+    >;
+    request?: SecondParameter<typeof customFetch>;
+  },
+  queryClient?: QueryClient,
+): UseQueryResult<TData, TError> & {
+  queryKey: DataTag<QueryKey, TData, TError>;
+};
+/**
+ * @summary Get Skill Pack Sync
+ */
+
+export function useGetSkillPackSyncApiV1SkillsPacksPackIdSyncGet<
+  TData = Awaited<
+    ReturnType<typeof getSkillPackSyncApiV1SkillsPacksPackIdSyncGet>
+  >,
+  TError = HTTPValidationError,
+>(
+  packId: string,
+  options?: {
+    query?: Partial<
+      UseQueryOptions<
+        Awaited<
+          ReturnType<typeof getSkillPackSyncApiV1SkillsPacksPackIdSyncGet>
+        >,
+        TError,
+        TData
+      >
+    >;
+    request?: SecondParameter<typeof customFetch>;
+  },
+  queryClient?: QueryClient,
+): UseQueryResult<TData, TError> & {
+  queryKey: DataTag<QueryKey, TData, TError>;
+} {
+  const queryOptions =
+    getGetSkillPackSyncApiV1SkillsPacksPackIdSyncGetQueryOptions(
+      packId,
+      options,
+    );
+
+  const query = useQuery(queryOptions, queryClient) as UseQueryResult<
+    TData,
+    TError
+  > & { queryKey: DataTag<QueryKey, TData, TError> };
+
+  return { ...query, queryKey: queryOptions.queryKey };
+}
@@ -3,15 +3,19 @@
 export const dynamic = "force-dynamic";
 
 import Link from "next/link";
-import { useMemo, useState } from "react";
+import { useEffect, useMemo, useRef, useState } from "react";
 
 import { useAuth } from "@/auth/clerk";
 import { useQueryClient } from "@tanstack/react-query";
 
 import { ApiError } from "@/api/mutator";
-import type { SkillPackRead } from "@/api/generated/model";
+import type {
+  SkillPackRead,
+  SkillPackSyncResponse,
+} from "@/api/generated/model";
 import {
   getListSkillPacksApiV1SkillsPacksGetQueryKey,
+  getSkillPackSyncApiV1SkillsPacksPackIdSyncGet,
   type listSkillPacksApiV1SkillsPacksGetResponse,
   useDeleteSkillPackApiV1SkillsPacksPackIdDelete,
   useListSkillPacksApiV1SkillsPacksGet,
@@ -32,12 +36,65 @@ const PACKS_SORTABLE_COLUMNS = [
   "updated_at",
 ];
 
+const SYNC_POLL_INTERVAL_MS = 2_000;
+// Mirrors the backend `SKILL_PACK_SYNC_STALE_SECONDS` default: a sync still
+// pending after this long is treated as stale and may be re-queued.
+const SKILL_PACK_SYNC_STALE_SECONDS = 900;
+
+const wait = (ms: number, signal?: AbortSignal) =>
+  new Promise<void>((resolve, reject) => {
+    const onAbort = () => {
+      clearTimeout(timer);
+      reject(signal?.reason);
+    };
+    const timer = setTimeout(() => {
+      signal?.removeEventListener("abort", onAbort);
+      resolve();
+    }, ms);
+    signal?.addEventListener("abort", onAbort, { once: true });
+  });
+
+/**
+ * Poll a pack's background sync until it has succeeded or failed.
+ *
+ * `POST /sync` only queues the job, so its response is never the final result.
+ * Gives up once the sync has been pending for `SKILL_PACK_SYNC_STALE_SECONDS`.
+ */
+const waitForPackSync = async (
+  packId: string,
+  signal?: AbortSignal,
+): Promise<SkillPackSyncResponse> => {
+  const deadline = Date.now() + SKILL_PACK_SYNC_STALE_SECONDS * 1_000;
+  for (;;) {
+    signal?.throwIfAborted();
+    const response = await getSkillPackSyncApiV1SkillsPacksPackIdSyncGet(
+      packId,
+      { signal },
+    );
+    if (response.status !== 200) {
+      throw new Error("Unable to read skill pack sync status.");
+    }
+    if (response.data.status === "succeeded") return response.data;
+    if (response.data.status === "failed") {
+      throw new Error(response.data.error || "Skill pack sync failed.");
+    }
+    if (Date.now() >= deadline) {
+      throw new Error(
+        "Skill pack sync is taking too long. Try syncing again later.",
+      );
+    }
+    await wait(SYNC_POLL_INTERVAL_MS, signal);
+  }
+};
+
 /**
  * Skill packs admin page.
  *
  * Notes:
  * - Sync actions are intentionally serialized (per-pack) to avoid a thundering herd
  *   of GitHub fetches / backend sync jobs.
+ * - Syncs run in the background: after queueing one we poll `GET /sync` until
+ *   it succeeds, fails or goes stale, and stop polling when the page unmounts.
  * - We keep UI state (`syncingPackIds`, warnings) local; the canonical list is
  *   still React Query (invalidate after sync/delete).
  */
@@ -49,7 +106,15 @@ export default function SkillsPacksPage() {
   const [syncingPackIds, setSyncingPackIds] = useState<Set<string>>(new Set());
   const [isSyncingAll, setIsSyncingAll] = useState(false);
   const [syncAllError, setSyncAllError] = useState<string | null>(null);
+  const [syncError, setSyncError] = useState<string | null>(null);
   const [syncWarnings, setSyncWarnings] = useState<string[]>([]);
+  const syncPollSignalRef = useRef<AbortSignal | undefined>(undefined);
+
+  useEffect(() => {
+    const controller = new AbortController();
+    syncPollSignalRef.current = controller.signal;
+    return () => controller.abort();
+  }, []);
 
   const { sorting, onSortingChange } = useUrlSorting({
     allowedColumnIds: PACKS_SORTABLE_COLUMNS,
@@ -90,18 +155,22 @@ export default function SkillsPacksPage() {
       queryClient,
     );
   const syncMutation = useSyncSkillPackApiV1SkillsPacksPackIdSyncPost<ApiError>(
-    {
-      mutation: {
-        onSuccess: async () => {
-          await queryClient.invalidateQueries({
-            queryKey: packsQueryKey,
-          });
-        },
-      },
-    },
+    undefined,
     queryClient,
   );
 
+  const finishPackSync = async (
+    packId: string,
+  ): Promise<SkillPackSyncResponse> => {
+    try {
+      return await waitForPackSync(packId, syncPollSignalRef.current);
+    } finally {
+      await queryClient.invalidateQueries({
+        queryKey: packsQueryKey,
+      });
+    }
+  };
+
   const handleDelete = () => {
     if (!deleteTarget) return;
     deleteMutation.mutate({ packId: deleteTarget.id });
@@ -110,6 +179,7 @@ export default function SkillsPacksPage() {
   const handleSyncPack = async (pack: SkillPackRead) => {
     if (isSyncingAll || syncingPackIds.has(pack.id)) return;
     setSyncAllError(null);
+    setSyncError(null);
     setSyncWarnings([]);
 
     setSyncingPackIds((previous) => {
@@ -117,12 +187,18 @@ export default function SkillsPacksPage() {
       next.add(pack.id);
       return next;
     });
+    let queued = false;
     try {
-      const response = await syncMutation.mutateAsync({
-        packId: pack.id,
-      });
-      if (response.status === 200) {
-        setSyncWarnings(response.data.warnings ?? []);
+      await syncMutation.mutateAsync({ packId: pack.id });
+      queued = true;
+      const result = await finishPackSync(pack.id);
+      setSyncWarnings(result.warnings ?? []);
+    } catch (error) {
+      // Failures to queue the sync are shown through `syncMutation.error`.
+      if (queued && !syncPollSignalRef.current?.aborted) {
+        setSyncError(
+          error instanceof Error ? error.message : "Skill pack sync failed.",
+        );
       }
     } finally {
       setSyncingPackIds((previous) => {
@@ -144,6 +220,7 @@ export default function SkillsPacksPage() {
     }
 
     setSyncAllError(null);
+    setSyncError(null);
     setSyncWarnings([]);
     setIsSyncingAll(true);
 
@@ -161,14 +238,14 @@ export default function SkillsPacksPage() {
         });
 
         try {
-          const response = await syncMutation.mutateAsync({ packId: pack.id });
-          if (response.status === 200) {
-            setSyncWarnings((previous) => [
-              ...previous,
-              ...(response.data.warnings ?? []),
-            ]);
-          }
+          await syncMutation.mutateAsync({ packId: pack.id });
+          const result = await finishPackSync(pack.id);
+          setSyncWarnings((previous) => [
+            ...previous,
+            ...(result.warnings ?? []),
+          ]);
         } catch {
+          if (syncPollSignalRef.current?.aborted) return;
           hasFailure = true;
         } finally {
           setSyncingPackIds((previous) => {
@@ -267,6 +344,9 @@ export default function SkillsPacksPage() {
               {syncMutation.error.message}
             </p>
           ) : null}
+          {syncError ? (
+            <p className="text-sm text-rose-600">{syncError}</p>
+          ) : null}
           {syncAllError ? (
             <p className="text-sm text-rose-600">{syncAllError}</p>
           ) : null}